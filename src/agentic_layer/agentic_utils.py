@@ -8,6 +8,7 @@ Provides tools required for LLM-guided multi-round retrieval:
 """
 
 import json
+import os
 import asyncio
 import logging
 from typing import List, Tuple, Optional, Dict, Any
@@ -112,10 +113,23 @@ class AgenticConfig:
     reranker_batch_size: int = 10
     reranker_timeout: float = 30.0
 
+    # Speculative round 2: start query expansion and round-2 search in parallel
+    # with the sufficiency check, discard them if round 1 turns out sufficient
+    speculative_round2: bool = False
+
     # Fallback strategy
     fallback_on_error: bool = True  # Fallback when LLM fails
     timeout: float = 60.0  # Overall timeout (seconds)
 
+    def __post_init__(self):
+        """Load agentic retrieval switches from environment"""
+        self.speculative_round2 = (
+            os.getenv(
+                "AGENTIC_SPECULATIVE_ROUND2", str(self.speculative_round2)
+            ).lower()
+            == "true"
+        )
+
 
 # ==================== Utility Functions ====================
 
@@ -9,11 +9,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Union
+from typing import AsyncIterator, Optional, Tuple, Union
 
 from core.di import get_bean_by_type, get_bean, service
-from core.oxm.constants import MAGIC_ALL
+from core.oxm.constants import MAGIC_ALL, MAX_FETCH_LIMIT
+from core.oxm.keyset_pagination import KeysetCursor, split_page
 from common_utils.datetime_utils import from_iso_format
 from infra_layer.adapters.out.persistence.document.memory.foresight_record import (
     ForesightRecord,
@@ -63,6 +65,7 @@ from api_specs.memory_models import (
     CoreMemoryModel,
     EventLogModel,
     ForesightModel,
+    MemoryModel,
     Metadata,
 )
 
@@ -82,6 +85,8 @@ class FetchMemoryServiceInterface(ABC):
         end_time: Optional[str] = None,
         version_range: Optional[Tuple[Optional[str], Optional[str]]] = None,
         limit: int = 10,
+        cursor: Optional[str] = None,
+        raise_on_error: bool = False,
     ) -> FetchMemResponse:
         """
         Find memories by user ID and optional filters
@@ -94,12 +99,36 @@ class FetchMemoryServiceInterface(ABC):
             end_time: End time for time range filtering (optional)
             version_range: Version range (start, end), closed interval [start, end]
             limit: Limit on number of returned items
+            cursor: Keyset cursor (next_cursor of the previous page)
+            raise_on_error: Raise instead of returning an empty response on failure
 
         Returns:
             Memory query response
         """
         pass
 
+    @abstractmethod
+    def iter_memories(
+        self,
+        user_id: str,
+        memory_type: MemoryType,
+        group_id: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ) -> AsyncIterator[MemoryModel]:
+        """
+        Walk all matching memories page by page (for streaming export)
+
+        Args:
+            Same filters as find_memories
+            batch_size: Mongo page size (default MEMORY_EXPORT_BATCH_SIZE)
+
+        Yields:
+            Memory models in the same order as find_memories pages
+        """
+        pass
+
 
 @service(name="fetch_memory_service", primary=True)
 class FetchMemoryServiceImpl(FetchMemoryServiceInterface):
@@ -522,6 +551,8 @@ class FetchMemoryServiceImpl(FetchMemoryServiceInterface):
         end_time: Optional[str] = None,
         version_range: Optional[Tuple[Optional[str], Optional[str]]] = None,
         limit: int = 10,
+        cursor: Optional[str] = None,
+        raise_on_error: bool = False,
     ) -> FetchMemResponse:
         """
         Find memories by user ID and optional filters
@@ -535,9 +566,13 @@ class FetchMemoryServiceImpl(FetchMemoryServiceInterface):
             version_range: Version range (start, end), closed interval [start, end].
                           If not provided or None, get the latest version (ordered by version descending)
             limit: Limit on number of returned items
+            cursor: Keyset cursor (next_cursor of the previous page). Pages are keyed
+                    on (timestamp, _id) for episodic memory / event log / behavior history,
+                    (created_at, _id) for foresight and (version, _id) for profiles
+            raise_on_error: Raise instead of returning an empty response on failure
 
         Returns:
-            Memory query response
+            Memory query response (next_cursor is set when more pages exist)
 
         Time Field Mapping by Memory Type:
         ----------------------------------
@@ -562,6 +597,11 @@ class FetchMemoryServiceImpl(FetchMemoryServiceInterface):
         try:
             self._get_repositories()
             memories = []
+            next_cursor = None
+
+            # Fetch one extra record per page to detect whether more pages exist
+            page_cursor = KeysetCursor.decode(cursor) if cursor else None
+            fetch_limit = limit + 1
 
             # Parse time range if provided
             start_dt = from_iso_format(start_time) if start_time else None
@@ -584,10 +624,14 @@ class FetchMemoryServiceImpl(FetchMemoryServiceInterface):
                             group_id=group_id,
                             start_time=start_dt,
                             end_time=end_dt,
-                            limit=limit,
+                            limit=fetch_limit,
+                            cursor=page_cursor,
                             model=ForesightRecordProjection,
                         )
                     )
+                    foresight_records, next_cursor = split_page(
+                        foresight_records, "created_at", limit
+                    )
 
                     memories = [
                         self._convert_foresight_record(
@@ -603,8 +647,12 @@ class FetchMemoryServiceImpl(FetchMemoryServiceInterface):
                         group_id=group_id,
                         start_time=start_dt,
                         end_time=end_dt,
-                        limit=limit,
+                        limit=fetch_limit,
                         sort_desc=True,
+                        cursor=page_cursor,
+                    )
+                    episodic_memories, next_cursor = split_page(
+                        episodic_memories, "timestamp", limit
                     )
 
                     memories = [
@@ -620,10 +668,12 @@ class FetchMemoryServiceImpl(FetchMemoryServiceInterface):
                         group_id=group_id,
                         start_time=start_dt,
                         end_time=end_dt,
-                        limit=limit,
+                        limit=fetch_limit,
                         sort_desc=True,
+                        cursor=page_cursor,
                         model=EventLogRecordProjection,
                     )
+                    event_logs, next_cursor = split_page(event_logs, "timestamp", limit)
 
                     memories = [
                         self._convert_event_log(
@@ -639,11 +689,15 @@ class FetchMemoryServiceImpl(FetchMemoryServiceInterface):
 
                     # Fetch user_profiles and global_user_profile concurrently
                     user_profiles_task = self._user_profile_repo.find_by_filters(
-                        user_id=user_id, group_id=group_id, limit=limit
+                        user_id=user_id,
+                        group_id=group_id,
+                        limit=fetch_limit,
+                        cursor=page_cursor,
                     )
 
+                    # Global profile is returned with the first page only
                     global_profile_task = None
-                    if user_id and user_id != MAGIC_ALL:
+                    if user_id and user_id != MAGIC_ALL and page_cursor is None:
                         global_profile_task = (
                             self._global_user_profile_repo.get_by_user_id(
                                 user_id=user_id
@@ -659,8 +713,11 @@ class FetchMemoryServiceImpl(FetchMemoryServiceInterface):
                         user_profiles = await user_profiles_task
                         global_user_profile = None
 
+                    user_profiles, next_cursor = split_page(
+                        user_profiles, "version", limit
+                    )
                     profile_models = [
-                        self._convert_user_profile(up) for up in user_profiles[:limit]
+                        self._convert_user_profile(up) for up in user_profiles
                     ]
 
                     global_profile_model = None
@@ -712,7 +769,10 @@ class FetchMemoryServiceImpl(FetchMemoryServiceInterface):
                     # TODO: BehaviorHistory repository needs enhancement for filtering
                     if user_id and user_id != MAGIC_ALL:
                         behaviors = await self._behavior_repo.get_by_user_id(
-                            user_id, limit=limit
+                            user_id, limit=fetch_limit, cursor=page_cursor
+                        )
+                        behaviors, next_cursor = split_page(
+                            behaviors, "timestamp", limit
                         )
                         memories = [
                             self._convert_behavior_history(behavior)
@@ -734,11 +794,14 @@ class FetchMemoryServiceImpl(FetchMemoryServiceInterface):
             return FetchMemResponse(
                 memories=memories,
                 total_count=len(memories),
-                has_more=len(memories) == limit,
+                has_more=next_cursor is not None,
+                next_cursor=next_cursor.encode() if next_cursor else None,
                 metadata=response_metadata,
             )
 
         except Exception as e:
+            if raise_on_error:
+                raise
             import traceback
 
             traceback.print_exc()
@@ -759,6 +822,51 @@ class FetchMemoryServiceImpl(FetchMemoryServiceInterface):
                 memories=[], total_count=0, has_more=False, metadata=error_metadata
             )
 
+    async def iter_memories(
+        self,
+        user_id: str,
+        memory_type: MemoryType,
+        group_id: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ) -> AsyncIterator[MemoryModel]:
+        """
+        Walk all matching memories with keyset pages of at most batch_size records
+
+        Only one page is held in memory at a time, so exports of any size run in
+        constant memory. Errors are raised rather than ending the walk early.
+        """
+        batch_size = min(batch_size or get_export_batch_size(), MAX_FETCH_LIMIT)
+        cursor = None
+        pages = 0
+        while True:
+            response = await self.find_memories(
+                user_id=user_id,
+                memory_type=memory_type,
+                group_id=group_id,
+                start_time=start_time,
+                end_time=end_time,
+                limit=batch_size,
+                cursor=cursor,
+                raise_on_error=True,
+            )
+            pages += 1
+            for memory in response.memories:
+                yield memory
+            cursor = response.next_cursor
+            if not cursor:
+                break
+        logger.debug(
+            f"Exported {memory_type} memories for user_id={user_id}, "
+            f"group_id={group_id} in {pages} pages"
+        )
+
+
+def get_export_batch_size() -> int:
+    """Mongo page size for streaming exports (MEMORY_EXPORT_BATCH_SIZE, default 200)"""
+    return max(1, int(os.getenv("MEMORY_EXPORT_BATCH_SIZE", "200")))
+
 
 def get_fetch_memory_service() -> FetchMemoryServiceInterface:
     """Get memory retrieval service instance
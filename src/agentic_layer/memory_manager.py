@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, List, Optional, Tuple
 import logging
 import asyncio
 
 from datetime import datetime, timedelta
 import jieba
+from bson import ObjectId
 import numpy as np
 import time
 from typing import Dict, Any
@@ -18,7 +19,7 @@ from api_specs.memory_types import (
     Foresight,
     RawDataType,
 )
-from biz_layer.mem_memorize import memorize
+from biz_layer.mem_memorize import memorize, memorize_batch, GroupBatchMemorizeResult
 from api_specs.dtos import MemorizeRequest
 from .fetch_mem_service import get_fetch_memory_service
 from api_specs.dtos import (
@@ -28,7 +29,7 @@ from api_specs.dtos import (
     RetrieveMemRequest,
     RetrieveMemResponse,
 )
-from api_specs.memory_models import Metadata
+from api_specs.memory_models import MemoryModel, Metadata
 from core.di import get_bean_by_type
 from core.oxm.constants import MAGIC_ALL
 from infra_layer.adapters.out.search.repository.episodic_memory_es_repository import (
@@ -50,6 +51,9 @@ from common_utils.datetime_utils import (
 from infra_layer.adapters.out.persistence.repository.memcell_raw_repository import (
     MemCellRawRepository,
 )
+from infra_layer.adapters.out.persistence.document.memory.memcell import (
+    MemCellOriginalDataProjection,
+)
 from service.memory_request_log_service import MemoryRequestLogService
 from infra_layer.adapters.out.persistence.repository.group_user_profile_memory_raw_repository import (
     GroupUserProfileMemoryRawRepository,
@@ -67,6 +71,15 @@ from infra_layer.adapters.out.search.repository.foresight_milvus_repository impo
 from infra_layer.adapters.out.search.repository.event_log_milvus_repository import (
     EventLogMilvusRepository,
 )
+from infra_layer.adapters.out.persistence.document.memory.episodic_memory import (
+    EpisodicMemory,
+)
+from infra_layer.adapters.out.persistence.document.memory.event_log_record import (
+    EventLogRecord,
+)
+from infra_layer.adapters.out.persistence.document.memory.foresight_record import (
+    ForesightRecord,
+)
 from .vectorize_service import get_vectorize_service
 from .rerank_service import get_rerank_service
 from api_specs.memory_models import MemoryType, RetrieveMethod
@@ -74,6 +87,7 @@ from agentic_layer.metrics.retrieve_metrics import (
     record_retrieve_request,
     record_retrieve_stage,
     record_retrieve_error,
+    record_agentic_speculation,
 )
 import os
 from memory_layer.llm.llm_provider import LLMProvider
@@ -82,7 +96,12 @@ from agentic_layer.agentic_utils import (
     check_sufficiency,
     generate_multi_queries,
 )
-from agentic_layer.retrieval_utils import reciprocal_rank_fusion
+from agentic_layer.retrieval_utils import multi_rrf_fusion, reciprocal_rank_fusion
+from agentic_layer.memory_read_cache import (
+    get_memcell_read_cache,
+    get_group_user_profile_read_cache,
+    group_user_profile_cache_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +114,18 @@ ES_REPO_MAP = {
 }
 
 
+def _consume_task_exception(task: asyncio.Task) -> None:
+    """Retrieve a discarded task's exception so asyncio does not log it"""
+    if not task.cancelled():
+        task.exception()
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    """Cancel a task whose result is no longer needed, even if it already failed"""
+    task.cancel()
+    task.add_done_callback(_consume_task_exception)
+
+
 @dataclass
 class EventLogCandidate:
     """Event Log candidate object (used for retrieval from atomic_fact)"""
@@ -144,6 +175,17 @@ class MemoryManager:
         count = await memorize(memorize_request)
         return count
 
+    @trace_logger(operation_name="agentic_layer memory batch storage")
+    async def memorize_batch(
+        self, memorize_requests: List[MemorizeRequest]
+    ) -> List[GroupBatchMemorizeResult]:
+        """Memorize an ordered batch of messages spanning one or more groups.
+
+        Returns:
+            List[GroupBatchMemorizeResult]: Per-group message, MemCell and memory counts
+        """
+        return await memorize_batch(memorize_requests)
+
     # --------- Read path (query -> fetch_mem) ---------
     # Memory reading based on key-value, including static and dynamic memory
     @trace_logger(operation_name="agentic_layer memory reading")
@@ -170,6 +212,7 @@ class MemoryManager:
             end_time=request.end_time,
             version_range=request.version_range,
             limit=request.limit,
+            cursor=request.cursor,
         )
 
         # Note: response.metadata already contains complete employee information
@@ -181,6 +224,27 @@ class MemoryManager:
         )
         return response
 
+    def export_mem(self, request: FetchMemRequest) -> AsyncIterator[MemoryModel]:
+        """Stream every memory matching the fetch filters (limit/cursor are ignored)
+
+        Args:
+            request: FetchMemRequest with user/group/type/time filters
+
+        Returns:
+            Async iterator over memory models, paged through Mongo with keyset cursors
+        """
+        logger.debug(
+            f"export_mem called with request: user_id={request.user_id}, group_id={request.group_id}, "
+            f"memory_type={request.memory_type}"
+        )
+        return self._fetch_service.iter_memories(
+            user_id=request.user_id,
+            memory_type=request.memory_type,
+            group_id=request.group_id,
+            start_time=request.start_time,
+            end_time=request.end_time,
+        )
+
     # Memory reading based on retrieve_method, including static and dynamic memory
     @trace_logger(operation_name="agentic_layer memory retrieval")
     async def retrieve_mem(
@@ -298,16 +362,13 @@ class MemoryManager:
     ) -> RetrieveMemResponse:
         """Keyword-based memory retrieval"""
         start_time = time.perf_counter()
-        memory_type = (
-            retrieve_mem_request.memory_types[0].value
-            if retrieve_mem_request.memory_types
-            else 'unknown'
-        )
+        memory_type = self._get_memory_type_label(retrieve_mem_request)
 
         try:
-            hits = await self.get_keyword_search_results(
+            results_by_type = await self._keyword_search_by_type(
                 retrieve_mem_request, retrieve_method=RetrieveMethod.KEYWORD.value
             )
+            hits = self._fuse_across_types(results_by_type, retrieve_mem_request.top_k)
             duration = time.perf_counter() - start_time
             status = 'success' if hits else 'empty_result'
 
@@ -337,94 +398,161 @@ class MemoryManager:
         retrieve_mem_request: 'RetrieveMemRequest',
         retrieve_method: str = RetrieveMethod.KEYWORD.value,
     ) -> List[Dict[str, Any]]:
-        """Keyword search with stage-level metrics"""
-        stage_start = time.perf_counter()
-        memory_type = (
-            retrieve_mem_request.memory_types[0].value
-            if retrieve_mem_request.memory_types
-            else 'unknown'
+        """Keyword search over all requested memory types, returns flat list"""
+        results_by_type = await self._keyword_search_by_type(
+            retrieve_mem_request, retrieve_method=retrieve_method
         )
+        return [hit for hits in results_by_type.values() for hit in hits]
 
-        try:
-            # Get parameters from Request
-            if not retrieve_mem_request:
-                raise ValueError("retrieve_mem_request is required for retrieve_mem")
+    async def _keyword_search_by_type(
+        self,
+        retrieve_mem_request: 'RetrieveMemRequest',
+        retrieve_method: str = RetrieveMethod.KEYWORD.value,
+    ) -> Dict[MemoryType, List[Dict[str, Any]]]:
+        """Keyword search fanned out to every requested memory type
 
-            top_k = retrieve_mem_request.top_k
-            query = retrieve_mem_request.query
-            user_id = retrieve_mem_request.user_id
-            group_id = retrieve_mem_request.group_id
-            start_time = retrieve_mem_request.start_time
-            end_time = retrieve_mem_request.end_time
-            memory_types = retrieve_mem_request.memory_types
+        All per-type ES searches share one segmented query and are sent in a
+        single _msearch round trip.
 
-            # Convert query string to search word list
-            # Use jieba for search mode word segmentation, then filter stopwords
-            if query:
-                raw_words = list(jieba.cut_for_search(query))
-                query_words = filter_stopwords(raw_words, min_length=2)
-            else:
-                query_words = []
+        Returns:
+            Dict[MemoryType, List[Dict]]: hits per memory type, in request order
+        """
+        # Get parameters from Request
+        if not retrieve_mem_request:
+            raise ValueError("retrieve_mem_request is required for retrieve_mem")
 
-            logger.debug(f"query_words: {query_words}")
+        results = await self._keyword_search_batch(
+            [retrieve_mem_request], retrieve_method=retrieve_method
+        )
+        return results[0]
 
-            # Build time range filter conditions, handle None values
-            date_range = {}
-            if start_time is not None:
-                date_range["gte"] = start_time
-            if end_time is not None:
-                date_range["lte"] = end_time
+    def _build_keyword_query(
+        self, retrieve_mem_request: 'RetrieveMemRequest'
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """Segment the query into search words and build the time range filter"""
+        query = retrieve_mem_request.query
+        start_time = retrieve_mem_request.start_time
+        end_time = retrieve_mem_request.end_time
+
+        # Convert query string to search word list
+        # Use jieba for search mode word segmentation, then filter stopwords
+        if query:
+            raw_words = list(jieba.cut_for_search(query))
+            query_words = filter_stopwords(raw_words, min_length=2)
+        else:
+            query_words = []
 
-            mem_type = memory_types[0]
+        logger.debug(f"query_words: {query_words}")
 
-            repo_class = ES_REPO_MAP.get(mem_type)
-            if not repo_class:
-                logger.warning(f"Unsupported memory_type: {mem_type}")
-                return []
+        # Build time range filter conditions, handle None values
+        date_range = {}
+        if start_time is not None:
+            date_range["gte"] = start_time
+        if end_time is not None:
+            date_range["lte"] = end_time
+        return query_words, date_range
 
-            es_repo = get_bean_by_type(repo_class)
-            logger.debug(f"Using {repo_class.__name__} for {mem_type}")
+    async def _keyword_search_batch(
+        self,
+        retrieve_mem_requests: List['RetrieveMemRequest'],
+        retrieve_method: str = RetrieveMethod.KEYWORD.value,
+    ) -> List[Dict[MemoryType, List[Dict[str, Any]]]]:
+        """Keyword search for several requests in a single _msearch round trip
 
-            results = await es_repo.multi_search(
-                query=query_words,
-                user_id=user_id,
-                group_id=group_id,
-                size=top_k,
-                from_=0,
-                date_range=date_range,
-            )
+        Every (request, memory type) pair becomes one search of the batch, so
+        multi-query expansion and multi-type fan-out cost one ES round trip.
+        Stage metrics are recorded per memory type with the shared latency.
 
-            # Mark memory_type, search_source, and unified score
-            if results:
-                for r in results:
-                    r['memory_type'] = mem_type.value
-                    r['_search_source'] = RetrieveMethod.KEYWORD.value
-                    r['id'] = r.get('_id', '')  # Unify ES '_id' to 'id'
-                    r['score'] = r.get('_score', 0.0)  # Unified score field
+        Returns:
+            List[Dict[MemoryType, List[Dict]]]: hits per memory type, per request
+        """
+        stage_start = time.perf_counter()
+        results: List[Dict[MemoryType, List[Dict[str, Any]]]] = []
+        searches = []
+        slots: List[Tuple[int, MemoryType]] = []
+        msearch_repo = None
+
+        for index, request in enumerate(retrieve_mem_requests):
+            query_words, date_range = self._build_keyword_query(request)
+            results.append({})
+            for mem_type in self._get_memory_types(request):
+                results[index][mem_type] = []
+                repo_class = ES_REPO_MAP.get(mem_type)
+                if not repo_class:
+                    logger.warning(f"Unsupported memory_type: {mem_type}")
+                    continue
+
+                es_repo = get_bean_by_type(repo_class)
+                msearch_repo = msearch_repo or es_repo
+                searches.append(
+                    es_repo.build_multi_search(
+                        query=query_words,
+                        user_id=request.user_id,
+                        group_id=request.group_id,
+                        size=request.top_k,
+                        from_=0,
+                        date_range=date_range,
+                    )
+                )
+                slots.append((index, mem_type))
 
-            # Record stage metrics
-            record_retrieve_stage(
-                retrieve_method=retrieve_method,
-                stage=RetrieveMethod.KEYWORD.value,
-                memory_type=memory_type,
-                duration_seconds=time.perf_counter() - stage_start,
-            )
+        if not searches:
+            return results
 
-            return results or []
+        mem_type_labels = list(dict.fromkeys(mem_type.value for _, mem_type in slots))
+        errors: List[Exception] = []
+        try:
+            # A failed search only loses its own hits, not the whole batch
+            hits_list = await msearch_repo.msearch(searches, raise_on_error=False)
+            errors = [h for h in hits_list if isinstance(h, Exception)]
+            for error in errors:
+                record_retrieve_error(
+                    retrieve_method=retrieve_method,
+                    stage=RetrieveMethod.KEYWORD.value,
+                    error_type=self._classify_retrieve_error(error),
+                )
+            hits_list = self._drop_failed_results(
+                hits_list, [f"keyword {mem_type.value}" for _, mem_type in slots], list
+            )
         except Exception as e:
-            record_retrieve_stage(
-                retrieve_method=retrieve_method,
-                stage=RetrieveMethod.KEYWORD.value,
-                memory_type=memory_type,
-                duration_seconds=time.perf_counter() - stage_start,
+            for label in mem_type_labels:
+                record_retrieve_stage(
+                    retrieve_method=retrieve_method,
+                    stage=RetrieveMethod.KEYWORD.value,
+                    memory_type=label,
+                    duration_seconds=time.perf_counter() - stage_start,
+                )
+            if not errors:
+                record_retrieve_error(
+                    retrieve_method=retrieve_method,
+                    stage=RetrieveMethod.KEYWORD.value,
+                    error_type=self._classify_retrieve_error(e),
+                )
+            logger.error(
+                f"Error in keyword msearch ({len(searches)} searches, "
+                f"types={mem_type_labels}): {e}"
             )
-            record_retrieve_error(
+            raise
+
+        # Mark memory_type, search_source, and unified score
+        for (index, mem_type), hits in zip(slots, hits_list):
+            for r in hits:
+                r['memory_type'] = mem_type.value
+                r['_search_source'] = RetrieveMethod.KEYWORD.value
+                r['id'] = r.get('_id', '')  # Unify ES '_id' to 'id'
+                r['score'] = r.get('_score', 0.0)  # Unified score field
+            results[index][mem_type] = hits
+
+        # Record stage metrics (one shared round trip for all types)
+        duration = time.perf_counter() - stage_start
+        for label in mem_type_labels:
+            record_retrieve_stage(
                 retrieve_method=retrieve_method,
                 stage=RetrieveMethod.KEYWORD.value,
-                error_type=self._classify_retrieve_error(e),
+                memory_type=label,
+                duration_seconds=duration,
             )
-            logger.error(f"Error in get_keyword_search_results: {e}")
-            raise
+        return results
 
     # Vector-based memory retrieval
     @trace_logger(operation_name="agentic_layer vector memory retrieval")
@@ -433,16 +561,13 @@ class MemoryManager:
     ) -> RetrieveMemResponse:
         """Vector-based memory retrieval"""
         start_time = time.perf_counter()
-        memory_type = (
-            retrieve_mem_request.memory_types[0].value
-            if retrieve_mem_request.memory_types
-            else 'unknown'
-        )
+        memory_type = self._get_memory_type_label(retrieve_mem_request)
 
         try:
-            hits = await self.get_vector_search_results(
+            results_by_type = await self._vector_search_by_type(
                 retrieve_mem_request, retrieve_method=RetrieveMethod.VECTOR.value
             )
+            hits = self._fuse_across_types(results_by_type, retrieve_mem_request.top_k)
             duration = time.perf_counter() - start_time
             status = 'success' if hits else 'empty_result'
 
@@ -472,12 +597,27 @@ class MemoryManager:
         retrieve_mem_request: 'RetrieveMemRequest',
         retrieve_method: str = RetrieveMethod.VECTOR.value,
     ) -> List[Dict[str, Any]]:
-        """Vector search with stage-level metrics (embedding + milvus_search)"""
-        memory_type = (
-            retrieve_mem_request.memory_types[0].value
-            if retrieve_mem_request.memory_types
-            else 'unknown'
+        """Vector search over all requested memory types, returns flat list"""
+        results_by_type = await self._vector_search_by_type(
+            retrieve_mem_request, retrieve_method=retrieve_method
         )
+        return [hit for hits in results_by_type.values() for hit in hits]
+
+    async def _vector_search_by_type(
+        self,
+        retrieve_mem_request: 'RetrieveMemRequest',
+        retrieve_method: str = RetrieveMethod.VECTOR.value,
+    ) -> Dict[MemoryType, List[Dict[str, Any]]]:
+        """Vector search fanned out to every requested memory type concurrently
+
+        The query is embedded once and the vector is shared by all per-type
+        Milvus searches.
+
+        Returns:
+            Dict[MemoryType, List[Dict]]: hits per memory type, in request order
+        """
+        memory_type = self._get_memory_type_label(retrieve_mem_request)
+        embedding_start = time.perf_counter()
 
         try:
             # Get parameters from Request
@@ -492,23 +632,11 @@ class MemoryManager:
             if not query:
                 raise ValueError("query is required for retrieve_mem_vector")
 
-            user_id = retrieve_mem_request.user_id
-            group_id = retrieve_mem_request.group_id
-            top_k = retrieve_mem_request.top_k
-            start_time = retrieve_mem_request.start_time
-            end_time = retrieve_mem_request.end_time
-            mem_type = retrieve_mem_request.memory_types[0]
-
-            logger.debug(
-                f"retrieve_mem_vector called with query: {query}, user_id: {user_id}, group_id: {group_id}, top_k: {top_k}"
-            )
-
             # Get vectorization service
             vectorize_service = get_vectorize_service()
 
-            # Convert query text to vector (embedding stage)
+            # Convert query text to vector once for all memory types (embedding stage)
             logger.debug(f"Starting to vectorize query text: {query}")
-            embedding_start = time.perf_counter()
             query_vector = await vectorize_service.get_embedding(query)
             query_vector_list = query_vector.tolist()  # Convert to list format
             record_retrieve_stage(
@@ -520,6 +648,59 @@ class MemoryManager:
             logger.debug(
                 f"Query text vectorization completed, vector dimension: {len(query_vector_list)}"
             )
+        except Exception as e:
+            record_retrieve_stage(
+                retrieve_method=retrieve_method,
+                stage='embedding',
+                memory_type=memory_type,
+                duration_seconds=time.perf_counter() - embedding_start,
+            )
+            record_retrieve_error(
+                retrieve_method=retrieve_method,
+                stage='embedding',
+                error_type=self._classify_retrieve_error(e),
+            )
+            logger.error(f"Error in get_vector_search_results: {e}")
+            raise
+
+        mem_types = self._get_memory_types(retrieve_mem_request)
+        results = await asyncio.gather(
+            *[
+                self._vector_search_single_type(
+                    retrieve_mem_request,
+                    mem_type,
+                    query_vector_list,
+                    retrieve_method=retrieve_method,
+                )
+                for mem_type in mem_types
+            ],
+            return_exceptions=True,
+        )
+        results = self._drop_failed_results(
+            results, [f"vector {mem_type.value}" for mem_type in mem_types], list
+        )
+        return dict(zip(mem_types, results))
+
+    async def _vector_search_single_type(
+        self,
+        retrieve_mem_request: 'RetrieveMemRequest',
+        mem_type: MemoryType,
+        query_vector_list: List[float],
+        retrieve_method: str = RetrieveMethod.VECTOR.value,
+    ) -> List[Dict[str, Any]]:
+        """Milvus search for a single memory type with stage-level metrics"""
+        milvus_start = time.perf_counter()
+
+        try:
+            user_id = retrieve_mem_request.user_id
+            group_id = retrieve_mem_request.group_id
+            top_k = retrieve_mem_request.top_k
+            start_time = retrieve_mem_request.start_time
+            end_time = retrieve_mem_request.end_time
+
+            logger.debug(
+                f"vector search for {mem_type}: user_id: {user_id}, group_id: {group_id}, top_k: {top_k}"
+            )
 
             # Select Milvus repository based on memory type
             match mem_type:
@@ -563,7 +744,6 @@ class MemoryManager:
                     current_time_dt = from_iso_format(retrieve_mem_request.current_time)
 
             # Call Milvus vector search (pass different parameters based on memory type)
-            milvus_start = time.perf_counter()
             if mem_type == MemoryType.FORESIGHT:
                 # Foresight: supports time range and validity filtering, supports radius parameter
                 search_results = await milvus_repo.vector_search(
@@ -592,7 +772,7 @@ class MemoryManager:
             record_retrieve_stage(
                 retrieve_method=retrieve_method,
                 stage='milvus_search',
-                memory_type=memory_type,
+                memory_type=mem_type.value,
                 duration_seconds=time.perf_counter() - milvus_start,
             )
 
@@ -606,7 +786,7 @@ class MemoryManager:
             record_retrieve_stage(
                 retrieve_method=retrieve_method,
                 stage=RetrieveMethod.VECTOR.value,
-                memory_type=memory_type,
+                memory_type=mem_type.value,
                 duration_seconds=time.perf_counter() - milvus_start,
             )
             record_retrieve_error(
@@ -614,7 +794,7 @@ class MemoryManager:
                 stage=RetrieveMethod.VECTOR.value,
                 error_type=self._classify_retrieve_error(e),
             )
-            logger.error(f"Error in get_vector_search_results: {e}")
+            logger.error(f"Error in vector search for {mem_type}: {e}")
             raise
 
     # Hybrid memory retrieval
@@ -624,11 +804,7 @@ class MemoryManager:
     ) -> RetrieveMemResponse:
         """Hybrid memory retrieval: keyword + vector + rerank"""
         start_time = time.perf_counter()
-        memory_type = (
-            retrieve_mem_request.memory_types[0].value
-            if retrieve_mem_request.memory_types
-            else 'unknown'
-        )
+        memory_type = self._get_memory_type_label(retrieve_mem_request)
 
         try:
             hits = await self._search_hybrid(
@@ -698,14 +874,25 @@ class MemoryManager:
         request: 'RetrieveMemRequest',
         retrieve_method: str = RetrieveMethod.HYBRID.value,
     ) -> List[Dict]:
-        """Core hybrid search: keyword + vector + rerank, returns flat list"""
-        memory_type = (
-            request.memory_types[0].value if request.memory_types else 'unknown'
-        )
-        # Run keyword and vector search concurrently
-        kw_results, vec_results = await asyncio.gather(
-            self.get_keyword_search_results(request, retrieve_method=retrieve_method),
-            self.get_vector_search_results(request, retrieve_method=retrieve_method),
+        """Core hybrid search: keyword + vector + rerank, returns flat list
+
+        All requested memory types are searched concurrently and reranked
+        together under a single top_k.
+        """
+        memory_type = self._get_memory_type_label(request)
+        # Run keyword and vector search concurrently, a failed leg yields no hits
+        kw_results, vec_results = self._drop_failed_results(
+            await asyncio.gather(
+                self.get_keyword_search_results(
+                    request, retrieve_method=retrieve_method
+                ),
+                self.get_vector_search_results(
+                    request, retrieve_method=retrieve_method
+                ),
+                return_exceptions=True,
+            ),
+            ["keyword", "vector"],
+            list,
         )
         # Deduplicate by id
         seen_ids = {h.get('id') for h in kw_results}
@@ -716,27 +903,98 @@ class MemoryManager:
             request.query, merged_results, request.top_k, memory_type, retrieve_method
         )
 
+    async def _search_hybrid_batch(
+        self,
+        requests: List['RetrieveMemRequest'],
+        retrieve_method: str = RetrieveMethod.HYBRID.value,
+    ) -> List[Any]:
+        """Hybrid search for several queries with one batched keyword round trip
+
+        Keyword searches of all requests go out in a single _msearch; vector
+        search and rerank still run per request, concurrently.
+
+        Returns:
+            List: reranked hits per request, or the exception that request raised
+        """
+        # Keyword batch and per-request vector searches run concurrently
+        kw_batch, vec_by_request = await asyncio.gather(
+            self._keyword_search_batch(requests, retrieve_method=retrieve_method),
+            asyncio.gather(
+                *[
+                    self.get_vector_search_results(r, retrieve_method=retrieve_method)
+                    for r in requests
+                ],
+                return_exceptions=True,
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(vec_by_request, BaseException):
+            raise vec_by_request
+        if isinstance(kw_batch, BaseException):
+            kw_by_request = [kw_batch] * len(requests)
+        else:
+            kw_by_request = [
+                [hit for hits in kw_by_type.values() for hit in hits]
+                for kw_by_type in kw_batch
+            ]
+
+        async def finish(request, kw_results, vec_results) -> List[Dict]:
+            # A failed keyword or vector leg yields no hits, the other one is kept
+            kw_results, vec_results = self._drop_failed_results(
+                [kw_results, vec_results], ["keyword", "vector"], list
+            )
+            # Deduplicate by id
+            seen_ids = {h.get('id') for h in kw_results}
+            merged_results = kw_results + [
+                h for h in vec_results if h.get('id') not in seen_ids
+            ]
+            return await self._rerank(
+                request.query,
+                merged_results,
+                request.top_k,
+                self._get_memory_type_label(request),
+                retrieve_method,
+            )
+
+        return await asyncio.gather(
+            *[
+                finish(r, kw, vec)
+                for r, kw, vec in zip(requests, kw_by_request, vec_by_request)
+            ],
+            return_exceptions=True,
+        )
+
     async def _search_rrf(
         self,
         request: 'RetrieveMemRequest',
         retrieve_method: str = RetrieveMethod.RRF.value,
     ) -> List[Dict]:
-        """Core RRF search: keyword + vector + RRF fusion, returns flat list"""
-        memory_type = (
-            request.memory_types[0].value if request.memory_types else 'unknown'
-        )
+        """Core RRF search: keyword + vector + RRF fusion, returns flat list
 
-        # Run keyword and vector search concurrently
-        kw, vec = await asyncio.gather(
-            self.get_keyword_search_results(request, retrieve_method=retrieve_method),
-            self.get_vector_search_results(request, retrieve_method=retrieve_method),
+        Keyword and vector rankings are fused per memory type; the rank-based
+        RRF scores are then comparable across types and merged under top_k.
+        """
+        memory_type = self._get_memory_type_label(request)
+
+        # Run keyword and vector search concurrently, a failed leg yields no hits
+        kw_by_type, vec_by_type = self._drop_failed_results(
+            await asyncio.gather(
+                self._keyword_search_by_type(request, retrieve_method=retrieve_method),
+                self._vector_search_by_type(request, retrieve_method=retrieve_method),
+                return_exceptions=True,
+            ),
+            ["keyword", "vector"],
+            dict,
         )
 
         # RRF fusion with stage metrics
         rrf_start = time.perf_counter()
-        kw_tuples = [(h, h.get('score', 0)) for h in kw]
-        vec_tuples = [(h, h.get('score', 0)) for h in vec]
-        fused = reciprocal_rank_fusion(kw_tuples, vec_tuples, k=60)
+        fused = []
+        for mem_type in self._get_memory_types(request):
+            kw_tuples = [(h, h.get('score', 0)) for h in kw_by_type.get(mem_type, [])]
+            vec_tuples = [(h, h.get('score', 0)) for h in vec_by_type.get(mem_type, [])]
+            fused.extend(reciprocal_rank_fusion(kw_tuples, vec_tuples, k=60))
+        fused.sort(key=lambda x: x[1], reverse=True)
         record_retrieve_stage(
             retrieve_method=retrieve_method,
             stage='rrf_fusion',
@@ -746,6 +1004,65 @@ class MemoryManager:
 
         return [dict(doc, score=score) for doc, score in fused[: request.top_k]]
 
+    def _get_memory_types(self, request: 'RetrieveMemRequest') -> List[MemoryType]:
+        """Requested memory types, deduplicated and in request order"""
+        if not request or not request.memory_types:
+            return []
+        return list(dict.fromkeys(request.memory_types))
+
+    def _get_memory_type_label(self, request: 'RetrieveMemRequest') -> str:
+        """Memory type metric label, fixed to 'multi' for multi-type fan-out
+
+        Request-level metrics cannot be split by type, and joining the types
+        would create one label value per combination; per-type stage metrics
+        carry the individual types instead.
+        """
+        mem_types = self._get_memory_types(request)
+        if not mem_types:
+            return 'unknown'
+        if len(mem_types) > 1:
+            return 'multi'
+        return mem_types[0].value
+
+    def _drop_failed_results(
+        self, results: List[Any], labels: List[str], empty: Callable[[], Any]
+    ) -> List[Any]:
+        """Replace results of failed concurrent searches with `empty()`
+
+        One failing memory type (or search leg) must not discard the others;
+        the first error is only re-raised when every search failed.
+        """
+        errors = [r for r in results if isinstance(r, BaseException)]
+        for error in errors:
+            if not isinstance(error, Exception):
+                raise error
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        for label, result in zip(labels, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Search for {label} failed, skipping it: {result}")
+        return [empty() if isinstance(r, Exception) else r for r in results]
+
+    def _fuse_across_types(
+        self, results_by_type: Dict[MemoryType, List[Dict]], top_k: int
+    ) -> List[Dict]:
+        """Merge per-type ranked hits under a single top_k
+
+        Raw scores (BM25 per index, cosine per collection) are not comparable
+        across memory types, so multiple types are interleaved by RRF rank while
+        each hit keeps its original score.
+        """
+        ranked_lists = [hits for hits in results_by_type.values() if hits]
+        if not ranked_lists:
+            return []
+        if len(ranked_lists) == 1:
+            return ranked_lists[0][:top_k]
+
+        fused = multi_rrf_fusion(
+            [[(h, h.get('score', 0)) for h in hits] for hits in ranked_lists]
+        )
+        return [doc for doc, _ in fused[:top_k]]
+
     def _classify_retrieve_error(self, error: Exception) -> str:
         """Classify error type for metrics"""
         error_str = str(error).lower()
@@ -784,7 +1101,11 @@ class MemoryManager:
                 ),
             )
         memories, scores, importance_scores, original_data, total_count = (
-            await self.group_by_groupid_stratagy(hits, source_type=source_type)
+            await self.group_by_groupid_stratagy(
+                hits,
+                source_type=source_type,
+                include_original_data=req.include_original_data if req else True,
+            )
         )
         return RetrieveMemResponse(
             memories=memories,
@@ -808,11 +1129,7 @@ class MemoryManager:
     ) -> RetrieveMemResponse:
         """RRF-based memory retrieval: keyword + vector + RRF fusion"""
         start_time = time.perf_counter()
-        memory_type = (
-            retrieve_mem_request.memory_types[0].value
-            if retrieve_mem_request.memory_types
-            else 'unknown'
-        )
+        memory_type = self._get_memory_type_label(retrieve_mem_request)
 
         try:
             hits = await self._search_rrf(
@@ -850,12 +1167,15 @@ class MemoryManager:
         """Agentic retrieval: LLM-guided multi-round intelligent retrieval
 
         Process: Round 1 (Hybrid) → Rerank → LLM sufficiency check → Round 2 (multi-query) → Merge → Final Rerank
+
+        With AgenticConfig.speculative_round2, round 2 starts alongside the
+        sufficiency check and is cancelled if round 1 is judged sufficient.
         """
         start_time = time.perf_counter()
         req = retrieve_mem_request  # alias
         top_k = req.top_k
         config = AgenticConfig()
-        memory_type = req.memory_types[0].value if req.memory_types else 'unknown'
+        memory_type = self._get_memory_type_label(req)
 
         try:
             llm_provider = LLMProvider(
@@ -877,7 +1197,14 @@ class MemoryManager:
                 top_k=config.round1_top_n,
                 memory_types=req.memory_types,
             )
+            stage_start = time.perf_counter()
             round1 = await self._search_hybrid(req1, retrieve_method='agentic')
+            record_retrieve_stage(
+                retrieve_method=RetrieveMethod.AGENTIC.value,
+                stage='agentic_round1',
+                memory_type=memory_type,
+                duration_seconds=time.perf_counter() - stage_start,
+            )
             logger.info(f"Round 1: {len(round1)} memories")
 
             if not round1:
@@ -894,25 +1221,53 @@ class MemoryManager:
             # ========== Rerank → max(5, top_k) for LLM & return ==========
             rerank_n = max(config.round1_rerank_top_n, top_k)
             reranked = await self._rerank(
-                req.query, round1, rerank_n, memory_type, 'agentic',
+                req.query,
+                round1,
+                rerank_n,
+                memory_type,
+                'agentic',
                 instruction=config.reranker_instruction,
             )
             # Use top 5 for sufficiency check
-            topn_for_llm = reranked[:config.round1_rerank_top_n]
+            topn_for_llm = reranked[: config.round1_rerank_top_n]
             topn_pairs = [(m, m.get("score", 0)) for m in topn_for_llm]
 
-            # ========== LLM sufficiency check ==========
-            is_sufficient, reasoning, missing_info = await check_sufficiency(
-                query=req.query,
-                results=topn_pairs,
-                llm_provider=llm_provider,
-                max_docs=config.round1_rerank_top_n,
-            )
+            # ========== LLM sufficiency check (+ speculative round 2) ==========
+            speculative_task = None
+            if config.speculative_round2:
+                # Missing information is not known yet: expand from round 1 alone
+                speculative_task = asyncio.create_task(
+                    self._agentic_round2(
+                        req, topn_pairs, [], config, llm_provider, memory_type
+                    )
+                )
+
+            try:
+                stage_start = time.perf_counter()
+                is_sufficient, reasoning, missing_info = await check_sufficiency(
+                    query=req.query,
+                    results=topn_pairs,
+                    llm_provider=llm_provider,
+                    max_docs=config.round1_rerank_top_n,
+                )
+                record_retrieve_stage(
+                    retrieve_method=RetrieveMethod.AGENTIC.value,
+                    stage='sufficiency_check',
+                    memory_type=memory_type,
+                    duration_seconds=time.perf_counter() - stage_start,
+                )
+            except BaseException:
+                if speculative_task is not None:
+                    _discard_task(speculative_task)
+                raise
             logger.info(
                 f"LLM: {'Sufficient' if is_sufficient else 'Insufficient'} - {reasoning}"
             )
 
             if is_sufficient:
+                if speculative_task is not None:
+                    _discard_task(speculative_task)
+                    record_agentic_speculation(memory_type, 'discarded')
                 # Return reranked results (already done above, no extra rerank)
                 final_results = reranked[:top_k]
                 duration = time.perf_counter() - start_time
@@ -926,36 +1281,19 @@ class MemoryManager:
                 return await self._to_response(final_results, req)
 
             # ========== Round 2: Multi-query ==========
-            refined_queries, _ = await generate_multi_queries(
-                original_query=req.query,
-                results=topn_pairs,
-                missing_info=missing_info,
-                llm_provider=llm_provider,
-                max_docs=config.round1_rerank_top_n,
-                num_queries=config.num_queries,
-            )
-            logger.info(f"Generated {len(refined_queries)} queries")
-
-            # Parallel hybrid search
-            async def do_search(q: str) -> List[Dict]:
-                return await self._search_hybrid(
-                    RetrieveMemRequest(
-                        query=q,
-                        user_id=req.user_id,
-                        group_id=req.group_id,
-                        top_k=config.round2_per_query_top_n,
-                        memory_types=req.memory_types,
-                    ),
-                    retrieve_method='agentic',
+            all_round2 = None
+            if speculative_task is not None:
+                try:
+                    all_round2 = await speculative_task
+                    record_agentic_speculation(memory_type, 'used')
+                except Exception as e:
+                    logger.warning(f"Speculative round 2 failed, rerunning: {e}")
+                    record_agentic_speculation(memory_type, 'failed')
+            if all_round2 is None:
+                all_round2 = await self._agentic_round2(
+                    req, topn_pairs, missing_info, config, llm_provider, memory_type
                 )
 
-            round2_results = await asyncio.gather(
-                *[do_search(q) for q in refined_queries], return_exceptions=True
-            )
-            all_round2 = [
-                h for r in round2_results if not isinstance(r, Exception) for h in r
-            ]
-
             # Deduplicate and merge
             seen_ids = {m.get("id") for m in round1}
             round2_unique = [m for m in all_round2 if m.get("id") not in seen_ids]
@@ -964,7 +1302,11 @@ class MemoryManager:
 
             # ========== Final Rerank ==========
             final = await self._rerank(
-                req.query, combined, top_k, memory_type, 'agentic',
+                req.query,
+                combined,
+                top_k,
+                memory_type,
+                'agentic',
                 instruction=config.reranker_instruction,
             )
 
@@ -991,6 +1333,67 @@ class MemoryManager:
             logger.error(f"Error in retrieve_mem_agentic: {e}", exc_info=True)
             return await self._to_response([], req)
 
+    async def _agentic_round2(
+        self,
+        req: 'RetrieveMemRequest',
+        topn_pairs: List[Tuple[Dict, float]],
+        missing_info: List[str],
+        config: AgenticConfig,
+        llm_provider: LLMProvider,
+        memory_type: str,
+    ) -> List[Dict]:
+        """Agentic round 2: generate refined queries and search them
+
+        Returns:
+            List[Dict]: hits of all refined queries (not deduplicated)
+        """
+        stage_start = time.perf_counter()
+        refined_queries, _ = await generate_multi_queries(
+            original_query=req.query,
+            results=topn_pairs,
+            missing_info=missing_info,
+            llm_provider=llm_provider,
+            max_docs=config.round1_rerank_top_n,
+            num_queries=config.num_queries,
+        )
+        record_retrieve_stage(
+            retrieve_method=RetrieveMethod.AGENTIC.value,
+            stage='multi_query',
+            memory_type=memory_type,
+            duration_seconds=time.perf_counter() - stage_start,
+        )
+        logger.info(f"Generated {len(refined_queries)} queries")
+
+        # Batched hybrid search: all keyword queries in one _msearch
+        round2_requests = [
+            RetrieveMemRequest(
+                query=q,
+                user_id=req.user_id,
+                group_id=req.group_id,
+                top_k=config.round2_per_query_top_n,
+                memory_types=req.memory_types,
+            )
+            for q in refined_queries
+        ]
+        stage_start = time.perf_counter()
+        try:
+            round2_results = await self._search_hybrid_batch(
+                round2_requests, retrieve_method='agentic'
+            )
+        except Exception as e:
+            logger.warning(f"Round 2 search failed: {e}")
+            round2_results = []
+        for query, result in zip(refined_queries, round2_results):
+            if isinstance(result, Exception):
+                logger.warning(f"Round 2 search for query {query!r} failed: {result}")
+        record_retrieve_stage(
+            retrieve_method=RetrieveMethod.AGENTIC.value,
+            stage='agentic_round2',
+            memory_type=memory_type,
+            duration_seconds=time.perf_counter() - stage_start,
+        )
+        return [h for r in round2_results if not isinstance(r, Exception) for h in r]
+
     def _calculate_importance_score(
         self, importance_evidence: Optional[Dict[str, Any]]
     ) -> float:
@@ -1037,39 +1440,35 @@ class MemoryManager:
     async def _batch_get_memcells(
         self, event_ids: List[str], batch_size: int = 100
     ) -> Dict[str, Any]:
-        """Batch get MemCells, supports batch queries to control single query size
+        """Batch get the raw messages of MemCells, batches are queried concurrently
+
+        Only `original_data` is loaded (MemCellOriginalDataProjection), the response
+        builder reads nothing else from the MemCell. Reads go through the memory read
+        cache, only misses hit MongoDB.
 
         Args:
             event_ids: List of event_id to get
             batch_size: Number of items per batch, default 100
 
         Returns:
-            Dict[event_id, MemCell]: Mapping dictionary from event_id to MemCell
+            Dict[event_id, MemCellOriginalDataProjection]: Mapping dictionary from event_id to MemCell
         """
         if not event_ids:
             return {}
 
-        # Deduplicate event_ids
-        unique_event_ids = list(set(event_ids))
-        logger.debug(
-            f"Batch get MemCells: Total {len(unique_event_ids)} (before deduplication: {len(event_ids)})"
-        )
-
         memcell_repo = get_bean_by_type(MemCellRawRepository)
-        all_memcells = {}
 
-        # Batch get
-        for i in range(0, len(unique_event_ids), batch_size):
-            batch_event_ids = unique_event_ids[i : i + batch_size]
-            logger.debug(
-                f"Getting batch {i // batch_size + 1} MemCells: {len(batch_event_ids)} items"
+        async def load_memcells(missing_ids: List[str]) -> Dict[str, Any]:
+            return await memcell_repo.get_by_event_ids_batched(
+                missing_ids,
+                projection_model=MemCellOriginalDataProjection,
+                batch_size=batch_size,
             )
 
-            batch_memcells = await memcell_repo.get_by_event_ids(batch_event_ids)
-            all_memcells.update(batch_memcells)
+        all_memcells = await get_memcell_read_cache().get_many(event_ids, load_memcells)
 
         logger.debug(
-            f"Batch get MemCells completed: Successfully retrieved {len(all_memcells)} items"
+            f"Batch get MemCells completed: Successfully retrieved {len(all_memcells)} items (requested {len(event_ids)})"
         )
         return all_memcells
 
@@ -1094,13 +1493,88 @@ class MemoryManager:
         )
 
         group_user_profile_repo = get_bean_by_type(GroupUserProfileMemoryRawRepository)
-        profiles = await group_user_profile_repo.batch_get_by_user_groups(unique_pairs)
+        pairs_by_key = {
+            group_user_profile_cache_key(user_id, group_id): (user_id, group_id)
+            for user_id, group_id in unique_pairs
+        }
+
+        async def load_profiles(missing_keys: List[str]) -> Dict[str, Any]:
+            loaded = await group_user_profile_repo.batch_get_by_user_groups(
+                [pairs_by_key[key] for key in missing_keys]
+            )
+            # Missing profiles come back as None and are cached as such
+            return {
+                key: loaded[pairs_by_key[key]]
+                for key in missing_keys
+                if pairs_by_key[key] in loaded
+            }
+
+        cached = await get_group_user_profile_read_cache().get_many(
+            list(pairs_by_key), load_profiles
+        )
+        profiles = {pairs_by_key[key]: profile for key, profile in cached.items()}
 
         logger.debug(
             f"Batch get group user profiles completed: Successfully retrieved {len([v for v in profiles.values() if v is not None])} items"
         )
         return profiles
 
+    async def _hydrate_milvus_metadata(
+        self, search_results: List[Dict[str, Any]]
+    ) -> None:
+        """Load the metadata of vector hits searched without it (summary output profile)
+
+        Milvus keeps a JSON copy of these fields; for the final hits only, they are
+        read from the MongoDB source documents (Milvus id == MongoDB _id) instead.
+        Each type loads the fields its Milvus converter puts in the metadata JSON,
+        so hydrated hits match hits searched with the full profile.
+        """
+        missing: Dict[str, List[Dict[str, Any]]] = {}
+        for hit in search_results:
+            if (
+                hit.get('_search_source') == RetrieveMethod.VECTOR.value
+                and 'metadata' not in hit
+            ):
+                missing.setdefault(hit.get('memory_type'), []).append(hit)
+        if not missing:
+            return
+
+        # (document model, metadata fields read by _extract_hit_fields_from_milvus)
+        document_models = {
+            MemoryType.EPISODIC_MEMORY.value: (
+                EpisodicMemory,
+                (
+                    'memcell_event_id_list',
+                    'subject',
+                    'summary',
+                    'participants',
+                    'extend',
+                ),
+            ),
+            MemoryType.EVENT_LOG.value: (EventLogRecord, ('extend',)),
+            MemoryType.FORESIGHT.value: (ForesightRecord, ('extend',)),
+        }
+
+        async def load(memory_type: str, hits: List[Dict[str, Any]]) -> None:
+            model, fields = document_models.get(memory_type, (None, ()))
+            object_ids = [
+                ObjectId(hit['id']) for hit in hits if ObjectId.is_valid(hit.get('id'))
+            ]
+            docs = {}
+            if model is not None and object_ids:
+                rows = (
+                    await model.get_pymongo_collection()
+                    .find({"_id": {"$in": object_ids}}, {field: 1 for field in fields})
+                    .to_list(length=None)
+                )
+                docs = {str(row.pop('_id')): row for row in rows}
+            for hit in hits:
+                hit['metadata'] = docs.get(hit.get('id'), {})
+
+        await asyncio.gather(
+            *(load(memory_type, hits) for memory_type, hits in missing.items())
+        )
+
     def _get_type_str(self, val) -> str:
         """Extract string value of type field"""
         if isinstance(val, RawDataType):
@@ -1167,16 +1641,20 @@ class MemoryManager:
         self,
         search_results: List[Dict[str, Any]],
         source_type: str = RetrieveMethod.VECTOR.value,
+        include_original_data: bool = True,
     ) -> tuple:
         """Generic search result grouping processing strategy
 
         Args:
             search_results: List of search results
             source_type: Retrieval method (keyword/vector/hybrid)
+            include_original_data: Whether to load MemCell raw messages into original_data
 
         Returns:
             tuple: (memories, scores, importance_scores, original_data, total_count)
         """
+        await self._hydrate_milvus_metadata(search_results)
+
         # Step 1: Collect all data needed for queries
         all_memcell_event_ids = []
         all_user_group_pairs = []
@@ -1187,7 +1665,7 @@ class MemoryManager:
             user_id = fields['user_id']
             group_id = fields['group_id']
 
-            if memcell_event_id_list:
+            if memcell_event_id_list and include_original_data:
                 all_memcell_event_ids.extend(memcell_event_id_list)
 
             # Collect user_id and group_id pairs
@@ -1240,7 +1718,7 @@ class MemoryManager:
             # Get memcell data from cache (foresight doesn't need this)
             memory_type_value = hit.get('memory_type', 'episodic_memory')
             memcells = []
-            if memcell_event_id_list:
+            if memcell_event_id_list and include_original_data:
                 # Get memcells from cache in original order
                 for event_id in memcell_event_id_list:
                     memcell = memcells_cache.get(event_id)
@@ -0,0 +1,394 @@
+"""
+Memory Read Cache
+
+Tenant-aware read-through cache for the documents the search path re-reads on
+every request:
+- MemCells (raw messages), keyed by event_id
+- Group user profiles, keyed by (user_id, group_id)
+
+Two tiers, like the embedding cache:
+- Local tier: in-process LRU with TTL
+- Redis tier: optional shared tier through RedisProvider (JSON values)
+
+Keys carry the tenant prefix and a per-tenant generation number. The memorize and
+delete paths invalidate explicitly: single documents by key, bulk deletes by
+bumping the generation (which orphans every entry of the tenant).
+
+Invalidations only reach the tiers of the process that issues them. A local tier
+therefore serves other processes' invalidated entries until its TTL expires, so
+with the Redis tier enabled (several replicas) the local tier is off unless
+local_with_redis is set; without the Redis tier it is the only tier.
+
+Usage:
+    cache = get_memcell_read_cache()
+    memcells = await cache.get_many(event_ids, load_memcells)
+    await cache.invalidate([event_id])
+"""
+
+import hashlib
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+from agentic_layer.metrics.retrieve_metrics import record_retrieve_read_cache
+from core.cache.local_ttl_cache import LocalTTLCache
+from core.tenants.tenantize.kv.redis.tenant_key_utils import patch_redis_tenant_key
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "memory_read_cache"
+
+# Marks a key that is not cached (a cached value may legitimately be None)
+NOT_CACHED = object()
+
+
+@dataclass
+class MemoryReadCacheConfig:
+    """Configuration for the memory read cache"""
+
+    enabled: bool = True
+    local_max_entries: int = 10000
+    local_ttl_seconds: int = 300
+
+    redis_enabled: bool = False
+    redis_ttl_seconds: int = 3600
+    # Keep the local tier in front of the Redis tier (stale for up to
+    # local_ttl_seconds after another process invalidates)
+    local_with_redis: bool = False
+
+    def __post_init__(self):
+        """Load cache configuration from environment"""
+        self.enabled = (
+            os.getenv("MEMORY_READ_CACHE_ENABLED", str(self.enabled)).lower() == "true"
+        )
+        self.local_max_entries = int(
+            os.getenv("MEMORY_READ_CACHE_MAX_ENTRIES", str(self.local_max_entries))
+        )
+        self.local_ttl_seconds = int(
+            os.getenv("MEMORY_READ_CACHE_TTL_SECONDS", str(self.local_ttl_seconds))
+        )
+        self.redis_enabled = (
+            os.getenv(
+                "MEMORY_READ_CACHE_REDIS_ENABLED", str(self.redis_enabled)
+            ).lower()
+            == "true"
+        )
+        self.redis_ttl_seconds = int(
+            os.getenv(
+                "MEMORY_READ_CACHE_REDIS_TTL_SECONDS", str(self.redis_ttl_seconds)
+            )
+        )
+        self.local_with_redis = (
+            os.getenv(
+                "MEMORY_READ_CACHE_LOCAL_WITH_REDIS", str(self.local_with_redis)
+            ).lower()
+            == "true"
+        )
+
+
+class ReadCacheTier(ABC):
+    """Read cache storage tier"""
+
+    tier: str = "unknown"
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> List[Any]:
+        """Get values in key order, NOT_CACHED for misses"""
+        pass
+
+    @abstractmethod
+    async def set_many(self, items: Dict[str, Any]) -> None:
+        """Store values"""
+        pass
+
+    @abstractmethod
+    async def delete(self, keys: List[str]) -> None:
+        """Drop keys"""
+        pass
+
+    @abstractmethod
+    async def get_generation(self, scope: str) -> int:
+        """Current generation of a scope (tenant + cache name)"""
+        pass
+
+    @abstractmethod
+    async def bump_generation(self, scope: str) -> None:
+        """Invalidate every entry of a scope"""
+        pass
+
+
+class LocalReadCacheTier(ReadCacheTier):
+    """In-process LRU cache with per-entry TTL (stores the objects themselves)"""
+
+    tier = "local"
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: int = 300):
+        self._cache = LocalTTLCache(max_entries, ttl_seconds)
+        self._generations: Dict[str, int] = {}
+
+    async def get_many(self, keys: List[str]) -> List[Any]:
+        return self._cache.get_many(keys, NOT_CACHED)
+
+    async def set_many(self, items: Dict[str, Any]) -> None:
+        self._cache.set_many(items)
+
+    async def delete(self, keys: List[str]) -> None:
+        self._cache.delete_many(keys)
+
+    async def get_generation(self, scope: str) -> int:
+        return self._generations.get(scope, 0)
+
+    async def bump_generation(self, scope: str) -> None:
+        self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class RedisReadCacheTier(ReadCacheTier):
+    """Shared Redis tier, values are model JSON (fail-open on Redis errors)"""
+
+    tier = "redis"
+
+    def __init__(
+        self, model: Type[BaseModel], ttl_seconds: int = 3600, redis_provider=None
+    ):
+        self.model = model
+        self.ttl_seconds = ttl_seconds
+        self._redis_provider = redis_provider
+
+    async def _get_client(self):
+        if self._redis_provider is None:
+            from core.di import get_bean_by_type
+            from core.component.redis_provider import RedisProvider
+
+            self._redis_provider = get_bean_by_type(RedisProvider)
+        return await self._redis_provider.get_client()
+
+    def _decode(self, raw: Optional[str]) -> Any:
+        if raw is None:
+            return NOT_CACHED
+        data = json.loads(raw)
+        return None if data is None else self.model.model_validate(data)
+
+    async def get_many(self, keys: List[str]) -> List[Any]:
+        if not keys:
+            return []
+        try:
+            client = await self._get_client()
+            raw_values = await client.mget(keys)
+            return [self._decode(raw) for raw in raw_values]
+        except Exception as e:
+            logger.warning(f"Memory read cache Redis MGET failed: error={e}")
+            return [NOT_CACHED] * len(keys)
+
+    async def set_many(self, items: Dict[str, Any]) -> None:
+        if not items:
+            return
+        try:
+            client = await self._get_client()
+            pipe = client.pipeline()
+            for key, value in items.items():
+                raw = "null" if value is None else value.model_dump_json()
+                pipe.set(key, raw, ex=self.ttl_seconds)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Memory read cache Redis SET failed: error={e}")
+
+    async def delete(self, keys: List[str]) -> None:
+        if not keys:
+            return
+        try:
+            client = await self._get_client()
+            await client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Memory read cache Redis DEL failed: error={e}")
+
+    async def get_generation(self, scope: str) -> int:
+        try:
+            client = await self._get_client()
+            return int(await client.get(f"{scope}:generation") or 0)
+        except Exception as e:
+            logger.warning(f"Memory read cache Redis generation read failed: {e}")
+            return 0
+
+    async def bump_generation(self, scope: str) -> None:
+        try:
+            client = await self._get_client()
+            await client.incr(f"{scope}:generation")
+        except Exception as e:
+            logger.warning(f"Memory read cache Redis generation bump failed: {e}")
+
+
+class MemoryReadCache:
+    """
+    Tiered read-through cache for one document kind
+
+    Lookups go through the tiers in order (local first); a hit in a lower tier is
+    promoted into the tiers above it, misses are loaded in one call and written to
+    every tier. The loader may return None for keys that do not exist, these are
+    cached too; keys absent from the loader result are not cached.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model: Type[BaseModel],
+        config: Optional[MemoryReadCacheConfig] = None,
+        backends: Optional[List[ReadCacheTier]] = None,
+    ):
+        if config is None:
+            config = MemoryReadCacheConfig()
+        self.name = name
+        self.config = config
+
+        if backends is None:
+            backends = []
+            if not config.redis_enabled or config.local_with_redis:
+                backends.append(
+                    LocalReadCacheTier(
+                        max_entries=config.local_max_entries,
+                        ttl_seconds=config.local_ttl_seconds,
+                    )
+                )
+            if config.redis_enabled:
+                backends.append(
+                    RedisReadCacheTier(model, ttl_seconds=config.redis_ttl_seconds)
+                )
+        self.backends = backends
+
+        logger.info(
+            f"Initialized MemoryReadCache | name={name} | enabled={config.enabled} | "
+            f"tiers={[backend.tier for backend in self.backends]}"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled and bool(self.backends)
+
+    def _scope(self) -> str:
+        return patch_redis_tenant_key(f"{CACHE_KEY_PREFIX}:{self.name}")
+
+    async def _build_keys(self, keys: List[str]) -> List[str]:
+        scope = self._scope()
+        # The outermost tier is the shared one, its generation is authoritative
+        generation = await self.backends[-1].get_generation(scope)
+        return [f"{scope}:{generation}:{key}" for key in keys]
+
+    async def get_many(
+        self, keys: List[str], loader: Callable[[List[str]], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Get values for keys, loading misses with `loader(missing_keys)`
+
+        Returns:
+            Dict[key, value]: Keys the loader did not return are absent
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        if not self.enabled:
+            return await loader(keys)
+
+        cache_keys = await self._build_keys(keys)
+        results: Dict[str, Any] = {}
+        pending = list(range(len(keys)))
+        for level, backend in enumerate(self.backends):
+            if not pending:
+                break
+
+            values = await backend.get_many([cache_keys[i] for i in pending])
+            still_pending = []
+            promote = {}
+            for i, value in zip(pending, values):
+                if value is NOT_CACHED:
+                    still_pending.append(i)
+                    continue
+                results[keys[i]] = value
+                promote[cache_keys[i]] = value
+            # Promote into upper tiers
+            if promote:
+                for upper in self.backends[:level]:
+                    await upper.set_many(promote)
+
+            record_retrieve_read_cache(
+                cache=self.name, tier=backend.tier, result="hit", count=len(promote)
+            )
+            record_retrieve_read_cache(
+                cache=self.name,
+                tier=backend.tier,
+                result="miss",
+                count=len(still_pending),
+            )
+            pending = still_pending
+
+        if pending:
+            loaded = await loader([keys[i] for i in pending])
+            to_cache = {
+                cache_keys[i]: loaded[keys[i]] for i in pending if keys[i] in loaded
+            }
+            for backend in self.backends:
+                await backend.set_many(to_cache)
+            for i in pending:
+                if keys[i] in loaded:
+                    results[keys[i]] = loaded[keys[i]]
+
+        return results
+
+    async def invalidate(self, keys: List[str]) -> None:
+        """Drop keys from every tier (current tenant)"""
+        if not self.enabled or not keys:
+            return
+        cache_keys = await self._build_keys(list(dict.fromkeys(keys)))
+        for backend in self.backends:
+            await backend.delete(cache_keys)
+
+    async def invalidate_all(self) -> None:
+        """Invalidate every entry of the current tenant (bulk deletes)"""
+        if not self.enabled:
+            return
+        scope = self._scope()
+        for backend in self.backends:
+            await backend.bump_generation(scope)
+
+
+def group_user_profile_cache_key(user_id: str, group_id: str) -> str:
+    """Cache key of a (user_id, group_id) pair (hashed, ids may contain separators)"""
+    return hashlib.sha1(
+        json.dumps([user_id, group_id], ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+_memcell_read_cache: Optional[MemoryReadCache] = None
+_group_user_profile_read_cache: Optional[MemoryReadCache] = None
+
+
+def get_memcell_read_cache() -> MemoryReadCache:
+    """Get the process-wide MemCell read cache (MemCellOriginalDataProjection values)"""
+    global _memcell_read_cache
+    if _memcell_read_cache is None:
+        from infra_layer.adapters.out.persistence.document.memory.memcell import (
+            MemCellOriginalDataProjection,
+        )
+
+        _memcell_read_cache = MemoryReadCache("memcell", MemCellOriginalDataProjection)
+    return _memcell_read_cache
+
+
+def get_group_user_profile_read_cache() -> MemoryReadCache:
+    """Get the process-wide group user profile read cache"""
+    global _group_user_profile_read_cache
+    if _group_user_profile_read_cache is None:
+        from infra_layer.adapters.out.persistence.document.memory.group_user_profile_memory import (
+            GroupUserProfileMemory,
+        )
+
+        _group_user_profile_read_cache = MemoryReadCache(
+            "group_user_profile", GroupUserProfileMemory
+        )
+    return _group_user_profile_read_cache
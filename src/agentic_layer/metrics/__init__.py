@@ -6,6 +6,7 @@ Memory flow metrics including:
 - Rerank metrics
 - Retrieve pipeline metrics
 - Memorize pipeline metrics
+- LLM client metrics
 """
 
 from .vectorize_metrics import (
@@ -15,6 +16,9 @@ from .vectorize_metrics import (
     VECTORIZE_FALLBACK_TOTAL,
     VECTORIZE_ERRORS_TOTAL,
     VECTORIZE_TOKENS_TOTAL,
+    VECTORIZE_CACHE_TOTAL,
+    VECTORIZE_MICRO_BATCH_SIZE,
+    VECTORIZE_MICRO_BATCH_WAIT_SECONDS,
 )
 
 from .rerank_metrics import (
@@ -23,6 +27,8 @@ from .rerank_metrics import (
     RERANK_DOCUMENTS_TOTAL,
     RERANK_FALLBACK_TOTAL,
     RERANK_ERRORS_TOTAL,
+    RERANK_SCORE_CACHE_TOTAL,
+    RERANK_BATCH_TOKENS,
 )
 
 from .retrieve_metrics import (
@@ -31,6 +37,10 @@ from .retrieve_metrics import (
     RETRIEVE_RESULTS_COUNT,
     RETRIEVE_STAGE_DURATION_SECONDS,
     RETRIEVE_ERRORS_TOTAL,
+    RETRIEVE_READ_CACHE_TOTAL,
+    RETRIEVE_MILVUS_DECODE_SECONDS,
+    RETRIEVE_MILVUS_PAYLOAD_BYTES,
+    RETRIEVE_AGENTIC_SPECULATION_TOTAL,
 )
 
 from .memorize_metrics import (
@@ -44,11 +54,24 @@ from .memorize_metrics import (
     MEMORY_EXTRACTED_TOTAL,
     EXTRACT_MEMORY_REQUESTS_TOTAL,
     EXTRACT_MEMORY_DURATION_SECONDS,
+    MEMORY_STORE_WRITES_TOTAL,
+    PROFILE_EXTRACTION_TRIGGERS_TOTAL,
+    PROFILE_EXTRACTION_TOKENS_TOTAL,
+    MEMORIZE_MAILBOX_TASKS_TOTAL,
+    MEMORIZE_MAILBOX_WAIT_SECONDS,
     # Utility functions
     get_space_id_for_metrics,
     get_raw_data_type_label,
 )
 
+from .llm_metrics import (
+    LLM_REQUESTS_TOTAL,
+    LLM_RATE_LIMIT_BACKOFF_SECONDS_TOTAL,
+    LLM_RESPONSE_CACHE_TOTAL,
+    LLM_QUEUE_WAIT_SECONDS,
+    LLM_IN_FLIGHT_SECONDS,
+)
+
 __all__ = [
     # Vectorize metrics
     'VECTORIZE_REQUESTS_TOTAL',
@@ -57,6 +80,9 @@ __all__ = [
     'VECTORIZE_FALLBACK_TOTAL',
     'VECTORIZE_ERRORS_TOTAL',
     'VECTORIZE_TOKENS_TOTAL',
+    'VECTORIZE_CACHE_TOTAL',
+    'VECTORIZE_MICRO_BATCH_SIZE',
+    'VECTORIZE_MICRO_BATCH_WAIT_SECONDS',
     
     # Rerank metrics
     'RERANK_REQUESTS_TOTAL',
@@ -64,6 +90,8 @@ __all__ = [
     'RERANK_DOCUMENTS_TOTAL',
     'RERANK_FALLBACK_TOTAL',
     'RERANK_ERRORS_TOTAL',
+    'RERANK_SCORE_CACHE_TOTAL',
+    'RERANK_BATCH_TOKENS',
     
     # Retrieve metrics
     'RETRIEVE_REQUESTS_TOTAL',
@@ -71,6 +99,10 @@ __all__ = [
     'RETRIEVE_RESULTS_COUNT',
     'RETRIEVE_STAGE_DURATION_SECONDS',
     'RETRIEVE_ERRORS_TOTAL',
+    'RETRIEVE_READ_CACHE_TOTAL',
+    'RETRIEVE_MILVUS_DECODE_SECONDS',
+    'RETRIEVE_MILVUS_PAYLOAD_BYTES',
+    'RETRIEVE_AGENTIC_SPECULATION_TOTAL',
     
     # Memorize metrics
     'MEMORIZE_REQUESTS_TOTAL',
@@ -87,5 +119,17 @@ __all__ = [
     'MEMORY_EXTRACTED_TOTAL',
     'EXTRACT_MEMORY_REQUESTS_TOTAL',
     'EXTRACT_MEMORY_DURATION_SECONDS',
+    'MEMORY_STORE_WRITES_TOTAL',
+    'PROFILE_EXTRACTION_TRIGGERS_TOTAL',
+    'PROFILE_EXTRACTION_TOKENS_TOTAL',
+    'MEMORIZE_MAILBOX_TASKS_TOTAL',
+    'MEMORIZE_MAILBOX_WAIT_SECONDS',
+
+    # LLM client metrics
+    'LLM_REQUESTS_TOTAL',
+    'LLM_RATE_LIMIT_BACKOFF_SECONDS_TOTAL',
+    'LLM_RESPONSE_CACHE_TOTAL',
+    'LLM_QUEUE_WAIT_SECONDS',
+    'LLM_IN_FLIGHT_SECONDS',
 ]
 
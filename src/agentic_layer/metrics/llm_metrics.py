@@ -0,0 +1,160 @@
+"""
+LLM Client Metrics
+
+Metrics for monitoring LLM chat completion calls made through the shared client pool.
+
+"""
+
+from core.observation.metrics import Counter, Histogram, HistogramBuckets
+
+
+# ============================================================
+# Counter Metrics
+# ============================================================
+
+LLM_REQUESTS_TOTAL = Counter(
+    name='llm_requests_total',
+    description='Total number of LLM completion requests (one per HTTP attempt)',
+    labelnames=['model', 'status'],
+    namespace='evermemos',
+    subsystem='llm',
+)
+"""
+LLM requests counter
+
+Labels:
+- model: LLM model name
+- status: success, error, rate_limited, timeout
+"""
+
+
+LLM_RATE_LIMIT_BACKOFF_SECONDS_TOTAL = Counter(
+    name='llm_rate_limit_backoff_seconds_total',
+    description='Total backoff applied after 429 responses, in seconds',
+    labelnames=['model'],
+    namespace='evermemos',
+    subsystem='llm',
+)
+"""
+LLM rate limit backoff counter
+
+Labels:
+- model: LLM model name
+"""
+
+
+LLM_RESPONSE_CACHE_TOTAL = Counter(
+    name='llm_response_cache_total',
+    description='Total number of LLM response cache lookups',
+    labelnames=['backend', 'call_site', 'result'],
+    namespace='evermemos',
+    subsystem='llm',
+)
+"""
+LLM response cache lookups counter
+
+Labels:
+- backend: disk, redis
+- call_site: boundary_detection, episode, event_log, foresight, ...
+- result: hit, miss, error
+"""
+
+
+# ============================================================
+# Histogram Metrics
+# ============================================================
+
+LLM_QUEUE_WAIT_SECONDS = Histogram(
+    name='llm_queue_wait_seconds',
+    description='Time spent waiting for rate limit tokens and concurrency slots',
+    labelnames=['model'],
+    namespace='evermemos',
+    subsystem='llm',
+    buckets=HistogramBuckets.API_CALL,
+)
+"""
+LLM queue wait histogram (time before the request is sent)
+
+Labels:
+- model: LLM model name
+"""
+
+
+LLM_IN_FLIGHT_SECONDS = Histogram(
+    name='llm_in_flight_seconds',
+    description='Time from sending an LLM request to receiving the full response',
+    labelnames=['model', 'status'],
+    namespace='evermemos',
+    subsystem='llm',
+    buckets=HistogramBuckets.BATCH,
+)
+"""
+LLM in-flight duration histogram
+
+Labels:
+- model: LLM model name
+- status: success, error, rate_limited, timeout
+
+Buckets: 100ms - 60s
+"""
+
+
+# ============================================================
+# Helper Functions
+# ============================================================
+
+
+def record_llm_request(
+    model: str, status: str, queue_wait_seconds: float, in_flight_seconds: float
+) -> None:
+    """
+    Helper function to record one LLM request attempt
+
+    Args:
+        model: LLM model name
+        status: Request status (success, error, rate_limited, timeout)
+        queue_wait_seconds: Time spent waiting for tokens/slots before sending
+        in_flight_seconds: Time spent on the HTTP request itself
+
+    Example:
+        record_llm_request(
+            model='gpt-4.1-mini',
+            status='success',
+            queue_wait_seconds=0.02,
+            in_flight_seconds=3.5
+        )
+    """
+    LLM_REQUESTS_TOTAL.labels(model=model, status=status).inc()
+    LLM_QUEUE_WAIT_SECONDS.labels(model=model).observe(queue_wait_seconds)
+    LLM_IN_FLIGHT_SECONDS.labels(model=model, status=status).observe(in_flight_seconds)
+
+
+def record_llm_rate_limit_backoff(model: str, backoff_seconds: float) -> None:
+    """
+    Helper function to record the backoff applied after a 429 response
+
+    Args:
+        model: LLM model name
+        backoff_seconds: Backoff duration in seconds
+
+    Example:
+        record_llm_rate_limit_backoff(model='gpt-4.1-mini', backoff_seconds=2.0)
+    """
+    LLM_RATE_LIMIT_BACKOFF_SECONDS_TOTAL.labels(model=model).inc(backoff_seconds)
+
+
+def record_llm_response_cache(backend: str, call_site: str, result: str) -> None:
+    """
+    Helper function to record an LLM response cache lookup
+
+    Args:
+        backend: Cache backend (disk, redis)
+        call_site: Call site that enabled caching
+        result: Lookup result (hit, miss, error)
+
+    Example:
+        record_llm_response_cache(backend='disk', call_site='episode', result='hit')
+    """
+    LLM_RESPONSE_CACHE_TOTAL.labels(
+        backend=backend, call_site=call_site, result=result
+    ).inc()
@@ -92,7 +92,7 @@ Memorize requests counter
 Labels:
 - space_id: Tenant space identifier
 - raw_data_type: Type of raw data (conversation, etc.)
-- status: success, error, accumulated, extracted
+- status: success, error, accumulated, extracted, partial (batch with failed groups)
   - success: Request processed successfully (with or without memory extraction)
   - error: Request failed
   - accumulated: No memory extracted, message queued
@@ -278,6 +278,93 @@ Buckets: 10ms - 10s for ML inference
 """
 
 
+MEMORY_STORE_WRITES_TOTAL = Counter(
+    name='memory_store_writes_total',
+    description='Total number of memory documents written to each store',
+    labelnames=['store', 'memory_type', 'status'],
+    namespace='evermemos',
+    subsystem='agentic',
+)
+"""
+Memory store write counter (bulk write path)
+
+Labels:
+- store: mongo, es, milvus
+- memory_type: episodic_memory, foresight, event_log
+- status: success, error
+"""
+
+
+PROFILE_EXTRACTION_TRIGGERS_TOTAL = Counter(
+    name='profile_extraction_triggers_total',
+    description='Total number of profile extraction triggers by scheduling outcome',
+    labelnames=['space_id', 'outcome'],
+    namespace='evermemos',
+    subsystem='agentic',
+)
+"""
+Profile extraction trigger counter
+
+Labels:
+- space_id: Tenant space identifier
+- outcome: scheduled (starts a debounce window), coalesced (merged into a
+  pending extraction, i.e. a skipped LLM run), immediate (debounce disabled)
+"""
+
+
+PROFILE_EXTRACTION_TOKENS_TOTAL = Counter(
+    name='profile_extraction_tokens_total',
+    description='Estimated MemCell input tokens of profile extraction',
+    labelnames=['space_id', 'kind'],
+    namespace='evermemos',
+    subsystem='agentic',
+)
+"""
+Profile extraction MemCell input token counter (tiktoken estimate)
+
+Labels:
+- space_id: Tenant space identifier
+- kind: sent (MemCells sent to the LLM), saved (full-cluster-per-trigger
+  baseline minus sent)
+"""
+
+
+MEMORIZE_MAILBOX_TASKS_TOTAL = Counter(
+    name='memorize_mailbox_tasks_total',
+    description='Total number of memorize work items handled by the group mailbox executor',
+    labelnames=['space_id', 'outcome'],
+    namespace='evermemos',
+    subsystem='agentic',
+)
+"""
+Group mailbox executor work item counter
+
+Labels:
+- space_id: Tenant space identifier
+- outcome: executed, failed, rejected (mailbox full), cancelled (submitter
+  gave up before the item started)
+"""
+
+
+MEMORIZE_MAILBOX_WAIT_SECONDS = Histogram(
+    name='memorize_mailbox_wait_seconds',
+    description='Time memorize work items spent queued in a group mailbox',
+    labelnames=['space_id'],
+    namespace='evermemos',
+    subsystem='agentic',
+    buckets=HistogramBuckets.BATCH,  # 100ms - 60s for queued work
+)
+"""
+Group mailbox queue wait histogram (submission until start, including the
+cross-group concurrency limit)
+
+Labels:
+- space_id: Tenant space identifier
+
+Buckets: 100ms, 250ms, 500ms, 1s, 2.5s, 5s, 10s, 30s, 60s
+"""
+
+
 # ============================================================
 # Helper Functions
 # ============================================================
@@ -294,7 +381,7 @@ def record_memorize_request(
     Args:
         space_id: Tenant space identifier
         raw_data_type: Type of raw data (conversation, etc.)
-        status: Request status (success, error, accumulated, extracted)
+        status: Request status (success, error, accumulated, extracted, partial)
         duration_seconds: Total operation duration in seconds
     
     Example:
@@ -539,3 +626,91 @@ def record_extract_memory_call(
     EXTRACT_MEMORY_DURATION_SECONDS.labels(
         space_id=space_id, raw_data_type=raw_data_type, memory_type=memory_type
     ).observe(duration_seconds)
+
+
+def record_memory_store_write(
+    store: str, memory_type: str, status: str, count: int = 1
+) -> None:
+    """
+    Helper function to record documents written to a store by the bulk write path
+
+    Args:
+        store: Store name (mongo, es, milvus)
+        memory_type: Memory type (episodic_memory, foresight, event_log)
+        status: Write status (success, error)
+        count: Number of documents
+
+    Example:
+        record_memory_store_write(
+            store='es',
+            memory_type='foresight',
+            status='success',
+            count=12,
+        )
+    """
+    if count <= 0:
+        return
+    MEMORY_STORE_WRITES_TOTAL.labels(
+        store=store, memory_type=memory_type, status=status
+    ).inc(count)
+
+
+def record_profile_extraction_trigger(space_id: str, outcome: str) -> None:
+    """
+    Helper function to record a profile extraction trigger
+
+    Args:
+        space_id: Tenant space identifier
+        outcome: Scheduling outcome (scheduled, coalesced, immediate)
+
+    Example:
+        record_profile_extraction_trigger(space_id='default', outcome='coalesced')
+    """
+    PROFILE_EXTRACTION_TRIGGERS_TOTAL.labels(space_id=space_id, outcome=outcome).inc()
+
+
+def record_profile_extraction_tokens(
+    space_id: str, sent_tokens: int, saved_tokens: int
+) -> None:
+    """
+    Helper function to record profile extraction input tokens
+
+    Args:
+        space_id: Tenant space identifier
+        sent_tokens: Estimated MemCell tokens sent to the LLM
+        saved_tokens: Estimated MemCell tokens not sent compared to the baseline
+
+    Example:
+        record_profile_extraction_tokens(
+            space_id='default', sent_tokens=1200, saved_tokens=9800
+        )
+    """
+    if sent_tokens > 0:
+        PROFILE_EXTRACTION_TOKENS_TOTAL.labels(space_id=space_id, kind='sent').inc(
+            sent_tokens
+        )
+    if saved_tokens > 0:
+        PROFILE_EXTRACTION_TOKENS_TOTAL.labels(space_id=space_id, kind='saved').inc(
+            saved_tokens
+        )
+
+
+def record_memorize_mailbox_task(
+    space_id: str, outcome: str, wait_seconds: Optional[float] = None
+) -> None:
+    """
+    Helper function to record a group mailbox work item
+
+    Args:
+        space_id: Tenant space identifier
+        outcome: executed, failed, rejected, cancelled
+        wait_seconds: Time the item waited before it started (started items only)
+
+    Example:
+        record_memorize_mailbox_task(
+            space_id='default', outcome='executed', wait_seconds=0.3
+        )
+    """
+    MEMORIZE_MAILBOX_TASKS_TOTAL.labels(space_id=space_id, outcome=outcome).inc()
+    if wait_seconds is not None:
+        MEMORIZE_MAILBOX_WAIT_SECONDS.labels(space_id=space_id).observe(wait_seconds)
@@ -85,6 +85,22 @@ Labels:
 """
 
 
+RERANK_SCORE_CACHE_TOTAL = Counter(
+    name='rerank_score_cache_total',
+    description='Total number of rerank score cache lookups',
+    labelnames=['provider', 'result'],
+    namespace='evermemos',
+    subsystem='agentic',
+)
+"""
+Rerank (query, document) score cache lookups counter (hit rate = hit / (hit + miss))
+
+Labels:
+- provider: vllm, deepinfra
+- result: hit, miss
+"""
+
+
 # ============================================================
 # Histogram Metrics
 # ============================================================
@@ -125,6 +141,24 @@ Buckets: 1, 5, 10, 20, 50, 100, 200, 500, 1000 documents
 """
 
 
+RERANK_BATCH_TOKENS = Histogram(
+    name='rerank_batch_tokens',
+    description='Estimated prompt tokens of one rerank request batch',
+    labelnames=['provider'],
+    namespace='evermemos',
+    subsystem='agentic',
+    buckets=(64, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768),
+)
+"""
+Rerank batch size in tokens histogram (documents after truncation)
+
+Labels:
+- provider: vllm, deepinfra
+
+Buckets: 64 - 32768 tokens
+"""
+
+
 # ============================================================
 # Helper Functions
 # ============================================================
@@ -217,3 +251,34 @@ def record_rerank_error(
         provider=provider,
         error_type=error_type
     ).inc()
+
+
+def record_rerank_score_cache(provider: str, result: str, count: int = 1) -> None:
+    """
+    Helper function to record rerank score cache lookups
+
+    Args:
+        provider: Service provider (vllm, deepinfra)
+        result: Lookup result (hit, miss)
+        count: Number of lookups with this result
+
+    Example:
+        record_rerank_score_cache(provider='vllm', result='hit', count=12)
+    """
+    if count <= 0:
+        return
+    RERANK_SCORE_CACHE_TOTAL.labels(provider=provider, result=result).inc(count)
+
+
+def record_rerank_batch_tokens(provider: str, tokens: int) -> None:
+    """
+    Helper function to record the token size of one rerank batch
+
+    Args:
+        provider: Service provider (vllm, deepinfra)
+        tokens: Estimated tokens of the batch documents
+
+    Example:
+        record_rerank_batch_tokens(provider='vllm', tokens=3800)
+    """
+    RERANK_BATCH_TOKENS.labels(provider=provider).observe(tokens)
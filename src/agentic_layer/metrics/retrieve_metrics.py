@@ -76,6 +76,39 @@ Labels:
 """
 
 
+RETRIEVE_READ_CACHE_TOTAL = Counter(
+    name='retrieve_read_cache_total',
+    description='Total number of read-through cache lookups on the retrieval path',
+    labelnames=['cache', 'tier', 'result'],
+    namespace='evermemos',
+    subsystem='agentic',
+)
+"""
+Retrieval read-through cache lookups counter (hit rate = hit / (hit + miss))
+
+Labels:
+- cache: memcell, group_user_profile
+- tier: local, redis
+- result: hit, miss
+"""
+
+
+RETRIEVE_AGENTIC_SPECULATION_TOTAL = Counter(
+    name='retrieve_agentic_speculation_total',
+    description='Total number of speculative round-2 runs in agentic retrieval',
+    labelnames=['memory_type', 'outcome'],
+    namespace='evermemos',
+    subsystem='agentic',
+)
+"""
+Speculative round-2 counter (waste rate = discarded / total)
+
+Labels:
+- memory_type: episodic_memory, foresight, event_log, etc.
+- outcome: used (round 1 insufficient), discarded (round 1 sufficient), failed
+"""
+
+
 # ============================================================
 # Histogram Metrics
 # ============================================================
@@ -112,7 +145,8 @@ Stage-specific duration histogram
 
 Labels:
 - retrieve_method: keyword, vector, hybrid, rrf, agentic
-- stage: keyword, vector, embedding, milvus_search, rerank, rrf_fusion
+- stage: keyword, vector, embedding, milvus_search, rerank, rrf_fusion,
+  agentic_round1, sufficiency_check, multi_query, agentic_round2
 - memory_type: episodic_memory, profile, foresight, event_log, etc.
 
 Buckets: 1ms, 5ms, 10ms, 25ms, 50ms, 100ms, 250ms, 500ms, 1s, 2.5s, 5s
@@ -138,6 +172,44 @@ Buckets: 0, 1, 5, 10, 20, 50, 100, 200, 500, 1000 results
 """
 
 
+RETRIEVE_MILVUS_DECODE_SECONDS = Histogram(
+    name='retrieve_milvus_decode_seconds',
+    description='Time spent deserializing the JSON fields of one Milvus search response',
+    labelnames=['collection', 'output_profile'],
+    namespace='evermemos',
+    subsystem='agentic',
+    buckets=HistogramBuckets.FAST,
+)
+"""
+Milvus search response deserialization histogram (one observation per search)
+
+Labels:
+- collection: EpisodicMemoryCollection, EventLogCollection, ForesightCollection
+- output_profile: ids, summary, full
+
+Buckets: 1ms - 500ms
+"""
+
+
+RETRIEVE_MILVUS_PAYLOAD_BYTES = Histogram(
+    name='retrieve_milvus_payload_bytes',
+    description='Size of the serialized JSON fields returned by one Milvus search',
+    labelnames=['collection', 'output_profile'],
+    namespace='evermemos',
+    subsystem='agentic',
+    buckets=(0, 1024, 10240, 102400, 524288, 1048576, 5242880, 10485760),
+)
+"""
+Milvus search JSON payload size histogram (metadata + search_content characters)
+
+Labels:
+- collection: EpisodicMemoryCollection, EventLogCollection, ForesightCollection
+- output_profile: ids, summary, full
+
+Buckets: 0, 1KB, 10KB, 100KB, 512KB, 1MB, 5MB, 10MB
+"""
+
+
 # ============================================================
 # Helper Functions
 # ============================================================
@@ -231,6 +303,70 @@ def record_retrieve_error(retrieve_method: str, stage: str, error_type: str) ->
     ).inc()
 
 
+def record_retrieve_read_cache(
+    cache: str, tier: str, result: str, count: int = 1
+) -> None:
+    """
+    Helper function to record read-through cache lookups
+
+    Args:
+        cache: Cache name (memcell, group_user_profile)
+        tier: Cache tier (local, redis)
+        result: Lookup result (hit, miss)
+        count: Number of lookups with this result
+
+    Example:
+        record_retrieve_read_cache(cache='memcell', tier='local', result='hit', count=12)
+    """
+    if count <= 0:
+        return
+    RETRIEVE_READ_CACHE_TOTAL.labels(cache=cache, tier=tier, result=result).inc(count)
+
+
+def record_milvus_search_decode(
+    collection: str, output_profile: str, duration_seconds: float, payload_bytes: int
+) -> None:
+    """
+    Helper function to record the deserialization cost of one Milvus search
+
+    Args:
+        collection: Milvus collection model name
+        output_profile: Output profile (ids, summary, full)
+        duration_seconds: Time spent parsing JSON fields of all hits
+        payload_bytes: Total size of the JSON fields of all hits
+
+    Example:
+        record_milvus_search_decode(
+            collection='EpisodicMemoryCollection',
+            output_profile='full',
+            duration_seconds=0.004,
+            payload_bytes=120000
+        )
+    """
+    RETRIEVE_MILVUS_DECODE_SECONDS.labels(
+        collection=collection, output_profile=output_profile
+    ).observe(duration_seconds)
+    RETRIEVE_MILVUS_PAYLOAD_BYTES.labels(
+        collection=collection, output_profile=output_profile
+    ).observe(payload_bytes)
+
+
+def record_agentic_speculation(memory_type: str, outcome: str) -> None:
+    """
+    Helper function to record the outcome of a speculative agentic round 2
+
+    Args:
+        memory_type: Memory type label of the request
+        outcome: Speculation outcome (used, discarded, failed)
+
+    Example:
+        record_agentic_speculation(memory_type='episodic_memory', outcome='discarded')
+    """
+    RETRIEVE_AGENTIC_SPECULATION_TOTAL.labels(
+        memory_type=memory_type, outcome=outcome
+    ).inc()
+
+
 class RetrieveMetricsContext:
     """
     Context manager for easy metrics recording in retrieval operations
@@ -5,6 +5,8 @@ Metrics for monitoring embedding generation performance and reliability.
 
 """
 
+from typing import List
+
 from core.observation.metrics import Counter, Histogram, HistogramBuckets
 
 
@@ -78,6 +80,22 @@ Labels:
 """
 
 
+VECTORIZE_CACHE_TOTAL = Counter(
+    name='vectorize_cache_total',
+    description='Total number of embedding cache lookups',
+    labelnames=['tier', 'result'],
+    namespace='evermemos',
+    subsystem='agentic',
+)
+"""
+Embedding cache lookups counter
+
+Labels:
+- tier: local, redis
+- result: hit, miss
+"""
+
+
 # ============================================================
 # Histogram Metrics
 # ============================================================
@@ -120,6 +138,43 @@ Buckets: 1, 2, 5, 10, 20, 50, 100, 200, 500 texts
 """
 
 
+VECTORIZE_MICRO_BATCH_SIZE = Histogram(
+    name='vectorize_micro_batch_size',
+    description='Number of coalesced single-text requests per micro-batch flush',
+    labelnames=['provider', 'reason'],
+    namespace='evermemos',
+    subsystem='agentic',
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+"""
+Micro-batch size histogram
+
+Labels:
+- provider: vllm, deepinfra
+- reason: size (batch limit reached), window (flush window elapsed), close
+
+Buckets: 1, 2, 4, 8, 16, 32, 64, 128 texts
+"""
+
+
+VECTORIZE_MICRO_BATCH_WAIT_SECONDS = Histogram(
+    name='vectorize_micro_batch_wait_seconds',
+    description='Time a request waited in the micro-batcher before its batch was sent',
+    labelnames=['provider'],
+    namespace='evermemos',
+    subsystem='agentic',
+    buckets=HistogramBuckets.FAST,  # 1ms - 500ms
+)
+"""
+Micro-batch queue wait histogram
+
+Labels:
+- provider: vllm, deepinfra
+
+Buckets: 1ms, 5ms, 10ms, 25ms, 50ms, 100ms, 250ms, 500ms
+"""
+
+
 # ============================================================
 # Helper Functions
 # ============================================================
@@ -231,3 +286,47 @@ def record_vectorize_error(
         error_type=error_type
     ).inc()
 
+
+def record_vectorize_cache(tier: str, result: str, count: int = 1) -> None:
+    """
+    Helper function to record embedding cache lookups
+
+    Args:
+        tier: Cache tier (local, redis)
+        result: Lookup result (hit, miss)
+        count: Number of lookups with this result
+
+    Example:
+        record_vectorize_cache(tier='local', result='hit', count=3)
+    """
+    if count <= 0:
+        return
+    VECTORIZE_CACHE_TOTAL.labels(tier=tier, result=result).inc(count)
+
+
+def record_vectorize_micro_batch(
+    provider: str, reason: str, batch_size: int, wait_seconds: List[float]
+) -> None:
+    """
+    Helper function to record a micro-batch flush
+
+    Args:
+        provider: Service provider (vllm, deepinfra)
+        reason: Flush reason (size, window, close)
+        batch_size: Number of coalesced requests
+        wait_seconds: Queue wait of each coalesced request
+
+    Example:
+        record_vectorize_micro_batch(
+            provider='vllm',
+            reason='window',
+            batch_size=3,
+            wait_seconds=[0.005, 0.003, 0.001]
+        )
+    """
+    VECTORIZE_MICRO_BATCH_SIZE.labels(provider=provider, reason=reason).observe(
+        batch_size
+    )
+    wait_histogram = VECTORIZE_MICRO_BATCH_WAIT_SECONDS.labels(provider=provider)
+    for wait in wait_seconds:
+        wait_histogram.observe(wait)
@@ -0,0 +1,96 @@
+"""
+Rerank Score Cache
+
+In-process LRU cache with TTL (LocalTTLCache) for reranker scores, keyed by
+(model, instruction + query hash, document hash). Agentic retrieval reranks the
+same round-1 candidates several times and repeated searches hit the same
+documents, so cached pairs skip the model entirely.
+
+Usage:
+    from agentic_layer.rerank_cache import RerankScoreCache
+
+    cache = RerankScoreCache()
+    keys = [cache.build_key(model, query, doc, instruction) for doc in documents]
+    scores = cache.get_many(keys)  # None for misses
+    cache.set_many({key: score, ...})
+"""
+
+import hashlib
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from core.cache.local_ttl_cache import LocalTTLCache
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "rerank_cache"
+
+
+@dataclass
+class RerankScoreCacheConfig:
+    """Configuration for the rerank score cache"""
+
+    enabled: bool = True
+    max_entries: int = 50000
+    ttl_seconds: int = 3600
+
+    def __post_init__(self):
+        """Load cache configuration from environment"""
+        self.enabled = (
+            os.getenv("RERANK_SCORE_CACHE_ENABLED", str(self.enabled)).lower() == "true"
+        )
+        self.max_entries = int(
+            os.getenv("RERANK_SCORE_CACHE_MAX_ENTRIES", str(self.max_entries))
+        )
+        self.ttl_seconds = int(
+            os.getenv("RERANK_SCORE_CACHE_TTL_SECONDS", str(self.ttl_seconds))
+        )
+
+
+class RerankScoreCache:
+    """LRU cache of (query, document) rerank scores with per-entry TTL"""
+
+    def __init__(self, config: Optional[RerankScoreCacheConfig] = None):
+        if config is None:
+            config = RerankScoreCacheConfig()
+        self.config = config
+        self._cache = LocalTTLCache(config.max_entries, config.ttl_seconds)
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled and self.config.max_entries > 0
+
+    @staticmethod
+    def build_key(
+        model: str, query: str, document: str, instruction: Optional[str] = None
+    ) -> str:
+        """Build cache key from (model, instruction + query hash, document hash)
+
+        The instruction changes the prompt the model scores, so it is part of
+        the query hash.
+        """
+        query_hash = hashlib.sha256(
+            f"{instruction or ''}\x00{query}".encode("utf-8")
+        ).hexdigest()[:32]
+        doc_hash = hashlib.sha256(document.encode("utf-8")).hexdigest()[:32]
+        return f"{CACHE_KEY_PREFIX}:{model}:{query_hash}:{doc_hash}"
+
+    def get_many(self, keys: List[str]) -> List[Optional[float]]:
+        """Look up scores, preserving order (None for misses)"""
+        if not self.enabled:
+            return [None] * len(keys)
+        return self._cache.get_many(keys)
+
+    def set_many(self, items: Dict[str, float]) -> None:
+        """Store scores, evicting least recently used entries beyond max_entries"""
+        if not self.enabled:
+            return
+        self._cache.set_many({key: float(score) for key, score in items.items()})
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -12,6 +12,7 @@ from dataclasses import dataclass
 
 from agentic_layer.rerank_interface import RerankServiceInterface, RerankError
 from api_specs.memory_models import MemoryType
+from core.rate_limit.rate_limiter import get_provider_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,9 @@ class DeepInfraRerankConfig:
     max_retries: int = 3
     batch_size: int = 10
     max_concurrent_requests: int = 5
+    # Requests per second to the provider (0 = no rate limit)
+    rate_limit_rps: float = 0.0
+    rate_limit_burst: int = 10
 
 
 class DeepInfraRerankService(RerankServiceInterface):
@@ -39,6 +43,11 @@ class DeepInfraRerankService(RerankServiceInterface):
         self.config = config
         self.session: Optional[aiohttp.ClientSession] = None
         self._semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+        self._rate_limiter = get_provider_rate_limiter(
+            f"rerank:deepinfra:{config.model}",
+            config.rate_limit_rps,
+            config.rate_limit_burst,
+        )
         logger.info(f"Initialized DeepInfraRerankService | model={config.model}")
 
     async def _ensure_session(self):
@@ -98,6 +107,8 @@ class DeepInfraRerankService(RerankServiceInterface):
         async with self._semaphore:
             for attempt in range(self.config.max_retries):
                 try:
+                    if self._rate_limiter is not None:
+                        await self._rate_limiter.acquire()
                     async with self.session.post(url, json=request_data) as response:
                         if response.status == 200:
                             json_body = await response.json()
@@ -55,6 +55,12 @@ class HybridRerankConfig:
     max_retries: int = 3
     batch_size: int = 10
     max_concurrent_requests: int = 5
+    max_batch_tokens: int = 8192
+    max_document_tokens: int = 1024
+
+    # Requests per second to each provider (0 = no rate limit)
+    rate_limit_rps: float = 0.0
+    rate_limit_burst: int = 10
 
     # Fallback behavior
     enable_fallback: bool = True
@@ -93,6 +99,18 @@ class HybridRerankConfig:
         self.max_concurrent_requests = int(
             os.getenv("RERANK_MAX_CONCURRENT", str(self.max_concurrent_requests))
         )
+        self.max_batch_tokens = int(
+            os.getenv("RERANK_MAX_BATCH_TOKENS", str(self.max_batch_tokens))
+        )
+        self.max_document_tokens = int(
+            os.getenv("RERANK_MAX_DOCUMENT_TOKENS", str(self.max_document_tokens))
+        )
+        self.rate_limit_rps = float(
+            os.getenv("RERANK_RATE_LIMIT_RPS", str(self.rate_limit_rps))
+        )
+        self.rate_limit_burst = int(
+            os.getenv("RERANK_RATE_LIMIT_BURST", str(self.rate_limit_burst))
+        )
 
         # Fallback behavior
         # Enable fallback only if:
@@ -121,6 +139,10 @@ def _create_service_from_config(
     max_retries: int,
     batch_size: int,
     max_concurrent: int,
+    max_batch_tokens: int = 8192,
+    max_document_tokens: int = 1024,
+    rate_limit_rps: float = 0.0,
+    rate_limit_burst: int = 10,
 ) -> RerankServiceInterface:
     """
     Factory function to create a rerank service based on provider type
@@ -134,6 +156,10 @@ def _create_service_from_config(
         max_retries: Maximum retry attempts
         batch_size: Batch size for requests
         max_concurrent: Maximum concurrent requests
+        max_batch_tokens: Token budget of one request batch (vllm only)
+        max_document_tokens: Per-document truncation budget (vllm only)
+        rate_limit_rps: Requests per second to the provider (0 means no rate limit)
+        rate_limit_burst: Maximum burst of requests to the provider
 
     Returns:
         RerankServiceInterface: The created service instance
@@ -147,6 +173,10 @@ def _create_service_from_config(
             max_retries=max_retries,
             batch_size=batch_size,
             max_concurrent_requests=max_concurrent,
+            max_batch_tokens=max_batch_tokens,
+            max_document_tokens=max_document_tokens,
+            rate_limit_rps=rate_limit_rps,
+            rate_limit_burst=rate_limit_burst,
         )
         return VllmRerankService(config)
     elif provider.lower() == "deepinfra":
@@ -158,6 +188,8 @@ def _create_service_from_config(
             max_retries=max_retries,
             batch_size=batch_size,
             max_concurrent_requests=max_concurrent,
+            rate_limit_rps=rate_limit_rps,
+            rate_limit_burst=rate_limit_burst,
         )
         return DeepInfraRerankService(config)
     else:
@@ -201,6 +233,10 @@ class HybridRerankService(RerankServiceInterface):
             max_retries=config.max_retries,
             batch_size=config.batch_size,
             max_concurrent=config.max_concurrent_requests,
+            max_batch_tokens=config.max_batch_tokens,
+            max_document_tokens=config.max_document_tokens,
+            rate_limit_rps=config.rate_limit_rps,
+            rate_limit_burst=config.rate_limit_burst,
         )
 
         # Create fallback service if enabled
@@ -215,6 +251,10 @@ class HybridRerankService(RerankServiceInterface):
                 max_retries=config.max_retries,
                 batch_size=config.batch_size,
                 max_concurrent=config.max_concurrent_requests,
+                max_batch_tokens=config.max_batch_tokens,
+                max_document_tokens=config.max_document_tokens,
+                rate_limit_rps=config.rate_limit_rps,
+                rate_limit_burst=config.rate_limit_burst,
             )
 
         logger.info(
@@ -2,16 +2,29 @@
 vLLM (Self-Deployed) Rerank Service Implementation
 
 Reranking service for self-deployed vLLM or similar OpenAI-compatible services.
+
+Candidates are truncated to a per-document token budget and packed into request
+batches by a token budget; batches run concurrently (capped by
+max_concurrent_requests). Scores of repeated (query, document) pairs are served
+from RerankScoreCache without calling the model.
 """
 
 import asyncio
 import aiohttp
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from agentic_layer.rerank_interface import RerankServiceInterface, RerankError
+from agentic_layer.rerank_cache import RerankScoreCache
+from agentic_layer.metrics.rerank_metrics import (
+    record_rerank_score_cache,
+    record_rerank_batch_tokens,
+)
 from api_specs.memory_models import MemoryType
+from core.di import get_bean_by_type
+from core.component.llm.tokenizer.tokenizer_factory import TokenizerFactory
+from core.rate_limit.rate_limiter import get_provider_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -25,20 +38,38 @@ class VllmRerankConfig:
     model: str = "Qwen/Qwen3-Reranker-4B"  # skip-sensitive-check
     timeout: int = 30
     max_retries: int = 3
-    batch_size: int = 10
+    batch_size: int = 10  # Max documents per request
     max_concurrent_requests: int = 5
+    max_batch_tokens: int = 8192  # Token budget of one request (query + doc per pair)
+    max_document_tokens: int = 1024  # Per-document truncation budget
+    tokenizer_encoding: str = "o200k_base"  # Estimate only, not the model tokenizer
+    # Requests per second to the provider (0 = no rate limit)
+    rate_limit_rps: float = 0.0
+    rate_limit_burst: int = 10
 
 
 class VllmRerankService(RerankServiceInterface):
     """vLLM reranking service implementation"""
 
-    def __init__(self, config: Optional[VllmRerankConfig] = None):
+    def __init__(
+        self,
+        config: Optional[VllmRerankConfig] = None,
+        score_cache: Optional[RerankScoreCache] = None,
+    ):
         if config is None:
             config = VllmRerankConfig()
 
         self.config = config
         self.session: Optional[aiohttp.ClientSession] = None
         self._semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+        self._rate_limiter = get_provider_rate_limiter(
+            f"rerank:vllm:{config.model}",
+            config.rate_limit_rps,
+            config.rate_limit_burst,
+        )
+        self.score_cache = (
+            score_cache if score_cache is not None else RerankScoreCache()
+        )
         logger.info(
             f"Initialized VllmRerankService | url={config.base_url} | model={config.model}"
         )
@@ -105,6 +136,8 @@ class VllmRerankService(RerankServiceInterface):
         async with self._semaphore:
             for attempt in range(self.config.max_retries):
                 try:
+                    if self._rate_limiter is not None:
+                        await self._rate_limiter.acquire()
                     async with self.session.post(url, json=request_data) as response:
                         if response.status == 200:
                             result = await response.json()
@@ -164,39 +197,137 @@ class VllmRerankService(RerankServiceInterface):
         if not documents:
             return {"results": []}
 
-        batch_size = self.config.batch_size
-        if batch_size <= 0:
-            batch_size = 10
+        scores = await self._score_documents(query, documents, instruction)
+        # Documents of failed batches rank last
+        all_scores = [score if score is not None else -100.0 for score in scores]
+
+        # Convert to same format as DeepInfra
+        return self._convert_response_format(all_scores, len(documents))
+
+    def _get_tokenizer(self):
+        """Get the shared tiktoken encoder from tokenizer factory (with caching)"""
+        tokenizer_factory: TokenizerFactory = get_bean_by_type(TokenizerFactory)
+        return tokenizer_factory.get_tokenizer_from_tiktoken(
+            self.config.tokenizer_encoding
+        )
+
+    def _truncate_documents(self, documents: List[str]) -> Tuple[List[str], List[int]]:
+        """
+        Truncate documents to max_document_tokens
+
+        Returns:
+            (truncated_documents, token_counts)
+        """
+        tokenizer = self._get_tokenizer()
+        max_tokens = self.config.max_document_tokens
+        truncated, token_counts = [], []
+        for doc in documents:
+            tokens = tokenizer.encode(doc, disallowed_special=())
+            if max_tokens > 0 and len(tokens) > max_tokens:
+                tokens = tokens[:max_tokens]
+                doc = tokenizer.decode(tokens)
+            truncated.append(doc)
+            token_counts.append(len(tokens))
+        return truncated, token_counts
+
+    def _pack_batches(
+        self, token_counts: List[int], query_tokens: int
+    ) -> List[List[int]]:
+        """
+        Greedily pack documents (in order) into batches under the token budget
+
+        Each pair costs query_tokens + document tokens. A batch is closed when
+        the next document would exceed max_batch_tokens or batch_size documents;
+        a document larger than the budget on its own gets a batch of its own.
+
+        Returns:
+            List of batches, each a list of document indices
+        """
+        max_docs = self.config.batch_size if self.config.batch_size > 0 else 10
+        budget = self.config.max_batch_tokens
+
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for i, doc_tokens in enumerate(token_counts):
+            cost = query_tokens + doc_tokens
+            if current and (
+                len(current) >= max_docs
+                or (budget > 0 and current_tokens + cost > budget)
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _score_documents(
+        self, query: str, documents: List[str], instruction: Optional[str] = None
+    ) -> List[Optional[float]]:
+        """
+        Score documents against the query (cache first, then token-budgeted batches)
 
-        batches = [
-            documents[i : i + batch_size] for i in range(0, len(documents), batch_size)
+        Returns:
+            Scores in document order, None for documents whose batch failed
+        """
+        cache_keys = [
+            self.score_cache.build_key(self.config.model, query, doc, instruction)
+            for doc in documents
         ]
+        scores = self.score_cache.get_many(cache_keys)
+        misses = [i for i, score in enumerate(scores) if score is None]
+        if self.score_cache.enabled:
+            record_rerank_score_cache(
+                provider="vllm", result="hit", count=len(documents) - len(misses)
+            )
+            record_rerank_score_cache(provider="vllm", result="miss", count=len(misses))
+        if not misses:
+            return scores
+
+        truncated, token_counts = self._truncate_documents(
+            [documents[i] for i in misses]
+        )
+        query_tokens = len(
+            self._get_tokenizer().encode(
+                f"{instruction or ''}{query}", disallowed_special=()
+            )
+        )
+        batches = self._pack_batches(token_counts, query_tokens)
 
         batch_tasks = []
-        for i, batch in enumerate(batches):
-            start_index = i * batch_size
+        for batch in batches:
+            record_rerank_batch_tokens(
+                provider="vllm",
+                tokens=sum(query_tokens + token_counts[j] for j in batch),
+            )
             batch_tasks.append(
-                self._send_rerank_request_batch(query, batch, start_index, instruction)
+                self._send_rerank_request_batch(
+                    query, [truncated[j] for j in batch], batch[0], instruction
+                )
             )
-
         batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
 
-        all_scores = []
-        for i, result in enumerate(batch_results):
+        new_scores = {}
+        for batch_no, (batch, result) in enumerate(zip(batches, batch_results)):
             if isinstance(result, Exception):
-                logger.error(f"Rerank batch {i} failed: {result}")
-                batch_len = len(batches[i])
-                all_scores.extend([-100.0] * batch_len)
+                logger.error(f"Rerank batch {batch_no} failed: {result}")
                 continue
 
             # vLLM returns {"results": [{"index": ..., "relevance_score": ...}, ...]}
-            results = result.get("results", [])
-            results_sorted = sorted(results, key=lambda x: x.get("index", 0))
-            for r in results_sorted:
-                all_scores.append(r.get("relevance_score", 0.0))
+            # with index relative to the batch
+            for item in result.get("results", []):
+                index = item.get("index")
+                if index is None or not 0 <= index < len(batch):
+                    continue
+                doc_index = misses[batch[index]]
+                score = item.get("relevance_score", 0.0)
+                scores[doc_index] = score
+                new_scores[cache_keys[doc_index]] = score
 
-        # Convert to same format as DeepInfra
-        return self._convert_response_format(all_scores, len(documents))
+        self.score_cache.set_many(new_scores)
+        return scores
 
     def _convert_response_format(
         self, scores: List[float], num_documents: int
@@ -284,33 +415,19 @@ class VllmRerankService(RerankServiceInterface):
         if not documents:
             return []
 
-        # Send rerank request
+        # Score documents (cached pairs skip the model)
         try:
-            result = await self._send_rerank_request_batch(
-                query=query, documents=documents, start_index=0, instruction=instruction
-            )
-
-            # Parse results (OpenAI-compatible format)
-            if "results" not in result:
-                raise RerankError(
-                    f"Invalid rerank response format: missing 'results' key"
-                )
-
-            # Create score mapping
-            score_map = {}
-            for item in result["results"]:
-                index = item.get("index")
-                score = item.get("relevance_score", 0.0)
-                if index is not None:
-                    score_map[index] = score
+            scores = await self._score_documents(query, documents, instruction)
+            if any(score is None for score in scores):
+                failed = sum(1 for score in scores if score is None)
+                raise RerankError(f"{failed}/{len(scores)} documents were not scored")
 
             # Create reranked hits with updated scores
             reranked_hits = []
-            for i, hit in enumerate(hits):
-                if i in score_map:
-                    hit_copy = hit.copy()
-                    hit_copy['score'] = score_map[i]  # Update score
-                    reranked_hits.append(hit_copy)
+            for hit, score in zip(hits, scores):
+                hit_copy = hit.copy()
+                hit_copy['score'] = score  # Update score
+                reranked_hits.append(hit_copy)
 
             # Sort by rerank score (descending)
             reranked_hits.sort(key=lambda x: x.get('score', 0.0), reverse=True)
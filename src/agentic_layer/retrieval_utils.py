@@ -9,10 +9,12 @@ Provides implementations of various retrieval strategies:
 
 import re
 import time
+import hashlib
 import jieba
 import numpy as np
 import logging
 import asyncio
+from collections import OrderedDict
 from typing import List, Tuple, Dict, Any, Optional
 from core.nlp.stopwords_utils import filter_stopwords as filter_chinese_stopwords
 from .vectorize_service import get_vectorize_service
@@ -52,95 +54,325 @@ def _safe_cosine_similarity(
         return None
 
 
-def build_bm25_index(candidates):
-    """Build BM25 index (supports Chinese and English)"""
+# ==================== BM25 ====================
+
+# English tokenizer resources (stemmer, stop words, word_tokenize), loaded once
+_english_nlp_resources: Optional[Tuple[Any, Any, Any]] = None
+
+BM25_INDEX_CACHE_MAX_ENTRIES = 32
+BM25_TOKEN_CACHE_MAX_ENTRIES = 20000
+
+
+def load_bm25_resources() -> bool:
+    """
+    Load NLTK data and BM25 tokenizer resources once (call at startup)
+
+    Downloads missing NLTK data (punkt, punkt_tab, stopwords) and builds the
+    shared stemmer / stop word set, so requests never hit nltk.download.
+
+    Returns:
+        bool: False if nltk or rank_bm25 is not installed
+    """
+    return _get_english_nlp_resources() is not None
+
+
+def _get_english_nlp_resources() -> Optional[Tuple[Any, Any, Any]]:
+    """Get (stemmer, stop_words, word_tokenize), loading them on first use"""
+    global _english_nlp_resources
+    if _english_nlp_resources is not None:
+        return _english_nlp_resources
+
     try:
         import nltk
         from nltk.corpus import stopwords
         from nltk.stem import PorterStemmer
         from nltk.tokenize import word_tokenize
-        from rank_bm25 import BM25Okapi
-    except ImportError as e:
-        return None, None, None, None
+        import rank_bm25  # noqa: F401
+    except ImportError:
+        return None
 
     # Ensure NLTK data is downloaded
-    try:
-        nltk.data.find("tokenizers/punkt")
-    except LookupError:
-        nltk.download("punkt", quiet=True)
+    for resource, package in (
+        ("tokenizers/punkt", "punkt"),
+        ("tokenizers/punkt_tab", "punkt_tab"),
+        ("corpora/stopwords", "stopwords"),
+    ):
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package, quiet=True)
+
+    _english_nlp_resources = (
+        PorterStemmer(),
+        frozenset(stopwords.words("english")),
+        word_tokenize,
+    )
+    return _english_nlp_resources
 
-    try:
-        nltk.data.find("tokenizers/punkt_tab")
-    except LookupError:
-        nltk.download("punkt_tab", quiet=True)
 
-    try:
-        nltk.data.find("corpora/stopwords")
-    except LookupError:
-        nltk.download("stopwords", quiet=True)
-
-    stemmer = PorterStemmer()
-    stop_words = set(stopwords.words("english"))
-
-    # Extract text and tokenize (supports Chinese and English)
-    tokenized_docs = []
-    for mem in candidates:
-        text = getattr(mem, "episode", None) or getattr(mem, "summary", "") or ""
-        has_chinese = bool(re.search(r'[\u4e00-\u9fff]', text))
-
-        if has_chinese:
-            tokens = list(jieba.cut(text))
-            processed_tokens = filter_chinese_stopwords(tokens)
+def _tokenize_for_bm25(text: str, stemmer, stop_words) -> List[str]:
+    """Tokenize a document or query for BM25 (supports Chinese and English)"""
+    if re.search(r'[\u4e00-\u9fff]', text):
+        return filter_chinese_stopwords(list(jieba.cut(text)))
+
+    word_tokenize = _get_english_nlp_resources()[2]
+    return [
+        stemmer.stem(token)
+        for token in word_tokenize(text.lower())
+        if token.isalpha() and len(token) >= 2 and token not in stop_words
+    ]
+
+
+def _candidate_text(mem: Any) -> str:
+    """Text of a candidate used for BM25"""
+    return getattr(mem, "episode", None) or getattr(mem, "summary", "") or ""
+
+
+class Bm25Index:
+    """
+    BM25 index over an ordered list of documents, with incremental add/remove
+
+    Tokenized documents are kept, so add/remove only tokenizes the new
+    documents; the BM25Okapi model (global IDF) is rebuilt lazily from them.
+    """
+
+    def __init__(self, texts: List[str], tokenize):
+        self._tokenize = tokenize
+        self.texts: List[str] = []
+        self.tokenized_docs: List[List[str]] = []
+        self._bm25 = None
+        self.add(texts)
+
+    def add(self, texts: List[str]) -> None:
+        """Append documents to the index"""
+        for text in texts:
+            self.texts.append(text)
+            self.tokenized_docs.append(self._tokenize(text))
+        self._bm25 = None
+
+    def remove(self, positions: List[int]) -> None:
+        """Remove documents by position"""
+        drop = set(positions)
+        self.texts = [t for i, t in enumerate(self.texts) if i not in drop]
+        self.tokenized_docs = [
+            d for i, d in enumerate(self.tokenized_docs) if i not in drop
+        ]
+        self._bm25 = None
+
+    def copy(self) -> "Bm25Index":
+        """Copy sharing the tokenized documents, to apply a delta without
+        changing this (cached) index"""
+        index = Bm25Index([], self._tokenize)
+        index.texts = list(self.texts)
+        index.tokenized_docs = list(self.tokenized_docs)
+        return index
+
+    @property
+    def bm25(self):
+        """BM25Okapi model over the current documents"""
+        if self._bm25 is None:
+            from rank_bm25 import BM25Okapi
+
+            # BM25Okapi divides by the corpus size
+            self._bm25 = BM25Okapi(self.tokenized_docs or [[]])
+        return self._bm25
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+
+class Bm25IndexCache:
+    """
+    Memoises BM25 indexes by candidate-set fingerprint
+
+    The fingerprint is a hash of the ordered candidate texts, so an index is
+    reused by every retrieval over the same candidates (all queries of
+    multi-query and agentic retrieval). A candidate set that only appends to or
+    deletes from a cached one is derived from it with Bm25Index.add/remove.
+    Tokenized documents are cached by text as well, so a new candidate set only
+    tokenizes texts not seen before.
+    """
+
+    def __init__(
+        self,
+        max_indexes: int = BM25_INDEX_CACHE_MAX_ENTRIES,
+        max_tokenized: int = BM25_TOKEN_CACHE_MAX_ENTRIES,
+    ):
+        self.max_indexes = max_indexes
+        self.max_tokenized = max_tokenized
+        self._indexes: "OrderedDict[str, Bm25Index]" = OrderedDict()
+        self._tokens: "OrderedDict[str, List[str]]" = OrderedDict()
+
+    @staticmethod
+    def fingerprint(texts: List[str]) -> str:
+        """Fingerprint of an ordered list of texts"""
+        digest = hashlib.sha1()
+        for text in texts:
+            digest.update(hashlib.sha1(text.encode("utf-8")).digest())
+        return digest.hexdigest()
+
+    def _tokenize(self, text: str) -> List[str]:
+        tokens = self._tokens.get(text)
+        if tokens is not None:
+            self._tokens.move_to_end(text)
+            return tokens
+
+        stemmer, stop_words, _ = _get_english_nlp_resources()
+        tokens = _tokenize_for_bm25(text, stemmer, stop_words)
+        self._tokens[text] = tokens
+        while len(self._tokens) > self.max_tokenized:
+            self._tokens.popitem(last=False)
+        return tokens
+
+    def get_or_build(self, texts: List[str]) -> Bm25Index:
+        """Get the index for these texts (in order), building it on a miss"""
+        key = self.fingerprint(texts)
+        index = self._indexes.get(key)
+        if index is not None:
+            self._indexes.move_to_end(key)
+            return index
+
+        index = self._derive(texts)
+        if index is None:
+            index = Bm25Index(texts, self._tokenize)
+        self._indexes[key] = index
+        while len(self._indexes) > self.max_indexes:
+            self._indexes.popitem(last=False)
+        return index
+
+    def _derive(self, texts: List[str]) -> Optional[Bm25Index]:
+        """Index for texts that append to or delete from a cached index"""
+        for base in reversed(self._indexes.values()):
+            if len(texts) > len(base) and texts[: len(base)] == base.texts:
+                index = base.copy()
+                index.add(texts[len(base) :])
+                return index
+            if len(texts) < len(base):
+                removed = _removed_positions(base.texts, texts)
+                if removed is not None:
+                    index = base.copy()
+                    index.remove(removed)
+                    return index
+        return None
+
+    def clear(self) -> None:
+        self._indexes.clear()
+        self._tokens.clear()
+
+
+def _removed_positions(old: List[str], new: List[str]) -> Optional[List[int]]:
+    """Positions to remove from old to get new, None if new is not a subsequence"""
+    removed = []
+    j = 0
+    for i, text in enumerate(old):
+        if j < len(new) and new[j] == text:
+            j += 1
         else:
-            tokens = word_tokenize(text.lower())
-            processed_tokens = [
-                stemmer.stem(token)
-                for token in tokens
-                if token.isalpha() and len(token) >= 2 and token not in stop_words
-            ]
+            removed.append(i)
+    return removed if j == len(new) else None
 
-        tokenized_docs.append(processed_tokens)
 
-    bm25 = BM25Okapi(tokenized_docs)
-    return bm25, tokenized_docs, stemmer, stop_words
+_bm25_index_cache = Bm25IndexCache()
+
+
+def build_bm25_index(candidates):
+    """Build BM25 index (supports Chinese and English), memoised per candidate set"""
+    resources = _get_english_nlp_resources()
+    if resources is None:
+        return None, None, None, None
+    stemmer, stop_words, _ = resources
+
+    index = _bm25_index_cache.get_or_build([_candidate_text(m) for m in candidates])
+    return index.bm25, index.tokenized_docs, stemmer, stop_words
 
 
 async def search_with_bm25(
     query: str, bm25, candidates, stemmer, stop_words, top_k: int = 50
 ) -> List[Tuple]:
     """BM25 retrieval (supports Chinese and English)"""
-    if bm25 is None:
-        return []
-
-    try:
-        from nltk.tokenize import word_tokenize
-    except ImportError:
+    if bm25 is None or _get_english_nlp_resources() is None:
         return []
 
     # Tokenize query (supports Chinese and English)
-    has_chinese = bool(re.search(r'[\u4e00-\u9fff]', query))
-
-    if has_chinese:
-        tokens = list(jieba.cut(query))
-        tokenized_query = filter_chinese_stopwords(tokens)
-    else:
-        tokens = word_tokenize(query.lower())
-        tokenized_query = [
-            stemmer.stem(token)
-            for token in tokens
-            if token.isalpha() and len(token) >= 2 and token not in stop_words
-        ]
-
+    tokenized_query = _tokenize_for_bm25(query, stemmer, stop_words)
     if not tokenized_query:
         return []
 
     # Calculate BM25 scores
-    scores = bm25.get_scores(tokenized_query)
+    scores = np.asarray(bm25.get_scores(tokenized_query))
+
+    # Sort (stable, candidate order breaks ties) and return Top-K
+    order = np.argsort(-scores, kind="stable")[:top_k]
+    return [(candidates[i], float(scores[i])) for i in order]
 
-    # Sort and return Top-K
-    results = sorted(zip(candidates, scores), key=lambda x: x[1], reverse=True)[:top_k]
 
-    return results
+# ==================== Embedding similarity ====================
+
+
+class CandidateEmbeddingMatrix:
+    """
+    Candidate embeddings stacked into L2-normalised matrices (one per dimension)
+
+    Build once per candidate list; every query is then scored with a single
+    matrix-vector product instead of a per-candidate Python loop. Candidates
+    without a usable embedding (missing, zero norm, NaN/inf) are skipped, the
+    same as _safe_cosine_similarity.
+    """
+
+    def __init__(self, candidates):
+        self.candidates = candidates
+        rows_by_dim: Dict[int, Tuple[List[int], List[np.ndarray]]] = {}
+        for i, mem in enumerate(candidates):
+            candidate_extend = getattr(mem, "extend", None)
+            if not isinstance(candidate_extend, dict):
+                continue
+            try:
+                vec = np.asarray(candidate_extend.get("embedding", []), dtype=float)
+            except (TypeError, ValueError):
+                continue
+            if vec.ndim != 1 or vec.size == 0:
+                continue
+            indices, rows = rows_by_dim.setdefault(vec.size, ([], []))
+            indices.append(i)
+            rows.append(vec)
+
+        # dim -> (candidate indices, normalised matrix)
+        self._matrices: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        for dim, (indices, rows) in rows_by_dim.items():
+            matrix = np.vstack(rows)
+            with np.errstate(invalid="ignore", over="ignore"):
+                norms = np.linalg.norm(matrix, axis=1)
+            valid = np.isfinite(norms) & (norms > 0)
+            if not valid.any():
+                continue
+            self._matrices[dim] = (
+                np.asarray(indices)[valid],
+                matrix[valid] / norms[valid][:, None],
+            )
+
+    def similarities(self, query_vec: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cosine similarity of the query against every usable candidate
+
+        Returns:
+            (candidate_indices, scores), empty arrays on dimension mismatch
+        """
+        query_vec = np.asarray(query_vec, dtype=float).ravel()
+        query_norm = np.linalg.norm(query_vec)
+        entry = self._matrices.get(query_vec.size)
+        if entry is None or not query_norm > 0:
+            return np.empty(0, dtype=int), np.empty(0)
+
+        indices, matrix = entry
+        scores = matrix @ (query_vec / query_norm)
+        finite = np.isfinite(scores)
+        return indices[finite], scores[finite]
+
+    def top_k(self, query_vec: np.ndarray, k: int) -> List[Tuple]:
+        """Top-k (candidate, cosine similarity), highest first"""
+        indices, scores = self.similarities(query_vec)
+        order = np.argsort(-scores, kind="stable")[:k]
+        return [(self.candidates[indices[j]], float(scores[j])) for j in order]
 
 
 def reciprocal_rank_fusion(
@@ -179,8 +411,13 @@ async def lightweight_retrieval(
     emb_top_n: int = 50,
     bm25_top_n: int = 50,
     final_top_n: int = 20,
+    embedding_matrix: Optional[CandidateEmbeddingMatrix] = None,
 ) -> Tuple:
-    """Lightweight retrieval (Embedding + BM25 + RRF fusion)"""
+    """Lightweight retrieval (Embedding + BM25 + RRF fusion)
+
+    Pass a prebuilt embedding_matrix when running several queries over the
+    same candidates; the BM25 index is memoised per candidate set.
+    """
     start_time = time.time()
 
     metadata = {
@@ -205,16 +442,9 @@ async def lightweight_retrieval(
         query_vec = np.asarray(
             await vectorize_service.get_embedding(query), dtype=float
         )
-        query_norm = np.linalg.norm(query_vec)
-
-        if query_norm > 0:
-            scores = []
-            for mem in candidates:
-                sim = _safe_cosine_similarity(query_vec, query_norm, mem)
-                if sim is not None:
-                    scores.append((mem, sim))
-
-            emb_results = sorted(scores, key=lambda x: x[1], reverse=True)[:emb_top_n]
+        if embedding_matrix is None:
+            embedding_matrix = CandidateEmbeddingMatrix(candidates)
+        emb_results = embedding_matrix.top_k(query_vec, emb_top_n)
     except Exception as e:
         logger.warning(
             "Embedding retrieval failed in lightweight_retrieval, falling back: %s", e
@@ -321,6 +551,7 @@ async def multi_query_retrieval(
     bm25_top_n: int = 50,
     final_top_n: int = 40,
     rrf_k: int = 60,
+    embedding_matrix: Optional[CandidateEmbeddingMatrix] = None,
 ) -> Tuple[List[Tuple], Dict[str, Any]]:
     """
     Multi-query parallel retrieval + RRF fusion
@@ -340,6 +571,7 @@ async def multi_query_retrieval(
         bm25_top_n: Number of BM25 candidates per query
         final_top_n: Number of documents to return after fusion
         rrf_k: RRF parameter
+        embedding_matrix: Prebuilt candidate embedding matrix (optional)
 
     Returns:
         (results, metadata)
@@ -373,9 +605,13 @@ async def multi_query_retrieval(
 
     logger.info(f"Executing {len(queries)} queries in parallel...")
 
-    # Execute hybrid retrieval for all queries in parallel
+    # Execute hybrid retrieval for all queries in parallel (shared embedding matrix)
+    if embedding_matrix is None:
+        embedding_matrix = CandidateEmbeddingMatrix(candidates)
     tasks = [
-        lightweight_retrieval(q, candidates, emb_top_n, bm25_top_n, final_top_n)
+        lightweight_retrieval(
+            q, candidates, emb_top_n, bm25_top_n, final_top_n, embedding_matrix
+        )
         for q in queries
     ]
 
@@ -592,6 +828,9 @@ async def agentic_retrieval(
     # ========== Round 1: Hybrid search Top 20 ==========
     logger.info("Round 1: Hybrid search for Top 20...")
 
+    # Stacked once, shared by Round 1 and every Round 2 query
+    embedding_matrix = CandidateEmbeddingMatrix(candidates)
+
     try:
         round1_results, round1_metadata = await lightweight_retrieval(
             query=query,
@@ -599,6 +838,7 @@ async def agentic_retrieval(
             emb_top_n=config.round1_emb_top_n,
             bm25_top_n=config.round1_bm25_top_n,
             final_top_n=config.round1_top_n,
+            embedding_matrix=embedding_matrix,
         )
 
         metadata["round1_count"] = len(round1_results)
@@ -733,6 +973,7 @@ async def agentic_retrieval(
             bm25_top_n=config.round1_bm25_top_n,
             final_top_n=config.round2_per_query_top_n,
             rrf_k=60,
+            embedding_matrix=embedding_matrix,
         )
 
         metadata["round2_count"] = len(round2_results)
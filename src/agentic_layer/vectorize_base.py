@@ -16,6 +16,8 @@ from agentic_layer.vectorize_interface import (
     VectorizeError,
     UsageInfo,
 )
+from agentic_layer.vectorize_batcher import EmbeddingMicroBatcher
+from core.rate_limit.rate_limiter import get_provider_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -28,16 +30,36 @@ class BaseVectorizeService(VectorizeServiceInterface):
     - _get_config_params(): return (api_key, base_url, model)
     - _should_pass_dimensions(): return True/False
     - _should_truncate_client_side(): return True/False
+
+    When config.micro_batch_enabled is set, concurrent get_embedding calls are
+    coalesced into batched requests by an EmbeddingMicroBatcher.
     """
 
+    provider_name: str = "unknown"
+
     def __init__(self, config):
         self.config = config
         self.client: Optional[AsyncOpenAI] = None
         self._semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+        self._rate_limiter = get_provider_rate_limiter(
+            f"vectorize:{self.provider_name}:{config.model}",
+            config.rate_limit_rps,
+            config.rate_limit_burst,
+        )
+
+        self._batcher: Optional[EmbeddingMicroBatcher] = None
+        if config.micro_batch_enabled:
+            self._batcher = EmbeddingMicroBatcher(
+                send_batch=self._embed_texts,
+                provider=self.provider_name,
+                window_ms=config.micro_batch_window_ms,
+                max_batch_size=config.micro_batch_max_size or config.batch_size,
+            )
         
         api_key, base_url, model = self._get_config_params()
         logger.info(
-            f"Initialized {self.__class__.__name__} | model={model} | base_url={base_url}"
+            f"Initialized {self.__class__.__name__} | model={model} | base_url={base_url} | "
+            f"micro_batch={config.micro_batch_enabled}"
         )
 
     @abstractmethod
@@ -73,6 +95,8 @@ class BaseVectorizeService(VectorizeServiceInterface):
 
     async def close(self):
         """Close the client connection"""
+        if self._batcher:
+            await self._batcher.close()
         if self.client:
             await self.client.close()
             self.client = None
@@ -105,6 +129,9 @@ class BaseVectorizeService(VectorizeServiceInterface):
         async with self._semaphore:
             for attempt in range(self.config.max_retries):
                 try:
+                    if self._rate_limiter is not None:
+                        await self._rate_limiter.acquire()
+
                     request_kwargs = {
                         "model": self.config.model,
                         "input": formatted_texts,
@@ -162,10 +189,21 @@ class BaseVectorizeService(VectorizeServiceInterface):
             embeddings.append(emb)
         return embeddings
 
+    async def _embed_texts(
+        self, texts: List[str], instruction: Optional[str], is_query: bool
+    ) -> List[np.ndarray]:
+        """Send one embeddings request for texts (micro-batcher flush target)"""
+        response = await self._make_request(texts, instruction, is_query)
+        return self._parse_embeddings_response(response)
+
     async def get_embedding(
         self, text: str, instruction: Optional[str] = None, is_query: bool = False
     ) -> np.ndarray:
-        """Get embedding for a single text"""
+        """Get embedding for a single text (coalesced when micro-batching is on)"""
+        if self._batcher is not None:
+            embedding = await self._batcher.submit(text, instruction, is_query)
+            return np.array(embedding, dtype=np.float32)
+
         response = await self._make_request([text], instruction, is_query)
         if not response.data:
             raise VectorizeError("Invalid API response: missing data")
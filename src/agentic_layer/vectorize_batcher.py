@@ -0,0 +1,145 @@
+"""
+Embedding Micro-Batcher
+
+Coalesces concurrent single-text embedding requests into one batched API call.
+
+Requests that arrive within a short flush window (or until max_batch_size is
+reached) and share the same (instruction, is_query) are sent together; each
+caller awaits its own future and receives its own embedding.
+
+Usage:
+    batcher = EmbeddingMicroBatcher(
+        send_batch=service._embed_texts,
+        provider="vllm",
+        window_ms=5.0,
+        max_batch_size=32,
+    )
+    embedding = await batcher.submit("hello", instruction=None, is_query=True)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from agentic_layer.metrics.vectorize_metrics import record_vectorize_micro_batch
+
+logger = logging.getLogger(__name__)
+
+# (texts, instruction, is_query) -> embeddings, in input order
+SendBatchFunc = Callable[[List[str], Optional[str], bool], Awaitable[List[np.ndarray]]]
+BatchKey = Tuple[Optional[str], bool]
+
+
+@dataclass
+class _PendingBatch:
+    """Requests waiting to be flushed together"""
+
+    texts: List[str] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+    enqueued_at: List[float] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class EmbeddingMicroBatcher:
+    """Async micro-batcher for single-text embedding requests"""
+
+    def __init__(
+        self,
+        send_batch: SendBatchFunc,
+        provider: str,
+        window_ms: float = 5.0,
+        max_batch_size: int = 32,
+    ):
+        """
+        Args:
+            send_batch: Coroutine function sending one batched embeddings call
+            provider: Provider name used as metrics label
+            window_ms: Maximum time a request waits for companions before flushing
+            max_batch_size: Flush immediately once this many requests are queued
+        """
+        self._send_batch = send_batch
+        self.provider = provider
+        self.window_seconds = max(window_ms, 0.0) / 1000.0
+        self.max_batch_size = max(max_batch_size, 1)
+        self._pending: Dict[BatchKey, _PendingBatch] = {}
+        self._inflight: set = set()
+
+        logger.info(
+            f"Initialized EmbeddingMicroBatcher | provider={provider} | "
+            f"window_ms={window_ms} | max_batch_size={self.max_batch_size}"
+        )
+
+    async def submit(
+        self, text: str, instruction: Optional[str] = None, is_query: bool = False
+    ) -> np.ndarray:
+        """Queue a single text and wait for its embedding"""
+        loop = asyncio.get_running_loop()
+        key: BatchKey = (instruction, is_query)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch()
+            self._pending[key] = batch
+
+        future = loop.create_future()
+        batch.texts.append(text)
+        batch.futures.append(future)
+        batch.enqueued_at.append(time.perf_counter())
+
+        if len(batch.texts) >= self.max_batch_size:
+            self._flush(key, reason="size")
+        elif batch.timer is None:
+            batch.timer = loop.call_later(
+                self.window_seconds, self._flush, key, "window"
+            )
+
+        return await future
+
+    def _flush(self, key: BatchKey, reason: str) -> None:
+        """Detach the pending batch for key and send it in the background"""
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        task = asyncio.create_task(self._send(key, batch, reason))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, key: BatchKey, batch: _PendingBatch, reason: str) -> None:
+        instruction, is_query = key
+        flushed_at = time.perf_counter()
+        record_vectorize_micro_batch(
+            provider=self.provider,
+            reason=reason,
+            batch_size=len(batch.texts),
+            wait_seconds=[flushed_at - t for t in batch.enqueued_at],
+        )
+
+        try:
+            embeddings = await self._send_batch(batch.texts, instruction, is_query)
+            if len(embeddings) != len(batch.futures):
+                raise ValueError(
+                    f"Embedding count mismatch: expected {len(batch.futures)}, "
+                    f"got {len(embeddings)}"
+                )
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, embedding in zip(batch.futures, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+
+    async def close(self) -> None:
+        """Flush everything still queued and wait for in-flight batches"""
+        for key in list(self._pending.keys()):
+            self._flush(key, reason="close")
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
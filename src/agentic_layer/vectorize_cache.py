@@ -0,0 +1,282 @@
+"""
+Vectorize Embedding Cache
+
+Two-tier cache for embedding results, sitting in front of the vectorize providers:
+- Local tier: in-process LRU with TTL (always on when the cache is enabled)
+- Redis tier: optional shared tier through RedisProvider
+
+Entries are keyed by (model, dimensions, instruction, is_query, text hash) and
+stored as raw float32 bytes, so a 1024-d vector costs 4 KB instead of a JSON list.
+
+Usage:
+    from agentic_layer.vectorize_cache import EmbeddingCache
+
+    cache = EmbeddingCache()
+    key = cache.build_key(model, dimensions, text, instruction, is_query)
+    embedding = await cache.get(key)
+    if embedding is None:
+        embedding = await compute(...)
+        await cache.set(key, embedding)
+"""
+
+import hashlib
+import logging
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from agentic_layer.metrics.vectorize_metrics import record_vectorize_cache
+from core.cache.local_ttl_cache import LocalTTLCache
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "vectorize_cache"
+REDIS_CLIENT_NAME = "vectorize_cache"
+
+
+@dataclass
+class EmbeddingCacheConfig:
+    """Configuration for the embedding cache"""
+
+    enabled: bool = True
+    local_max_entries: int = 4096
+    local_ttl_seconds: int = 3600
+
+    redis_enabled: bool = False
+    redis_ttl_seconds: int = 86400
+
+    def __post_init__(self):
+        """Load cache configuration from environment"""
+        self.enabled = (
+            os.getenv("VECTORIZE_CACHE_ENABLED", str(self.enabled)).lower() == "true"
+        )
+        self.local_max_entries = int(
+            os.getenv("VECTORIZE_CACHE_MAX_ENTRIES", str(self.local_max_entries))
+        )
+        self.local_ttl_seconds = int(
+            os.getenv("VECTORIZE_CACHE_TTL_SECONDS", str(self.local_ttl_seconds))
+        )
+        self.redis_enabled = (
+            os.getenv("VECTORIZE_CACHE_REDIS_ENABLED", str(self.redis_enabled)).lower()
+            == "true"
+        )
+        self.redis_ttl_seconds = int(
+            os.getenv("VECTORIZE_CACHE_REDIS_TTL_SECONDS", str(self.redis_ttl_seconds))
+        )
+
+
+class EmbeddingCacheBackend(ABC):
+    """Embedding cache storage tier (values are float32 bytes)"""
+
+    tier: str = "unknown"
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get cached bytes, None on miss"""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes) -> None:
+        """Store bytes under key"""
+        pass
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Get multiple keys, default implementation loops over get()"""
+        return [await self.get(key) for key in keys]
+
+    async def clear(self) -> None:
+        """Drop all entries held by this tier (optional)"""
+        pass
+
+
+class LocalEmbeddingCache(EmbeddingCacheBackend):
+    """In-process LRU cache with per-entry TTL"""
+
+    tier = "local"
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: int = 3600):
+        self._cache = LocalTTLCache(max_entries, ttl_seconds)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        self._cache.set(key, value)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class RedisEmbeddingCache(EmbeddingCacheBackend):
+    """Shared Redis cache tier (binary client, fail-open on Redis errors)"""
+
+    tier = "redis"
+
+    def __init__(self, ttl_seconds: int = 86400, redis_provider=None):
+        self.ttl_seconds = ttl_seconds
+        self._redis_provider = redis_provider
+
+    async def _get_client(self):
+        if self._redis_provider is None:
+            from core.di import get_bean_by_type
+            from core.component.redis_provider import RedisProvider
+
+            self._redis_provider = get_bean_by_type(RedisProvider)
+        return await self._redis_provider.get_named_client(
+            REDIS_CLIENT_NAME, decode_responses=False
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            client = await self._get_client()
+            return await client.get(key)
+        except Exception as e:
+            logger.warning(f"Embedding cache Redis GET failed: key={key}, error={e}")
+            return None
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        try:
+            client = await self._get_client()
+            return await client.mget(keys)
+        except Exception as e:
+            logger.warning(f"Embedding cache Redis MGET failed: error={e}")
+            return [None] * len(keys)
+
+    async def set(self, key: str, value: bytes) -> None:
+        try:
+            client = await self._get_client()
+            await client.set(key, value, ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Embedding cache Redis SET failed: key={key}, error={e}")
+
+
+class EmbeddingCache:
+    """
+    Tiered embedding cache
+
+    Lookups go through the tiers in order (local first); a hit in a lower tier
+    is promoted into the tiers above it. Writes go to every tier.
+    """
+
+    def __init__(
+        self,
+        config: Optional[EmbeddingCacheConfig] = None,
+        backends: Optional[List[EmbeddingCacheBackend]] = None,
+    ):
+        if config is None:
+            config = EmbeddingCacheConfig()
+        self.config = config
+
+        if backends is None:
+            backends = [
+                LocalEmbeddingCache(
+                    max_entries=config.local_max_entries,
+                    ttl_seconds=config.local_ttl_seconds,
+                )
+            ]
+            if config.redis_enabled:
+                backends.append(
+                    RedisEmbeddingCache(ttl_seconds=config.redis_ttl_seconds)
+                )
+        self.backends = backends
+
+        logger.info(
+            f"Initialized EmbeddingCache | enabled={config.enabled} | "
+            f"tiers={[backend.tier for backend in self.backends]}"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled and bool(self.backends)
+
+    @staticmethod
+    def build_key(
+        model: str,
+        dimensions: int,
+        text: str,
+        instruction: Optional[str] = None,
+        is_query: bool = False,
+    ) -> str:
+        """Build cache key from (model, dimensions, instruction, is_query, text hash)"""
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        instruction_hash = (
+            hashlib.sha256(instruction.encode("utf-8")).hexdigest()[:16]
+            if instruction is not None
+            else "-"
+        )
+        return (
+            f"{CACHE_KEY_PREFIX}:{model}:{dimensions}:{instruction_hash}:"
+            f"{int(is_query)}:{text_hash}"
+        )
+
+    @staticmethod
+    def encode(embedding: np.ndarray) -> bytes:
+        """Encode embedding as raw float32 bytes"""
+        return np.asarray(embedding, dtype=np.float32).tobytes()
+
+    @staticmethod
+    def decode(value: bytes) -> np.ndarray:
+        """Decode raw float32 bytes (returns a writable copy)"""
+        return np.frombuffer(value, dtype=np.float32).copy()
+
+    async def get(self, key: str) -> Optional[np.ndarray]:
+        """Look up a single embedding, returns None on miss"""
+        return (await self.get_many([key]))[0]
+
+    async def get_many(self, keys: List[str]) -> List[Optional[np.ndarray]]:
+        """Look up multiple embeddings, preserving order (None for misses)"""
+        results: List[Optional[bytes]] = [None] * len(keys)
+        if not self.enabled or not keys:
+            return [None] * len(keys)
+
+        pending = list(range(len(keys)))
+        for level, backend in enumerate(self.backends):
+            if not pending:
+                break
+
+            values = await backend.get_many([keys[i] for i in pending])
+            still_pending = []
+            hits = 0
+            for i, value in zip(pending, values):
+                if value is None:
+                    still_pending.append(i)
+                    continue
+                hits += 1
+                results[i] = value
+                # Promote into upper tiers
+                for upper in self.backends[:level]:
+                    await upper.set(keys[i], value)
+
+            record_vectorize_cache(tier=backend.tier, result="hit", count=hits)
+            record_vectorize_cache(
+                tier=backend.tier, result="miss", count=len(still_pending)
+            )
+            pending = still_pending
+
+        return [self.decode(value) if value is not None else None for value in results]
+
+    async def set(self, key: str, embedding: np.ndarray) -> None:
+        """Store an embedding in every tier"""
+        if not self.enabled:
+            return
+        value = self.encode(embedding)
+        for backend in self.backends:
+            await backend.set(key, value)
+
+    async def set_many(self, items: Dict[str, np.ndarray]) -> None:
+        """Store multiple embeddings in every tier"""
+        for key, embedding in items.items():
+            await self.set(key, embedding)
+
+    async def clear(self) -> None:
+        """Clear every tier that supports it"""
+        for backend in self.backends:
+            await backend.clear()
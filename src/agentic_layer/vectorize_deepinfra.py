@@ -28,6 +28,15 @@ class DeepInfraVectorizeConfig:
     encoding_format: str = "float"
     dimensions: int = 1024
 
+    # Micro-batching of concurrent single-text requests (opt-in)
+    micro_batch_enabled: bool = False
+    micro_batch_window_ms: float = 5.0
+    micro_batch_max_size: int = 0  # 0 means use batch_size
+
+    # Requests per second to the provider (0 = no rate limit)
+    rate_limit_rps: float = 0.0
+    rate_limit_burst: int = 10
+
 
 class DeepInfraVectorizeService(BaseVectorizeService):
     """
@@ -35,6 +44,8 @@ class DeepInfraVectorizeService(BaseVectorizeService):
     Uses DeepInfra's commercial API for text embeddings
     """
 
+    provider_name = "deepinfra"
+
     def __init__(self, config: Optional[DeepInfraVectorizeConfig] = None):
         if config is None:
             config = DeepInfraVectorizeConfig()
@@ -26,6 +26,7 @@ from agentic_layer.vectorize_deepinfra import (
     DeepInfraVectorizeService,
     DeepInfraVectorizeConfig,
 )
+from agentic_layer.vectorize_cache import EmbeddingCache
 from agentic_layer.metrics.vectorize_metrics import (
     record_vectorize_request,
     record_vectorize_fallback,
@@ -62,6 +63,15 @@ class HybridVectorizeConfig:
     encoding_format: str = "float"
     dimensions: int = 1024
 
+    # Micro-batching of concurrent single-text requests (opt-in)
+    micro_batch_enabled: bool = False
+    micro_batch_window_ms: float = 5.0
+    micro_batch_max_size: int = 0  # 0 means use batch_size
+
+    # Requests per second to each provider (0 = no rate limit)
+    rate_limit_rps: float = 0.0
+    rate_limit_burst: int = 10
+
     # Fallback behavior
     enable_fallback: bool = True
     max_primary_failures: int = 3
@@ -96,6 +106,30 @@ class HybridVectorizeConfig:
         self.encoding_format = os.getenv("VECTORIZE_ENCODING_FORMAT", self.encoding_format)
         self.dimensions = int(os.getenv("VECTORIZE_DIMENSIONS", str(self.dimensions)))
 
+        # Read micro-batching settings
+        self.micro_batch_enabled = (
+            os.getenv(
+                "VECTORIZE_MICRO_BATCH_ENABLED", str(self.micro_batch_enabled)
+            ).lower()
+            == "true"
+        )
+        self.micro_batch_window_ms = float(
+            os.getenv(
+                "VECTORIZE_MICRO_BATCH_WINDOW_MS", str(self.micro_batch_window_ms)
+            )
+        )
+        self.micro_batch_max_size = int(
+            os.getenv("VECTORIZE_MICRO_BATCH_MAX_SIZE", str(self.micro_batch_max_size))
+        )
+
+        # Read provider rate limit
+        self.rate_limit_rps = float(
+            os.getenv("VECTORIZE_RATE_LIMIT_RPS", str(self.rate_limit_rps))
+        )
+        self.rate_limit_burst = int(
+            os.getenv("VECTORIZE_RATE_LIMIT_BURST", str(self.rate_limit_burst))
+        )
+
         # Fallback behavior
         # Enable fallback only if:
         # 1. fallback_provider is not "none"
@@ -126,6 +160,11 @@ def _create_service_from_config(
     max_concurrent: int,
     encoding_format: str,
     dimensions: int,
+    micro_batch_enabled: bool = False,
+    micro_batch_window_ms: float = 5.0,
+    micro_batch_max_size: int = 0,
+    rate_limit_rps: float = 0.0,
+    rate_limit_burst: int = 10,
 ) -> VectorizeServiceInterface:
     """
     Factory function to create a vectorize service based on provider type
@@ -141,6 +180,11 @@ def _create_service_from_config(
         max_concurrent: Maximum concurrent requests
         encoding_format: Encoding format for embeddings
         dimensions: Vector dimensions
+        micro_batch_enabled: Whether to coalesce concurrent single-text requests
+        micro_batch_window_ms: Micro-batch flush window in milliseconds
+        micro_batch_max_size: Micro-batch size limit (0 means batch_size)
+        rate_limit_rps: Requests per second to the provider (0 means no rate limit)
+        rate_limit_burst: Maximum burst of requests to the provider
         
     Returns:
         VectorizeServiceInterface: The created service instance
@@ -156,6 +200,11 @@ def _create_service_from_config(
             max_concurrent_requests=max_concurrent,
             encoding_format=encoding_format,
             dimensions=dimensions,
+            micro_batch_enabled=micro_batch_enabled,
+            micro_batch_window_ms=micro_batch_window_ms,
+            micro_batch_max_size=micro_batch_max_size,
+            rate_limit_rps=rate_limit_rps,
+            rate_limit_burst=rate_limit_burst,
         )
         return VllmVectorizeService(config)
     elif provider.lower() == "deepinfra":
@@ -169,6 +218,11 @@ def _create_service_from_config(
             max_concurrent_requests=max_concurrent,
             encoding_format=encoding_format,
             dimensions=dimensions,
+            micro_batch_enabled=micro_batch_enabled,
+            micro_batch_window_ms=micro_batch_window_ms,
+            micro_batch_max_size=micro_batch_max_size,
+            rate_limit_rps=rate_limit_rps,
+            rate_limit_burst=rate_limit_burst,
         )
         return DeepInfraVectorizeService(config)
     else:
@@ -185,6 +239,8 @@ class HybridVectorizeService(VectorizeServiceInterface):
     3. Secondary: Configurable fallback provider
     4. Automatic failover on errors with failure tracking
     5. All method calls transparently use fallback logic
+    6. get_embedding / get_embeddings are served from a tiered embedding cache
+       (in-process LRU + optional Redis) before any network round trip
     
     Strategy Benefits:
     - Cost optimization: ~95% savings with vllm self-deployed service
@@ -196,11 +252,16 @@ class HybridVectorizeService(VectorizeServiceInterface):
         embedding = await service.get_embedding("Hello")  # Auto-fallback built-in
     """
 
-    def __init__(self, config: Optional[HybridVectorizeConfig] = None):
+    def __init__(
+        self,
+        config: Optional[HybridVectorizeConfig] = None,
+        cache: Optional[EmbeddingCache] = None,
+    ):
         if config is None:
             config = HybridVectorizeConfig()
 
         self.config = config
+        self.cache = cache if cache is not None else EmbeddingCache()
         
         # Create primary service based on provider type
         self.primary_service = _create_service_from_config(
@@ -214,6 +275,11 @@ class HybridVectorizeService(VectorizeServiceInterface):
             max_concurrent=config.max_concurrent_requests,
             encoding_format=config.encoding_format,
             dimensions=config.dimensions,
+            micro_batch_enabled=config.micro_batch_enabled,
+            micro_batch_window_ms=config.micro_batch_window_ms,
+            micro_batch_max_size=config.micro_batch_max_size,
+            rate_limit_rps=config.rate_limit_rps,
+            rate_limit_burst=config.rate_limit_burst,
         )
         
         # Create fallback service if enabled
@@ -230,6 +296,11 @@ class HybridVectorizeService(VectorizeServiceInterface):
                 max_concurrent=config.max_concurrent_requests,
                 encoding_format=config.encoding_format,
                 dimensions=config.dimensions,
+                micro_batch_enabled=config.micro_batch_enabled,
+                micro_batch_window_ms=config.micro_batch_window_ms,
+                micro_batch_max_size=config.micro_batch_max_size,
+                rate_limit_rps=config.rate_limit_rps,
+                rate_limit_burst=config.rate_limit_burst,
             )
 
         logger.info(
@@ -253,16 +324,40 @@ class HybridVectorizeService(VectorizeServiceInterface):
     
     # Implement VectorizeServiceInterface methods with automatic fallback
     
+    def _cache_key(
+        self, text: str, instruction: Optional[str], is_query: bool
+    ) -> Optional[str]:
+        """Build embedding cache key, None when the cache is disabled"""
+        if not self.cache.enabled:
+            return None
+        return self.cache.build_key(
+            model=self.config.model,
+            dimensions=self.config.dimensions,
+            text=text,
+            instruction=instruction,
+            is_query=is_query,
+        )
+
     async def get_embedding(
         self, text: str, instruction: Optional[str] = None, is_query: bool = False
     ) -> np.ndarray:
-        """Get embedding for a single text with automatic fallback"""
-        return await self.execute_with_fallback(
+        """Get embedding for a single text with cache lookup and automatic fallback"""
+        cache_key = self._cache_key(text, instruction, is_query)
+        if cache_key is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        embedding = await self.execute_with_fallback(
             "get_embedding",
             lambda: self.primary_service.get_embedding(text, instruction, is_query),
             lambda: self.fallback_service.get_embedding(text, instruction, is_query) if self.fallback_service else None,
             batch_size=1,
         )
+
+        if cache_key is not None:
+            await self.cache.set(cache_key, embedding)
+        return embedding
     
     async def get_embedding_with_usage(
         self, text: str, instruction: Optional[str] = None, is_query: bool = False
@@ -281,7 +376,38 @@ class HybridVectorizeService(VectorizeServiceInterface):
         instruction: Optional[str] = None,
         is_query: bool = False,
     ) -> List[np.ndarray]:
-        """Get embeddings for multiple texts with automatic fallback"""
+        """Get embeddings for multiple texts with cache lookup and automatic fallback
+
+        Only texts missing from the cache are sent to the provider.
+        """
+        if not texts or not self.cache.enabled:
+            return await self._get_embeddings_uncached(texts, instruction, is_query)
+
+        cache_keys = [self._cache_key(text, instruction, is_query) for text in texts]
+        embeddings = await self.cache.get_many(cache_keys)
+
+        miss_indices = [i for i, emb in enumerate(embeddings) if emb is None]
+        if miss_indices:
+            miss_embeddings = await self._get_embeddings_uncached(
+                [texts[i] for i in miss_indices], instruction, is_query
+            )
+            for i, embedding in zip(miss_indices, miss_embeddings):
+                embeddings[i] = embedding
+            await self.cache.set_many(
+                {
+                    cache_keys[i]: embedding
+                    for i, embedding in zip(miss_indices, miss_embeddings)
+                }
+            )
+        return embeddings
+
+    async def _get_embeddings_uncached(
+        self,
+        texts: List[str],
+        instruction: Optional[str] = None,
+        is_query: bool = False,
+    ) -> List[np.ndarray]:
+        """Get embeddings for multiple texts from the providers with automatic fallback"""
         return await self.execute_with_fallback(
             "get_embeddings",
             lambda: self.primary_service.get_embeddings(texts, instruction, is_query),
@@ -29,6 +29,15 @@ class VllmVectorizeConfig:
     encoding_format: str = "float"
     dimensions: int = 1024  # Client-side truncation target
 
+    # Micro-batching of concurrent single-text requests (opt-in)
+    micro_batch_enabled: bool = False
+    micro_batch_window_ms: float = 5.0
+    micro_batch_max_size: int = 0  # 0 means use batch_size
+
+    # Requests per second to the provider (0 = no rate limit)
+    rate_limit_rps: float = 0.0
+    rate_limit_burst: int = 10
+
 
 class VllmVectorizeService(BaseVectorizeService):
     """
@@ -39,6 +48,8 @@ class VllmVectorizeService(BaseVectorizeService):
     - Any OpenAI-compatible embedding endpoint
     """
 
+    provider_name = "vllm"
+
     def __init__(self, config: Optional[VllmVectorizeConfig] = None):
         if config is None:
             config = VllmVectorizeConfig()
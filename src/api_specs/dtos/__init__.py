@@ -18,6 +18,10 @@ from api_specs.dtos.memory import (
     MemorizeMessageRequest,
     MemorizeResult,
     MemorizeResponse,
+    MemorizeBatchRequest,
+    MemorizeBatchGroupResult,
+    MemorizeBatchResult,
+    MemorizeBatchResponse,
     # Fetch
     FetchMemRequest,
     FetchMemResponse,
@@ -63,6 +67,10 @@ __all__ = [
     "MemorizeMessageRequest",
     "MemorizeResult",
     "MemorizeResponse",
+    "MemorizeBatchRequest",
+    "MemorizeBatchGroupResult",
+    "MemorizeBatchResult",
+    "MemorizeBatchResponse",
     # Memory - Fetch
     "FetchMemRequest",
     "FetchMemResponse",
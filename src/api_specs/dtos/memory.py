@@ -28,6 +28,7 @@ from api_specs.memory_models import (
     MessageSenderRole,
 )
 from core.oxm.constants import MAGIC_ALL, MAX_FETCH_LIMIT, MAX_RETRIEVE_LIMIT
+from core.oxm.keyset_pagination import KeysetCursor
 
 
 iso_pattern = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'
@@ -468,6 +469,70 @@ class MemorizeResponse(BaseApiResponse[MemorizeResult]):
     }
 
 
+# Maximum number of messages accepted by one batch memorize request
+MAX_MEMORIZE_BATCH_SIZE = 1000
+
+
+class MemorizeBatchRequest(BaseModel):
+    """
+    Store message batch request body (HTTP API layer)
+
+    Used for POST /api/v1/memories/batch endpoint
+    """
+
+    messages: List[MemorizeMessageRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_MEMORIZE_BATCH_SIZE,
+        description="Ordered messages, may span several groups. Messages of the same group "
+        "are processed in the given order, different groups are processed concurrently.",
+    )
+
+
+class MemorizeBatchGroupResult(BaseModel):
+    """Memory storage result of one group in a batch"""
+
+    group_id: str = Field(..., description="Group ID", examples=["group_123"])
+    message_count: int = Field(
+        default=0, description="Number of messages received for this group"
+    )
+    memcell_count: int = Field(
+        default=0, description="Number of MemCells (boundaries) detected"
+    )
+    count: int = Field(default=0, description="Number of memories extracted")
+    error: Optional[str] = Field(
+        default=None, description="Error message if this group failed"
+    )
+
+
+class MemorizeBatchResult(BaseModel):
+    """Memory storage result data
+
+    Result data for POST /api/v1/memories/batch endpoint.
+    """
+
+    count: int = Field(
+        default=0, description="Total number of memories extracted", examples=[3]
+    )
+    memcell_count: int = Field(
+        default=0, description="Total number of MemCells detected", examples=[2]
+    )
+    groups: List[MemorizeBatchGroupResult] = Field(
+        default_factory=list, description="Per-group results"
+    )
+
+
+class MemorizeBatchResponse(BaseApiResponse[MemorizeBatchResult]):
+    """Memory batch storage response
+
+    Response for POST /api/v1/memories/batch endpoint.
+    """
+
+    result: MemorizeBatchResult = Field(
+        default_factory=MemorizeBatchResult, description="Memory batch storage result"
+    )
+
+
 # =============================================================================
 # Fetch DTOs (GET /api/v1/memories)
 # =============================================================================
@@ -483,6 +548,7 @@ class FetchMemRequest(BaseModel):
     - Empty string or None for user_id/group_id filters for null/empty values
     - user_id and group_id cannot both be MAGIC_ALL
     - limit is capped at MAX_FETCH_LIMIT (500)
+    - cursor (keyset on time + _id) pages in constant time; offset is not applied
     """
 
     user_id: Optional[str] = Field(
@@ -501,6 +567,11 @@ class FetchMemRequest(BaseModel):
     offset: Optional[int] = Field(
         default=0, description="Pagination offset", ge=0, examples=[0]
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque keyset cursor from the previous page's next_cursor",
+        examples=[None],
+    )
     memory_type: Optional[MemoryType] = Field(
         default=MemoryType.EPISODIC_MEMORY,
         description="""Memory type, enum values from MemoryType:
@@ -538,6 +609,10 @@ class FetchMemRequest(BaseModel):
         if self.limit and self.limit > MAX_FETCH_LIMIT:
             object.__setattr__(self, "limit", MAX_FETCH_LIMIT)
 
+        # Reject malformed cursors up front (raises ValueError)
+        if self.cursor:
+            KeysetCursor.decode(self.cursor)
+
         return self
 
     def get_memory_types(self) -> List[MemoryType]:
@@ -551,6 +626,9 @@ class FetchMemResponse(BaseModel):
     memories: SkipValidation[List[MemoryModel]] = Field(default_factory=list)
     total_count: int = 0
     has_more: bool = False
+    next_cursor: Optional[str] = Field(
+        default=None, description="Cursor for the next page, None on the last page"
+    )
     metadata: SkipValidation[Optional[Metadata]] = None
 
     model_config = {"arbitrary_types_allowed": True}
@@ -581,6 +659,7 @@ class FetchMemoriesResponse(BaseApiResponse[FetchMemResponse]):
                     ],
                     "total_count": 100,
                     "has_more": False,
+                    "next_cursor": None,
                     "metadata": {
                         "source": "fetch_mem_service",
                         "user_id": "user_123",
@@ -633,6 +712,12 @@ Note: profile type is not supported in search interface""",
     include_metadata: bool = Field(
         default=True, description="Whether to include metadata", examples=[True]
     )
+    include_original_data: bool = Field(
+        default=True,
+        description="Whether to include the raw messages of the matched MemCells in original_data "
+        "(set to false to skip loading them)",
+        examples=[True],
+    )
     start_time: Optional[str] = Field(
         default=None,
         description="Time range start (ISO 8601 format)",
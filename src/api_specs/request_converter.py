@@ -173,6 +173,7 @@ def convert_dict_to_fetch_mem_request(data: Dict[str, Any]) -> FetchMemRequest:
             memory_type=memory_type,
             limit=limit,
             offset=offset,
+            cursor=data.get("cursor") or None,
             version_range=data.get("version_range", None),
             start_time=data.get("start_time"),
             end_time=data.get("end_time"),
@@ -205,6 +206,9 @@ def convert_dict_to_retrieve_mem_request(
 
         top_k = _parse_int(data.get("top_k"), default=10)
         include_metadata = _parse_bool(data.get("include_metadata"), default=True)
+        include_original_data = _parse_bool(
+            data.get("include_original_data"), default=True
+        )
         radius = _parse_float(data.get("radius"))
         memory_types = _parse_memory_types(data.get("memory_types", []))
 
@@ -220,6 +224,7 @@ def convert_dict_to_retrieve_mem_request(
             memory_types=memory_types,
             top_k=top_k,
             include_metadata=include_metadata,
+            include_original_data=include_original_data,
             start_time=data.get("start_time", None),
             end_time=data.get("end_time", None),
             radius=radius,  # COSINE similarity threshold
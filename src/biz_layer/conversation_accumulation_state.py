@@ -0,0 +1,281 @@
+"""
+Conversation accumulation state
+
+Per-group cache of the current accumulation window (messages since the last MemCell),
+kept in Redis and updated incrementally on every memorize call, so that each request
+only processes and tokenizes its own new messages.
+
+Redis layout (keys are tenant-prefixed):
+- conv_accumulation:{group_id}:meta      JSON: anchor, message ids, message/token counts
+- conv_accumulation:{group_id}:messages  List of processed message dicts (RawData JSON)
+
+The message list is only read when boundary detection actually needs the history.
+The state is a cache, MongoDB conversation data stays the source of truth: if the
+state is missing, was built for a different last_memcell_time (anchor), was left
+in-flight by an interrupted request, or Redis fails, the caller reads history from
+MongoDB and rebuilds the state.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from api_specs.dtos import RawData
+from common_utils.datetime_utils import to_timestamp_ms_universal
+from core.component.redis_provider import RedisProvider
+from core.di import service
+from core.di.utils import get_bean_by_type
+from core.observation.logger import get_logger
+from core.tenants.tenantize.kv.redis.tenant_key_utils import patch_redis_tenant_key
+
+logger = get_logger(__name__)
+
+# Redis key prefix
+CONV_ACCUMULATION_KEY_PREFIX = "conv_accumulation"
+
+# Default TTL: 7 days (in seconds), refreshed on every update
+DEFAULT_CONV_ACCUMULATION_TTL = 7 * 24 * 60 * 60
+
+
+def build_accumulation_anchor(last_memcell_time: Any) -> str:
+    """
+    Build the anchor identifying an accumulation window
+
+    The anchor is the last_memcell_time the window started from, in epoch milliseconds
+    (MongoDB keeps millisecond precision), or an empty string before the first MemCell.
+    """
+    if not last_memcell_time:
+        return ""
+    return str(to_timestamp_ms_universal(last_memcell_time))
+
+
+@dataclass
+class ConversationAccumulationState:
+    """Metadata of a group's accumulation window"""
+
+    group_id: str
+    anchor: str = ""
+    # data_id of every accumulated raw message (including filtered message types)
+    message_ids: List[str] = field(default_factory=list)
+    # Number of processed messages stored in the messages list
+    message_count: int = 0
+    token_count: int = 0
+    # Set while a memorize request is working on this window
+    in_flight: bool = False
+
+    @property
+    def raw_message_count(self) -> int:
+        return len(self.message_ids)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, value: str) -> "ConversationAccumulationState":
+        return cls(**json.loads(value))
+
+
+@service("conversation_accumulation_state_service")
+class ConversationAccumulationStateService:
+    """
+    Conversation accumulation state service
+
+    Responsibilities:
+    - Load a group's accumulation state and validate it against the status table anchor
+    - Load the cached processed history messages on demand
+    - Append new messages (no boundary) or restart the window (boundary) incrementally
+    - Invalidate the state whenever it may have diverged from MongoDB
+    """
+
+    def __init__(self):
+        """Initialize service"""
+        # Lazy load RedisProvider to avoid circular dependency
+        self._redis_provider: Optional[RedisProvider] = None
+        self.enabled = (
+            os.getenv("CONV_ACCUMULATION_STATE_ENABLED", "true").lower() == "true"
+        )
+        self.ttl_seconds = int(
+            os.getenv(
+                "CONV_ACCUMULATION_STATE_TTL_SECONDS",
+                str(DEFAULT_CONV_ACCUMULATION_TTL),
+            )
+        )
+
+    async def _get_client(self):
+        if self._redis_provider is None:
+            self._redis_provider = get_bean_by_type(RedisProvider)
+        return await self._redis_provider.get_client()
+
+    def _build_keys(self, group_id: str) -> tuple[str, str]:
+        base = patch_redis_tenant_key(f"{CONV_ACCUMULATION_KEY_PREFIX}:{group_id}")
+        return f"{base}:meta", f"{base}:messages"
+
+    async def load(
+        self, group_id: str, anchor: str, new_message_ids: List[str]
+    ) -> Optional[ConversationAccumulationState]:
+        """
+        Load a usable accumulation state and mark it in-flight
+
+        Args:
+            group_id: Conversation group ID
+            anchor: Anchor built from the current status table last_memcell_time
+            new_message_ids: data_id of the messages in the current request
+
+        Returns:
+            ConversationAccumulationState if the cached window can be trusted, None otherwise
+        """
+        if not self.enabled or not group_id:
+            return None
+
+        try:
+            client = await self._get_client()
+            meta_key, messages_key = self._build_keys(group_id)
+
+            pipe = client.pipeline()
+            pipe.get(meta_key)
+            pipe.llen(messages_key)
+            meta, stored_count = await pipe.execute()
+
+            if not meta:
+                logger.debug("Accumulation state miss: group_id=%s", group_id)
+                return None
+
+            state = ConversationAccumulationState.from_json(meta)
+            reason = None
+            if state.in_flight:
+                reason = "previous request did not finish"
+            elif state.anchor != anchor:
+                reason = f"anchor changed ({state.anchor} -> {anchor})"
+            elif stored_count != state.message_count:
+                reason = (
+                    f"message count mismatch ({stored_count}/{state.message_count})"
+                )
+            elif set(new_message_ids) & set(state.message_ids):
+                reason = "new messages already accumulated"
+
+            if reason:
+                logger.info(
+                    "Accumulation state invalid, rebuilding: group_id=%s, reason=%s",
+                    group_id,
+                    reason,
+                )
+                return None
+
+            state.in_flight = True
+            await client.set(meta_key, state.to_json(), ex=self.ttl_seconds)
+            return state
+
+        except Exception as e:
+            logger.warning(
+                "Failed to load accumulation state: group_id=%s, error=%s", group_id, e
+            )
+            return None
+
+    async def load_messages(
+        self, state: ConversationAccumulationState
+    ) -> List[Dict[str, Any]]:
+        """Load the processed history messages of the window (raises on inconsistency)"""
+        client = await self._get_client()
+        _, messages_key = self._build_keys(state.group_id)
+        values = await client.lrange(messages_key, 0, -1)
+        if len(values) != state.message_count:
+            raise ValueError(
+                f"Accumulation messages changed while loading: group_id={state.group_id}, "
+                f"expected={state.message_count}, got={len(values)}"
+            )
+        return [RawData.from_json_str(value).content for value in values]
+
+    async def append(
+        self,
+        state: ConversationAccumulationState,
+        message_ids: List[str],
+        messages: List[Dict[str, Any]],
+        token_count: int,
+    ) -> bool:
+        """Append new messages to the window (no boundary detected)"""
+        state.message_ids = state.message_ids + list(message_ids)
+        state.message_count += len(messages)
+        state.token_count += token_count
+        state.in_flight = False
+        return await self._write(state, messages, reset=False)
+
+    async def reset(
+        self,
+        group_id: str,
+        anchor: str,
+        message_ids: List[str],
+        messages: List[Dict[str, Any]],
+        token_count: int,
+    ) -> bool:
+        """Replace the window, e.g. after a boundary or when rebuilding from MongoDB"""
+        state = ConversationAccumulationState(
+            group_id=group_id,
+            anchor=anchor,
+            message_ids=list(message_ids),
+            message_count=len(messages),
+            token_count=token_count,
+        )
+        return await self._write(state, messages, reset=True)
+
+    async def _write(
+        self,
+        state: ConversationAccumulationState,
+        messages: List[Dict[str, Any]],
+        reset: bool,
+    ) -> bool:
+        if not self.enabled or not state.group_id:
+            return False
+
+        try:
+            client = await self._get_client()
+            meta_key, messages_key = self._build_keys(state.group_id)
+
+            # MULTI/EXEC keeps meta and message list consistent
+            pipe = client.pipeline(transaction=True)
+            if reset:
+                pipe.delete(messages_key)
+            if messages:
+                pipe.rpush(
+                    messages_key,
+                    *[
+                        RawData(content=message, data_id="").to_json()
+                        for message in messages
+                    ],
+                )
+            pipe.set(meta_key, state.to_json(), ex=self.ttl_seconds)
+            pipe.expire(messages_key, self.ttl_seconds)
+            await pipe.execute()
+
+            logger.debug(
+                "Accumulation state updated: group_id=%s, reset=%s, messages=%d, tokens=%d",
+                state.group_id,
+                reset,
+                state.message_count,
+                state.token_count,
+            )
+            return True
+
+        except Exception as e:
+            logger.warning(
+                "Failed to update accumulation state: group_id=%s, error=%s",
+                state.group_id,
+                e,
+            )
+            await self.invalidate(state.group_id)
+            return False
+
+    async def invalidate(self, group_id: str) -> None:
+        """Drop the cached window so the next request rebuilds it from MongoDB"""
+        if not self.enabled or not group_id:
+            return
+
+        try:
+            client = await self._get_client()
+            await client.delete(*self._build_keys(group_id))
+        except Exception as e:
+            logger.warning(
+                "Failed to invalidate accumulation state: group_id=%s, error=%s",
+                group_id,
+                e,
+            )
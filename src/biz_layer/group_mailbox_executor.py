@@ -0,0 +1,294 @@
+"""
+Group Mailbox Executor
+
+Serialises memorize work per group while running independent groups
+concurrently.
+
+Two memorize requests of the same group must not overlap: both would reload
+the same history, run the same boundary detection LLM call and
+read-modify-write ClusterState and conversation status. Every group_id gets an
+ordered mailbox drained by one worker:
+- Work of one group runs strictly in submission order, one item at a time
+- At most max_concurrent_groups items run at the same time across groups
+- A full mailbox blocks the submitter for up to enqueue_timeout_seconds, then
+  the submission is rejected with MailboxFullError (backpressure)
+- Workers of mailboxes idle for idle_ttl_seconds exit and the mailbox is dropped
+
+Every item runs in the context (request / tenant context vars) of its submitter.
+Once started, an item runs to completion even if its submitter is cancelled; on
+close() items already running are awaited (up to shutdown_timeout_seconds) and
+pending ones are cancelled.
+
+Usage:
+    executor = get_group_mailbox_executor()
+    count = await executor.submit(group_id, lambda: _memorize_in_order(request))
+"""
+
+import asyncio
+import contextvars
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from agentic_layer.metrics.memorize_metrics import (
+    get_space_id_for_metrics,
+    record_memorize_mailbox_task,
+)
+from core.observation.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class MailboxFullError(Exception):
+    """Raised when a group mailbox stays full for longer than the enqueue timeout"""
+
+
+@dataclass
+class GroupMailboxExecutorConfig:
+    """Configuration for the group mailbox executor"""
+
+    enabled: bool = True
+    # Items running at the same time across all groups
+    max_concurrent_groups: int = 32
+    # Pending items per group before submitters are blocked
+    max_mailbox_size: int = 100
+    # How long a submitter waits for space in a full mailbox (<= 0: reject at once)
+    enqueue_timeout_seconds: float = 30.0
+    # Idle time after which a group's worker exits and its mailbox is dropped
+    idle_ttl_seconds: float = 60.0
+    # How long close() waits for running items before cancelling them
+    shutdown_timeout_seconds: float = 30.0
+
+    def __post_init__(self):
+        """Load executor configuration from environment"""
+        self.enabled = (
+            os.getenv("MEMORIZE_MAILBOX_ENABLED", str(self.enabled)).lower() == "true"
+        )
+        self.max_concurrent_groups = int(
+            os.getenv(
+                "MEMORIZE_MAILBOX_MAX_CONCURRENT_GROUPS",
+                str(self.max_concurrent_groups),
+            )
+        )
+        self.max_mailbox_size = int(
+            os.getenv("MEMORIZE_MAILBOX_MAX_SIZE", str(self.max_mailbox_size))
+        )
+        self.enqueue_timeout_seconds = float(
+            os.getenv(
+                "MEMORIZE_MAILBOX_ENQUEUE_TIMEOUT_SECONDS",
+                str(self.enqueue_timeout_seconds),
+            )
+        )
+        self.idle_ttl_seconds = float(
+            os.getenv("MEMORIZE_MAILBOX_IDLE_TTL_SECONDS", str(self.idle_ttl_seconds))
+        )
+        self.shutdown_timeout_seconds = float(
+            os.getenv(
+                "MEMORIZE_MAILBOX_SHUTDOWN_TIMEOUT_SECONDS",
+                str(self.shutdown_timeout_seconds),
+            )
+        )
+
+
+WorkFactory = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class _MailboxItem:
+    """One unit of work waiting in a mailbox"""
+
+    factory: WorkFactory
+    future: asyncio.Future
+    context: contextvars.Context
+    space_id: str
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class _Mailbox:
+    """Ordered queue of one group and its worker task"""
+
+    queue: asyncio.Queue
+    worker: Optional[asyncio.Task] = None
+    # Item currently running (started, not finished)
+    current: Optional[asyncio.Task] = None
+
+
+class GroupMailboxExecutor:
+    """Per-group ordered executor with bounded cross-group concurrency"""
+
+    def __init__(self, config: Optional[GroupMailboxExecutorConfig] = None):
+        if config is None:
+            config = GroupMailboxExecutorConfig()
+        self.config = config
+        self._mailboxes: Dict[str, _Mailbox] = {}
+        self._semaphore = asyncio.Semaphore(max(config.max_concurrent_groups, 1))
+        self._closed = False
+
+        logger.info(
+            f"Initialized GroupMailboxExecutor | enabled={config.enabled} | "
+            f"max_concurrent_groups={config.max_concurrent_groups} | "
+            f"max_mailbox_size={config.max_mailbox_size}"
+        )
+
+    async def submit(self, group_id: str, factory: WorkFactory) -> Any:
+        """
+        Run factory() after all earlier work of the same group and return its result
+
+        Args:
+            group_id: Ordering key
+            factory: Zero-argument callable returning the coroutine to run
+
+        Raises:
+            MailboxFullError: The group's mailbox stayed full past the enqueue timeout
+            RuntimeError: The executor is closed
+        """
+        if not self.config.enabled or not group_id:
+            return await factory()
+        if self._closed:
+            raise RuntimeError("GroupMailboxExecutor is closed")
+
+        space_id = get_space_id_for_metrics()
+        mailbox = self._get_mailbox(group_id)
+        item = _MailboxItem(
+            factory=factory,
+            future=asyncio.get_running_loop().create_future(),
+            context=contextvars.copy_context(),
+            space_id=space_id,
+        )
+
+        try:
+            if self.config.enqueue_timeout_seconds > 0:
+                await asyncio.wait_for(
+                    mailbox.queue.put(item), self.config.enqueue_timeout_seconds
+                )
+            else:
+                mailbox.queue.put_nowait(item)
+        except (asyncio.TimeoutError, asyncio.QueueFull) as e:
+            record_memorize_mailbox_task(space_id, "rejected")
+            logger.warning(
+                f"[Mailbox] Mailbox full, rejecting work: group_id={group_id}, "
+                f"size={mailbox.queue.qsize()}"
+            )
+            raise MailboxFullError(
+                f"Too many pending memorize requests for group {group_id}"
+            ) from e
+
+        return await item.future
+
+    def _get_mailbox(self, group_id: str) -> _Mailbox:
+        mailbox = self._mailboxes.get(group_id)
+        if mailbox is None:
+            mailbox = _Mailbox(
+                queue=asyncio.Queue(maxsize=max(self.config.max_mailbox_size, 1))
+            )
+            mailbox.worker = asyncio.create_task(
+                self._drain(group_id, mailbox), name=f"mailbox:{group_id}"
+            )
+            self._mailboxes[group_id] = mailbox
+        return mailbox
+
+    async def _drain(self, group_id: str, mailbox: _Mailbox) -> None:
+        """Worker of one mailbox: run items in order, exit when idle"""
+        while True:
+            if mailbox.queue.empty() and self.config.idle_ttl_seconds <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(
+                    mailbox.queue.get(), max(self.config.idle_ttl_seconds, 0.001)
+                )
+            except asyncio.TimeoutError:
+                if mailbox.queue.empty():
+                    break
+                continue
+            await self._run_item(item, mailbox)
+
+        # put() never suspends on a non-full queue, so no submission can be
+        # in flight for an empty mailbox at this point
+        if self._mailboxes.get(group_id) is mailbox:
+            del self._mailboxes[group_id]
+        logger.debug(f"[Mailbox] Evicted idle mailbox: group_id={group_id}")
+
+    async def _run_item(self, item: _MailboxItem, mailbox: _Mailbox) -> None:
+        if item.future.done() or self._closed:
+            # Submitter gave up, or the executor closed, before the item started
+            item.future.cancel()
+            record_memorize_mailbox_task(item.space_id, "cancelled")
+            return
+
+        async with self._semaphore:
+            if self._closed:
+                item.future.cancel()
+                record_memorize_mailbox_task(item.space_id, "cancelled")
+                return
+            wait_seconds = time.perf_counter() - item.enqueued_at
+            task = asyncio.create_task(item.factory(), context=item.context)
+            mailbox.current = task
+            try:
+                result = await task
+            except asyncio.CancelledError:
+                if not item.future.done():
+                    item.future.cancel()
+                raise
+            except Exception as e:
+                record_memorize_mailbox_task(item.space_id, "failed", wait_seconds)
+                if not item.future.done():
+                    item.future.set_exception(e)
+                return
+            finally:
+                mailbox.current = None
+
+        record_memorize_mailbox_task(item.space_id, "executed", wait_seconds)
+        if not item.future.done():
+            item.future.set_result(result)
+
+    def mailbox_count(self) -> int:
+        """Number of groups with a live mailbox"""
+        return len(self._mailboxes)
+
+    def pending_count(self, group_id: str) -> int:
+        """Number of items waiting (not yet started) in a group's mailbox"""
+        mailbox = self._mailboxes.get(group_id)
+        return mailbox.queue.qsize() if mailbox else 0
+
+    async def close(self) -> None:
+        """
+        Stop all workers (called on shutdown)
+
+        Pending submitters are cancelled; running items are awaited for up to
+        shutdown_timeout_seconds so a memorize is not interrupted halfway.
+        """
+        self._closed = True
+        workers = [m.worker for m in self._mailboxes.values() if m.worker]
+        for mailbox in self._mailboxes.values():
+            while not mailbox.queue.empty():
+                mailbox.queue.get_nowait().future.cancel()
+
+        running = [m.current for m in self._mailboxes.values() if m.current]
+        unfinished = running
+        if running and self.config.shutdown_timeout_seconds > 0:
+            _, unfinished = await asyncio.wait(
+                running, timeout=self.config.shutdown_timeout_seconds
+            )
+        if unfinished:
+            logger.warning(
+                f"[Mailbox] {len(unfinished)} running items did not finish "
+                f"within {self.config.shutdown_timeout_seconds}s, cancelling them"
+            )
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+        self._mailboxes.clear()
+
+
+_group_mailbox_executor: Optional[GroupMailboxExecutor] = None
+
+
+def get_group_mailbox_executor() -> GroupMailboxExecutor:
+    """Get the process-wide group mailbox executor (created lazily)"""
+    global _group_mailbox_executor
+    if _group_mailbox_executor is None:
+        _group_mailbox_executor = GroupMailboxExecutor()
+    return _group_mailbox_executor
@@ -21,6 +21,10 @@ from memory_layer.memory_extractor.profile_memory_extractor import (
     ImportanceEvidence,
 )
 from core.di import get_bean_by_type
+from agentic_layer.memory_read_cache import (
+    get_group_user_profile_read_cache,
+    group_user_profile_cache_key,
+)
 from infra_layer.adapters.out.persistence.repository.conversation_status_raw_repository import (
     ConversationStatusRawRepository,
 )
@@ -1131,6 +1135,13 @@ async def _save_profile_memory_to_group_user_profile_memory(
         await group_user_profile_memory_repo.upsert_by_user_group(
             profile_memory.user_id, profile_memory.group_id, save_data
         )
+        await get_group_user_profile_read_cache().invalidate(
+            [
+                group_user_profile_cache_key(
+                    profile_memory.user_id, profile_memory.group_id
+                )
+            ]
+        )
 
     except Exception as e:
         logger.error(f"Save Profile Memory to GroupUserProfileMemory failed: {e}")
@@ -1,13 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import random
 import time
+from functools import partial
 import json
 import traceback
 
 from memory_layer.profile_manager.config import ScenarioType
+from agentic_layer.memory_read_cache import get_memcell_read_cache
 from agentic_layer.metrics.memorize_metrics import (
+    record_memory_store_write,
     record_extraction_stage,
     record_memory_extracted,
+    record_profile_extraction_tokens,
     get_space_id_for_metrics,
 )
 from api_specs.dtos import MemorizeRequest
@@ -67,19 +71,16 @@ from memory_layer.memcell_extractor.base_memcell_extractor import StatusResult
 import traceback
 
 from core.observation.logger import get_logger
-from infra_layer.adapters.out.search.elasticsearch.converter.episodic_memory_converter import (
-    EpisodicMemoryConverter,
-)
-from infra_layer.adapters.out.search.milvus.converter.episodic_memory_milvus_converter import (
-    EpisodicMemoryMilvusConverter,
-)
-from infra_layer.adapters.out.search.repository.episodic_memory_milvus_repository import (
-    EpisodicMemoryMilvusRepository,
+from biz_layer.mem_sync import MemorySyncService
+from biz_layer.group_mailbox_executor import get_group_mailbox_executor
+from biz_layer.conversation_accumulation_state import (
+    ConversationAccumulationState,
+    ConversationAccumulationStateService,
+    build_accumulation_anchor,
 )
-from infra_layer.adapters.out.search.repository.episodic_memory_es_repository import (
-    EpisodicMemoryEsRepository,
+from memory_layer.memcell_extractor.conv_memcell_extractor import (
+    ConversationAccumulation,
 )
-from biz_layer.mem_sync import MemorySyncService
 from core.context.context import get_current_app_info
 
 logger = get_logger(__name__)
@@ -91,6 +92,19 @@ class MemoryDocPayload:
     doc: Any
 
 
+@dataclass
+class AccumulationContext:
+    """Accumulation state bookkeeping for one conversation memorize request"""
+
+    accumulation: ConversationAccumulation = field(
+        default_factory=ConversationAccumulation
+    )
+    state: Optional[ConversationAccumulationState] = None
+    anchor: str = ""
+    # Whether the history read from MongoDB is complete enough to rebuild the state from
+    rebuild: bool = False
+
+
 from biz_layer.memorize_config import MemorizeConfig, DEFAULT_MEMORIZE_CONFIG
 
 
@@ -99,6 +113,7 @@ async def _trigger_clustering(
     memcell: MemCell,
     scene: Optional[str] = None,
     config: MemorizeConfig = DEFAULT_MEMORIZE_CONFIG,
+    embedding: Optional[List[float]] = None,
 ) -> None:
     """Trigger MemCell clustering
 
@@ -108,6 +123,8 @@ async def _trigger_clustering(
         scene: Conversation scene (used to determine Profile extraction strategy)
             - "group_chat": use group_chat scene
             - "assistant": use assistant scene
+        embedding: Precomputed embedding of the MemCell episode, the episode text is
+            only re-embedded when it is missing
     """
     logger.info(
         f"[Clustering] Start triggering clustering: group_id={group_id}, event_id={memcell.event_id}, scene={scene}"
@@ -172,11 +189,14 @@ async def _trigger_clustering(
 
         # Perform clustering (pure computation)
         cluster_id, cluster_state = await cluster_manager.cluster_memcell(
-            memcell_dict, cluster_state
+            memcell_dict, cluster_state, vector=embedding
         )
 
-        # Save clustering state
-        await cluster_storage.save_cluster_state(group_id, cluster_state.to_dict())
+        # Save clustering state (only the new event and the touched cluster)
+        if await cluster_storage.save_cluster_state_delta(
+            group_id, cluster_state.to_delta()
+        ):
+            cluster_state.mark_synced()
         logger.info(f"[Clustering] Clustering state saved")
 
         print(f"[Clustering] Clustering completed: cluster_id={cluster_id}")
@@ -214,6 +234,21 @@ async def _trigger_clustering(
         raise  # Re-raise exception so caller knows it failed
 
 
+_profile_extraction_scheduler = None
+
+
+def get_profile_extraction_scheduler():
+    """Get the process-wide profile extraction scheduler (created lazily)"""
+    global _profile_extraction_scheduler
+    if _profile_extraction_scheduler is None:
+        from biz_layer.profile_extraction_scheduler import ProfileExtractionScheduler
+
+        _profile_extraction_scheduler = ProfileExtractionScheduler(
+            run_job=_run_profile_extraction
+        )
+    return _profile_extraction_scheduler
+
+
 async def _trigger_profile_extraction(
     group_id: str,
     cluster_id: str,
@@ -224,6 +259,9 @@ async def _trigger_profile_extraction(
 ) -> None:
     """Trigger Profile extraction
 
+    Triggers are debounced and coalesced per group by the profile extraction
+    scheduler, the extraction itself runs in _run_profile_extraction.
+
     Args:
         group_id: Group ID
         cluster_id: The cluster to which the current memcell was assigned
@@ -233,16 +271,10 @@ async def _trigger_profile_extraction(
         config: Memory extraction configuration
     """
     try:
-        from memory_layer.profile_manager import ProfileManager, ProfileManagerConfig
-        from infra_layer.adapters.out.persistence.repository.user_profile_raw_repository import (
-            UserProfileRawRepository,
-        )
-        from memory_layer.llm.llm_provider import LLMProvider
-        from core.di import get_bean_by_type
-        import os
+        from biz_layer.profile_extraction_scheduler import ProfileExtractionJob
 
         # Get the number of memcells in the current cluster
-        cluster_memcell_count = cluster_state.cluster_counts.get(cluster_id) or 0
+        cluster_memcell_count = cluster_state.get_cluster_count(cluster_id)
         if cluster_memcell_count < config.profile_min_memcells:
             logger.debug(
                 f"[Profile] Cluster {cluster_id} has only {cluster_memcell_count} memcells "
@@ -250,158 +282,238 @@ async def _trigger_profile_extraction(
             )
             return
 
-        logger.info(
-            f"[Profile] Start extracting Profile: cluster={cluster_id}, memcells={cluster_memcell_count}"
-        )
-
-        # Get Profile storage
-        profile_repo = get_bean_by_type(UserProfileRawRepository)
-        memcell_repo = get_bean_by_type(MemCellRawRepository)
-
-        # Create LLM Provider
-        llm_provider = LLMProvider(
-            provider_type=os.getenv("LLM_PROVIDER", "openai"),
-            model=os.getenv("LLM_MODEL", "gpt-4.1-mini"),  # skip-sensitive-check
-            base_url=os.getenv("LLM_BASE_URL"),  # skip-sensitive-check
-            api_key=os.getenv("LLM_API_KEY"),  # skip-sensitive-check
-            temperature=float(
-                os.getenv("LLM_TEMPERATURE", "0.3")
-            ),  # skip-sensitive-check
-            max_tokens=int(
-                os.getenv("LLM_MAX_TOKENS", "16384")
-            ),  # skip-sensitive-check
-        )
-
-        # Determine scenario
-        profile_scenario = (
-            ScenarioType(scene.lower()) if scene else ScenarioType.GROUP_CHAT
-        )
-
-        # Create ProfileManager (pure computation component)
-        profile_config = ProfileManagerConfig(
-            scenario=profile_scenario,
-            min_confidence=config.profile_min_confidence,
-            enable_versioning=config.profile_enable_versioning,
-            auto_extract=True,
-        )
-        profile_manager = ProfileManager(
-            llm_provider=llm_provider,
-            config=profile_config,
-            group_id=group_id,
-            group_name=None,
-        )
-
         # Get participant list (exclude robots)
         user_id_list = [
             u
             for u in (memcell.participants or [])
             if "robot" not in u.lower() and "assistant" not in u.lower()
         ]
-        # ===== Common preprocessing: fetch all cluster memcells =====
-        current_event_id = str(memcell.event_id) if memcell.event_id else cluster_id
-        cluster_event_ids = set()
-        if cluster_state and hasattr(cluster_state, 'eventid_to_cluster'):
-            for event_id, cid in cluster_state.eventid_to_cluster.items():
-                if cid == cluster_id and event_id != current_event_id:
-                    cluster_event_ids.add(event_id)
-
-        # Fetch cluster memcells + current memcell
-        all_memcells = []
-        if cluster_event_ids:
-            try:
-                cluster_memcells_dict = await memcell_repo.get_by_event_ids(
-                    list(cluster_event_ids)
-                )
-                all_memcells = list(cluster_memcells_dict.values())
-            except Exception as e:
-                logger.warning(f"[Profile] Failed to fetch cluster memcells: {e}")
 
-        # Append current memcell as the last one (new_memcell)
-        all_memcells.append(memcell)
-        logger.info(
-            f"[Profile] Context: cluster={len(all_memcells) - 1}, new=1, users={len(user_id_list)}"
+        await get_profile_extraction_scheduler().submit(
+            ProfileExtractionJob(
+                group_id=group_id,
+                cluster_ids=[cluster_id],
+                cluster_state=cluster_state,
+                memcell=memcell,
+                user_ids=user_id_list,
+                scene=scene,
+                config=config,
+            )
         )
 
-        # ===== Extract and save profiles =====
+    except Exception as e:
+        logger.error(f"[Profile] ❌ Profile extraction failed: {e}", exc_info=True)
 
-        # Load old profiles (same for Work and Life)
-        old_profiles_dict = await profile_repo.get_all_profiles(group_id=group_id)
-        old_profiles = list(old_profiles_dict.values()) if old_profiles_dict else []
-        logger.info(
-            f"[Profile] Loaded {len(old_profiles)} existing profiles for group={group_id}"
+
+def _estimate_memcell_tokens(memcells: List[Any]) -> int:
+    """Estimate the prompt tokens of memcells (o200k_base over their original data)"""
+    try:
+        from core.component.llm.tokenizer.tokenizer_factory import TokenizerFactory
+
+        tokenizer = get_bean_by_type(TokenizerFactory).get_tokenizer_from_tiktoken(
+            "o200k_base"
         )
-        if old_profiles:
-            for uid, p in old_profiles_dict.items():
-                keys = list(p.keys()) if isinstance(p, dict) else dir(p)
-                logger.info(f"[Profile] Profile for {uid}: keys={keys[:8]}")
+    except Exception as e:
+        logger.debug(f"[Profile] Tokenizer unavailable, skipping token estimate: {e}")
+        return 0
 
-        # Extract profiles
-        if profile_scenario == ScenarioType.ASSISTANT:
-            new_profiles = await profile_manager.extract_profiles_life(
-                memcells=all_memcells,
-                old_profiles=old_profiles,
-                user_id_list=user_id_list,
-                group_id=group_id,
-                max_items=config.profile_life_max_items,
-            )
+    total = 0
+    for mc in memcells:
+        original_data = getattr(mc, "original_data", None)
+        if original_data:
+            text = json.dumps(original_data, ensure_ascii=False, default=str)
         else:
-            new_profiles = await profile_manager.extract_profiles(
-                memcells=all_memcells,
-                old_profiles=old_profiles,
-                user_id_list=user_id_list,
-                group_id=group_id,
-            )
+            text = getattr(mc, "episode", None) or ""
+        total += len(tokenizer.encode(text, disallowed_special=()))
+    return total
 
-        # Save profiles
-        for profile in new_profiles:
-            try:
-                if profile_scenario == ScenarioType.ASSISTANT:
-                    user_id = profile.user_id
-                    profile_data = profile.to_dict()
-                    metadata = {
-                        "group_id": group_id,
-                        "scenario": ScenarioType.ASSISTANT.value,
-                        "cluster_id": cluster_id,
-                        "memcell_count": cluster_memcell_count,
-                        "total_items": profile.total_items(),
-                    }
-                else:
-                    user_id = (
-                        profile.get('user_id')
-                        if isinstance(profile, dict)
-                        else getattr(profile, 'user_id', None)
-                    )
-                    # Convert to dict if it's a ProfileMemory object
-                    if hasattr(profile, 'to_dict'):
-                        profile_data = profile.to_dict()
-                    elif isinstance(profile, dict):
-                        profile_data = profile
-                    else:
-                        profile_data = (
-                            profile.__dict__
-                            if hasattr(profile, '__dict__')
-                            else profile
-                        )
-                    metadata = {
-                        "group_id": group_id,
-                        "scenario": "group_chat",
-                        "cluster_id": cluster_id,
-                        "memcell_count": cluster_memcell_count,
-                        "confidence": config.profile_min_confidence,
-                    }
-
-                if user_id:
-                    await profile_repo.save_profile(
-                        user_id, profile_data, metadata=metadata
-                    )
-                    logger.info(f"[Profile] ✅ Saved: user={user_id}")
-            except Exception as e:
-                logger.warning(f"[Profile] Failed to save profile: {e}")
 
-        logger.info(f"[Profile] ✅ Completed: {len(new_profiles)} profiles")
+async def _run_profile_extraction(job) -> None:
+    """Run one (possibly coalesced) profile extraction job
 
-    except Exception as e:
-        logger.error(f"[Profile] ❌ Profile extraction failed: {e}", exc_info=True)
+    Only memcells past the profiles' event watermark are sent to the LLM together
+    with the current profiles, and the results are saved in one bulk write.
+    The watermark of a cluster is the number of group cluster-state events
+    already folded into a profile; the lowest watermark of the involved users
+    is used, and users without a profile start from the beginning.
+
+    Args:
+        job: ProfileExtractionJob built by _trigger_profile_extraction
+    """
+    from memory_layer.profile_manager import ProfileManager, ProfileManagerConfig
+    from infra_layer.adapters.out.persistence.repository.user_profile_raw_repository import (
+        UserProfileRawRepository,
+    )
+    from memory_layer.llm.llm_provider import LLMProvider
+
+    group_id = job.group_id
+    cluster_state = job.cluster_state
+    memcell = job.memcell
+    config = job.config or DEFAULT_MEMORIZE_CONFIG
+    cluster_id = job.cluster_ids[-1]
+    cluster_memcell_count = cluster_state.get_cluster_count(cluster_id)
+    user_id_list = job.user_ids
+
+    logger.info(
+        f"[Profile] Start extracting Profile: clusters={job.cluster_ids}, "
+        f"memcells={cluster_memcell_count}, triggers={job.trigger_count}"
+    )
+
+    # Get Profile storage
+    profile_repo = get_bean_by_type(UserProfileRawRepository)
+    memcell_repo = get_bean_by_type(MemCellRawRepository)
+
+    # Create LLM Provider
+    llm_provider = LLMProvider(
+        provider_type=os.getenv("LLM_PROVIDER", "openai"),
+        model=os.getenv("LLM_MODEL", "gpt-4.1-mini"),  # skip-sensitive-check
+        base_url=os.getenv("LLM_BASE_URL"),  # skip-sensitive-check
+        api_key=os.getenv("LLM_API_KEY"),  # skip-sensitive-check
+        temperature=float(os.getenv("LLM_TEMPERATURE", "0.3")),  # skip-sensitive-check
+        max_tokens=int(os.getenv("LLM_MAX_TOKENS", "16384")),  # skip-sensitive-check
+    )
+
+    # Determine scenario
+    profile_scenario = (
+        ScenarioType(job.scene.lower()) if job.scene else ScenarioType.GROUP_CHAT
+    )
+
+    # Create ProfileManager (pure computation component)
+    profile_config = ProfileManagerConfig(
+        scenario=profile_scenario,
+        min_confidence=config.profile_min_confidence,
+        enable_versioning=config.profile_enable_versioning,
+        auto_extract=True,
+    )
+    profile_manager = ProfileManager(
+        llm_provider=llm_provider,
+        config=profile_config,
+        group_id=group_id,
+        group_name=None,
+    )
+
+    # ===== Load current profiles and their per-cluster watermarks =====
+    profile_docs = await profile_repo.get_all_by_group(group_id)
+    old_profiles = [doc.profile_data for doc in profile_docs]
+    docs_by_user = {doc.user_id: doc for doc in profile_docs}
+    logger.info(
+        f"[Profile] Loaded {len(old_profiles)} existing profiles for group={group_id}"
+    )
+
+    watermarks: Dict[str, int] = {}
+    for cid in job.cluster_ids:
+        if not user_id_list or any(u not in docs_by_user for u in user_id_list):
+            watermarks[cid] = 0
+            continue
+        watermarks[cid] = min(
+            (docs_by_user[u].event_watermarks or {}).get(cid, 0) for u in user_id_list
+        )
+
+    # ===== Fetch memcells past the watermark (current memcell last) =====
+    current_event_id = str(memcell.event_id) if memcell.event_id else cluster_id
+    new_event_ids = []
+    for index, event_id in enumerate(cluster_state.event_ids):
+        cid = cluster_state.eventid_to_cluster.get(event_id)
+        if (
+            cid in watermarks
+            and index >= watermarks[cid]
+            and event_id != current_event_id
+        ):
+            new_event_ids.append(event_id)
+
+    all_memcells = []
+    if new_event_ids:
+        try:
+            memcells_by_id = await memcell_repo.get_by_event_ids(new_event_ids)
+            all_memcells = [
+                memcells_by_id[eid] for eid in new_event_ids if eid in memcells_by_id
+            ]
+        except Exception as e:
+            logger.warning(f"[Profile] Failed to fetch cluster memcells: {e}")
+
+    all_memcells.append(memcell)
+    logger.info(
+        f"[Profile] Context: incremental={len(all_memcells) - 1}, new=1, "
+        f"users={len(user_id_list)}, watermarks={watermarks}"
+    )
+
+    # ===== Extract profiles =====
+    if profile_scenario == ScenarioType.ASSISTANT:
+        new_profiles = await profile_manager.extract_profiles_life(
+            memcells=all_memcells,
+            old_profiles=old_profiles,
+            user_id_list=user_id_list,
+            group_id=group_id,
+            max_items=config.profile_life_max_items,
+        )
+    else:
+        new_profiles = await profile_manager.extract_profiles(
+            memcells=all_memcells,
+            old_profiles=old_profiles,
+            user_id_list=user_id_list,
+            group_id=group_id,
+        )
+
+    # ===== Bulk save profiles with advanced watermarks =====
+    event_watermarks = {cid: len(cluster_state.event_ids) for cid in job.cluster_ids}
+    items = []
+    for profile in new_profiles:
+        if profile_scenario == ScenarioType.ASSISTANT:
+            user_id = profile.user_id
+            profile_data = profile.to_dict()
+            metadata = {
+                "group_id": group_id,
+                "scenario": ScenarioType.ASSISTANT.value,
+                "cluster_id": cluster_id,
+                "memcell_count": cluster_memcell_count,
+                "total_items": profile.total_items(),
+                "event_watermarks": event_watermarks,
+            }
+        else:
+            user_id = (
+                profile.get('user_id')
+                if isinstance(profile, dict)
+                else getattr(profile, 'user_id', None)
+            )
+            # Convert to dict if it's a ProfileMemory object
+            if hasattr(profile, 'to_dict'):
+                profile_data = profile.to_dict()
+            elif isinstance(profile, dict):
+                profile_data = profile
+            else:
+                profile_data = (
+                    profile.__dict__ if hasattr(profile, '__dict__') else profile
+                )
+            metadata = {
+                "group_id": group_id,
+                "scenario": "group_chat",
+                "cluster_id": cluster_id,
+                "memcell_count": cluster_memcell_count,
+                "confidence": config.profile_min_confidence,
+                "event_watermarks": event_watermarks,
+            }
+        if user_id:
+            items.append((user_id, profile_data, metadata))
+
+    saved = await profile_repo.upsert_many(group_id, items)
+    logger.info(f"[Profile] ✅ Completed: {len(new_profiles)} profiles, {saved} saved")
+
+    # ===== Token accounting =====
+    # Baseline: every trigger sending the whole cluster (what a full, per-trigger
+    # extraction would have sent), estimated from the average memcell size
+    sent_tokens = _estimate_memcell_tokens(all_memcells)
+    if sent_tokens:
+        full_cluster_size = sum(
+            cluster_state.get_cluster_count(cid) for cid in job.cluster_ids
+        )
+        baseline_tokens = (
+            sent_tokens / len(all_memcells) * full_cluster_size * job.trigger_count
+        )
+        record_profile_extraction_tokens(
+            get_space_id_for_metrics(),
+            sent_tokens,
+            max(0, int(baseline_tokens) - sent_tokens),
+        )
 
 
 from biz_layer.mem_db_operations import (
@@ -694,6 +806,7 @@ async def _update_memcell_and_cluster(state: ExtractionState):
                 "subject": state.group_episode.subject,
             },
         )
+        await get_memcell_read_cache().invalidate([state.memcell.event_id])
         logger.info(
             f"[MemCell Processing] ✅ Updated MemCell episode: {state.memcell.event_id}"
         )
@@ -714,8 +827,13 @@ async def _update_memcell_and_cluster(state: ExtractionState):
             type=state.memcell.type,
             episode=state.group_episode.episode,
         )
+        # Reuse the group Episode embedding computed during extraction
+        episode_extend = state.group_episode.extend or {}
         await _trigger_clustering(
-            state.request.group_id, memcell_for_clustering, state.scene
+            state.request.group_id,
+            memcell_for_clustering,
+            state.scene,
+            embedding=episode_extend.get("embedding"),
         )
         logger.info(
             f"[MemCell Processing] ✅ Clustering completed (scene={state.scene})"
@@ -942,15 +1060,18 @@ from core.observation.tracing.decorators import trace_logger
 
 @trace_logger(operation_name="mem_memorize preprocess_conv_request", log_level="info")
 async def preprocess_conv_request(
-    request: MemorizeRequest, current_time: datetime
+    request: MemorizeRequest,
+    current_time: datetime,
+    accumulation_ctx: Optional[AccumulationContext] = None,
 ) -> MemorizeRequest:
     """
     Simplified request preprocessing:
     1. Get last_memcell_time from status table to determine current memcell start
-    2. Read historical messages from conversation_data_repo (only messages after last_memcell_time)
-    3. Set historical messages as history_raw_data_list
-    4. Set current new message as new_raw_data_list
-    5. Boundary detection handled by subsequent logic (will clear or retain after detection)
+    2. Use the cached accumulation state if it is valid (history is then loaded lazily)
+    3. Otherwise read historical messages from conversation_data_repo (only messages after last_memcell_time)
+    4. Set historical messages as history_raw_data_list
+    5. Set current new message as new_raw_data_list
+    6. Boundary detection handled by subsequent logic (will clear or retain after detection)
     """
 
     logger.info(f"[preprocess] Start processing: group_id={request.group_id}")
@@ -975,7 +1096,31 @@ async def preprocess_conv_request(
             start_time = status.last_memcell_time
             logger.info(f"[preprocess] Using last_memcell_time as start_time: {start_time}")
 
-        # Step 1: Get historical messages, excluding current request's messages
+        # Step 1: Use cached accumulation state (counts only, messages loaded on demand)
+        if accumulation_ctx is not None:
+            accumulation_ctx.anchor = build_accumulation_anchor(start_time)
+            state_service = get_bean_by_type(ConversationAccumulationStateService)
+            state = await state_service.load(
+                request.group_id, accumulation_ctx.anchor, new_message_ids
+            )
+            if state is not None:
+                accumulation = accumulation_ctx.accumulation
+                accumulation.history_raw_count = state.raw_message_count
+                accumulation.history_message_count = state.message_count
+                accumulation.history_token_count = state.token_count
+                accumulation.history_loader = partial(
+                    state_service.load_messages, state
+                )
+                accumulation_ctx.state = state
+                request.history_raw_data_list = []
+
+                logger.info(
+                    f"[preprocess] Completed from accumulation state: {state.raw_message_count} historical "
+                    f"({state.token_count} tokens), {len(request.new_raw_data_list)} new messages"
+                )
+                return request
+
+        # Step 2: Get historical messages, excluding current request's messages
         # Only get messages after last_memcell_time (current memcell's accumulated messages)
         history_raw_data_list = await conversation_data_repo.get_conversation_data(
             group_id=request.group_id,
@@ -993,6 +1138,11 @@ async def preprocess_conv_request(
         request.history_raw_data_list = history_raw_data_list
         # new_raw_data_list remains unchanged (the newly passed messages)
 
+        # An empty read may be a swallowed error and a full page may be truncated,
+        # only rebuild the accumulation state from a read that is clearly complete
+        if accumulation_ctx is not None:
+            accumulation_ctx.rebuild = 0 < len(history_raw_data_list) < 1000
+
         logger.info(
             f"[preprocess] Completed: {len(history_raw_data_list)} historical, {len(request.new_raw_data_list)} new messages"
         )
@@ -1006,6 +1156,59 @@ async def preprocess_conv_request(
         return request
 
 
+async def update_accumulation_state(
+    request: MemorizeRequest,
+    accumulation_ctx: AccumulationContext,
+    memcell: Optional[MemCell],
+) -> None:
+    """
+    Update the cached accumulation window after boundary detection
+
+    - No boundary: append the new messages (processed dicts and token count from the extractor)
+    - Boundary: the new messages start the next window, anchored at the MemCell timestamp
+    - Rebuilt from MongoDB: store history + new messages as the window
+    """
+    state_service = get_bean_by_type(ConversationAccumulationStateService)
+    accumulation = accumulation_ctx.accumulation
+    if accumulation.new_message_dict_list is None:
+        # New messages were skipped before processing, rebuild from MongoDB next time
+        await state_service.invalidate(request.group_id)
+        return
+
+    new_message_ids = [r.data_id for r in request.new_raw_data_list if r.data_id]
+
+    if memcell is not None:
+        await state_service.reset(
+            request.group_id,
+            build_accumulation_anchor(memcell.timestamp),
+            new_message_ids,
+            accumulation.new_message_dict_list,
+            accumulation.new_token_count,
+        )
+    elif accumulation_ctx.state is not None:
+        await state_service.append(
+            accumulation_ctx.state,
+            new_message_ids,
+            accumulation.new_message_dict_list,
+            accumulation.new_token_count,
+        )
+    elif (
+        accumulation_ctx.rebuild and accumulation.history_message_dict_list is not None
+    ):
+        history_message_ids = [
+            r.data_id for r in request.history_raw_data_list if r.data_id
+        ]
+        await state_service.reset(
+            request.group_id,
+            accumulation_ctx.anchor,
+            history_message_ids + new_message_ids,
+            accumulation.history_message_dict_list + accumulation.new_message_dict_list,
+            accumulation.history_token_count + accumulation.new_token_count,
+        )
+    else:
+        await state_service.invalidate(request.group_id)
+
+
 async def update_status_when_no_memcell(
     request: MemorizeRequest,
     status_result: StatusResult,
@@ -1099,6 +1302,31 @@ async def save_personal_profile_memory(
         # Remove individual operation success log
 
 
+async def _bulk_save_and_sync(
+    memory_type: MemoryType, docs: List[Any], create_batch, sync_batch
+) -> List[Any]:
+    """
+    Save docs with one MongoDB insert_many, then bulk sync them to ES/Milvus
+
+    MongoDB is the source of truth, so its failure is raised; ES/Milvus failures are
+    reported per store by the sync service (failed ids can be resynced later).
+    """
+    try:
+        saved_docs = await create_batch(docs)
+    except Exception:
+        record_memory_store_write("mongo", memory_type.value, "error", len(docs))
+        raise
+    record_memory_store_write("mongo", memory_type.value, "success", len(saved_docs))
+
+    sync_result = await sync_batch(saved_docs, sync_to_es=True, sync_to_milvus=True)
+    if sync_result.has_failures:
+        logger.warning(
+            f"[mem_memorize] {memory_type.value} saved to MongoDB but search sync partially failed, "
+            f"failed ids by store: {sync_result.failed_ids()}"
+        )
+    return saved_docs
+
+
 async def save_memory_docs(
     doc_payloads: List[MemoryDocPayload], version: Optional[str] = None
 ) -> Dict[MemoryType, List[Any]]:
@@ -1113,58 +1341,65 @@ async def save_memory_docs(
 
     saved_result: Dict[MemoryType, List[Any]] = {}
 
-    # Episodic
+    # Episodic / Foresight / Event Log: bulk write path
+    # MongoDB insert_many first (ES/Milvus ids derive from the Mongo _id), then one ES bulk
+    # and one Milvus insert per type; memory types are written concurrently
+    bulk_jobs = []
     episodic_docs = grouped_docs.get(MemoryType.EPISODIC_MEMORY, [])
     if episodic_docs:
         episodic_repo = get_bean_by_type(EpisodicMemoryRawRepository)
-        episodic_es_repo = get_bean_by_type(EpisodicMemoryEsRepository)
-        episodic_milvus_repo = get_bean_by_type(EpisodicMemoryMilvusRepository)
-        saved_episodic: List[Any] = []
-
-        for doc in episodic_docs:
-            saved_doc = await episodic_repo.append_episodic_memory(doc)
-            saved_episodic.append(saved_doc)
-
-            es_doc = EpisodicMemoryConverter.from_mongo(saved_doc)
-            await episodic_es_repo.create(es_doc)
-
-            milvus_entity = EpisodicMemoryMilvusConverter.from_mongo(saved_doc)
-            vector = (
-                milvus_entity.get("vector") if isinstance(milvus_entity, dict) else None
+        bulk_jobs.append(
+            (
+                MemoryType.EPISODIC_MEMORY,
+                episodic_docs,
+                episodic_repo.append_episodic_memories,
+                "sync_batch_episodic_memories",
             )
-            if vector and len(vector) > 0:
-                await episodic_milvus_repo.insert(milvus_entity, flush=False)
-            else:
-                logger.warning(
-                    "[mem_memorize] Skipping write to Milvus: vector empty or missing, event_id=%s",
-                    getattr(saved_doc, "event_id", None),
-                )
-
-        saved_result[MemoryType.EPISODIC_MEMORY] = saved_episodic
+        )
 
-    # Foresight
     foresight_docs = grouped_docs.get(MemoryType.FORESIGHT, [])
     if foresight_docs:
         foresight_repo = get_bean_by_type(ForesightRecordRawRepository)
-        saved_foresight = await foresight_repo.create_batch(foresight_docs)
-        saved_result[MemoryType.FORESIGHT] = saved_foresight
-
-        sync_service = get_bean_by_type(MemorySyncService)
-        await sync_service.sync_batch_foresights(
-            saved_foresight, sync_to_es=True, sync_to_milvus=True
+        bulk_jobs.append(
+            (
+                MemoryType.FORESIGHT,
+                foresight_docs,
+                foresight_repo.create_batch,
+                "sync_batch_foresights",
+            )
         )
 
-    # Event Log
     event_log_docs = grouped_docs.get(MemoryType.EVENT_LOG, [])
     if event_log_docs:
         event_log_repo = get_bean_by_type(EventLogRecordRawRepository)
-        saved_event_logs = await event_log_repo.create_batch(event_log_docs)
-        saved_result[MemoryType.EVENT_LOG] = saved_event_logs
+        bulk_jobs.append(
+            (
+                MemoryType.EVENT_LOG,
+                event_log_docs,
+                event_log_repo.create_batch,
+                "sync_batch_event_logs",
+            )
+        )
 
+    if bulk_jobs:
         sync_service = get_bean_by_type(MemorySyncService)
-        await sync_service.sync_batch_event_logs(
-            saved_event_logs, sync_to_es=True, sync_to_milvus=True
+        outcomes = await asyncio.gather(
+            *[
+                _bulk_save_and_sync(
+                    memory_type, docs, create_batch, getattr(sync_service, sync_name)
+                )
+                for memory_type, docs, create_batch, sync_name in bulk_jobs
+            ],
+            return_exceptions=True,
         )
+        errors = []
+        for (memory_type, _, _, _), outcome in zip(bulk_jobs, outcomes):
+            if isinstance(outcome, Exception):
+                errors.append(outcome)
+            else:
+                saved_result[memory_type] = outcome
+        if errors:
+            raise errors[0]
 
     # Profile
     profile_docs = grouped_docs.get(MemoryType.PROFILE, [])
@@ -1259,6 +1494,26 @@ async def load_core_memories(
 
 
 async def memorize(request: MemorizeRequest) -> int:
+    """
+    Main memory extraction process
+
+    Requests of one group run one at a time in arrival order through the group
+    mailbox executor (see biz_layer.group_mailbox_executor), so concurrent
+    messages of a group never reload the same history or race on ClusterState
+    and conversation status.
+
+    Returns:
+        int: Number of memories extracted (0 if no boundary detected or extraction failed)
+
+    Raises:
+        MailboxFullError: Too many pending requests for the group
+    """
+    return await get_group_mailbox_executor().submit(
+        request.group_id, partial(_memorize_in_order, request)
+    )
+
+
+async def _memorize_in_order(request: MemorizeRequest) -> int:
     """
     Main memory extraction process (global queue version)
 
@@ -1288,8 +1543,10 @@ async def memorize(request: MemorizeRequest) -> int:
     # (sync_status=-1, will be confirmed later based on boundary detection result)
 
     # ===== Preprocess and get historical data =====
+    accumulation_ctx = None
     if request.raw_data_type == RawDataType.CONVERSATION:
-        request = await preprocess_conv_request(request, current_time)
+        accumulation_ctx = AccumulationContext()
+        request = await preprocess_conv_request(request, current_time, accumulation_ctx)
         if request == None:
             logger.warning(f"[mem_memorize] preprocess_conv_request returned None")
             return 0
@@ -1317,6 +1574,7 @@ async def memorize(request: MemorizeRequest) -> int:
         request.group_id,
         request.group_name,
         request.user_id_list,
+        accumulation=accumulation_ctx.accumulation if accumulation_ctx else None,
     )
     record_extraction_stage(
         space_id=space_id,
@@ -1353,6 +1611,8 @@ async def memorize(request: MemorizeRequest) -> int:
         logger.info(
             f"[mem_memorize] No boundary, confirmed {len(request.new_raw_data_list)} messages to accumulation"
         )
+        if accumulation_ctx is not None:
+            await update_accumulation_state(request, accumulation_ctx, None)
         await update_status_when_no_memcell(
             request, status_result, current_time, request.raw_data_type
         )
@@ -1381,6 +1641,8 @@ async def memorize(request: MemorizeRequest) -> int:
             await conversation_data_repo.save_conversation_data(
                 request.new_raw_data_list, request.group_id
             )
+            if accumulation_ctx is not None:
+                await update_accumulation_state(request, accumulation_ctx, memcell)
         except Exception as e:
             logger.error(
                 f"[mem_memorize] Exception while marking conversation history: {e}"
@@ -1410,3 +1672,187 @@ async def memorize(request: MemorizeRequest) -> int:
         logger.error(f"[mem_memorize] ❌ Memory extraction failed: {e}")
         traceback.print_exc()
         return 0
+
+
+@dataclass
+class GroupBatchMemorizeResult:
+    """Outcome of memorizing one group's messages from a batch request"""
+
+    group_id: str
+    message_count: int = 0
+    memcell_count: int = 0
+    memory_count: int = 0
+    error: Optional[str] = None
+
+
+async def memorize_batch(
+    requests: List[MemorizeRequest], max_concurrent_groups: Optional[int] = None
+) -> List[GroupBatchMemorizeResult]:
+    """
+    Memorize an ordered batch of single-message conversation requests
+
+    Request logs must already be saved (sync_status=-1), like for memorize().
+    Requests are grouped by group_id (keeping their order); groups are independent
+    and processed concurrently, each group runs one boundary detection pass over
+    its messages and may emit several MemCells. A group's batch is ordered with
+    the group's other memorize work by the group mailbox executor.
+
+    Args:
+        requests: Ordered MemorizeRequests (one or more groups)
+        max_concurrent_groups: Concurrency limit across groups
+            (default: MemorizeConfig.batch_max_concurrent_groups)
+
+    Returns:
+        List[GroupBatchMemorizeResult]: One result per group, in order of first appearance
+    """
+    requests_by_group: Dict[str, List[MemorizeRequest]] = {}
+    for request in requests:
+        if request.new_raw_data_list:
+            requests_by_group.setdefault(request.group_id, []).append(request)
+
+    limit = max_concurrent_groups or DEFAULT_MEMORIZE_CONFIG.batch_max_concurrent_groups
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def _run(group_id: str, group_requests: List[MemorizeRequest]):
+        async with semaphore:
+            try:
+                return await get_group_mailbox_executor().submit(
+                    group_id, partial(_memorize_group_batch, group_requests)
+                )
+            except Exception as e:
+                logger.error(
+                    f"[mem_memorize] ❌ Batch memorize failed: group_id={group_id}, error={e}"
+                )
+                traceback.print_exc()
+                return GroupBatchMemorizeResult(
+                    group_id=group_id,
+                    message_count=sum(len(r.new_raw_data_list) for r in group_requests),
+                    error=str(e),
+                )
+
+    return list(
+        await asyncio.gather(
+            *[
+                _run(group_id, group_requests)
+                for group_id, group_requests in requests_by_group.items()
+            ]
+        )
+    )
+
+
+async def _memorize_group_batch(
+    requests: List[MemorizeRequest],
+) -> GroupBatchMemorizeResult:
+    """
+    Memorize the batch messages of one group
+
+    Flow:
+    1. Read the group's history once (excluding all batch messages)
+    2. Boundary detection over the batch in one pass, keeping the window in memory;
+       every boundary emits a MemCell and the triggering message starts the next window
+    3. Update sync_status in bulk: history and messages inside MemCells -1/0 -> 1,
+       messages of the trailing window -1 -> 0
+    4. Save each MemCell and run memory extraction, in order
+    """
+    first = requests[0]
+    group_id = first.group_id
+    result = GroupBatchMemorizeResult(
+        group_id=group_id, message_count=sum(len(r.new_raw_data_list) for r in requests)
+    )
+
+    # Each message keeps its own time, like a single memorize request would
+    current_times = [
+        request.current_time or get_now_with_timezone() + timedelta(seconds=1)
+        for request in requests
+    ]
+
+    memory_manager = MemoryManager()
+    conversation_data_repo = get_bean_by_type(ConversationDataRepository)
+    space_id = get_space_id_for_metrics()
+    raw_data_type = first.raw_data_type.value if first.raw_data_type else 'unknown'
+
+    # ===== History before the batch =====
+    batch_raw_data_list = [r for request in requests for r in request.new_raw_data_list]
+    seed = await preprocess_conv_request(
+        first.model_copy(update={"new_raw_data_list": batch_raw_data_list}),
+        current_times[0],
+    )
+    history_raw_data_list = list(seed.history_raw_data_list) if seed else []
+
+    logger.info(
+        f"[mem_memorize] Batch boundary detection: group_id={group_id}, "
+        f"{len(history_raw_data_list)} historical, {len(requests)} batch requests"
+    )
+
+    # ===== Boundary detection, one pass over the batch =====
+    memcells: List[tuple[MemCell, MemorizeRequest, datetime]] = []
+    window_raw_data_list: List[Any] = []
+    last_status: Optional[tuple[MemorizeRequest, StatusResult, datetime]] = None
+    for request, current_time in zip(requests, current_times):
+        memcell_start = time.perf_counter()
+        memcell_result = await memory_manager.extract_memcell(
+            history_raw_data_list,
+            request.new_raw_data_list,
+            request.raw_data_type,
+            request.group_id,
+            request.group_name,
+            request.user_id_list,
+        )
+        record_extraction_stage(
+            space_id=space_id,
+            raw_data_type=raw_data_type,
+            stage='extract_memcell',
+            duration_seconds=time.perf_counter() - memcell_start,
+        )
+
+        memcell, status_result = memcell_result or (None, None)
+        if memcell is None:
+            history_raw_data_list.extend(request.new_raw_data_list)
+            window_raw_data_list.extend(request.new_raw_data_list)
+            if status_result is not None:
+                last_status = (request, status_result, current_time)
+        else:
+            logger.info(
+                f"[mem_memorize] Batch boundary detected: group_id={group_id}, event_id={memcell.event_id}"
+            )
+            memcells.append((memcell, request, current_time))
+            history_raw_data_list = list(request.new_raw_data_list)
+            window_raw_data_list = list(request.new_raw_data_list)
+            last_status = None
+
+    # ===== Bulk sync_status update =====
+    window_message_ids = [r.data_id for r in window_raw_data_list if r.data_id]
+    if memcells:
+        await conversation_data_repo.delete_conversation_data(
+            group_id, exclude_message_ids=window_message_ids
+        )
+    await conversation_data_repo.save_conversation_data(window_raw_data_list, group_id)
+    # The cached window was built per message, rebuild it from MongoDB next time
+    state_service = get_bean_by_type(ConversationAccumulationStateService)
+    await state_service.invalidate(group_id)
+
+    # ===== Save MemCells and extract memories, in order =====
+    for memcell, request, current_time in memcells:
+        memcell = await _save_memcell_to_database(memcell, current_time)
+        result.memcell_count += 1
+        try:
+            result.memory_count += await process_memory_extraction(
+                memcell, request, memory_manager, current_time
+            )
+        except Exception as e:
+            logger.error(
+                f"[mem_memorize] ❌ Memory extraction failed: event_id={memcell.event_id}, error={e}"
+            )
+            traceback.print_exc()
+
+    if last_status is not None:
+        request, status_result, current_time = last_status
+        await update_status_when_no_memcell(
+            request, status_result, current_time, request.raw_data_type
+        )
+
+    logger.info(
+        f"[mem_memorize] ✅ Batch memorize completed: group_id={group_id}, "
+        f"messages={result.message_count}, memcells={result.memcell_count}, memories={result.memory_count}"
+    )
+    return result
@@ -1,9 +1,13 @@
 """Foresight and event log synchronization service
 
 Responsible for writing unified foresight and event logs into Milvus / Elasticsearch.
+Batch methods use one ES bulk request and one Milvus insert per batch, run both stores
+concurrently and report per-store failures so they can be retried.
 """
 
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Callable
+import asyncio
 import logging
 from datetime import datetime
 
@@ -37,12 +41,65 @@ from infra_layer.adapters.out.search.repository.foresight_es_repository import (
 from infra_layer.adapters.out.search.repository.event_log_es_repository import (
     EventLogEsRepository,
 )
+from infra_layer.adapters.out.persistence.document.memory.episodic_memory import (
+    EpisodicMemory,
+)
+from infra_layer.adapters.out.search.elasticsearch.converter.episodic_memory_converter import (
+    EpisodicMemoryConverter,
+)
+from infra_layer.adapters.out.search.milvus.converter.episodic_memory_milvus_converter import (
+    EpisodicMemoryMilvusConverter,
+)
+from infra_layer.adapters.out.search.repository.episodic_memory_milvus_repository import (
+    EpisodicMemoryMilvusRepository,
+)
+from infra_layer.adapters.out.search.repository.episodic_memory_es_repository import (
+    EpisodicMemoryEsRepository,
+)
+from agentic_layer.metrics.memorize_metrics import record_memory_store_write
 from core.di import get_bean_by_type, service
 from common_utils.datetime_utils import get_now_with_timezone
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class StoreSyncResult:
+    """Outcome of a bulk write against a single store"""
+
+    succeeded: int = 0
+    # MongoDB ids of the records that were not written
+    failed_ids: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass
+class BulkSyncResult:
+    """Per-store outcome of a bulk write
+
+    failed_ids are MongoDB ids, so a partial failure can be retried against the failed store only.
+    """
+
+    memory_type: str
+    skipped: int = 0
+    stores: Dict[str, StoreSyncResult] = field(default_factory=dict)
+
+    def store(self, name: str) -> StoreSyncResult:
+        return self.stores.setdefault(name, StoreSyncResult())
+
+    @property
+    def has_failures(self) -> bool:
+        return any(result.failed_ids for result in self.stores.values())
+
+    def failed_ids(self) -> Dict[str, List[str]]:
+        """Failed MongoDB ids grouped by store"""
+        return {
+            name: result.failed_ids
+            for name, result in self.stores.items()
+            if result.failed_ids
+        }
+
+
 @service(name="memory_sync_service", primary=True)
 class MemorySyncService:
     """Foresight and event log synchronization service"""
@@ -53,6 +110,8 @@ class MemorySyncService:
         eventlog_milvus_repo: Optional[EventLogMilvusRepository] = None,
         foresight_es_repo: Optional[ForesightEsRepository] = None,
         eventlog_es_repo: Optional[EventLogEsRepository] = None,
+        episodic_milvus_repo: Optional[EpisodicMemoryMilvusRepository] = None,
+        episodic_es_repo: Optional[EpisodicMemoryEsRepository] = None,
     ):
         """Initialize synchronization service
 
@@ -61,6 +120,8 @@ class MemorySyncService:
             eventlog_milvus_repo: Event log Milvus repository instance (optional, obtained from DI if not provided)
             foresight_es_repo: Foresight ES repository instance (optional, obtained from DI if not provided)
             eventlog_es_repo: Event log ES repository instance (optional, obtained from DI if not provided)
+            episodic_milvus_repo: Episodic memory Milvus repository instance (optional, obtained from DI if not provided)
+            episodic_es_repo: Episodic memory ES repository instance (optional, obtained from DI if not provided)
         """
         self.foresight_milvus_repo = foresight_milvus_repo or get_bean_by_type(
             ForesightMilvusRepository
@@ -74,6 +135,12 @@ class MemorySyncService:
         self.eventlog_es_repo = eventlog_es_repo or get_bean_by_type(
             EventLogEsRepository
         )
+        self.episodic_milvus_repo = episodic_milvus_repo or get_bean_by_type(
+            EpisodicMemoryMilvusRepository
+        )
+        self.episodic_es_repo = episodic_es_repo or get_bean_by_type(
+            EpisodicMemoryEsRepository
+        )
 
         logger.info("MemorySyncService initialization completed")
 
@@ -194,74 +261,229 @@ class MemorySyncService:
         foresights: List[ForesightRecord],
         sync_to_es: bool = True,
         sync_to_milvus: bool = True,
-    ) -> Dict[str, int]:
-        """Batch synchronize foresights
+        refresh: bool | str = False,
+        flush: bool = False,
+    ) -> BulkSyncResult:
+        """Batch synchronize foresights (one ES bulk + one Milvus insert, run concurrently)
 
         Args:
             foresights: List of ForesightRecord
             sync_to_es: Whether to sync to ES (default True)
             sync_to_milvus: Whether to sync to Milvus (default True)
+            refresh: ES refresh policy applied once for the bulk request
+            flush: Whether to flush the Milvus collection once after the insert
 
         Returns:
-            Synchronization statistics
+            Per-store synchronization result
         """
-        total_stats = {"foresight": 0, "es_records": 0}
-
-        for foresight_mem in foresights:
-            try:
-                stats = await self.sync_foresight(
-                    foresight_mem, sync_to_es=sync_to_es, sync_to_milvus=sync_to_milvus
-                )
-                total_stats["foresight"] += stats.get("foresight", 0)
-                total_stats["es_records"] += stats.get("es_records", 0)
-            except Exception as e:
-                logger.error(
-                    f"Failed to batch sync foresight: {foresight_mem.id}, error: {e}",
-                    exc_info=True,
-                )
-                # Do not silently swallow exceptions
+        result = await self._sync_batch(
+            memory_type="foresight",
+            records=foresights,
+            es_repo=self.foresight_es_repo if sync_to_es else None,
+            es_converter=ForesightConverter.from_mongo,
+            milvus_repo=self.foresight_milvus_repo if sync_to_milvus else None,
+            milvus_converter=ForesightMilvusConverter.from_mongo,
+            es_requires_vector=True,
+            refresh=refresh,
+            flush=flush,
+        )
 
         logger.info(
-            f"✅ Foresight Milvus flush completed: {total_stats['foresight']} records"
+            f"✅ Foresight batch sync completed: milvus={result.store('milvus').succeeded}, "
+            f"es={result.store('es').succeeded}, skipped={result.skipped}"
         )
 
-        return total_stats
+        return result
 
     async def sync_batch_event_logs(
         self,
         event_logs: List[EventLogRecord],
         sync_to_es: bool = True,
         sync_to_milvus: bool = True,
-    ) -> Dict[str, int]:
-        """Batch synchronize event logs
+        refresh: bool | str = False,
+        flush: bool = False,
+    ) -> BulkSyncResult:
+        """Batch synchronize event logs (one ES bulk + one Milvus insert, run concurrently)
 
         Args:
             event_logs: List of EventLogRecord
             sync_to_es: Whether to sync to ES (default True)
             sync_to_milvus: Whether to sync to Milvus (default True)
+            refresh: ES refresh policy applied once for the bulk request
+            flush: Whether to flush the Milvus collection once after the insert
 
         Returns:
-            Synchronization statistics
+            Per-store synchronization result
         """
-        total_stats = {"event_log": 0, "es_records": 0}
+        result = await self._sync_batch(
+            memory_type="event_log",
+            records=event_logs,
+            es_repo=self.eventlog_es_repo if sync_to_es else None,
+            es_converter=EventLogConverter.from_mongo,
+            milvus_repo=self.eventlog_milvus_repo if sync_to_milvus else None,
+            milvus_converter=EventLogMilvusConverter.from_mongo,
+            es_requires_vector=True,
+            refresh=refresh,
+            flush=flush,
+        )
 
-        for evt_log in event_logs:
-            try:
-                stats = await self.sync_event_log(
-                    evt_log, sync_to_es=sync_to_es, sync_to_milvus=sync_to_milvus
-                )
-                total_stats["event_log"] += stats.get("event_log", 0)
-                total_stats["es_records"] += stats.get("es_records", 0)
-            except Exception as e:
-                logger.error(
-                    f"Failed to batch sync event log: {evt_log.id}, error: {e}",
-                    exc_info=True,
-                )
-                # Do not silently swallow exceptions, let it surface
-                raise
+        logger.info(
+            f"✅ Event log batch sync completed: milvus={result.store('milvus').succeeded}, "
+            f"es={result.store('es').succeeded}, skipped={result.skipped}"
+        )
+
+        return result
+
+    async def sync_batch_episodic_memories(
+        self,
+        episodic_memories: List[EpisodicMemory],
+        sync_to_es: bool = True,
+        sync_to_milvus: bool = True,
+        refresh: bool | str = False,
+        flush: bool = False,
+    ) -> BulkSyncResult:
+        """Batch synchronize episodic memories (one ES bulk + one Milvus insert, run concurrently)
+
+        Episodic memories without a vector are still indexed in ES (keyword search) and only
+        skipped for Milvus.
+
+        Args:
+            episodic_memories: List of EpisodicMemory
+            sync_to_es: Whether to sync to ES (default True)
+            sync_to_milvus: Whether to sync to Milvus (default True)
+            refresh: ES refresh policy applied once for the bulk request
+            flush: Whether to flush the Milvus collection once after the insert
+
+        Returns:
+            Per-store synchronization result
+        """
+        result = await self._sync_batch(
+            memory_type="episodic_memory",
+            records=episodic_memories,
+            es_repo=self.episodic_es_repo if sync_to_es else None,
+            es_converter=EpisodicMemoryConverter.from_mongo,
+            milvus_repo=self.episodic_milvus_repo if sync_to_milvus else None,
+            milvus_converter=EpisodicMemoryMilvusConverter.from_mongo,
+            es_requires_vector=False,
+            refresh=refresh,
+            flush=flush,
+        )
 
         logger.info(
-            f"✅ Event log Milvus flush completed: {total_stats['event_log']} records"
+            f"✅ Episodic memory batch sync completed: milvus={result.store('milvus').succeeded}, "
+            f"es={result.store('es').succeeded}, skipped={result.skipped}"
         )
 
-        return total_stats
+        return result
+
+    async def _sync_batch(
+        self,
+        memory_type: str,
+        records: List[Any],
+        es_repo: Optional[Any],
+        es_converter: Callable[[Any], Any],
+        milvus_repo: Optional[Any],
+        milvus_converter: Callable[[Any], Dict[str, Any]],
+        es_requires_vector: bool,
+        refresh: bool | str,
+        flush: bool,
+    ) -> BulkSyncResult:
+        """Convert records once, then write ES and Milvus concurrently"""
+        result = BulkSyncResult(memory_type=memory_type)
+
+        es_items = []
+        milvus_items = []
+        for record in records:
+            record_id = str(record.id)
+            has_vector = bool(record.vector)
+            if not has_vector:
+                logger.warning(
+                    f"{memory_type} {record_id} has no embedding, skipping Milvus sync"
+                )
+                if es_requires_vector:
+                    result.skipped += 1
+                    continue
+
+            if es_repo is not None:
+                try:
+                    es_items.append((record_id, es_converter(record)))
+                except Exception as e:
+                    logger.error(
+                        f"Failed to convert {memory_type} {record_id} for ES: {e}"
+                    )
+                    result.store("es").failed_ids.append(record_id)
+
+            if milvus_repo is not None and has_vector:
+                try:
+                    milvus_items.append((record_id, milvus_converter(record)))
+                except Exception as e:
+                    logger.error(
+                        f"Failed to convert {memory_type} {record_id} for Milvus: {e}"
+                    )
+                    result.store("milvus").failed_ids.append(record_id)
+
+        tasks = []
+        if es_items:
+            tasks.append(self._bulk_write_es(es_repo, es_items, refresh, result))
+        if milvus_items:
+            tasks.append(
+                self._bulk_write_milvus(milvus_repo, milvus_items, flush, result)
+            )
+        if tasks:
+            await asyncio.gather(*tasks)
+
+        for store, store_result in result.stores.items():
+            record_memory_store_write(
+                store, memory_type, "success", store_result.succeeded
+            )
+            record_memory_store_write(
+                store, memory_type, "error", len(store_result.failed_ids)
+            )
+
+        if result.has_failures:
+            logger.error(
+                f"❌ {memory_type} batch sync partially failed: {result.failed_ids()}"
+            )
+
+        return result
+
+    async def _bulk_write_es(
+        self,
+        es_repo: Any,
+        items: List[tuple],
+        refresh: bool | str,
+        result: BulkSyncResult,
+    ) -> None:
+        store_result = result.store("es")
+        try:
+            failed = set(
+                await es_repo.bulk_create([doc for _, doc in items], refresh=refresh)
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to bulk sync {result.memory_type} to ES: {e}", exc_info=True
+            )
+            store_result.error = str(e)
+            store_result.failed_ids.extend(record_id for record_id, _ in items)
+            return
+
+        for record_id, doc in items:
+            if str(doc.meta.id) in failed:
+                store_result.failed_ids.append(record_id)
+            else:
+                store_result.succeeded += 1
+
+    async def _bulk_write_milvus(
+        self, milvus_repo: Any, items: List[tuple], flush: bool, result: BulkSyncResult
+    ) -> None:
+        store_result = result.store("milvus")
+        try:
+            await milvus_repo.insert_batch([entity for _, entity in items], flush=flush)
+            store_result.succeeded += len(items)
+        except Exception as e:
+            logger.error(
+                f"Failed to bulk sync {result.memory_type} to Milvus: {e}",
+                exc_info=True,
+            )
+            store_result.error = str(e)
+            store_result.failed_ids.extend(record_id for record_id, _ in items)
@@ -34,6 +34,10 @@ class MemorizeConfig:
     # Default parent type for Foresight and EventLog (memcell or episode)
     default_parent_type: str = ParentType.MEMCELL.value
 
+    # ===== Batch ingest configuration =====
+    # Maximum number of groups processed concurrently by one batch memorize request
+    batch_max_concurrent_groups: int = 4
+
     @classmethod
     def from_env(cls) -> "MemorizeConfig":
         """Load configuration from environment variables, use defaults if not set"""
@@ -51,6 +55,9 @@ class MemorizeConfig:
             default_parent_type=os.getenv(
                 "DEFAULT_PARENT_TYPE", ParentType.MEMCELL.value
             ),
+            batch_max_concurrent_groups=int(
+                os.getenv("MEMORIZE_BATCH_MAX_CONCURRENT_GROUPS", "4")
+            ),
         )
 
 
@@ -0,0 +1,215 @@
+"""
+Profile Extraction Scheduler
+
+Debounces and coalesces profile-extraction triggers per group.
+
+Every new MemCell in a large enough cluster triggers a profile extraction.
+Bursts of messages would start several overlapping LLM runs over nearly the
+same input, so triggers of one group are merged into a single pending job:
+- The job runs once no new trigger arrived for debounce_seconds, and at the
+  latest max_delay_seconds after the first trigger of the window
+- Merged jobs keep the newest cluster state / MemCell and the union of
+  clusters and participants
+- At most one job per group runs at a time; triggers arriving meanwhile
+  form the next job
+- Groups are scoped by tenant (group ids are only unique within a tenant) and
+  a job runs in the context of its tenant's latest trigger
+
+Usage:
+    scheduler = ProfileExtractionScheduler(run_job=_run_profile_extraction)
+    await scheduler.submit(ProfileExtractionJob(...))
+    ...
+    await scheduler.close()  # flush pending jobs on shutdown
+"""
+
+import asyncio
+import contextvars
+import os
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from agentic_layer.metrics.memorize_metrics import (
+    get_space_id_for_metrics,
+    record_profile_extraction_trigger,
+)
+from core.observation.logger import get_logger
+from core.tenants.tenant_contextvar import get_current_tenant_id
+
+logger = get_logger(__name__)
+
+# (tenant_id, group_id)
+GroupKey = Tuple[Optional[str], str]
+
+
+@dataclass
+class ProfileExtractionSchedulerConfig:
+    """Configuration for the profile extraction scheduler"""
+
+    # Quiet period after the last trigger before extraction runs (<= 0 runs inline)
+    debounce_seconds: float = 2.0
+    # Upper bound on how long the first trigger of a window can be deferred
+    max_delay_seconds: float = 30.0
+
+    def __post_init__(self):
+        """Load scheduler configuration from environment"""
+        self.debounce_seconds = float(
+            os.getenv("PROFILE_EXTRACTION_DEBOUNCE_SECONDS", str(self.debounce_seconds))
+        )
+        self.max_delay_seconds = float(
+            os.getenv(
+                "PROFILE_EXTRACTION_MAX_DELAY_SECONDS", str(self.max_delay_seconds)
+            )
+        )
+
+
+@dataclass
+class ProfileExtractionJob:
+    """One (possibly coalesced) profile extraction for a group"""
+
+    group_id: str
+    cluster_ids: List[str]
+    cluster_state: Any  # ClusterState after the newest trigger
+    memcell: Any  # Newest MemCell
+    user_ids: List[str]
+    scene: Optional[str] = None
+    config: Any = None  # MemorizeConfig
+    trigger_count: int = 1
+
+    def merge(self, newer: "ProfileExtractionJob") -> "ProfileExtractionJob":
+        """Coalesce a newer trigger of the same group into this job"""
+        return ProfileExtractionJob(
+            group_id=self.group_id,
+            cluster_ids=list(dict.fromkeys(self.cluster_ids + newer.cluster_ids)),
+            cluster_state=newer.cluster_state,
+            memcell=newer.memcell,
+            user_ids=list(dict.fromkeys(self.user_ids + newer.user_ids)),
+            scene=newer.scene or self.scene,
+            config=newer.config or self.config,
+            trigger_count=self.trigger_count + newer.trigger_count,
+        )
+
+
+RunJobFunc = Callable[[ProfileExtractionJob], Awaitable[None]]
+
+
+@dataclass
+class _PendingJob:
+    """Job waiting for its debounce window to close"""
+
+    job: ProfileExtractionJob
+    first_at: float
+    # Context (tenant) of the latest trigger, the job runs in it
+    context: contextvars.Context
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+@dataclass
+class _GroupLock:
+    """Per-group run lock with a reference count, dropped when unused"""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    refs: int = 0
+
+
+class ProfileExtractionScheduler:
+    """Per-group debouncing / coalescing scheduler for profile extraction"""
+
+    def __init__(
+        self,
+        run_job: RunJobFunc,
+        config: Optional[ProfileExtractionSchedulerConfig] = None,
+    ):
+        """
+        Args:
+            run_job: Coroutine function running one extraction job
+            config: Scheduler configuration (loaded from environment if None)
+        """
+        if config is None:
+            config = ProfileExtractionSchedulerConfig()
+        self.config = config
+        self._run_job = run_job
+        self._pending: Dict[GroupKey, _PendingJob] = {}
+        self._group_locks: Dict[GroupKey, _GroupLock] = {}
+        self._inflight: set = set()
+
+        logger.info(
+            f"Initialized ProfileExtractionScheduler | "
+            f"debounce={config.debounce_seconds}s | max_delay={config.max_delay_seconds}s"
+        )
+
+    async def submit(self, job: ProfileExtractionJob) -> None:
+        """Schedule an extraction trigger (returns before extraction when debounced)"""
+        space_id = get_space_id_for_metrics()
+        if self.config.debounce_seconds <= 0:
+            record_profile_extraction_trigger(space_id, "immediate")
+            await self._run(job)
+            return
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        key = (get_current_tenant_id(), job.group_id)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = _PendingJob(
+                job=job, first_at=now, context=contextvars.copy_context()
+            )
+            self._pending[key] = pending
+            record_profile_extraction_trigger(space_id, "scheduled")
+        else:
+            pending.job = pending.job.merge(job)
+            pending.context = contextvars.copy_context()
+            pending.timer.cancel()
+            record_profile_extraction_trigger(space_id, "coalesced")
+            logger.debug(
+                f"[Profile] Coalesced trigger: group={job.group_id}, "
+                f"pending_triggers={pending.job.trigger_count}"
+            )
+
+        deadline = pending.first_at + self.config.max_delay_seconds
+        delay = max(0.0, min(self.config.debounce_seconds, deadline - now))
+        pending.timer = loop.call_later(delay, self._flush, key)
+
+    def _flush(self, key: GroupKey) -> None:
+        """Detach the pending job of a group and run it in the background"""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+
+        # The task copies the trigger's context, also when flushed on shutdown
+        task = pending.context.run(asyncio.create_task, self._run(pending.job))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _run(self, job: ProfileExtractionJob) -> None:
+        key = (get_current_tenant_id(), job.group_id)
+        group_lock = self._group_locks.setdefault(key, _GroupLock())
+        group_lock.refs += 1
+        try:
+            async with group_lock.lock:
+                await self._run_job(job)
+        except Exception as e:
+            logger.error(
+                f"[Profile] Scheduled extraction failed: group={job.group_id}, error={e}",
+                exc_info=True,
+            )
+        finally:
+            group_lock.refs -= 1
+            if group_lock.refs == 0:
+                self._group_locks.pop(key, None)
+
+    def pending_count(self) -> int:
+        """Number of groups with a pending (not yet started) extraction"""
+        return len(self._pending)
+
+    async def flush(self) -> None:
+        """Run every pending job now and wait for all running jobs"""
+        for key in list(self._pending.keys()):
+            self._flush(key)
+        if self._inflight:
+            await asyncio.gather(*list(self._inflight), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Flush pending jobs (called on shutdown)"""
+        await self.flush()
@@ -0,0 +1,69 @@
+"""
+Local TTL Cache
+
+In-process LRU cache with a per-entry TTL, the local tier of the embedding,
+rerank score and memory read caches. Not thread-safe, meant for one event loop.
+
+Usage:
+    cache = LocalTTLCache(max_entries=4096, ttl_seconds=3600)
+    cache.set_many({"a": 1})
+    cache.get_many(["a", "b"])  # [1, None]
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+
+class LocalTTLCache:
+    """
+    LRU cache with per-entry TTL
+
+    Entries expire ttl_seconds after they were written (ttl_seconds <= 0: never);
+    beyond max_entries the least recently used entries are evicted.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value, `default` on miss or expiry"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if self.ttl_seconds > 0 and expires_at < time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def get_many(self, keys: List[str], default: Any = None) -> List[Any]:
+        """Get values in key order, `default` for misses"""
+        return [self.get(key, default) for key in keys]
+
+    def set(self, key: str, value: Any) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Store values, evicting least recently used entries beyond max_entries"""
+        expires_at = time.monotonic() + self.ttl_seconds
+        for key, value in items.items():
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete_many(self, keys: List[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
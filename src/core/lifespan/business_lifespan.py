@@ -32,6 +32,56 @@ def get_rerank_service():
     return _get_rerank_service()
 
 
+def get_llm_client_pool():
+    """Lazy import wrapper for the shared LLM client pool getter."""
+    from memory_layer.llm.client_pool import get_llm_client_pool as _get_llm_client_pool
+
+    return _get_llm_client_pool()
+
+
+def get_llm_response_cache():
+    """Lazy import wrapper for the LLM response cache getter."""
+    from memory_layer.llm.response_cache import (
+        get_llm_response_cache as _get_llm_response_cache,
+    )
+
+    return _get_llm_response_cache()
+
+
+def get_profile_extraction_scheduler():
+    """Lazy import wrapper for the profile extraction scheduler getter."""
+    from biz_layer.mem_memorize import (
+        get_profile_extraction_scheduler as _get_profile_extraction_scheduler,
+    )
+
+    return _get_profile_extraction_scheduler()
+
+
+def get_group_mailbox_executor():
+    """Lazy import wrapper for the memorize group mailbox executor getter."""
+    from biz_layer.group_mailbox_executor import (
+        get_group_mailbox_executor as _get_group_mailbox_executor,
+    )
+
+    return _get_group_mailbox_executor()
+
+
+def get_distributed_lock_manager():
+    """Lazy import wrapper for the Redis distributed lock manager."""
+    from core.lock.redis_distributed_lock import RedisDistributedLockManager
+
+    return get_bean_by_type(RedisDistributedLockManager)
+
+
+def load_bm25_resources() -> bool:
+    """Lazy import wrapper for preloading BM25 tokenizer resources."""
+    from agentic_layer.retrieval_utils import (
+        load_bm25_resources as _load_bm25_resources,
+    )
+
+    return _load_bm25_resources()
+
+
 @component(name="business_lifespan_provider")
 class BusinessLifespanProvider(LifespanProvider):
     """Business lifecycle provider"""
@@ -61,6 +111,11 @@ class BusinessLifespanProvider(LifespanProvider):
         # 0. Preload tokenizers to avoid blocking requests
         tokenizer_factory: TokenizerFactory = get_bean_by_type(TokenizerFactory)
         tokenizer_factory.load_default_encodings()
+        try:
+            if not load_bm25_resources():
+                logger.warning("nltk/rank_bm25 not installed, local BM25 disabled")
+        except Exception as exc:
+            logger.warning(f"Failed to preload BM25 resources: {exc}")
 
         # 1. Create business graph structure
         graphs = self._register_graphs(app)
@@ -97,10 +152,17 @@ class BusinessLifespanProvider(LifespanProvider):
         logger.info("Business application shutdown completed")
 
     async def _close_agentic_services(self) -> None:
-        """Close shared agentic services to release external client sessions."""
+        """Close shared agentic services and the LLM client pool to release client sessions."""
+        # Memorize workers stop and pending profile extractions are flushed first,
+        # they still need the LLM pool
         service_getters = (
+            ("memorize_mailbox_executor", get_group_mailbox_executor),
+            ("profile_extraction_scheduler", get_profile_extraction_scheduler),
+            ("distributed_lock_manager", get_distributed_lock_manager),
             ("vectorize", get_vectorize_service),
             ("rerank", get_rerank_service),
+            ("llm_client_pool", get_llm_client_pool),
+            ("llm_response_cache", get_llm_response_cache),
         )
         for service_name, service_getter in service_getters:
             try:
@@ -3,12 +3,31 @@ Redis distributed lock implementation
 
 Distributed lock service supporting coroutine-level reentrancy based on Redis
 Using contextvar to manage coroutine context, ensuring thread safety and coroutine safety
+
+- Owners are identified per process (host, pid, random nonce) and per task, so
+  owner ids never collide across processes or hosts
+- Every fresh acquisition gets a fencing token from a global monotonically
+  increasing counter; pass it to the protected resource to reject writes of a
+  holder whose lease already expired
+- auto_renew=True starts a watchdog that renews the lease every timeout / 3
+  while the holder is inside the critical section
+- Waiters block on a release notification (Redis pub/sub) instead of polling;
+  they still retry when the holder's lease runs out, and fall back to polling
+  every DEFAULT_RETRY_INTERVAL seconds if the subscription is unavailable
 """
 
 import asyncio
-from typing import Optional, Union
+import itertools
+import os
+import socket
+import uuid
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple, Union
 from contextlib import asynccontextmanager
 
+from redis.exceptions import RedisError
+
 from core.di.decorators import component
 from core.observation.logger import get_logger
 from core.component.redis_provider import RedisProvider
@@ -20,12 +39,50 @@ logger = get_logger(__name__)
 DEFAULT_LOCK_TIMEOUT = 60.0  # Default lock timeout (seconds)
 DEFAULT_BLOCKING_TIMEOUT = 80.0  # Default blocking timeout for acquiring lock (seconds)
 DEFAULT_RETRY_INTERVAL = 3  # Default retry interval (seconds)
+MIN_RENEW_INTERVAL = 0.1  # Lower bound of the watchdog renewal interval (seconds)
+
+# Errors of a failed Redis call (redis-py errors do not subclass the builtins)
+REDIS_ERRORS = (RedisError, ConnectionError, TimeoutError, OSError)
 
 
 class DistributedLockError(Exception):
     """Exception related to distributed lock"""
 
 
+@dataclass(frozen=True)
+class LockAcquisition:
+    """
+    Result of a lock acquisition, truthy when the lock is held
+
+    fencing_token increases monotonically across acquisitions; reentrant
+    acquisitions of the same holder return the token of the outer one.
+    """
+
+    acquired: bool
+    fencing_token: Optional[int] = None
+    owner_id: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return self.acquired
+
+
+_process_owner_prefix: Optional[Tuple[int, str]] = None
+_task_sequence = itertools.count(1)
+_task_ids: "weakref.WeakKeyDictionary[asyncio.Task, int]" = weakref.WeakKeyDictionary()
+
+
+def _get_process_owner_prefix() -> str:
+    """Process-unique owner prefix (host:pid:nonce), recomputed after fork"""
+    global _process_owner_prefix
+    pid = os.getpid()
+    if _process_owner_prefix is None or _process_owner_prefix[0] != pid:
+        _process_owner_prefix = (
+            pid,
+            f"{socket.gethostname()}:{pid}:{uuid.uuid4().hex[:8]}",
+        )
+    return _process_owner_prefix[1]
+
+
 class RedisDistributedLock:
     """
     Redis distributed reentrant lock
@@ -45,10 +102,14 @@ class RedisDistributedLock:
         self.lock_manager = lock_manager
         self._acquired = False
         self._reentry_count = 0
+        self.fencing_token: Optional[int] = None
 
     @asynccontextmanager
     async def acquire(
-        self, timeout: Optional[float] = None, blocking_timeout: Optional[float] = None
+        self,
+        timeout: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+        auto_renew: bool = False,
     ):
         """
         Asynchronous context manager for acquiring lock
@@ -56,9 +117,10 @@ class RedisDistributedLock:
         Args:
             timeout: Lock timeout (seconds)
             blocking_timeout: Blocking timeout for acquiring lock (seconds)
+            auto_renew: Renew the lease in the background until the lock is released
 
         Yields:
-            bool: Whether the lock was successfully acquired
+            LockAcquisition: Truthy if the lock was acquired, carries the fencing token
         """
         timeout = timeout or DEFAULT_LOCK_TIMEOUT
         blocking_timeout = blocking_timeout or DEFAULT_BLOCKING_TIMEOUT
@@ -66,13 +128,15 @@ class RedisDistributedLock:
         acquired = False
         try:
             # Call the lock manager's internal method to acquire the lock
-            acquired = await self.lock_manager._acquire_lock(  # pylint: disable=protected-access
-                self.resource, timeout, blocking_timeout
+            acquisition = await self.lock_manager._acquire_lock(  # pylint: disable=protected-access
+                self.resource, timeout, blocking_timeout, auto_renew
             )
+            acquired = acquisition.acquired
             if acquired:
                 self._acquired = True
+                self.fencing_token = acquisition.fencing_token
 
-            yield acquired
+            yield acquisition
 
         finally:
             if acquired:
@@ -82,11 +146,15 @@ class RedisDistributedLock:
                         self.resource
                     )  # pylint: disable=protected-access
                     self._acquired = False
-                except (ConnectionError, TimeoutError, OSError) as e:
+                except REDIS_ERRORS as e:
                     logger.error(
                         "Failed to release lock: %s, error: %s", self.resource, e
                     )
 
+    async def renew(self, timeout: Optional[float] = None) -> bool:
+        """Extend the lease of a lock held by the current coroutine"""
+        return await self.lock_manager.renew(self.resource, timeout)
+
     async def is_locked(self) -> bool:
         """Check if the lock is held"""
         return await self.lock_manager.is_locked(self.resource)
@@ -111,36 +179,63 @@ class RedisDistributedLockManager:
     # Lock key template
     LOCK_KEY_TEMPLATE = "reentrant_lock:{resource}"
 
+    # Global fencing token counter (never expires, so tokens only grow)
+    FENCING_TOKEN_KEY = "reentrant_lock_fencing_token"
+
+    # Release notification channel (waiters subscribe to the pattern)
+    RELEASE_CHANNEL_PREFIX = "reentrant_lock_released:"
+
     # Lua script: Acquire reentrant lock
+    # Returns {reentry count, fencing token, remaining lease ms}; count 0 means
+    # the lock is held by another owner (token 0, remaining lease of the holder)
     LUA_ACQUIRE_SCRIPT = """
         local lock_key = KEYS[1]
+        local fence_key = KEYS[2]
         local owner_id = ARGV[1]
         local timeout_ms = tonumber(ARGV[2])
         
         -- Get current lock information
-        -- Note: When lock_key does not exist, HMGET returns {false, false}
-        local lock_info = redis.call('HMGET', lock_key, 'owner', 'count')
+        -- Note: When lock_key does not exist, HMGET returns {false, false, false}
+        local lock_info = redis.call('HMGET', lock_key, 'owner', 'count', 'token')
         local current_owner = lock_info[1]  -- false when not exists
         local current_count = tonumber(lock_info[2]) or 0  -- tonumber(false) is nil, use 0 as default
+        local token = tonumber(lock_info[3])
         
         if current_owner == false or current_owner == owner_id then
             -- Lock is not occupied (current_owner == false) or held by current coroutine, can acquire/reenter
+            if current_owner == false or token == nil then
+                token = redis.call('INCR', fence_key)
+            end
             local new_count = current_count + 1
-            redis.call('HMSET', lock_key, 'owner', owner_id, 'count', new_count)
+            redis.call('HSET', lock_key, 'owner', owner_id, 'count', new_count, 'token', token)
             if timeout_ms > 0 then
                 redis.call('PEXPIRE', lock_key, timeout_ms)
             end
-            return new_count
+            return {new_count, token, 0}
         else
             -- Lock is held by another coroutine
+            return {0, 0, redis.call('PTTL', lock_key)}
+        end
+    """
+
+    # Lua script: Renew the lease of a lock held by owner_id
+    LUA_RENEW_SCRIPT = """
+        local lock_key = KEYS[1]
+        local owner_id = ARGV[1]
+        local timeout_ms = tonumber(ARGV[2])
+        
+        if redis.call('HGET', lock_key, 'owner') ~= owner_id then
             return 0
         end
+        redis.call('PEXPIRE', lock_key, timeout_ms)
+        return 1
     """
 
     # Lua script: Release reentrant lock
     LUA_RELEASE_SCRIPT = """
         local lock_key = KEYS[1]
         local owner_id = ARGV[1]
+        local channel = ARGV[2]
         
         -- Get current lock information
         -- Note: When lock_key does not exist, HMGET returns {false, false}
@@ -155,8 +250,9 @@ class RedisDistributedLockManager:
         
         local new_count = current_count - 1
         if new_count <= 0 then
-            -- Reentry count reaches zero, completely release the lock
+            -- Reentry count reaches zero, completely release the lock and wake waiters
             redis.call('DEL', lock_key)
+            redis.call('PUBLISH', channel, '1')
             return -1
         else
             -- Decrease reentry count but keep the lock
@@ -196,9 +292,16 @@ class RedisDistributedLockManager:
 
         # Lua script cache
         self._lua_acquire = None
+        self._lua_renew = None
         self._lua_release = None
         self._lua_status = None
 
+        # Local waiters per resource, woken by the release listener
+        self._waiters: Dict[str, Set[asyncio.Event]] = {}
+        self._listener_task: Optional[asyncio.Task] = None
+        # Lease renewal watchdogs per (resource, owner_id)
+        self._watchdogs: Dict[Tuple[str, str], asyncio.Task] = {}
+
     def get_lock(self, resource: str) -> RedisDistributedLock:
         """
         Get lock instance for specified resource
@@ -216,12 +319,15 @@ class RedisDistributedLockManager:
         if self._lua_acquire is None:
             redis_client = await self.redis_provider.get_client()
             self._lua_acquire = redis_client.register_script(self.LUA_ACQUIRE_SCRIPT)
+            self._lua_renew = redis_client.register_script(self.LUA_RENEW_SCRIPT)
             self._lua_release = redis_client.register_script(self.LUA_RELEASE_SCRIPT)
             self._lua_status = redis_client.register_script(self.LUA_STATUS_SCRIPT)
 
     def _get_owner_id(self) -> str:
         """
-        Get unique identifier for current coroutine
+        Get unique identifier for current coroutine: "{host}:{pid}:{nonce}:task_{seq}"
+
+        Task sequence numbers are never reused within a process (unlike id()).
 
         Returns:
             str: Unique identifier for coroutine
@@ -237,10 +343,11 @@ class RedisDistributedLockManager:
                     "Distributed lock must be used in coroutine environment, no running coroutine task"
                 )
 
-            # Use task id as coroutine identifier
-            task_id = id(current_task)
-            owner_id = f"task_{task_id}"
-            return owner_id
+            task_seq = _task_ids.get(current_task)
+            if task_seq is None:
+                task_seq = next(_task_sequence)
+                _task_ids[current_task] = task_seq
+            return f"{_get_process_owner_prefix()}:task_{task_seq}"
 
         except RuntimeError as e:
             raise DistributedLockError(
@@ -248,18 +355,26 @@ class RedisDistributedLockManager:
             ) from e
 
     async def _acquire_lock(
-        self, resource: str, timeout: float, blocking_timeout: float
-    ) -> bool:
+        self,
+        resource: str,
+        timeout: float,
+        blocking_timeout: float,
+        auto_renew: bool = False,
+    ) -> LockAcquisition:
         """
         Internal method: Acquire lock
 
+        Waits for a release notification between attempts, bounded by the
+        holder's remaining lease and DEFAULT_RETRY_INTERVAL.
+
         Args:
             resource: Resource name
             timeout: Lock timeout
             blocking_timeout: Blocking timeout for acquiring lock
+            auto_renew: Start a lease renewal watchdog on acquisition
 
         Returns:
-            bool: Whether the lock was successfully acquired
+            LockAcquisition: Acquisition result with fencing token
         """
         await self._ensure_scripts()
 
@@ -267,60 +382,95 @@ class RedisDistributedLockManager:
         owner_id = self._get_owner_id()
         timeout_ms = int(timeout * 1000) if timeout > 0 else 0
 
-        # Calculate retry count
-        retry_count = max(1, int(blocking_timeout / DEFAULT_RETRY_INTERVAL))
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + blocking_timeout
+        attempt = 0
 
-        for attempt in range(retry_count):
+        while True:
+            attempt += 1
+            # Register before trying so a release between the attempt and the
+            # wait is not missed
+            wake_event = self._add_waiter(resource)
             try:
-                redis_client = await self.redis_provider.get_client()
-                result = await self._lua_acquire(
-                    keys=[lock_key], args=[owner_id, timeout_ms], client=redis_client
-                )
+                wait_seconds = DEFAULT_RETRY_INTERVAL
+                try:
+                    redis_client = await self.redis_provider.get_client()
+                    count, token, holder_pttl_ms = await self._lua_acquire(
+                        keys=[lock_key, self.FENCING_TOKEN_KEY],
+                        args=[owner_id, timeout_ms],
+                        client=redis_client,
+                    )
 
-                if result > 0:
+                    if count > 0:
+                        logger.debug(
+                            "Successfully acquired reentrant lock: %s, coroutine: %s, reentry count: %s, fencing token: %s (attempt %s)",
+                            resource,
+                            owner_id,
+                            count,
+                            token,
+                            attempt,
+                        )
+                        if auto_renew and timeout_ms > 0:
+                            self._start_watchdog(resource, owner_id, timeout_ms)
+                        return LockAcquisition(
+                            acquired=True, fencing_token=int(token), owner_id=owner_id
+                        )
+
+                    if holder_pttl_ms > 0:
+                        # Retry as soon as the holder's lease runs out
+                        wait_seconds = min(wait_seconds, holder_pttl_ms / 1000)
+                    elif holder_pttl_ms == -2:
+                        # Released in the meantime
+                        wait_seconds = 0
+
+                except REDIS_ERRORS as e:
                     logger.debug(
-                        "Successfully acquired reentrant lock: %s, coroutine: %s, reentry count: %s (attempt %s)",
+                        "Failed to acquire lock (attempt %s): %s, error: %s",
+                        attempt,
                         resource,
-                        owner_id,
-                        result,
-                        attempt + 1,
+                        e,
                     )
-                    return True
-                else:
-                    if attempt < retry_count - 1:
-                        await asyncio.sleep(DEFAULT_RETRY_INTERVAL)
 
-            except (ConnectionError, TimeoutError, OSError) as e:
-                logger.debug(
-                    "Failed to acquire lock (attempt %s): %s, error: %s",
-                    attempt + 1,
-                    resource,
-                    e,
-                )
-                if attempt < retry_count - 1:
-                    await asyncio.sleep(DEFAULT_RETRY_INTERVAL)
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(
+                        wake_event.wait(), min(wait_seconds, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                self._remove_waiter(resource, wake_event)
 
         logger.warning(
             "Timed out acquiring reentrant distributed lock: %s, coroutine: %s",
             resource,
             owner_id,
         )
-        return False
+        return LockAcquisition(acquired=False, owner_id=owner_id)
 
     async def _release_lock(self, resource: str):
         """
         Internal method: Release lock
 
+        The renewal watchdog is stopped unless an outer reentrant acquisition
+        still holds the lock, also when the release fails or is cancelled, so a
+        lost release ends with the lease expiring instead of being renewed.
+
         Args:
             resource: Resource name
         """
         lock_key = self.LOCK_KEY_TEMPLATE.format(resource=resource)
         owner_id = self._get_owner_id()
 
+        result = None
         try:
             redis_client = await self.redis_provider.get_client()
             result = await self._lua_release(
-                keys=[lock_key], args=[owner_id], client=redis_client
+                keys=[lock_key],
+                args=[owner_id, f"{self.RELEASE_CHANNEL_PREFIX}{resource}"],
+                client=redis_client,
             )
 
             if result == -1:
@@ -343,13 +493,143 @@ class RedisDistributedLockManager:
                     owner_id,
                 )
 
-        except (ConnectionError, TimeoutError, OSError) as e:
+        except REDIS_ERRORS as e:
             logger.error(
                 "Exception occurred while releasing reentrant lock: %s, coroutine: %s, error: %s",
                 resource,
                 owner_id,
                 e,
             )
+        finally:
+            if result is None or result <= 0:
+                self._stop_watchdog(resource, owner_id)
+
+    async def renew(self, resource: str, timeout: Optional[float] = None) -> bool:
+        """
+        Extend the lease of a lock held by the current coroutine
+
+        Args:
+            resource: Name of the lock resource
+            timeout: New lease (seconds), default DEFAULT_LOCK_TIMEOUT
+
+        Returns:
+            bool: Whether the lease was extended (False if the lock is not held)
+        """
+        timeout_ms = int((timeout or DEFAULT_LOCK_TIMEOUT) * 1000)
+        try:
+            return await self._renew_lease(resource, self._get_owner_id(), timeout_ms)
+        except REDIS_ERRORS as e:
+            logger.error("Failed to renew reentrant lock: %s, error: %s", resource, e)
+            return False
+
+    async def _renew_lease(self, resource: str, owner_id: str, timeout_ms: int) -> bool:
+        await self._ensure_scripts()
+        redis_client = await self.redis_provider.get_client()
+        result = await self._lua_renew(
+            keys=[self.LOCK_KEY_TEMPLATE.format(resource=resource)],
+            args=[owner_id, timeout_ms],
+            client=redis_client,
+        )
+        return result == 1
+
+    def _start_watchdog(self, resource: str, owner_id: str, timeout_ms: int) -> None:
+        """Start the lease renewal watchdog of a holder (once per holder)"""
+        key = (resource, owner_id)
+        watchdog = self._watchdogs.get(key)
+        if watchdog is not None and not watchdog.done():
+            return
+        self._watchdogs[key] = asyncio.create_task(
+            self._watchdog_loop(resource, owner_id, timeout_ms),
+            name=f"lock_watchdog:{resource}",
+        )
+
+    def _stop_watchdog(self, resource: str, owner_id: str) -> None:
+        watchdog = self._watchdogs.pop((resource, owner_id), None)
+        if watchdog is not None:
+            watchdog.cancel()
+
+    async def _watchdog_loop(self, resource: str, owner_id: str, timeout_ms: int):
+        """Renew the lease every timeout / 3 until released or lost"""
+        interval = max(timeout_ms / 3000, MIN_RENEW_INTERVAL)
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    renewed = await self._renew_lease(resource, owner_id, timeout_ms)
+                except Exception as e:  # pylint: disable=broad-except
+                    # Keep trying, the lease may still be valid
+                    logger.warning(
+                        "Failed to renew reentrant lock: %s, coroutine: %s, error: %s",
+                        resource,
+                        owner_id,
+                        e,
+                    )
+                    continue
+                if not renewed:
+                    logger.warning(
+                        "Reentrant lock lost before release, stopping renewal: %s, coroutine: %s",
+                        resource,
+                        owner_id,
+                    )
+                    return
+        finally:
+            if self._watchdogs.get((resource, owner_id)) is asyncio.current_task():
+                del self._watchdogs[(resource, owner_id)]
+
+    def _add_waiter(self, resource: str) -> asyncio.Event:
+        """Register a local waiter for the release notification of a resource"""
+        self._ensure_release_listener()
+        event = asyncio.Event()
+        self._waiters.setdefault(resource, set()).add(event)
+        return event
+
+    def _remove_waiter(self, resource: str, event: asyncio.Event) -> None:
+        waiters = self._waiters.get(resource)
+        if waiters is not None:
+            waiters.discard(event)
+            if not waiters:
+                del self._waiters[resource]
+
+    def _ensure_release_listener(self) -> None:
+        """Start the release listener, or restart it after a connection failure"""
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(
+                self._listen_for_releases(), name="lock_release_listener"
+            )
+
+    async def _listen_for_releases(self):
+        """
+        Wake local waiters on release notifications
+
+        One pattern subscription per process; waiters poll on their own while
+        it is down, the next waiter restarts it.
+        """
+        pubsub = None
+        try:
+            redis_client = await self.redis_provider.get_client()
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            await pubsub.psubscribe(f"{self.RELEASE_CHANNEL_PREFIX}*")
+            async for message in pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode("utf-8")
+                resource = channel[len(self.RELEASE_CHANNEL_PREFIX) :]
+                for event in self._waiters.get(resource, ()):
+                    event.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(
+                "Lock release listener stopped, waiters fall back to polling: %s", e
+            )
+        finally:
+            if pubsub is not None:
+                try:
+                    await pubsub.reset()
+                except Exception:  # pylint: disable=broad-except
+                    pass
 
     async def is_locked(self, resource: str) -> bool:
         """
@@ -374,7 +654,7 @@ class RedisDistributedLockManager:
             status_code = result[0] if result else 0
             return status_code > 0  # 1 or 2 both indicate locked
 
-        except (ConnectionError, TimeoutError, OSError) as e:
+        except REDIS_ERRORS as e:
             logger.error(
                 "Failed to check reentrant lock status: %s, error: %s", resource, e
             )
@@ -403,7 +683,7 @@ class RedisDistributedLockManager:
             status_code = result[0] if result else 0
             return status_code == 1  # 1 indicates held by current coroutine
 
-        except (ConnectionError, TimeoutError, OSError) as e:
+        except REDIS_ERRORS as e:
             logger.error(
                 "Failed to check reentrant lock ownership: %s, error: %s", resource, e
             )
@@ -434,7 +714,7 @@ class RedisDistributedLockManager:
             else:
                 return 0
 
-        except (ConnectionError, TimeoutError, OSError) as e:
+        except REDIS_ERRORS as e:
             logger.error("Failed to get reentry count: %s, error: %s", resource, e)
             return 0
 
@@ -458,7 +738,7 @@ class RedisDistributedLockManager:
             )
             return result > 0
 
-        except (ConnectionError, TimeoutError, OSError) as e:
+        except REDIS_ERRORS as e:
             logger.error(
                 "Failed to forcibly release reentrant lock: %s, error: %s", resource, e
             )
@@ -470,6 +750,7 @@ class RedisDistributedLockManager:
         resource: str,
         timeout: Optional[float] = None,
         blocking_timeout: Optional[float] = None,
+        auto_renew: bool = False,
     ):
         """
         Asynchronous context manager for acquiring reentrant distributed lock (compatible with old interface)
@@ -478,16 +759,26 @@ class RedisDistributedLockManager:
             resource: Name of the lock resource (key name)
             timeout: Lock timeout (seconds)
             blocking_timeout: Blocking timeout for acquiring lock (seconds)
+            auto_renew: Renew the lease in the background until the lock is released
 
         Yields:
-            bool: Whether the lock was successfully acquired
+            LockAcquisition: Truthy if the lock was acquired, carries the fencing token
         """
         lock = self.get_lock(resource)
-        async with lock.acquire(timeout, blocking_timeout) as acquired:
+        async with lock.acquire(timeout, blocking_timeout, auto_renew) as acquired:
             yield acquired
 
     async def close(self):
         """Close service and clean up resources"""
+        tasks = list(self._watchdogs.values())
+        if self._listener_task is not None:
+            tasks.append(self._listener_task)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._watchdogs.clear()
+        self._listener_task = None
         logger.info("Redis distributed lock manager closed")
 
 
@@ -497,6 +788,7 @@ async def distributed_lock(
     resource: str,
     timeout: Optional[float] = None,
     blocking_timeout: Optional[float] = None,
+    auto_renew: bool = False,
 ):
     """
     Convenient distributed lock context manager, used within functions
@@ -505,9 +797,10 @@ async def distributed_lock(
         resource: Name of the lock resource
         timeout: Lock timeout (seconds)
         blocking_timeout: Blocking timeout for acquiring lock (seconds)
+        auto_renew: Renew the lease in the background until the lock is released
 
     Yields:
-        bool: Whether the lock was successfully acquired
+        LockAcquisition: Truthy if the lock was acquired, carries the fencing token
 
     Example:
         async def some_function():
@@ -518,6 +811,11 @@ async def distributed_lock(
                 else:
                     print("Failed to acquire lock")
 
+        # Long critical section: keep the lease alive, fence writes with the token
+        async with distributed_lock("group:123", auto_renew=True) as acquired:
+            if acquired:
+                await save(data, fencing_token=acquired.fencing_token)
+
         # Supports reentrancy
         async def reentrant_function():
             async with distributed_lock("resource:123") as acquired1:
@@ -534,7 +832,7 @@ async def distributed_lock(
     # Acquire lock and execute
     lock = lock_manager.get_lock(resource)
     async with lock.acquire(
-        timeout=timeout, blocking_timeout=blocking_timeout
+        timeout=timeout, blocking_timeout=blocking_timeout, auto_renew=auto_renew
     ) as acquired:
         yield acquired
 
@@ -544,6 +842,7 @@ def with_distributed_lock(
     resource_key: Union[str, callable],
     timeout: float = DEFAULT_LOCK_TIMEOUT,
     blocking_timeout: float = DEFAULT_BLOCKING_TIMEOUT,
+    auto_renew: bool = False,
 ):
     """
     Distributed lock decorator (supports reentrancy)
@@ -552,6 +851,7 @@ def with_distributed_lock(
         resource_key: Lock resource key, can be string or function returning string
         timeout: Lock timeout
         blocking_timeout: Blocking timeout for acquiring lock
+        auto_renew: Renew the lease in the background while the function runs
 
     Example:
         @with_distributed_lock("user:balance:{user_id}")
@@ -581,7 +881,9 @@ def with_distributed_lock(
             # Acquire lock and execute function
             lock = lock_manager.get_lock(resource)
             async with lock.acquire(
-                timeout=timeout, blocking_timeout=blocking_timeout
+                timeout=timeout,
+                blocking_timeout=blocking_timeout,
+                auto_renew=auto_renew,
             ) as acquired:
                 if acquired:
                     return await func(*args, **kwargs)
@@ -6,8 +6,9 @@ All Elasticsearch repositories should inherit from this base class to obtain uni
 """
 
 from abc import ABC
-from typing import Optional, TypeVar, Generic, Type, List, Dict, Any
-from elasticsearch import AsyncElasticsearch
+from typing import Optional, TypeVar, Generic, Type, List, Dict, Any, Union
+from elasticsearch import ApiError, AsyncElasticsearch
+from elasticsearch.dsl import AsyncMultiSearch, AsyncSearch
 from core.oxm.es.doc_base import DocBase
 from core.observation.logger import get_logger
 
@@ -186,24 +187,13 @@ class BaseRepository(ABC, Generic[T]):
             List of successfully created documents
         """
         try:
-            client = await self.get_client()
-            index_name = self.get_index_name()
-
-            # Build bulk operations
-            actions = []
-            for doc in documents:
-                action = {"_index": index_name, "_source": doc.to_dict()}
-                actions.append(action)
-
-            # Execute bulk operation
-            from elasticsearch.helpers import async_bulk
-
-            await async_bulk(client, actions, refresh=refresh)
-
+            failed_ids = await self.bulk_create(
+                documents, refresh=refresh, raise_on_error=True
+            )
             logger.debug(
                 "✅ Batch document creation succeeded [%s]: %d records",
                 self.model_name,
-                len(documents),
+                len(documents) - len(failed_ids),
             )
             return documents
         except Exception as e:
@@ -212,6 +202,63 @@ class BaseRepository(ABC, Generic[T]):
             )
             raise
 
+    async def bulk_create(
+        self,
+        documents: List[T],
+        refresh: Union[bool, str] = False,
+        raise_on_error: bool = False,
+    ) -> List[str]:
+        """
+        Index documents with a single bulk request
+
+        Documents keep their meta.id, so re-running a partially failed bulk is idempotent.
+
+        Args:
+            documents: List of documents
+            refresh: Refresh policy applied once for the whole bulk (False, True or "wait_for")
+            raise_on_error: Raise on the first item error instead of collecting failures
+
+        Returns:
+            List of document IDs that failed to index (empty when all succeeded)
+        """
+        if not documents:
+            return []
+
+        from elasticsearch.helpers import async_bulk
+
+        client = await self.get_client()
+        index_name = self.get_index_name()
+
+        # Build bulk operations (same index op as document.save)
+        actions = []
+        for doc in documents:
+            action = {"_index": index_name, "_source": doc.to_dict()}
+            doc_id = getattr(doc.meta, "id", None)
+            if doc_id is not None:
+                action["_id"] = doc_id
+            actions.append(action)
+
+        _, errors = await async_bulk(
+            client,
+            actions,
+            refresh=refresh,
+            raise_on_error=raise_on_error,
+            stats_only=False,
+        )
+
+        failed_ids = []
+        for error in errors or []:
+            item = next(iter(error.values()), {})
+            failed_ids.append(str(item.get("_id")))
+        if failed_ids:
+            logger.warning(
+                "⚠️ Bulk indexing partially failed [%s]: %d/%d failed",
+                self.model_name,
+                len(failed_ids),
+                len(documents),
+            )
+        return failed_ids
+
     # ==================== Search Methods ====================
 
     async def search(
@@ -273,6 +320,67 @@ class BaseRepository(ABC, Generic[T]):
             logger.error("❌ Failed to get all documents [%s]: %s", self.model_name, e)
             return []
 
+    async def msearch(
+        self, searches: List[AsyncSearch], raise_on_error: bool = True
+    ) -> List[Union[List[Dict[str, Any]], ApiError]]:
+        """
+        Execute multiple searches in a single _msearch round trip
+
+        Searches may target other indices on the same cluster (e.g. a fan-out over
+        several memory types); each keeps its own index from the AsyncSearch.
+
+        Args:
+            searches: Searches to execute, e.g. built by a repository's build_multi_search
+            raise_on_error: Raise if any search fails; if False, a failed search yields
+                its ApiError in place of its hits and the other searches are kept
+
+        Returns:
+            Hits per search in request order, each hit as
+            {"_index", "_id", "_score", "_source"}
+
+        Raises:
+            ApiError: If any of the searches fails (raise_on_error) or the whole
+                request fails
+        """
+        if not searches:
+            return []
+
+        try:
+            client = await self.get_client()
+            multi_search = AsyncMultiSearch(using=client)
+            for search in searches:
+                multi_search = multi_search.add(search)
+            responses = await client.msearch(body=multi_search.to_dict())
+
+            results: List[Union[List[Dict[str, Any]], ApiError]] = []
+            for response in responses["responses"]:
+                if response.get("error"):
+                    error = ApiError("N/A", meta=responses.meta, body=response)
+                    if raise_on_error:
+                        raise error
+                    results.append(error)
+                    continue
+                results.append(
+                    [
+                        {
+                            "_index": hit["_index"],
+                            "_id": hit["_id"],
+                            "_score": hit.get("_score"),
+                            "_source": hit.get("_source", {}),
+                        }
+                        for hit in response["hits"]["hits"]
+                    ]
+                )
+            return results
+        except Exception as e:
+            logger.error(
+                "❌ Failed to execute msearch [%s]: %d searches, %s",
+                self.model_name,
+                len(searches),
+                e,
+            )
+            raise
+
     # ==================== Statistics Methods ====================
 
     async def exists_by_id(self, doc_id: str) -> bool:
@@ -0,0 +1,126 @@
+"""
+MongoDB keyset (cursor) pagination utilities
+
+Pages are addressed by the (sort field, _id) pair of the last returned document
+instead of an offset, so every page costs one bounded index range scan no matter
+how deep the caller has paged. _id breaks ties between equal sort values.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    """
+    Position after the last document of a page
+
+    Attributes:
+        value: Sort field value of the last document (datetime, int, float or str)
+        id: _id of the last document
+    """
+
+    value: Any
+    id: ObjectId
+
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe token"""
+        if isinstance(self.value, datetime):
+            payload = {"k": "dt", "v": self.value.isoformat()}
+        else:
+            payload = {"k": "raw", "v": self.value}
+        payload["id"] = str(self.id)
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "KeysetCursor":
+        """
+        Decode a token produced by encode()
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            value = payload["v"]
+            if payload["k"] == "dt":
+                value = datetime.fromisoformat(value)
+            return cls(value=value, id=ObjectId(payload["id"]))
+        except (
+            binascii.Error,
+            UnicodeError,
+            json.JSONDecodeError,
+            KeyError,
+            TypeError,
+            ValueError,
+            InvalidId,
+        ) as e:
+            raise ValueError(f"Invalid pagination cursor: {token}") from e
+
+    @classmethod
+    def from_document(cls, document: Any, field: str) -> "KeysetCursor":
+        """Build the cursor pointing after the given document"""
+        return cls(value=getattr(document, field), id=ObjectId(str(document.id)))
+
+
+def keyset_sort(field: str, descending: bool = True) -> List[Tuple[str, int]]:
+    """Sort specification matching keyset_filter: (field, _id) in one direction"""
+    direction = -1 if descending else 1
+    return [(field, direction), ("_id", direction)]
+
+
+def keyset_filter(
+    field: str, cursor: KeysetCursor, descending: bool = True
+) -> Dict[str, Any]:
+    """
+    Filter selecting documents strictly after the cursor in keyset_sort order
+
+    Returns:
+        {"$or": [{field: {op: value}}, {field: value, "_id": {op: id}}]}
+    """
+    op = "$lt" if descending else "$gt"
+    return {
+        "$or": [
+            {field: {op: cursor.value}},
+            {field: cursor.value, "_id": {op: cursor.id}},
+        ]
+    }
+
+
+def apply_keyset_filter(
+    filter_dict: Dict[str, Any],
+    field: str,
+    cursor: Optional[KeysetCursor],
+    descending: bool = True,
+) -> Dict[str, Any]:
+    """AND the keyset condition onto an existing filter (no-op without cursor)"""
+    if cursor is None:
+        return filter_dict
+    condition = keyset_filter(field, cursor, descending)
+    if not filter_dict:
+        return condition
+    return {"$and": [filter_dict, condition]}
+
+
+def split_page(
+    documents: Sequence[Any], field: str, limit: int
+) -> Tuple[List[Any], Optional[KeysetCursor]]:
+    """
+    Split a fetch of limit + 1 documents into the page and the next-page cursor
+
+    Returns:
+        (first limit documents, cursor after the last of them or None if no more)
+    """
+    page = list(documents[:limit])
+    if len(documents) <= limit or not page:
+        return page, None
+    return page, KeysetCursor.from_document(page[-1], field)
@@ -4,8 +4,11 @@ Milvus Base Repository Class
 Provides common basic operations, all Milvus repositories should inherit from this class to obtain unified operation support.
 """
 
+import json
+import os
 from abc import ABC
-from typing import Optional, TypeVar, Generic, Type, List, Any
+from enum import Enum
+from typing import Optional, TypeVar, Generic, Type, List, Any, Tuple
 from core.oxm.milvus.milvus_collection_base import MilvusCollectionBase
 from core.oxm.milvus.async_collection import AsyncCollection
 from core.observation.logger import get_logger
@@ -17,6 +20,43 @@ logger = get_logger(__name__)
 T = TypeVar('T', bound=MilvusCollectionBase)
 
 
+class MilvusOutputProfile(str, Enum):
+    """
+    Output fields requested from Milvus searches
+
+    - IDS: id only (plus the score every hit carries)
+    - SUMMARY: scalar fields, without the large serialized JSON fields
+    - FULL: every field except the vector
+    """
+
+    IDS = "ids"
+    SUMMARY = "summary"
+    FULL = "full"
+
+
+def get_default_output_profile() -> MilvusOutputProfile:
+    """
+    Default search output profile (MILVUS_SEARCH_OUTPUT_PROFILE, default full)
+
+    Only summary and full are accepted: retrieval reranks and groups hits by their
+    text, owner and timestamp, which the ids profile does not return. Callers that
+    only need ids pass output_profile=MilvusOutputProfile.IDS explicitly.
+    """
+    value = os.getenv("MILVUS_SEARCH_OUTPUT_PROFILE", MilvusOutputProfile.FULL.value)
+    try:
+        profile = MilvusOutputProfile(value.lower())
+    except ValueError:
+        profile = None
+    if profile is None or profile == MilvusOutputProfile.IDS:
+        logger.warning(
+            "Unsupported MILVUS_SEARCH_OUTPUT_PROFILE=%s, using %s",
+            value,
+            MilvusOutputProfile.FULL.value,
+        )
+        return MilvusOutputProfile.FULL
+    return profile
+
+
 class BaseMilvusRepository(ABC, Generic[T]):
     """
     Milvus Base Repository Class
@@ -30,6 +70,9 @@ class BaseMilvusRepository(ABC, Generic[T]):
     - Collection management
     """
 
+    # Serialized JSON fields (up to tens of KB each), skipped by the SUMMARY profile
+    LARGE_OUTPUT_FIELDS: Tuple[str, ...] = ("metadata", "search_content")
+
     def __init__(self, model: Type[T]):
         """
         Initialize base repository
@@ -42,6 +85,18 @@ class BaseMilvusRepository(ABC, Generic[T]):
         self.collection: Optional[AsyncCollection] = model.async_collection()
         self.schema = model._SCHEMA
         self.all_output_fields = [field.name for field in self.schema.fields]
+        # Searches never return the vector, the caller already has the query vector
+        self._output_fields_by_profile = {
+            MilvusOutputProfile.IDS: ["id"],
+            MilvusOutputProfile.SUMMARY: [
+                name
+                for name in self.all_output_fields
+                if name != "vector" and name not in self.LARGE_OUTPUT_FIELDS
+            ],
+            MilvusOutputProfile.FULL: [
+                name for name in self.all_output_fields if name != "vector"
+            ],
+        }
 
     # ==================== Basic CRUD Operations ====================
 
@@ -154,7 +209,9 @@ class BaseMilvusRepository(ABC, Generic[T]):
             List[str]: List of inserted entity IDs
         """
         try:
-            entity_ids = await self.collection.insert_batch(entities)
+            # Collection.insert accepts a list of row dicts, one round trip for the batch
+            result = await self.collection.insert(entities)
+            entity_ids = list(result.primary_keys)
             if flush:
                 await self.collection.flush()
             logger.debug(
@@ -201,6 +258,25 @@ class BaseMilvusRepository(ABC, Generic[T]):
 
     # ==================== Helper Methods ====================
 
+    def get_output_fields(
+        self, profile: Optional[MilvusOutputProfile] = None
+    ) -> List[str]:
+        """
+        Get the output fields of a search output profile
+
+        Args:
+            profile: Output profile (None = MILVUS_SEARCH_OUTPUT_PROFILE)
+
+        Returns:
+            List[str]: Field names to request from Milvus
+        """
+        return self._output_fields_by_profile[profile or get_default_output_profile()]
+
+    @staticmethod
+    def parse_json_field(raw: Optional[str], default: Any) -> Any:
+        """Parse a serialized JSON field of a hit, default when empty"""
+        return json.loads(raw) if raw else default
+
     def get_model_name(self) -> str:
         """
         Get model name
@@ -1,7 +1,8 @@
 
 import os
+import copy
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from pymilvus import Collection, DataType, FieldSchema, utility, CollectionSchema
 from pymilvus.client.types import ConsistencyLevel, LoadState
@@ -66,6 +67,42 @@ class IndexConfig:
         return result
 
 
+@dataclass
+class PartitionKeyLayout:
+    """
+    Partition key layout of a collection
+
+    With a partition key, Milvus hashes rows into num_partitions partitions by the
+    key value and prunes searches whose filter has `key == "value"` to the matching
+    partition.
+
+    Attributes:
+        field_name: Partition key field (None = no partition key)
+        num_partitions: Number of partitions the key is hashed into
+    """
+
+    field_name: Optional[str] = None
+    num_partitions: int = 64
+
+    @classmethod
+    def from_env(cls) -> "PartitionKeyLayout":
+        """Read MILVUS_PARTITION_KEY and MILVUS_PARTITION_KEY_NUM_PARTITIONS"""
+        return cls(
+            field_name=os.getenv("MILVUS_PARTITION_KEY", "").strip() or None,
+            num_partitions=int(os.getenv("MILVUS_PARTITION_KEY_NUM_PARTITIONS", "64")),
+        )
+
+
+def get_schema_partition_key(schema: Optional[CollectionSchema]) -> Optional[str]:
+    """Get the partition key field name of a schema (None if it has none)"""
+    if schema is None:
+        return None
+    for field in schema.fields:
+        if getattr(field, "is_partition_key", False):
+            return field.name
+    return None
+
+
 def get_collection_suffix(suffix: Optional[str] = None) -> str:
     """
     Get Collection name suffix, used in multi-tenant scenarios
@@ -130,6 +167,8 @@ class MilvusCollectionBase:
     _SCHEMA: Optional[CollectionSchema] = None
     _INDEX_CONFIGS: Optional[List[IndexConfig]] = None
     _DB_USING: Optional[str] = "default"
+    # Fields that may be configured as partition key (MILVUS_PARTITION_KEY)
+    _PARTITION_KEY_FIELDS: Tuple[str, ...] = ()
 
     # Class-level instance cache
     _collection_instance: Optional[Collection] = None
@@ -170,6 +209,72 @@ class MilvusCollectionBase:
         """Get actual Collection name"""
         return self._COLLECTION_NAME
 
+    @classmethod
+    def get_partition_key_layout(cls) -> PartitionKeyLayout:
+        """
+        Get the partition key layout used when creating this Collection
+
+        The configured key only applies if it is one of _PARTITION_KEY_FIELDS,
+        otherwise the Collection is created without partition key.
+        """
+        layout = PartitionKeyLayout.from_env()
+        if layout.field_name and layout.field_name not in cls._PARTITION_KEY_FIELDS:
+            if cls._PARTITION_KEY_FIELDS:
+                logger.warning(
+                    "Partition key '%s' not supported by %s (supported: %s), ignoring",
+                    layout.field_name,
+                    cls.__name__,
+                    cls._PARTITION_KEY_FIELDS,
+                )
+            return PartitionKeyLayout()
+        return layout
+
+    @classmethod
+    def get_schema(cls) -> Optional[CollectionSchema]:
+        """
+        Get the Schema used when creating this Collection
+
+        Same as _SCHEMA, with the configured partition key field marked as such.
+        """
+        layout = cls.get_partition_key_layout()
+        if cls._SCHEMA is None or not layout.field_name:
+            return cls._SCHEMA
+
+        fields = copy.deepcopy(cls._SCHEMA.fields)
+        for field in fields:
+            field.is_partition_key = field.name == layout.field_name
+        return CollectionSchema(
+            fields=fields,
+            description=cls._SCHEMA.description,
+            enable_dynamic_field=cls._SCHEMA.enable_dynamic_field,
+        )
+
+    @classmethod
+    def get_create_kwargs(cls) -> Dict[str, Any]:
+        """Extra Collection() arguments for creating this Collection"""
+        layout = cls.get_partition_key_layout()
+        if not layout.field_name:
+            return {}
+        return {"num_partitions": layout.num_partitions}
+
+    def check_partition_key_layout(self, coll: Collection) -> None:
+        """Warn if an existing Collection does not match the configured layout"""
+        expected = self.get_partition_key_layout().field_name
+        try:
+            actual = get_schema_partition_key(coll.schema)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("Failed to read partition key of '%s': %s", self.name, e)
+            return
+        if actual != expected:
+            logger.warning(
+                "Collection '%s' partition key is %s but %s is configured; "
+                "rebuild it (devops_scripts/data_fix/milvus_rebuild_collection.py) "
+                "to migrate the data to the configured layout",
+                self.name,
+                actual,
+                expected,
+            )
+
     @property
     def using(self) -> str:
         """Get connection alias"""
@@ -426,9 +531,10 @@ class MilvusCollectionWithSuffix(MilvusCollectionBase):
             # Create Collection
             Collection(
                 name=_collection_name,
-                schema=self._SCHEMA,
+                schema=self.get_schema(),
                 using=self._using,
                 consistency_level=ConsistencyLevel.Bounded,  # Default bounded consistency
+                **self.get_create_kwargs(),
             )
 
             # Create alias pointing to new Collection
@@ -441,6 +547,7 @@ class MilvusCollectionWithSuffix(MilvusCollectionBase):
 
         # Uniformly load via alias (whether existing or newly created)
         coll = Collection(name=name, using=self._using)
+        self.check_partition_key_layout(coll)
 
         return coll
 
@@ -485,7 +592,8 @@ class MilvusCollectionWithSuffix(MilvusCollectionBase):
     def create_new_collection(self) -> Collection:
         """
         Create a new real Collection (without switching alias).
-        - Create new collection using class-defined `_SCHEMA`
+        - Create new collection using class-defined `_SCHEMA` and the configured
+          partition key layout (rebuilding migrates data into the current layout)
         - Create indexes and load for new collection according to `_INDEX_CONFIGS`
 
         Returns:
@@ -498,13 +606,14 @@ class MilvusCollectionWithSuffix(MilvusCollectionBase):
 
         alias_name = self._alias_name
 
-        # Create new collection
+        # Create new collection (with the configured partition key layout)
         new_real_name = generate_new_collection_name(alias_name)
         Collection(
             name=new_real_name,
-            schema=self._SCHEMA,
+            schema=self.get_schema(),
             using=self._using,
             consistency_level=ConsistencyLevel.Bounded,
+            **self.get_create_kwargs(),
         )
 
         # Create indexes for new collection
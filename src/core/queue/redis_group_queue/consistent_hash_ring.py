@@ -0,0 +1,49 @@
+"""
+Consistent hash ring with virtual nodes
+
+Used by RedisGroupQueueManager to route group keys to partitions:
+- ring point of a key: first 8 hex digits of its SHA-1, as an unsigned 32-bit int
+- node N owns virtual points ring_point(f"{N}#{i}") for i in 1..virtual_nodes
+- a key belongs to the node of the first point >= ring_point(key), wrapping
+  around; equal points are ordered by node name
+
+Adding or removing a node only moves the keys of the arcs it gains or loses.
+"""
+
+import bisect
+import hashlib
+from typing import Dict, Iterable, List, Tuple
+
+
+def ring_point(key: str) -> int:
+    """Ring position of a key"""
+    return int(hashlib.sha1(key.encode("utf-8")).hexdigest()[:8], 16)
+
+
+class ConsistentHashRing:
+    """Immutable consistent hash ring over a set of named nodes"""
+
+    def __init__(self, nodes: Iterable[str], virtual_nodes: int = 64):
+        if virtual_nodes <= 0:
+            raise ValueError(f"virtual_nodes must be positive, got {virtual_nodes}")
+        points: List[Tuple[int, str]] = sorted(
+            (ring_point(f"{node}#{i}"), node)
+            for node in set(nodes)
+            for i in range(1, virtual_nodes + 1)
+        )
+        if not points:
+            raise ValueError("ConsistentHashRing requires at least one node")
+        self.virtual_nodes = virtual_nodes
+        self._points = [point for point, _ in points]
+        self._nodes = [node for _, node in points]
+
+    def get_node(self, key: str) -> str:
+        """Node owning a key"""
+        index = bisect.bisect_left(self._points, ring_point(key))
+        if index == len(self._points):
+            index = 0
+        return self._nodes[index]
+
+    def assign(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Map every key to its node"""
+        return {key: self.get_node(key) for key in keys}
@@ -5,56 +5,127 @@ Provides atomic operation Lua scripts to ensure queue state consistency.
 """
 
 # Common rebalance function definition
+# Every active owner gets floor(P / n) or ceil(P / n) of the P partitions, and
+# partitions stay with their current owner whenever that owner is under its
+# share: an owner joining or leaving moves the minimum number of partitions.
+# Owners whose partition set is unchanged keep their queue_list.
 REBALANCE_FUNCTION = """
 -- rebalance partition function
-local function rebalance_partitions(owner_zset_key, queue_list_prefix, total_partitions, owner_expire)
+local function rebalance_partitions(owner_zset_key, queue_list_prefix, rebalance_stats_key, total_partitions, owner_expire)
     -- Get all active owners
     local active_owners = redis.call('ZRANGE', owner_zset_key, 0, -1)
     local owner_count = #active_owners
-    
+
     if owner_count == 0 then
         return {0, {}}
     end
-    
-    -- Clean up queue_list for all owners
+
+    local is_partition = {}
+    for i = 1, total_partitions do
+        is_partition[string.format("%03d", i)] = true
+    end
+
+    -- Previous assignment (partition -> owner) from the current queue_lists,
+    -- ignoring partitions out of range or already claimed by another owner
+    local previous_owner = {}
+    local previous_list = {}
+    local held = {}
     for _, owner_id in ipairs(active_owners) do
-        local queue_list_key = queue_list_prefix .. owner_id
-        redis.call('DEL', queue_list_key)
+        previous_list[owner_id] = redis.call('LRANGE', queue_list_prefix .. owner_id, 0, -1)
+        held[owner_id] = {}
+        for _, partition_name in ipairs(previous_list[owner_id]) do
+            if is_partition[partition_name] and not previous_owner[partition_name] then
+                previous_owner[partition_name] = owner_id
+                table.insert(held[owner_id], partition_name)
+            end
+        end
+        table.sort(held[owner_id])
     end
-    
-    -- Evenly distribute partitions
-    local partitions_per_owner = math.floor(total_partitions / owner_count)
-    local extra_partitions = total_partitions % owner_count
-    
+
+    -- Owners holding the most partitions get the ceil(P / n) shares
+    local by_holding = {}
+    local position = {}
+    for index, owner_id in ipairs(active_owners) do
+        table.insert(by_holding, owner_id)
+        position[owner_id] = index
+    end
+    table.sort(by_holding, function(a, b)
+        if #held[a] == #held[b] then
+            return position[a] < position[b]
+        end
+        return #held[a] > #held[b]
+    end)
+    local base_share = math.floor(total_partitions / owner_count)
+    local extra_shares = total_partitions % owner_count
+    local capacity = {}
+    for rank, owner_id in ipairs(by_holding) do
+        capacity[owner_id] = base_share
+        if rank <= extra_shares then
+            capacity[owner_id] = base_share + 1
+        end
+    end
+
+    -- Keep held partitions up to each owner's share, release the rest
+    local assigned = {}
+    local taken = {}
+    for _, owner_id in ipairs(active_owners) do
+        assigned[owner_id] = {}
+        for _, partition_name in ipairs(held[owner_id]) do
+            if #assigned[owner_id] < capacity[owner_id] then
+                table.insert(assigned[owner_id], partition_name)
+                taken[partition_name] = true
+            end
+        end
+    end
+
+    -- Hand the released and unowned partitions to owners under their share
+    local moved = 0
+    local next_partition = 1
+    for _, owner_id in ipairs(active_owners) do
+        while #assigned[owner_id] < capacity[owner_id] do
+            local partition_name = string.format("%03d", next_partition)
+            next_partition = next_partition + 1
+            if not taken[partition_name] then
+                table.insert(assigned[owner_id], partition_name)
+                taken[partition_name] = true
+                moved = moved + 1
+            end
+        end
+        table.sort(assigned[owner_id])
+    end
+
     -- Return assignment results in flat array format for proper conversion by Redis clients
     local assigned_partitions_flat = {}
-    local partition_index = 1
-    
-    for i, owner_id in ipairs(active_owners) do
+    for _, owner_id in ipairs(active_owners) do
         local queue_list_key = queue_list_prefix .. owner_id
-        local partitions_for_this_owner = partitions_per_owner
-        
-        -- First 'extra_partitions' owners get one additional partition
-        if i <= extra_partitions then
-            partitions_for_this_owner = partitions_for_this_owner + 1
+        local previous = previous_list[owner_id]
+        local changed = #previous ~= #assigned[owner_id]
+        for i, partition_name in ipairs(assigned[owner_id]) do
+            if previous[i] ~= partition_name then
+                changed = true
+            end
         end
-        
-        local owner_partitions = {}
-        for j = 1, partitions_for_this_owner do
-            local partition_name = string.format("%03d", partition_index)
-            redis.call('LPUSH', queue_list_key, partition_name)
-            table.insert(owner_partitions, partition_name)
-            partition_index = partition_index + 1
+        if changed then
+            redis.call('DEL', queue_list_key)
+            for _, partition_name in ipairs(assigned[owner_id]) do
+                redis.call('RPUSH', queue_list_key, partition_name)
+            end
         end
-        
+
         -- Set expiration time
         redis.call('EXPIRE', queue_list_key, owner_expire)
-        
+
         -- Add owner_id and partition list to flat array
         table.insert(assigned_partitions_flat, owner_id)
-        table.insert(assigned_partitions_flat, owner_partitions)
+        table.insert(assigned_partitions_flat, assigned[owner_id])
     end
-    
+
+    -- Rebalance churn statistics
+    redis.call('HINCRBY', rebalance_stats_key, 'rebalance_count', 1)
+    redis.call('HINCRBY', rebalance_stats_key, 'total_moved_partitions', moved)
+    redis.call('HSET', rebalance_stats_key, 'last_moved_partitions', moved, 'last_owner_count', owner_count)
+    redis.call('EXPIRE', rebalance_stats_key, owner_expire)
+
     return {owner_count, assigned_partitions_flat}
 end
 """
@@ -100,11 +171,63 @@ else
 end
 """
 
+# Lua script for adding many messages in one call
+ENQUEUE_BATCH_SCRIPT = """
+-- Parameters:
+-- KEYS[1]: total counter key
+-- KEYS[2..n+1]: queue key (zset) of each message, in message order
+-- ARGV[1]: queue expiration time (seconds)
+-- ARGV[2]: activity expiration time (seconds)
+-- ARGV[3]: maximum total limit
+-- ARGV[4..]: message content and sort score pairs, in message order
+-- Returns: {final count, per-message status} where status is
+--          1 (added), 0 (already exists), -1 (exceeded maximum total limit)
+
+local counter_key = KEYS[1]
+local queue_expire = tonumber(ARGV[1])
+local activity_expire = tonumber(ARGV[2])
+local max_total = tonumber(ARGV[3])
+
+local current_count = tonumber(redis.call('GET', counter_key) or '0')
+local statuses = {}
+local touched_queues = {}
+local added_total = 0
+
+for i = 2, #KEYS do
+    local queue_key = KEYS[i]
+    local message = ARGV[2 * i]
+    local score = tonumber(ARGV[2 * i + 1])
+
+    if current_count + added_total >= max_total then
+        table.insert(statuses, -1)
+    elseif redis.call('ZADD', queue_key, score, message) == 1 then
+        touched_queues[queue_key] = true
+        added_total = added_total + 1
+        table.insert(statuses, 1)
+    else
+        table.insert(statuses, 0)
+    end
+end
+
+-- Update queue expiration once per touched queue
+for queue_key, _ in pairs(touched_queues) do
+    redis.call('EXPIRE', queue_key, queue_expire)
+end
+
+if added_total > 0 then
+    current_count = redis.call('INCRBY', counter_key, added_total)
+    redis.call('EXPIRE', counter_key, activity_expire)
+end
+
+return {current_count, statuses}
+"""
+
 # Lua script for rebalance repartitioning
 REBALANCE_PARTITIONS_SCRIPT = """
 -- Parameters:
 -- KEYS[1]: owner_activate_time_zset key
 -- KEYS[2]: queue_list_prefix (used to construct queue_list key for each owner)
+-- KEYS[3]: rebalance statistics key (hash)
 -- ARGV[1]: total number of partitions
 -- ARGV[2]: owner expiration time (seconds, default 1 hour)
 
@@ -112,11 +235,12 @@ __REBALANCE_FUNCTION__
 
 local owner_zset_key = KEYS[1]
 local queue_list_prefix = KEYS[2]
+local rebalance_stats_key = KEYS[3]
 local total_partitions = tonumber(ARGV[1])
 local owner_expire = tonumber(ARGV[2])
 
 -- Call rebalance function
-return rebalance_partitions(owner_zset_key, queue_list_prefix, total_partitions, owner_expire)
+return rebalance_partitions(owner_zset_key, queue_list_prefix, rebalance_stats_key, total_partitions, owner_expire)
 """
 
 # Lua script for joining consumer
@@ -124,6 +248,7 @@ JOIN_CONSUMER_SCRIPT = """
 -- Parameters:
 -- KEYS[1]: owner_activate_time_zset key
 -- KEYS[2]: queue_list_prefix (used to construct queue_list key for each owner)
+-- KEYS[3]: rebalance statistics key (hash)
 -- ARGV[1]: owner_id
 -- ARGV[2]: current timestamp
 -- ARGV[3]: owner expiration time (seconds, default 1 hour)
@@ -133,6 +258,7 @@ __REBALANCE_FUNCTION__
 
 local owner_zset_key = KEYS[1]
 local queue_list_prefix = KEYS[2]
+local rebalance_stats_key = KEYS[3]
 local owner_id = ARGV[1]
 local current_time = tonumber(ARGV[2])
 local owner_expire = tonumber(ARGV[3])
@@ -143,7 +269,7 @@ redis.call('ZADD', owner_zset_key, current_time, owner_id)
 redis.call('EXPIRE', owner_zset_key, owner_expire)
 
 -- Call rebalance function
-return rebalance_partitions(owner_zset_key, queue_list_prefix, total_partitions, owner_expire)
+return rebalance_partitions(owner_zset_key, queue_list_prefix, rebalance_stats_key, total_partitions, owner_expire)
 """
 
 # Lua script for consumer exit
@@ -151,6 +277,7 @@ EXIT_CONSUMER_SCRIPT = """
 -- Parameters:
 -- KEYS[1]: owner_activate_time_zset key
 -- KEYS[2]: queue_list_prefix (used to construct queue_list key for each owner)
+-- KEYS[3]: rebalance statistics key (hash)
 -- ARGV[1]: owner_id
 -- ARGV[2]: owner expiration time (seconds, default 1 hour)
 -- ARGV[3]: total number of partitions
@@ -159,6 +286,7 @@ __REBALANCE_FUNCTION__
 
 local owner_zset_key = KEYS[1]
 local queue_list_prefix = KEYS[2]
+local rebalance_stats_key = KEYS[3]
 local owner_id = ARGV[1]
 local owner_expire = tonumber(ARGV[2])
 local total_partitions = tonumber(ARGV[3])
@@ -177,7 +305,7 @@ if #remaining_owners == 0 then
 end
 
 -- Call rebalance function
-return rebalance_partitions(owner_zset_key, queue_list_prefix, total_partitions, owner_expire)
+return rebalance_partitions(owner_zset_key, queue_list_prefix, rebalance_stats_key, total_partitions, owner_expire)
 """
 
 # Lua script for consumer keepalive
@@ -217,6 +345,7 @@ CLEANUP_INACTIVE_OWNERS_SCRIPT = """
 -- KEYS[2]: queue_list_prefix (used to construct queue_list key for each owner)
 -- KEYS[3]: queue_prefix (used to construct partition queue key)
 -- KEYS[4]: counter_key (message total counter key)
+-- KEYS[5]: rebalance statistics key (hash)
 -- ARGV[1]: inactive threshold timestamp (5 minutes ago)
 -- ARGV[2]: current timestamp
 -- ARGV[3]: owner expiration time (seconds, default 1 hour)
@@ -228,6 +357,7 @@ local owner_zset_key = KEYS[1]
 local queue_list_prefix = KEYS[2]
 local queue_prefix = KEYS[3]
 local counter_key = KEYS[4]
+local rebalance_stats_key = KEYS[5]
 local inactive_threshold = tonumber(ARGV[1])
 local current_time = tonumber(ARGV[2])
 local owner_expire = tonumber(ARGV[3])
@@ -272,7 +402,7 @@ if #remaining_owners == 0 then
 end
 
 -- Call rebalance function
-local owner_count, assigned_partitions = unpack(rebalance_partitions(owner_zset_key, queue_list_prefix, total_partitions, owner_expire))
+local owner_count, assigned_partitions = unpack(rebalance_partitions(owner_zset_key, queue_list_prefix, rebalance_stats_key, total_partitions, owner_expire))
 return {cleaned_count, owner_count, assigned_partitions}
 """
 
@@ -330,7 +460,7 @@ else
 end
 """
 
-# Lua script for getting messages (traverse all partitions and attempt to get one from each)
+# Lua script for getting messages (traverse all partitions and get up to N ready messages from each)
 GET_MESSAGES_SCRIPT = """
 -- Parameters:
 -- KEYS[1]: owner_activate_time_zset key
@@ -341,6 +471,8 @@ GET_MESSAGES_SCRIPT = """
 -- ARGV[2]: owner expiration time (seconds, default 1 hour)
 -- ARGV[3]: score difference threshold (milliseconds)
 -- ARGV[4]: current score (used for threshold comparison when queue is empty)
+-- ARGV[5]: maximum messages per partition (optional, default 1)
+-- ARGV[6]: maximum messages in total (optional, 0 = unlimited)
 
 local owner_zset_key = KEYS[1]
 local queue_list_prefix = KEYS[2]
@@ -350,6 +482,8 @@ local owner_id = ARGV[1]
 local owner_expire = tonumber(ARGV[2])
 local score_threshold = tonumber(ARGV[3])
 local current_score = tonumber(ARGV[4])
+local max_per_partition = tonumber(ARGV[5] or '1')
+local max_total = tonumber(ARGV[6] or '0')
 
 -- Check if owner exists in zset
 local owner_score = redis.call('ZSCORE', owner_zset_key, owner_id)
@@ -374,30 +508,30 @@ end
 
 local messages = {}
 local messages_consumed = 0
+-- A message is ready when (current_score - message_score) >= score_threshold
+-- (formatted with full precision, Lua's default number formatting keeps 14 digits)
+local max_ready_score = string.format('%.17g', current_score - score_threshold)
 
--- Traverse all partitions, attempt to get 1 message from each
+-- Traverse all partitions, get up to max_per_partition ready messages from each
 for _, partition in ipairs(owner_queues) do
+    local limit = max_per_partition
+    if max_total > 0 then
+        limit = math.min(limit, max_total - messages_consumed)
+    end
+    if limit <= 0 then
+        break
+    end
+
     local queue_key = queue_prefix .. partition
-    
-    -- Check if queue has messages
-    local queue_size = redis.call('ZCARD', queue_key)
-    if queue_size > 0 then
-        -- Get score of earliest message
-        local min_result = redis.call('ZRANGE', queue_key, 0, 0, 'WITHSCORES')
-        
-        -- Directly compare difference between earliest message and current score
-        if #min_result >= 2 then
-            local earliest_message_score = tonumber(min_result[2])
-            -- Check difference between earliest message score and current score
-            if (current_score - earliest_message_score) >= score_threshold then
-                -- Get earliest message (directly remove)
-                local popped = redis.call('ZPOPMIN', queue_key)
-                if #popped >= 2 then
-                    table.insert(messages, popped[1])  -- Return only message content
-                    messages_consumed = messages_consumed + 1
-                end
-            end
+    -- Earliest ready messages, in score order
+    local ready = redis.call('ZRANGEBYSCORE', queue_key, '-inf', max_ready_score, 'LIMIT', 0, limit)
+    if #ready > 0 then
+        -- Ready messages are the lowest ranks of the zset, remove them in one call
+        redis.call('ZREMRANGEBYRANK', queue_key, 0, #ready - 1)
+        for _, message in ipairs(ready) do
+            table.insert(messages, message)  -- Return only message content
         end
+        messages_consumed = messages_consumed + #ready
     end
 end
 
@@ -457,10 +591,16 @@ GET_ALL_PARTITIONS_STATS_SCRIPT = """
 -- Parameters:
 -- KEYS[1]: queue_prefix (used to construct partition queue key)
 -- KEYS[2]: total counter key
+-- KEYS[3]: owner_activate_time_zset key (optional, enables owner load statistics)
+-- KEYS[4]: queue_list_prefix (optional, used to construct queue_list key for each owner)
+-- KEYS[5]: rebalance statistics key (optional, hash)
 -- ARGV[1]: total number of partitions
 
 local queue_prefix = KEYS[1]
 local counter_key = KEYS[2]
+local owner_zset_key = KEYS[3]
+local queue_list_prefix = KEYS[4]
+local rebalance_stats_key = KEYS[5]
 local total_partitions = tonumber(ARGV[1])
 
 -- Get total count
@@ -468,6 +608,7 @@ local total_count = tonumber(redis.call('GET', counter_key) or '0')
 
 -- Store statistics for all partitions
 local partition_stats = {}
+local partition_sizes = {}
 local total_messages_in_queues = 0
 local global_min_score = nil
 local global_max_score = nil
@@ -480,6 +621,7 @@ for i = 1, total_partitions do
     -- Get queue size
     local queue_size = redis.call('ZCARD', queue_key)
     total_messages_in_queues = total_messages_in_queues + queue_size
+    partition_sizes[partition_name] = queue_size
     
     local min_score = 0
     local max_score = 0
@@ -511,12 +653,36 @@ for i = 1, total_partitions do
     table.insert(partition_stats, max_score)
 end
 
+-- Per-owner load (flat array: owner_id, assigned partitions, queued messages)
+local owner_stats = {}
+if owner_zset_key and queue_list_prefix then
+    local active_owners = redis.call('ZRANGE', owner_zset_key, 0, -1)
+    for _, owner_id in ipairs(active_owners) do
+        local owner_partitions = redis.call('LRANGE', queue_list_prefix .. owner_id, 0, -1)
+        local owner_messages = 0
+        for _, partition_name in ipairs(owner_partitions) do
+            owner_messages = owner_messages + (partition_sizes[partition_name] or 0)
+        end
+        table.insert(owner_stats, owner_id)
+        table.insert(owner_stats, #owner_partitions)
+        table.insert(owner_stats, owner_messages)
+    end
+end
+
+-- Rebalance churn (flat array: field, value)
+local rebalance_stats = {}
+if rebalance_stats_key then
+    rebalance_stats = redis.call('HGETALL', rebalance_stats_key)
+end
+
 return {
     total_count,
     total_messages_in_queues,
     global_min_score or 0,
     global_max_score or 0,
-    partition_stats
+    partition_stats,
+    owner_stats,
+    rebalance_stats
 }
 """
 
@@ -1,14 +1,21 @@
 """
 Redis Message Group Queue Manager
 
-Redis-based fixed partition queue manager.
+Redis-based partitioned queue manager.
 Core features:
-1. Fixed 50 partitions, numbered 001-050, not configurable
-2. group_key routed to fixed partition via hash
-3. Supports concurrent consumption of multiple queues, prevents conflicts using owner mechanism
+1. Configurable partition count (default 50), numbered 001, 002, ...
+2. group_key routed to a partition via hash modulo (legacy) or a consistent hash
+   ring with virtual nodes
+3. Supports concurrent consumption of multiple queues, prevents conflicts using owner mechanism;
+   every owner gets floor or ceil of partitions / owners, and owner join/exit only
+   moves the partitions needed to restore that split
 4. Uses Redis sorted sets (ZSET) to store messages, supports sorting by score and time filtering
 
-⚠️ Warning: Partition count is fixed at 50. Modifying this configuration will cause severe data routing errors and message loss!
+⚠️ Warning: All producers and consumers sharing a key_prefix must use the same partition
+count and group routing. With consistent routing, raising the partition count from N
+to M moves about (M - N) / M of the groups; messages of moved groups still queued in
+their old partition may be consumed out of order with new ones during the switch.
+Switching the routing mode reshuffles all groups, drain the queue first.
 """
 
 import asyncio
@@ -24,12 +31,14 @@ import redis.asyncio as redis
 from core.observation.logger import get_logger
 from common_utils.datetime_utils import get_now_with_timezone, to_iso_format
 from core.queue.redis_group_queue.redis_group_queue_item import SimpleQueueItem
+from core.queue.redis_group_queue.consistent_hash_ring import ConsistentHashRing
 from core.queue.redis_group_queue.redis_group_queue_item import (
     RedisGroupQueueItem,
     SerializationMode,
 )
 from core.queue.redis_group_queue.redis_group_queue_lua_scripts import (
     ENQUEUE_SCRIPT,
+    ENQUEUE_BATCH_SCRIPT,
     GET_QUEUE_STATS_SCRIPT,
     GET_ALL_PARTITIONS_STATS_SCRIPT,
     REBALANCE_PARTITIONS_SCRIPT,
@@ -40,11 +49,19 @@ from core.queue.redis_group_queue.redis_group_queue_lua_scripts import (
     FORCE_CLEANUP_SCRIPT,
     GET_MESSAGES_SCRIPT,
 )
-from core.rate_limit.rate_limiter import rate_limit
+from core.rate_limit.rate_limiter import local_rate_limit
 
 logger = get_logger(__name__)
 
 
+def _get_messages_rate_limit_key(
+    manager: "RedisGroupQueueManager", *args, **kwargs
+) -> str:
+    """Rate limit key of get_messages: one limiter per owner"""
+    owner_id = kwargs.get("owner_id") or (args[2] if len(args) > 2 else None)
+    return f"get_messages_{owner_id or manager.owner_id}"
+
+
 class ShutdownMode(Enum):
     """Shutdown mode enumeration"""
 
@@ -139,6 +156,13 @@ class RedisManagerStats:
         }
 
 
+class GroupRouting(Enum):
+    """Group key -> partition routing"""
+
+    MODULO = "modulo"  # MD5 hash modulo partition count (legacy)
+    CONSISTENT = "consistent"  # Consistent hash ring with virtual nodes
+
+
 class RedisGroupQueueManager:
     """
     Redis message group queue manager (dynamic owner management version)
@@ -153,11 +177,18 @@ class RedisGroupQueueManager:
     7. Supports forced cleanup and reset
     8. Checks score difference threshold when consuming messages
     9. All operations ensure atomicity through Lua scripts
+    10. Batch delivery (deliver_messages) and multi-message dequeue per partition
     """
 
-    # Fixed partition count, configurable but recommended to keep at 50
+    # Default partition count (see partition_count)
     FIXED_PARTITION_COUNT = 50
 
+    # Default virtual nodes per partition on the group routing hash ring
+    DEFAULT_VIRTUAL_NODES = 64
+
+    # Messages per enqueue script call in deliver_messages (bounds script run time)
+    DELIVER_BATCH_CHUNK_SIZE = 500
+
     def __init__(
         self,
         redis_client: redis.Redis,
@@ -173,6 +204,9 @@ class RedisGroupQueueManager:
         owner_expire_seconds: int = 3600,  # owner expiration time, default 1 hour
         inactive_threshold_seconds: int = 300,  # inactive threshold, default 5 minutes
         cleanup_interval_seconds: int = 300,  # periodic cleanup interval, default 5 minutes
+        partition_count: int = FIXED_PARTITION_COUNT,
+        group_routing: GroupRouting = GroupRouting.MODULO,
+        virtual_nodes: int = DEFAULT_VIRTUAL_NODES,
     ):
         """
         Initialize Redis message group queue manager
@@ -191,7 +225,12 @@ class RedisGroupQueueManager:
             owner_expire_seconds: owner expiration time (seconds, default 1 hour)
             inactive_threshold_seconds: Inactive threshold (seconds, default 5 minutes)
             cleanup_interval_seconds: Periodic cleanup interval (seconds, default 5 minutes)
+            partition_count: Number of partitions (default 50)
+            group_routing: Group key -> partition routing (default modulo, see module warning)
+            virtual_nodes: Virtual nodes per partition on the group routing ring
         """
+        if partition_count <= 0:
+            raise ValueError(f"partition_count must be positive, got {partition_count}")
         self.redis_client = redis_client
         self.key_prefix = key_prefix
         self.serialization_mode = serialization_mode
@@ -209,6 +248,9 @@ class RedisGroupQueueManager:
         self.owner_expire_seconds = owner_expire_seconds
         self.inactive_threshold_seconds = inactive_threshold_seconds
         self.cleanup_interval_seconds = cleanup_interval_seconds
+        self.partition_count = partition_count
+        self.group_routing = GroupRouting(group_routing)
+        self.virtual_nodes = max(1, virtual_nodes)
 
         # Redis key patterns - new dynamic owner management mode
         self.queue_prefix = (
@@ -224,6 +266,7 @@ class RedisGroupQueueManager:
             f"{key_prefix}:queue_list:"  # owner's queue_list prefix
         )
         self.counter_key = f"{key_prefix}:counter"
+        self.rebalance_stats_key = f"{key_prefix}:rebalance_stats"
 
         # Process-level owner ID (generated at startup, globally unique)
         self.owner_id = (
@@ -233,10 +276,13 @@ class RedisGroupQueueManager:
         # Maintain owner last keepalive timestamp mapping (millisecond timestamp)
         self.owner_last_keepalive_time = {}
 
-        # Generate fixed partition name list: 001, 002, ..., 050
-        self.partition_names = [
-            f"{i:03d}" for i in range(1, self.FIXED_PARTITION_COUNT + 1)
-        ]
+        # Generate partition name list: 001, 002, ... (same format as the Lua scripts)
+        self.partition_names = [f"{i:03d}" for i in range(1, self.partition_count + 1)]
+        self._group_ring = (
+            ConsistentHashRing(self.partition_names, self.virtual_nodes)
+            if self.group_routing == GroupRouting.CONSISTENT
+            else None
+        )
 
         # Manager statistics
         self._manager_stats = RedisManagerStats(
@@ -259,6 +305,7 @@ class RedisGroupQueueManager:
 
         # Pre-compiled Lua scripts
         self._enqueue_script = None
+        self._enqueue_batch_script = None
         self._get_stats_script = None
         self._get_all_partitions_stats_script = None
         self._rebalance_partitions_script = None
@@ -270,10 +317,12 @@ class RedisGroupQueueManager:
         self._get_messages_script = None
 
         logger.info(
-            "🚀 RedisGroupQueueManager[%s] Initialization completed: key_prefix=%s, max_total_messages=%d",
+            "🚀 RedisGroupQueueManager[%s] Initialization completed: key_prefix=%s, max_total_messages=%d, partitions=%d, group_routing=%s",
             self.key_prefix,
             self.key_prefix,
             self.max_total_messages,
+            self.partition_count,
+            self.group_routing.value,
         )
 
     def _default_sort_key(self, _item: RedisGroupQueueItem) -> int:
@@ -290,18 +339,21 @@ class RedisGroupQueueManager:
 
     def _hash_group_key_to_partition(self, group_key: str) -> str:
         """
-        Route group_key to fixed partition via hash
+        Route group_key to a partition via hash
 
         Args:
             group_key: Group key
 
         Returns:
-            str: Partition name (001-100)
+            str: Partition name (001, 002, ...)
         """
+        if self._group_ring is not None:
+            return self._group_ring.get_node(group_key)
+
         # Use MD5 hash to ensure even distribution
         hash_value = hashlib.md5(group_key.encode('utf-8')).hexdigest()
         # Take first 8 characters, convert to integer, then modulo
-        partition_index = int(hash_value[:8], 16) % self.FIXED_PARTITION_COUNT
+        partition_index = int(hash_value[:8], 16) % self.partition_count
         return self.partition_names[partition_index]
 
     def _get_queue_key(self, partition: str) -> str:
@@ -468,6 +520,9 @@ class RedisGroupQueueManager:
         """Ensure Lua scripts are loaded"""
         if self._enqueue_script is None:
             self._enqueue_script = self.redis_client.register_script(ENQUEUE_SCRIPT)
+            self._enqueue_batch_script = self.redis_client.register_script(
+                ENQUEUE_BATCH_SCRIPT
+            )
             self._get_stats_script = self.redis_client.register_script(
                 GET_QUEUE_STATS_SCRIPT
             )
@@ -496,7 +551,7 @@ class RedisGroupQueueManager:
                 GET_MESSAGES_SCRIPT
             )
 
-    @rate_limit(max_rate=200, time_period=1)
+    @local_rate_limit(max_rate=200, time_period=1)
     async def deliver_message(
         self,
         group_key: str,
@@ -524,10 +579,7 @@ class RedisGroupQueueManager:
             sort_score = self.sort_key_func(item)
 
             # Serialize message based on serialization mode
-            if self.serialization_mode == SerializationMode.BSON:
-                message_data = item.to_bson_bytes()
-            else:  # JSON mode
-                message_data = item.to_json_str()
+            message_data = self._serialize_item(item)
 
             # Get queue key
             queue_key = self._get_queue_key(partition)
@@ -611,26 +663,132 @@ class RedisGroupQueueManager:
             else:
                 return False, "Delivery error"
 
-    @rate_limit(
-        max_rate=4, time_period=1, key_func=lambda owner_id: f"get_messages_{owner_id}"
-    )
+    def _serialize_item(self, item: RedisGroupQueueItem) -> Any:
+        """Serialize a queue item based on serialization mode"""
+        if self.serialization_mode == SerializationMode.BSON:
+            return item.to_bson_bytes()
+        return item.to_json_str()  # JSON mode
+
+    @local_rate_limit(max_rate=200, time_period=1)
+    async def deliver_messages(
+        self,
+        items: List[Tuple[str, RedisGroupQueueItem]],
+        max_total_messages: int = None,
+    ) -> List[bool]:
+        """
+        Deliver many messages with one enqueue script call per chunk
+
+        Same routing, scoring and limits as deliver_message; messages are added in
+        list order, so messages of one group keep their relative order.
+
+        Args:
+            items: (group_key, item) pairs
+            max_total_messages: Maximum total message count limit, default uses the manager limit
+
+        Returns:
+            List[bool]: Per-message delivery result, in input order
+        """
+        results: List[bool] = []
+        if not items:
+            return results
+
+        try:
+            await self._ensure_scripts_loaded()
+        except (redis.RedisError, ValueError, TypeError) as e:
+            logger.error(
+                "❌ RedisGroupQueueManager[%s] Batch delivery failed: error=%s",
+                self.key_prefix,
+                e,
+            )
+            return [False] * len(items)
+
+        max_total = (
+            max_total_messages
+            if max_total_messages is not None
+            else self.max_total_messages
+        )
+        delivered = 0
+        rejected = 0
+        new_count = None
+
+        for start in range(0, len(items), self.DELIVER_BATCH_CHUNK_SIZE):
+            chunk = items[start : start + self.DELIVER_BATCH_CHUNK_SIZE]
+            try:
+                keys = [self.counter_key]
+                args = [
+                    self.queue_expire_seconds,
+                    self.activity_expire_seconds,
+                    max_total,
+                ]
+                for group_key, item in chunk:
+                    partition = self._hash_group_key_to_partition(group_key)
+                    keys.append(self._get_queue_key(partition))
+                    args.extend([self._serialize_item(item), self.sort_key_func(item)])
+
+                new_count, statuses = await self._enqueue_batch_script(
+                    keys=keys, args=args
+                )
+                chunk_results = [int(status) == 1 for status in statuses]
+                over_limit = sum(1 for status in statuses if int(status) == -1)
+                if over_limit:
+                    logger.warning(
+                        "❌ RedisGroupQueueManager[%s] Batch delivery rejected %d messages: Exceeded maximum total limit",
+                        self.key_prefix,
+                        over_limit,
+                    )
+            except (redis.RedisError, ValueError, TypeError) as e:
+                logger.error(
+                    "❌ RedisGroupQueueManager[%s] Batch delivery failed: messages=%d, error=%s",
+                    self.key_prefix,
+                    len(chunk),
+                    e,
+                )
+                chunk_results = [False] * len(chunk)
+
+            results.extend(chunk_results)
+            delivered += sum(chunk_results)
+            rejected += len(chunk_results) - sum(chunk_results)
+
+        # Update statistics
+        async with self._stats_lock:
+            self._manager_stats.total_delivered_messages += delivered
+            self._manager_stats.total_rejected_messages += rejected
+            if new_count is not None:
+                self._manager_stats.total_current_messages = new_count
+
+        logger.debug(
+            "✅ RedisGroupQueueManager[%s] Batch delivery completed: delivered=%d, rejected=%d, total retained=%s",
+            self.key_prefix,
+            delivered,
+            rejected,
+            new_count,
+        )
+        return results
+
+    @local_rate_limit(max_rate=4, time_period=1, key_func=_get_messages_rate_limit_key)
     async def get_messages(
         self,
         score_threshold: int,
         current_score: Optional[int] = None,
         owner_id: Optional[str] = None,
+        max_messages_per_partition: int = 1,
+        max_messages: int = 0,
         _retry_depth: int = 2,
     ) -> List[RedisGroupQueueItem]:
         """
         Get messages
 
-        Iterate through all partitions assigned to this owner, attempt to get 1 message from each partition.
+        Iterate through all partitions assigned to this owner, get up to
+        max_messages_per_partition ready messages (in score order) from each
+        partition in one script call.
         On-demand keepalive mechanism: Check last keepalive time, trigger keepalive if exceeds 30 seconds.
 
         Args:
             score_threshold: Score difference threshold (milliseconds), required parameter
             current_score: Current score, used for threshold comparison when queue is empty, optional parameter
             owner_id: Consumer ID, default uses self.owner_id
+            max_messages_per_partition: Maximum messages taken from each partition, default 1
+            max_messages: Maximum messages in total, 0 means unlimited
             _retry_depth: Internal parameter, recursive retry depth limit, prevents infinite loop
 
         Returns:
@@ -662,6 +820,8 @@ class RedisGroupQueueManager:
                         if current_score is not None
                         else self._default_sort_key(None)
                     ),
+                    max(1, max_messages_per_partition),
+                    max(0, max_messages),
                 ],
             )
 
@@ -692,7 +852,12 @@ class RedisGroupQueueManager:
                 await self.join_consumer(owner_id)
                 # Re-get messages, decrement retry depth
                 return await self.get_messages(
-                    score_threshold, current_score, owner_id, _retry_depth - 1
+                    score_threshold,
+                    current_score,
+                    owner_id,
+                    max_messages_per_partition=max_messages_per_partition,
+                    max_messages=max_messages,
+                    _retry_depth=_retry_depth - 1,
                 )
 
             if status_str == "NO_QUEUES":
@@ -753,13 +918,16 @@ class RedisGroupQueueManager:
 
     # ==================== New dynamic owner management methods ====================
 
-    @rate_limit(max_rate=1, time_period=1, key_func=lambda: "rebalance_partitions")
+    @local_rate_limit(
+        max_rate=1, time_period=1, key_func=lambda: "rebalance_partitions"
+    )
     async def rebalance_partitions(self) -> Tuple[int, Dict[str, List[str]]]:
         """
         Rebalance partitions
 
-        Based on owner_activate_time_zset, clear all owners' queue_list,
-        redistribute partitions evenly, assign a new queue_list to each owner.
+        Based on owner_activate_time_zset, split partitions evenly over the active
+        owners (floor or ceil each), keeping partitions with their current owner
+        where possible; only owners whose partitions changed get a new queue_list.
 
         Returns:
             Tuple[int, Dict[str, List[str]]]: (owner count, assignment result dictionary)
@@ -769,8 +937,12 @@ class RedisGroupQueueManager:
 
             # Execute rebalance script
             result = await self._rebalance_partitions_script(
-                keys=[self.owner_activate_time_zset_key, self.queue_list_prefix],
-                args=[self.FIXED_PARTITION_COUNT, self.owner_expire_seconds],
+                keys=[
+                    self.owner_activate_time_zset_key,
+                    self.queue_list_prefix,
+                    self.rebalance_stats_key,
+                ],
+                args=[self.partition_count, self.owner_expire_seconds],
             )
 
             # Parse return result
@@ -797,7 +969,7 @@ class RedisGroupQueueManager:
             )
             return 0, {}
 
-    @rate_limit(
+    @local_rate_limit(
         max_rate=1, time_period=1, key_func=lambda owner_id: f"join_consumer_{owner_id}"
     )
     async def join_consumer(
@@ -824,12 +996,16 @@ class RedisGroupQueueManager:
 
             # Execute join consumer script
             result = await self._join_consumer_script(
-                keys=[self.owner_activate_time_zset_key, self.queue_list_prefix],
+                keys=[
+                    self.owner_activate_time_zset_key,
+                    self.queue_list_prefix,
+                    self.rebalance_stats_key,
+                ],
                 args=[
                     owner_id,
                     current_time,
                     self.owner_expire_seconds,
-                    self.FIXED_PARTITION_COUNT,
+                    self.partition_count,
                 ],
             )
 
@@ -863,7 +1039,7 @@ class RedisGroupQueueManager:
             )
             return 0, {}
 
-    @rate_limit(
+    @local_rate_limit(
         max_rate=1, time_period=1, key_func=lambda owner_id: f"exit_consumer_{owner_id}"
     )
     async def exit_consumer(
@@ -888,8 +1064,12 @@ class RedisGroupQueueManager:
 
             # Execute consumer exit script
             result = await self._exit_consumer_script(
-                keys=[self.owner_activate_time_zset_key, self.queue_list_prefix],
-                args=[owner_id, self.owner_expire_seconds, self.FIXED_PARTITION_COUNT],
+                keys=[
+                    self.owner_activate_time_zset_key,
+                    self.queue_list_prefix,
+                    self.rebalance_stats_key,
+                ],
+                args=[owner_id, self.owner_expire_seconds, self.partition_count],
             )
 
             # Parse return result
@@ -921,7 +1101,7 @@ class RedisGroupQueueManager:
             )
             return 0, {}
 
-    @rate_limit(
+    @local_rate_limit(
         max_rate=1,
         time_period=2,
         key_func=lambda owner_id: f"keepalive_consumer_{owner_id}",
@@ -976,7 +1156,9 @@ class RedisGroupQueueManager:
             )
             return False
 
-    @rate_limit(max_rate=1, time_period=5, key_func=lambda: "cleanup_inactive_owners")
+    @local_rate_limit(
+        max_rate=1, time_period=5, key_func=lambda: "cleanup_inactive_owners"
+    )
     async def cleanup_inactive_owners(self) -> Tuple[int, int, Dict[str, List[str]]]:
         """
         Periodic cleanup and reset
@@ -1002,12 +1184,13 @@ class RedisGroupQueueManager:
                     self.queue_list_prefix,
                     self.queue_prefix,
                     self.counter_key,
+                    self.rebalance_stats_key,
                 ],
                 args=[
                     inactive_threshold,
                     current_time,
                     self.owner_expire_seconds,
-                    self.FIXED_PARTITION_COUNT,
+                    self.partition_count,
                 ],
             )
 
@@ -1042,7 +1225,9 @@ class RedisGroupQueueManager:
             )
             return 0, 0, {}
 
-    @rate_limit(max_rate=1, time_period=5, key_func=lambda: "force_cleanup_and_reset")
+    @local_rate_limit(
+        max_rate=1, time_period=5, key_func=lambda: "force_cleanup_and_reset"
+    )
     async def force_cleanup_and_reset(self, purge_all: bool = False) -> int:
         """
         Force cleanup and reset
@@ -1066,7 +1251,7 @@ class RedisGroupQueueManager:
                         self.queue_prefix,
                         self.counter_key,
                     ],
-                    args=[self.FIXED_PARTITION_COUNT, "1"],
+                    args=[self.partition_count, "1"],
                 )
 
                 # Reset local statistics
@@ -1091,7 +1276,7 @@ class RedisGroupQueueManager:
                         self.queue_prefix,
                         self.counter_key,
                     ],
-                    args=[self.FIXED_PARTITION_COUNT, "0"],
+                    args=[self.partition_count, "0"],
                 )
 
                 logger.warning(
@@ -1109,7 +1294,39 @@ class RedisGroupQueueManager:
             )
             return 0
 
-    @rate_limit(max_rate=1, time_period=5, key_func=lambda: "get_stats")
+    def _build_owner_load_stats(self, owner_stats_raw: List[Any]) -> Dict[str, Any]:
+        """
+        Per-owner load and skew from the flat (owner, partitions, messages) array
+
+        Skew is max / mean (1.0 means perfectly even).
+        """
+        owners = {}
+        for i in range(0, len(owner_stats_raw) - 2, 3):
+            owners[self._safe_decode_redis_value(owner_stats_raw[i])] = {
+                "partitions": int(owner_stats_raw[i + 1]),
+                "messages": int(owner_stats_raw[i + 2]),
+            }
+
+        def skew(values: List[int]) -> float:
+            mean = sum(values) / len(values) if values else 0
+            return round(max(values) / mean, 3) if mean > 0 else 0.0
+
+        return {
+            "owners": owners,
+            "partition_skew": skew([o["partitions"] for o in owners.values()]),
+            "message_skew": skew([o["messages"] for o in owners.values()]),
+        }
+
+    def _build_rebalance_stats(self, rebalance_stats_raw: List[Any]) -> Dict[str, int]:
+        """Rebalance churn counters from the flat HGETALL array"""
+        return {
+            self._safe_decode_redis_value(rebalance_stats_raw[i]): int(
+                rebalance_stats_raw[i + 1]
+            )
+            for i in range(0, len(rebalance_stats_raw) - 1, 2)
+        }
+
+    @local_rate_limit(max_rate=1, time_period=5, key_func=lambda: "get_stats")
     async def get_stats(
         self,
         group_key: Optional[str] = None,
@@ -1156,8 +1373,14 @@ class RedisGroupQueueManager:
 
             # Get statistics for all partitions (manager level or all partitions statistics)
             result = await self._get_all_partitions_stats_script(
-                keys=[self.queue_prefix, self.counter_key],
-                args=[str(self.FIXED_PARTITION_COUNT)],
+                keys=[
+                    self.queue_prefix,
+                    self.counter_key,
+                    self.owner_activate_time_zset_key,
+                    self.queue_list_prefix,
+                    self.rebalance_stats_key,
+                ],
+                args=[str(self.partition_count)],
             )
 
             (
@@ -1166,6 +1389,8 @@ class RedisGroupQueueManager:
                 global_min_score,
                 global_max_score,
                 partition_stats_raw,
+                owner_stats_raw,
+                rebalance_stats_raw,
             ) = result
 
             # Build basic statistics
@@ -1173,7 +1398,7 @@ class RedisGroupQueueManager:
                 # Update uptime and statistics
                 self._manager_stats.uptime_seconds = time.time() - self._start_time
                 self._manager_stats.total_current_messages = total_messages_in_queues
-                self._manager_stats.total_queues = self.FIXED_PARTITION_COUNT
+                self._manager_stats.total_queues = self.partition_count
 
                 stats = self._manager_stats.to_dict()
 
@@ -1188,6 +1413,9 @@ class RedisGroupQueueManager:
                     "global_min_score": global_min_score,
                     "global_max_score": global_max_score,
                     "key_prefix": self.key_prefix,
+                    "group_routing": self.group_routing.value,
+                    "owner_load": self._build_owner_load_stats(owner_stats_raw),
+                    "rebalance": self._build_rebalance_stats(rebalance_stats_raw),
                 }
             )
 
@@ -1278,11 +1506,11 @@ class RedisGroupQueueManager:
             return {
                 "type": "error_fallback",
                 "total_current_messages": total_current_messages,
-                "total_queues": self.FIXED_PARTITION_COUNT,
+                "total_queues": self.partition_count,
                 "error": str(e),
             }
 
-    @rate_limit(
+    @local_rate_limit(
         max_rate=1,
         time_period=5,
         key_func=lambda group_key: f"get_queue_stats_{group_key}",
@@ -1292,7 +1520,7 @@ class RedisGroupQueueManager:
         result = await self.get_stats(group_key=group_key)
         return result if result.get("type") != "error_fallback" else None
 
-    @rate_limit(max_rate=1, time_period=5, key_func=lambda: "get_manager_stats")
+    @local_rate_limit(max_rate=1, time_period=5, key_func=lambda: "get_manager_stats")
     async def get_manager_stats(self) -> Dict[str, Any]:
         """Compatibility method: Get manager statistics"""
         return await self.get_stats()
@@ -12,7 +12,7 @@ from typing import Dict, Optional, Callable, Type
 from core.di.decorators import component
 from core.observation.logger import get_logger
 from core.component.redis_provider import RedisProvider
-from .redis_msg_group_queue_manager import RedisGroupQueueManager
+from .redis_msg_group_queue_manager import GroupRouting, RedisGroupQueueManager
 from .redis_group_queue_item import RedisGroupQueueItem, SerializationMode
 
 logger = get_logger(__name__)
@@ -32,6 +32,9 @@ class RedisGroupQueueConfig:
         enable_metrics: bool = True,
         log_interval_seconds: int = 60,
         cleanup_interval_seconds: int = 300,  # 5 minutes
+        partition_count: int = RedisGroupQueueManager.FIXED_PARTITION_COUNT,
+        group_routing: GroupRouting = GroupRouting.MODULO,
+        virtual_nodes: int = RedisGroupQueueManager.DEFAULT_VIRTUAL_NODES,
         **kwargs,
     ):
         self.key_prefix = key_prefix
@@ -43,6 +46,9 @@ class RedisGroupQueueConfig:
         self.enable_metrics = enable_metrics
         self.log_interval_seconds = log_interval_seconds
         self.cleanup_interval_seconds = cleanup_interval_seconds
+        self.partition_count = partition_count
+        self.group_routing = GroupRouting(group_routing)
+        self.virtual_nodes = virtual_nodes
         self.kwargs = kwargs
 
     def get_cache_key(self) -> str:
@@ -62,7 +68,8 @@ class RedisGroupQueueConfig:
             f"{self.key_prefix}:{self.serialization_mode.value}:{sort_func_name}:"
             f"{self.max_total_messages}:{self.queue_expire_seconds}:"
             f"{self.activity_expire_seconds}:{self.enable_metrics}:"
-            f"{self.log_interval_seconds}:{self.cleanup_interval_seconds}"
+            f"{self.log_interval_seconds}:{self.cleanup_interval_seconds}:"
+            f"{self.partition_count}:{self.group_routing.value}:{self.virtual_nodes}"
         )
 
     @classmethod
@@ -110,6 +117,21 @@ class RedisGroupQueueConfig:
         cleanup_interval_seconds = int(
             _env("REDIS_QUEUE_CLEANUP_INTERVAL_SECONDS", "300")
         )
+        partition_count = int(
+            _env(
+                "REDIS_QUEUE_PARTITION_COUNT",
+                str(RedisGroupQueueManager.FIXED_PARTITION_COUNT),
+            )
+        )
+        group_routing = GroupRouting(
+            _env("REDIS_QUEUE_GROUP_ROUTING", GroupRouting.MODULO.value).lower()
+        )
+        virtual_nodes = int(
+            _env(
+                "REDIS_QUEUE_VIRTUAL_NODES",
+                str(RedisGroupQueueManager.DEFAULT_VIRTUAL_NODES),
+            )
+        )
 
         return cls(
             key_prefix=key_prefix,
@@ -120,12 +142,17 @@ class RedisGroupQueueConfig:
             enable_metrics=enable_metrics,
             log_interval_seconds=log_interval_seconds,
             cleanup_interval_seconds=cleanup_interval_seconds,
+            partition_count=partition_count,
+            group_routing=group_routing,
+            virtual_nodes=virtual_nodes,
         )
 
     def __repr__(self) -> str:
         return (
             f"RedisGroupQueueConfig(key_prefix={self.key_prefix}, "
-            f"max_total_messages={self.max_total_messages})"
+            f"max_total_messages={self.max_total_messages}, "
+            f"partition_count={self.partition_count}, "
+            f"group_routing={self.group_routing.value})"
         )
 
 
@@ -204,6 +231,9 @@ class RedisGroupQueueManagerFactory:
                     enable_metrics=config.enable_metrics,
                     log_interval_seconds=config.log_interval_seconds,
                     cleanup_interval_seconds=config.cleanup_interval_seconds,
+                    partition_count=config.partition_count,
+                    group_routing=config.group_routing,
+                    virtual_nodes=config.virtual_nodes,
                     **config.kwargs,
                 )
 
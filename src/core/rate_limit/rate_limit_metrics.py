@@ -0,0 +1,90 @@
+"""
+Rate Limit Metrics
+
+Metrics for monitoring admissions of the distributed (Redis) rate limiter.
+
+The key label is bounded: after MAX_KEY_LABELS distinct keys, further keys
+(e.g. per-user keys from a key_func) are recorded as "other".
+
+"""
+
+from typing import Set
+
+from core.observation.metrics import Counter, Histogram
+
+# Distinct rate limit keys recorded as their own label value
+MAX_KEY_LABELS = 100
+_key_labels: Set[str] = set()
+
+
+# ============================================================
+# Counter Metrics
+# ============================================================
+
+RATE_LIMIT_ADMISSIONS_TOTAL = Counter(
+    name='rate_limit_admissions_total',
+    description='Total number of rate limiter admission decisions',
+    labelnames=['key', 'source'],
+    namespace='evermemos',
+    subsystem='rate_limit',
+)
+"""
+Rate limiter admissions counter
+
+Labels:
+- key: Rate limit key ("other" beyond MAX_KEY_LABELS keys)
+- source: redis (token fetched from Redis), prefetched (local pre-fetched token),
+  fallback (Redis unavailable, local limiter), rejected (Redis unavailable, fail closed)
+"""
+
+
+# ============================================================
+# Histogram Metrics
+# ============================================================
+
+RATE_LIMIT_WAIT_SECONDS = Histogram(
+    name='rate_limit_wait_seconds',
+    description='Time spent waiting for a rate limit token',
+    labelnames=['key'],
+    namespace='evermemos',
+    subsystem='rate_limit',
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+"""
+Rate limiter wait histogram (including the Redis round trip)
+
+Labels:
+- key: Rate limit key ("other" beyond MAX_KEY_LABELS keys)
+"""
+
+
+# ============================================================
+# Helper Functions
+# ============================================================
+
+
+def _key_label(key: str) -> str:
+    """Label value for a rate limit key, bounded to MAX_KEY_LABELS distinct values"""
+    if key in _key_labels:
+        return key
+    if len(_key_labels) < MAX_KEY_LABELS:
+        _key_labels.add(key)
+        return key
+    return "other"
+
+
+def record_rate_limit_admission(key: str, source: str, wait_seconds: float) -> None:
+    """
+    Helper function to record one rate limiter admission decision
+
+    Args:
+        key: Rate limit key
+        source: redis, prefetched, fallback or rejected
+        wait_seconds: Time from the acquire call to the decision
+
+    Example:
+        record_rate_limit_admission(key='llm:gpt-4.1-mini', source='redis', wait_seconds=0.002)
+    """
+    key = _key_label(key)
+    RATE_LIMIT_ADMISSIONS_TOTAL.labels(key=key, source=source).inc()
+    RATE_LIMIT_WAIT_SECONDS.labels(key=key).observe(wait_seconds)
@@ -2,20 +2,31 @@
 Async rate limiting decorator module based on aiolimiter
 
 Provides rate limiting functionality for async functions with flexible configuration.
+Limiters are per process (aiolimiter) by default; with RATE_LIMIT_BACKEND=redis
+they enforce one quota shared by all processes (see redis_rate_limiter).
 """
 
 from functools import wraps
-from typing import Callable, Any, Dict, Optional
+from typing import Callable, Any, Dict, Optional, Union
 from aiolimiter import AsyncLimiter
 
+from core.rate_limit.redis_rate_limiter import RateLimiterConfig, RedisRateLimiter
+
 
 class RateLimitManager:
     """Rate limit manager that manages multiple limiter instances"""
 
-    def __init__(self):
-        self._limiters: Dict[str, AsyncLimiter] = {}
-
-    def get_limiter(self, key: str, max_rate: int, time_period: int) -> AsyncLimiter:
+    def __init__(self, config: Optional[RateLimiterConfig] = None):
+        self.config = config or RateLimiterConfig()
+        self._limiters: Dict[str, Union[AsyncLimiter, RedisRateLimiter]] = {}
+
+    def get_limiter(
+        self,
+        key: str,
+        max_rate: int,
+        time_period: int,
+        distributed: Optional[bool] = None,
+    ) -> Union[AsyncLimiter, RedisRateLimiter]:
         """
         Get or create a limiter instance
 
@@ -23,14 +34,23 @@ class RateLimitManager:
             key: Unique identifier for the limiter
             max_rate: Maximum number of allowed requests within the time window
             time_period: Time window size (seconds)
+            distributed: Share the quota across processes via Redis,
+                None follows RATE_LIMIT_BACKEND
 
         Returns:
-            AsyncLimiter: Limiter instance
+            Limiter instance, used as `async with limiter:`
         """
-        limiter_key = f"{key}_{max_rate}_{time_period}"
+        if distributed is None:
+            distributed = self.config.backend == "redis"
+        backend = "redis" if distributed else "local"
+        limiter_key = f"{key}_{max_rate}_{time_period}_{backend}"
 
         if limiter_key not in self._limiters:
-            self._limiters[limiter_key] = AsyncLimiter(max_rate, time_period)
+            self._limiters[limiter_key] = (
+                RedisRateLimiter(key, max_rate, time_period, self.config)
+                if distributed
+                else AsyncLimiter(max_rate, time_period)
+            )
 
         return self._limiters[limiter_key]
 
@@ -39,10 +59,38 @@ class RateLimitManager:
 _rate_limit_manager = RateLimitManager()
 
 
+def is_distributed_rate_limit_enabled() -> bool:
+    """Whether limiters share one quota across processes (RATE_LIMIT_BACKEND=redis)"""
+    return _rate_limit_manager.config.backend == "redis"
+
+
+def get_provider_rate_limiter(
+    key: str, rps: float, burst: int, distributed: Optional[bool] = None
+) -> Optional[Union[AsyncLimiter, RedisRateLimiter]]:
+    """
+    Get the limiter for requests to an external provider (LLM, embedding, rerank)
+
+    Args:
+        key: Rate limit key, e.g. "vectorize:vllm:<model>"
+        rps: Requests per second, 0 or less means no rate limit
+        burst: Maximum burst of requests
+        distributed: Share the quota across processes via Redis,
+            None follows RATE_LIMIT_BACKEND
+
+    Returns:
+        Limiter instance (call `await limiter.acquire()` per request), or None
+    """
+    if rps <= 0:
+        return None
+    burst = max(burst, 1)
+    return _rate_limit_manager.get_limiter(key, burst, burst / rps, distributed)
+
+
 def rate_limit(
     max_rate: int = 3,
     time_period: int = 10,
     key_func: Optional[Callable[..., str]] = None,
+    distributed: Optional[bool] = None,
 ):
     """
     Async function rate limiting decorator
@@ -52,9 +100,12 @@ def rate_limit(
         time_period: Time window size (seconds), default is 10 seconds
         key_func: Optional key function to generate different rate limit keys for different parameters
                  If not provided, all calls share the same limiter
+        distributed: True to share the quota across processes (Redis), False for a
+                 per-process limiter, None (default) follows RATE_LIMIT_BACKEND
 
     Raises:
         ValueError: Raised when max_rate <= 0 or time_period <= 0
+        RateLimiterUnavailableError: Redis is unavailable and RATE_LIMIT_FAILURE_MODE is "closed"
 
     Usage:
         @rate_limit(max_rate=3, time_period=10)
@@ -64,6 +115,10 @@ def rate_limit(
         @rate_limit(max_rate=5, time_period=60, key_func=lambda user_id: f"user_{user_id}")
         async def user_specific_call(user_id: str):
             pass
+
+        @rate_limit(max_rate=100, time_period=1, key_func=lambda model: f"llm:{model}", distributed=True)
+        async def call_provider(model: str):
+            pass
     """
     if max_rate <= 0:
         raise ValueError(f"max_rate must be positive, got {max_rate}")
@@ -87,7 +142,7 @@ def rate_limit(
 
             # Get the limiter
             limiter = _rate_limit_manager.get_limiter(
-                limiter_key, max_rate, time_period
+                limiter_key, max_rate, time_period, distributed
             )
 
             # Wait for the limiter to allow execution
@@ -99,6 +154,15 @@ def rate_limit(
     return decorator
 
 
+def local_rate_limit(
+    max_rate: int = 3,
+    time_period: int = 10,
+    key_func: Optional[Callable[..., str]] = None,
+):
+    """Per-process rate limiting decorator, regardless of RATE_LIMIT_BACKEND"""
+    return rate_limit(max_rate, time_period, key_func, distributed=False)
+
+
 # Predefined common rate limiting decorators
 def rate_limit_3_per_10s(func: Callable) -> Callable:
     """Rate limiting decorator allowing maximum 3 requests per 10 seconds"""
@@ -0,0 +1,269 @@
+"""
+Redis-backed distributed rate limiter
+
+Enforces one quota across all processes sharing a Redis, using GCRA (generic
+cell rate algorithm) in a Lua script:
+- max_rate tokens per time_period, with bursts of up to max_rate tokens (same
+  semantics as the local aiolimiter.AsyncLimiter)
+- Redis TIME is the clock, so process clock skew does not matter
+- One key per limiter holding the theoretical arrival time, expiring once idle
+
+To keep the hot path off Redis, a process fetches a batch of tokens at once and
+spends them locally (at most PREFETCH_MAX_SHARE of the burst, discarded after
+prefetch_ttl_seconds). Pre-fetched tokens are already counted in Redis, so
+pre-fetching never exceeds the global quota; it only lets a process use its
+tokens slightly later than they were granted.
+
+When Redis is unavailable the limiter fails open (falls back to a per-process
+limiter with the same rate) or closed (raises RateLimiterUnavailableError).
+After a failure Redis is not contacted again for unavailable_backoff_seconds, so
+an outage does not cost a failing round trip per call.
+
+Usage:
+    limiter = RedisRateLimiter("llm:gpt-4.1-mini", max_rate=100, time_period=1)
+    async with limiter:
+        ...
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from aiolimiter import AsyncLimiter
+from redis.exceptions import RedisError
+
+from core.observation.logger import get_logger
+from core.rate_limit.rate_limit_metrics import record_rate_limit_admission
+
+logger = get_logger(__name__)
+
+
+class RateLimiterUnavailableError(Exception):
+    """Raised when Redis is unavailable and the limiter is configured to fail closed"""
+
+
+@dataclass
+class RateLimiterConfig:
+    """Rate limiter configuration"""
+
+    # "local" (per-process aiolimiter) or "redis" (shared quota)
+    backend: str = "local"
+    # "open": fall back to a per-process limiter, "closed": raise
+    failure_mode: str = "open"
+    # Tokens fetched from Redis per round trip (capped by PREFETCH_MAX_SHARE)
+    prefetch_tokens: int = 10
+    # Unused pre-fetched tokens are dropped after this many seconds
+    prefetch_ttl_seconds: float = 1.0
+    # Redis is not retried for this many seconds after it failed
+    unavailable_backoff_seconds: float = 1.0
+    redis_key_prefix: str = "rate_limit"
+
+    def __post_init__(self):
+        """Load rate limiter configuration from environment"""
+        self.backend = os.getenv("RATE_LIMIT_BACKEND", self.backend).lower()
+        self.failure_mode = os.getenv(
+            "RATE_LIMIT_FAILURE_MODE", self.failure_mode
+        ).lower()
+        self.prefetch_tokens = int(
+            os.getenv("RATE_LIMIT_PREFETCH_TOKENS", str(self.prefetch_tokens))
+        )
+        self.prefetch_ttl_seconds = float(
+            os.getenv("RATE_LIMIT_PREFETCH_TTL_SECONDS", str(self.prefetch_ttl_seconds))
+        )
+        self.unavailable_backoff_seconds = float(
+            os.getenv(
+                "RATE_LIMIT_UNAVAILABLE_BACKOFF_SECONDS",
+                str(self.unavailable_backoff_seconds),
+            )
+        )
+        self.redis_key_prefix = os.getenv(
+            "RATE_LIMIT_REDIS_KEY_PREFIX", self.redis_key_prefix
+        )
+
+
+# GCRA acquire script
+# KEYS[1]: limiter key (theoretical arrival time, microseconds)
+# ARGV[1]: emission interval (microseconds per token)
+# ARGV[2]: burst tolerance (microseconds)
+# ARGV[3]: tokens requested
+# Returns {granted tokens, retry after (microseconds) when none granted}
+GCRA_ACQUIRE_SCRIPT = """
+redis.replicate_commands()
+
+local key = KEYS[1]
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+
+local tat = tonumber(redis.call('GET', key)) or now
+if tat < now then
+    tat = now
+end
+
+-- Token j (1-based) conforms if tat + (j - 1) * interval - tolerance <= now
+local available = math.floor((now + tolerance - tat) / interval) + 1
+if available < 1 then
+    return {0, math.ceil(tat - tolerance - now)}
+end
+
+local granted = math.min(requested, available)
+tat = tat + granted * interval
+redis.call('SET', key, string.format('%.0f', tat), 'PX', math.ceil((tat - now) / 1000) + 1)
+return {granted, 0}
+"""
+
+# Errors treated as "Redis unavailable"
+REDIS_UNAVAILABLE_ERRORS = (RedisError, ConnectionError, TimeoutError, OSError)
+
+
+class RedisRateLimiter:
+    """Distributed rate limiter with local token pre-fetch (async context manager)"""
+
+    # At most this share of the burst is pre-fetched by one process
+    PREFETCH_MAX_SHARE = 0.1
+    # Lower bound of the sleep before retrying a rejected fetch (seconds)
+    MIN_RETRY_SLEEP = 0.001
+
+    def __init__(
+        self,
+        key: str,
+        max_rate: float,
+        time_period: float,
+        config: Optional[RateLimiterConfig] = None,
+    ):
+        """
+        Args:
+            key: Rate limit key (shared by all processes enforcing the same quota)
+            max_rate: Maximum number of allowed requests within the time window
+            time_period: Time window size (seconds)
+            config: Limiter configuration, default read from environment
+        """
+        if max_rate <= 0:
+            raise ValueError(f"max_rate must be positive, got {max_rate}")
+        if time_period <= 0:
+            raise ValueError(f"time_period must be positive, got {time_period}")
+        self.key = key
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.config = config or RateLimiterConfig()
+        self.redis_key = (
+            f"{self.config.redis_key_prefix}:{key}:{max_rate}:{time_period}"
+        )
+
+        self._interval_us = time_period * 1_000_000 / max_rate
+        self._tolerance_us = (max_rate - 1) * self._interval_us
+        self._prefetch_batch = max(
+            1, min(self.config.prefetch_tokens, int(max_rate * self.PREFETCH_MAX_SHARE))
+        )
+
+        self._lock = asyncio.Lock()
+        self._local_tokens = 0
+        self._local_expires_at = 0.0
+        self._script = None
+        self._fallback: Optional[AsyncLimiter] = None
+        self._redis_healthy = True
+        # While Redis is failing: skip it until this time (monotonic)
+        self._redis_retry_at = 0.0
+        self._redis_error: Optional[Exception] = None
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available
+
+        Raises:
+            RateLimiterUnavailableError: Redis is unavailable and failure_mode is "closed"
+        """
+        start = time.perf_counter()
+        try:
+            # Waiters queue on the lock; its holder fetches for the next ones
+            async with self._lock:
+                source = await self._acquire_locked()
+        except RateLimiterUnavailableError:
+            record_rate_limit_admission(
+                self.key, "rejected", time.perf_counter() - start
+            )
+            raise
+        record_rate_limit_admission(self.key, source, time.perf_counter() - start)
+
+    async def _acquire_locked(self) -> str:
+        while True:
+            if self._local_tokens > 0 and time.monotonic() < self._local_expires_at:
+                self._local_tokens -= 1
+                return "prefetched"
+            self._local_tokens = 0
+
+            if time.monotonic() < self._redis_retry_at:
+                return await self._acquire_without_redis()
+
+            try:
+                granted, retry_after_us = await self._fetch(self._prefetch_batch)
+            except REDIS_UNAVAILABLE_ERRORS as e:
+                self._on_redis_unavailable(e)
+                return await self._acquire_without_redis()
+
+            if not self._redis_healthy:
+                self._redis_healthy = True
+                logger.info("Distributed rate limiter recovered: key=%s", self.key)
+
+            if granted > 0:
+                self._local_tokens = granted - 1
+                self._local_expires_at = (
+                    time.monotonic() + self.config.prefetch_ttl_seconds
+                )
+                return "redis"
+
+            await asyncio.sleep(max(retry_after_us / 1_000_000, self.MIN_RETRY_SLEEP))
+
+    async def _fetch(self, requested: int) -> Tuple[int, int]:
+        """Fetch up to `requested` tokens, returns (granted, retry after microseconds)"""
+        if self._script is None:
+            redis_client = await self._get_redis_client()
+            self._script = redis_client.register_script(GCRA_ACQUIRE_SCRIPT)
+        granted, retry_after_us = await self._script(
+            keys=[self.redis_key],
+            args=[self._interval_us, self._tolerance_us, requested],
+        )
+        return int(granted), int(retry_after_us)
+
+    async def _get_redis_client(self):
+        # Imported lazily so the local backend does not need the DI container
+        from core.component.redis_provider import RedisProvider
+        from core.di.utils import get_bean_by_type
+
+        return await get_bean_by_type(RedisProvider).get_client()
+
+    def _on_redis_unavailable(self, error: Exception) -> None:
+        self._redis_error = error
+        self._redis_retry_at = (
+            time.monotonic() + self.config.unavailable_backoff_seconds
+        )
+        if self._redis_healthy:
+            self._redis_healthy = False
+            logger.warning(
+                "Distributed rate limiter unavailable (failure_mode=%s): key=%s, error=%s",
+                self.config.failure_mode,
+                self.key,
+                error,
+            )
+
+    async def _acquire_without_redis(self) -> str:
+        if self.config.failure_mode == "closed":
+            raise RateLimiterUnavailableError(
+                f"Rate limiter backend unavailable for key {self.key}"
+            ) from self._redis_error
+
+        if self._fallback is None:
+            self._fallback = AsyncLimiter(self.max_rate, self.time_period)
+        await self._fallback.acquire()
+        return "fallback"
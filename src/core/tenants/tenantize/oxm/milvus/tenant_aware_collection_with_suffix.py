@@ -185,9 +185,10 @@ class TenantAwareMilvusCollectionWithSuffix(MilvusCollectionWithSuffix):
             # Use native Collection, need to explicitly pass using parameter
             _coll = Collection(
                 name=tenant_aware_new_real_name,
-                schema=self._SCHEMA,
+                schema=self.get_schema(),
                 consistency_level=ConsistencyLevel.Bounded,
                 using=using,
+                **self.get_create_kwargs(),
             )
 
             # Create alias pointing to new Collection
@@ -209,11 +210,12 @@ class TenantAwareMilvusCollectionWithSuffix(MilvusCollectionWithSuffix):
             )
 
         # Uniformly load tenant-aware Collection via alias
+        # The schema is read from the server: an existing Collection may still use
+        # another partition key layout until it is rebuilt
         coll = TenantAwareCollection(
-            name=origin_alias_name,
-            schema=self._SCHEMA,
-            consistency_level=ConsistencyLevel.Bounded,
+            name=origin_alias_name, consistency_level=ConsistencyLevel.Bounded
         )
+        self.check_partition_key_layout(coll)
 
         return coll
 
@@ -261,9 +263,10 @@ class TenantAwareMilvusCollectionWithSuffix(MilvusCollectionWithSuffix):
         # Use native Collection, need to explicitly pass using parameter
         _coll = Collection(
             name=tenant_aware_new_real_name,
-            schema=self._SCHEMA,
+            schema=self.get_schema(),
             consistency_level=ConsistencyLevel.Bounded,
             using=using,
+            **self.get_create_kwargs(),
         )
 
         logger.info(
@@ -286,7 +289,7 @@ class TenantAwareMilvusCollectionWithSuffix(MilvusCollectionWithSuffix):
         # Note: Use _original_alias_name here, TenantAwareCollection will automatically add tenant prefix
         new_coll = TenantAwareCollection(
             name=new_real_name,
-            schema=self._SCHEMA,
+            schema=self.get_schema(),
             consistency_level=ConsistencyLevel.Bounded,
         )
 
@@ -366,7 +369,7 @@ class TenantAwareMilvusCollectionWithSuffix(MilvusCollectionWithSuffix):
         try:
             self.__class__._collection_instance = TenantAwareCollection(
                 name=origin_alias_name,
-                schema=self._SCHEMA,
+                schema=self.get_schema(),
                 consistency_level=ConsistencyLevel.Bounded,
             )
         except Exception:
@@ -0,0 +1,197 @@
+"""
+Elasticsearch keyword retrieval benchmark
+
+Compares keyword retrieval latency against a local Elasticsearch:
+- legacy:  hard conditions in bool.must, one search per query (previous behaviour)
+- filter:  hard conditions in bool.filter, one search per query
+- msearch: hard conditions in bool.filter, all queries in a single _msearch
+
+A deterministic corpus (fixed seed) is indexed under a dedicated benchmark user
+and removed afterwards, so runs are reproducible and do not touch real data.
+Shard request cache is disabled for every search to measure query execution.
+
+Usage (run via bootstrap, which loads the application context):
+  python src/bootstrap.py src/devops_scripts/benchmark/es_keyword_search_benchmark.py --docs 5000 --queries 4 --rounds 50
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import traceback
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, List
+
+from core.di import get_bean_by_type
+from core.observation.logger import get_logger
+from common_utils.datetime_utils import get_now_with_timezone
+from infra_layer.adapters.out.search.elasticsearch.memory.episodic_memory import (
+    EpisodicMemoryDoc,
+)
+from infra_layer.adapters.out.search.repository.episodic_memory_es_repository import (
+    EpisodicMemoryEsRepository,
+)
+
+logger = get_logger(__name__)
+
+BENCHMARK_USER_ID = "benchmark_es_keyword_user"
+BENCHMARK_GROUP_IDS = [f"benchmark_es_keyword_group_{i}" for i in range(8)]
+VOCABULARY = [
+    "project",
+    "meeting",
+    "deadline",
+    "budget",
+    "travel",
+    "hiking",
+    "coffee",
+    "restaurant",
+    "doctor",
+    "birthday",
+    "family",
+    "concert",
+    "marathon",
+    "python",
+    "release",
+    "interview",
+    "holiday",
+    "museum",
+    "garden",
+    "football",
+]
+
+
+async def seed_corpus(repo: EpisodicMemoryEsRepository, docs: int, seed: int) -> None:
+    """Index a deterministic benchmark corpus"""
+    rng = random.Random(seed)
+    base_time = get_now_with_timezone()
+    documents = []
+    for i in range(docs):
+        words = rng.sample(VOCABULARY, 6)
+        documents.append(
+            EpisodicMemoryDoc(
+                meta={"id": f"benchmark_es_keyword_{i}"},
+                event_id=f"benchmark_es_keyword_{i}",
+                user_id=BENCHMARK_USER_ID,
+                group_id=rng.choice(BENCHMARK_GROUP_IDS),
+                timestamp=base_time - timedelta(minutes=i),
+                episode=" ".join(words),
+                search_content=words,
+                type="Conversation",
+            )
+        )
+    await repo.bulk_create(documents, refresh=True, raise_on_error=True)
+    logger.info("Seeded %d benchmark documents", docs)
+
+
+def build_queries(num_queries: int, seed: int) -> List[List[str]]:
+    """Deterministic query expansion: num_queries word lists"""
+    rng = random.Random(seed + 1)
+    return [rng.sample(VOCABULARY, 3) for _ in range(num_queries)]
+
+
+async def measure(
+    name: str, rounds: int, run_once: Callable[[], Awaitable[None]]
+) -> Dict[str, float]:
+    """Run one variant rounds times after a warm-up, return latency stats (ms)"""
+    await run_once()
+    latencies = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await run_once()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return {
+        "variant": name,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "mean": statistics.fmean(latencies),
+    }
+
+
+async def run(docs: int, num_queries: int, rounds: int, seed: int) -> None:
+    """Seed corpus, benchmark the three variants, clean up"""
+    repo = get_bean_by_type(EpisodicMemoryEsRepository)
+    client = await repo.get_client()
+    index_name = repo.get_index_name()
+    queries = build_queries(num_queries, seed)
+    search_kwargs = dict(
+        user_id=BENCHMARK_USER_ID,
+        group_id=BENCHMARK_GROUP_IDS[0],
+        date_range={"gte": get_now_with_timezone() - timedelta(days=30)},
+        size=20,
+    )
+
+    def build(query: List[str]):
+        return repo.build_multi_search(query=query, **search_kwargs).params(
+            request_cache=False
+        )
+
+    def legacy_body(query: List[str]) -> Dict:
+        body = build(query).to_dict()
+        bool_query = body["query"]["bool"]
+        bool_query["must"] = bool_query.pop("filter")
+        return body
+
+    async def run_legacy() -> None:
+        for query in queries:
+            await client.search(
+                index=index_name, body=legacy_body(query), request_cache=False
+            )
+
+    async def run_filter() -> None:
+        for query in queries:
+            await build(query).execute(ignore_cache=True)
+
+    async def run_msearch() -> None:
+        await repo.msearch([build(query) for query in queries])
+
+    try:
+        await seed_corpus(repo, docs, seed)
+        results = [
+            await measure("legacy (must, sequential)", rounds, run_legacy),
+            await measure("filter (sequential)", rounds, run_filter),
+            await measure("filter + msearch", rounds, run_msearch),
+        ]
+        print(
+            f"\ndocs={docs} queries={num_queries} rounds={rounds} seed={seed} "
+            f"index={index_name}"
+        )
+        print(f"{'variant':<28}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}")
+        for r in results:
+            print(
+                f"{r['variant']:<28}{r['p50']:>10.2f}{r['p95']:>10.2f}{r['mean']:>10.2f}"
+            )
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Benchmark failed: %s", exc)
+        traceback.print_exc()
+        raise
+    finally:
+        await repo.delete_by_filters(user_id=BENCHMARK_USER_ID, refresh=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark ES keyword retrieval: must vs filter vs msearch"
+    )
+    parser.add_argument(
+        "--docs", type=int, default=5000, help="Corpus size, default 5000"
+    )
+    parser.add_argument(
+        "--queries",
+        type=int,
+        default=4,
+        help="Queries per retrieval (multi-query expansion), default 4",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=50, help="Measured rounds, default 50"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args.docs, args.queries, args.rounds, args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
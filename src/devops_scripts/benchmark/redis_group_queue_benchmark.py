@@ -0,0 +1,201 @@
+"""
+Redis group queue throughput benchmark
+
+Compares RedisGroupQueueManager throughput (messages per second) against a local
+Redis:
+- enqueue:  deliver_message per message (previous behaviour) vs deliver_messages
+- dequeue:  get_messages taking 1 message per partition (previous behaviour) vs
+            up to N messages per partition in one call
+
+Messages are spread over a fixed set of group keys (fixed seed), and everything
+lives under a dedicated key prefix that is purged before and after the run.
+By default the client-side rate limits of the manager are bypassed so the Redis
+round trips themselves are measured; --with-rate-limit measures the decorated
+methods end to end.
+
+Usage (run via bootstrap, which loads the application context):
+  python src/bootstrap.py src/devops_scripts/benchmark/redis_group_queue_benchmark.py --messages 10000 --per-partition 50
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import traceback
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from core.di import get_bean_by_type
+from core.component.redis_provider import RedisProvider
+from core.observation.logger import get_logger
+from core.queue.redis_group_queue.redis_group_queue_item import SimpleQueueItem
+from core.queue.redis_group_queue.redis_msg_group_queue_manager import (
+    RedisGroupQueueManager,
+)
+
+logger = get_logger(__name__)
+
+BENCHMARK_KEY_PREFIX = "benchmark_redis_group_queue"
+
+
+def build_items(
+    messages: int, groups: int, seed: int, run_tag: str
+) -> List[Tuple[str, SimpleQueueItem]]:
+    """Deterministic (group_key, item) pairs with unique payloads"""
+    rng = random.Random(seed)
+    group_keys = [f"benchmark_group_{i}" for i in range(groups)]
+    return [
+        (rng.choice(group_keys), SimpleQueueItem({"seq": i, "run": run_tag}))
+        for i in range(messages)
+    ]
+
+
+async def measure(
+    name: str, messages: int, run_once: Callable[[], Awaitable[int]]
+) -> Dict[str, float]:
+    """Run one variant, return throughput stats (run_once returns processed count)"""
+    start = time.perf_counter()
+    processed = await run_once()
+    elapsed = time.perf_counter() - start
+    if processed != messages:
+        logger.warning("%s processed %d of %d messages", name, processed, messages)
+    return {
+        "variant": name,
+        "messages": processed,
+        "seconds": elapsed,
+        "rate": processed / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+async def run(
+    messages: int, groups: int, per_partition: int, seed: int, with_rate_limit: bool
+) -> None:
+    """Benchmark enqueue and dequeue variants, purge the benchmark keys"""
+    redis_client = await get_bean_by_type(RedisProvider).get_client()
+    manager = RedisGroupQueueManager(
+        redis_client=redis_client,
+        key_prefix=BENCHMARK_KEY_PREFIX,
+        max_total_messages=messages * 2,
+    )
+
+    def method(name: str):
+        bound = getattr(manager, name)
+        if with_rate_limit:
+            return bound
+        # Undecorated method: skip the client-side rate limiter
+        return getattr(RedisGroupQueueManager, name).__wrapped__.__get__(manager)
+
+    deliver_message = method("deliver_message")
+    deliver_messages = method("deliver_messages")
+    get_messages = method("get_messages")
+
+    async def enqueue_single(items) -> int:
+        delivered = 0
+        for group_key, item in items:
+            delivered += bool(await deliver_message(group_key, item))
+        return delivered
+
+    async def enqueue_batch(items) -> int:
+        return sum(await deliver_messages(items))
+
+    async def drain(max_per_partition: int) -> Tuple[int, int]:
+        consumed = 0
+        polls = 0
+        while consumed < messages:
+            batch = await get_messages(
+                score_threshold=0,
+                current_score=int(time.time() * 1000) + 1000,
+                max_messages_per_partition=max_per_partition,
+            )
+            polls += 1
+            if not batch:
+                break
+            consumed += len(batch)
+        return consumed, polls
+
+    results = []
+    poll_counts = {}
+    try:
+        await manager.force_cleanup_and_reset(purge_all=True)
+        await manager.join_consumer()
+
+        for variant, enqueue, per_part in (
+            ("single", enqueue_single, 1),
+            ("batch", enqueue_batch, per_partition),
+        ):
+            items = build_items(messages, groups, seed, variant)
+            results.append(
+                await measure(f"enqueue {variant}", messages, lambda: enqueue(items))
+            )
+
+            async def dequeue(per_part=per_part, variant=variant) -> int:
+                consumed, polls = await drain(per_part)
+                poll_counts[variant] = polls
+                return consumed
+
+            results.append(
+                await measure(f"dequeue {per_part}/partition", messages, dequeue)
+            )
+
+        print(
+            f"\nmessages={messages} groups={groups} per_partition={per_partition} "
+            f"seed={seed} rate_limit={'on' if with_rate_limit else 'off'}"
+        )
+        print(f"{'variant':<26}{'messages':>10}{'seconds':>10}{'msg/s':>12}")
+        for r in results:
+            print(
+                f"{r['variant']:<26}{r['messages']:>10}{r['seconds']:>10.2f}{r['rate']:>12.0f}"
+            )
+        print(
+            f"polls to drain: single={poll_counts.get('single')} "
+            f"batch={poll_counts.get('batch')}"
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Benchmark failed: %s", exc)
+        traceback.print_exc()
+        raise
+    finally:
+        await manager.exit_consumer()
+        await manager.force_cleanup_and_reset(purge_all=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark Redis group queue: per-message vs batch enqueue/dequeue"
+    )
+    parser.add_argument(
+        "--messages",
+        type=int,
+        default=10000,
+        help="Messages per variant, default 10000",
+    )
+    parser.add_argument(
+        "--groups", type=int, default=500, help="Distinct group keys, default 500"
+    )
+    parser.add_argument(
+        "--per-partition",
+        type=int,
+        default=50,
+        help="Messages per partition per poll in the batch variant, default 50",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument(
+        "--with-rate-limit",
+        action="store_true",
+        help="Keep the manager's client-side rate limits (end-to-end numbers)",
+    )
+    args = parser.parse_args(argv)
+
+    asyncio.run(
+        run(
+            args.messages,
+            args.groups,
+            args.per_partition,
+            args.seed,
+            args.with_rate_limit,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -12,6 +12,7 @@ from api_specs.dtos import (
     BaseApiResponse,
     # Command DTOs
     MemorizeMessageRequest,
+    MemorizeBatchRequest,
     DeleteMemoriesRequest as DeleteMemoriesRequestDTO,
     # Request DTOs
     FetchMemRequest,
@@ -27,8 +28,10 @@ from api_specs.dtos import (
     PatchConversationMetaResult,
     DeleteMemoriesResult,
     MemorizeResult,
+    MemorizeBatchResult,
     # API Response wrappers
     MemorizeResponse,
+    MemorizeBatchResponse,
     FetchMemoriesResponse,
     SearchMemoriesResponse,
     GetConversationMetaResponse,
@@ -48,6 +51,7 @@ __all__ = [
     "BaseApiResponse",
     # Command DTOs
     "MemorizeMessageRequest",
+    "MemorizeBatchRequest",
     "DeleteMemoriesRequest",
     "DeleteMemoriesRequestDTO",
     # Query DTOs (Requests)
@@ -64,8 +68,10 @@ __all__ = [
     "PatchConversationMetaResult",
     "DeleteMemoriesResult",
     "MemorizeResult",
+    "MemorizeBatchResult",
     # API Response wrappers
     "MemorizeResponse",
+    "MemorizeBatchResponse",
     "FetchMemoriesResponse",
     "SearchMemoriesResponse",
     "GetConversationMetaResponse",
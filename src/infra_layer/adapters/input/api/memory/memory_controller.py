@@ -3,7 +3,9 @@ Memory Controller - Unified memory management controller
 
 Provides RESTful API routes for:
 - Memory ingestion (POST /memories): accept a single-message payload and create memories
-- Memory fetch (GET /memories): fetch by memory_type with optional user/group/time filters (query params or JSON body)
+- Batch ingestion (POST /memories/batch): accept an ordered message list for one or more groups
+- Memory fetch (GET /memories): fetch by memory_type with optional user/group/time filters (query params or JSON body), keyset-paginated via cursor
+- Memory export (GET /memories/export): stream all matching memories as NDJSON
 - Memory search (GET /memories/search): keyword/vector/hybrid/rrf/agentic retrieval with grouped results
 - Conversation metadata (GET/POST/PATCH /conversation-meta): get with default fallback, upsert, and partial update
 - Memory deletion (DELETE /memories): soft delete by combined filters
@@ -15,6 +17,8 @@ import time
 from contextlib import suppress
 from typing import Any, Dict
 from fastapi import HTTPException, Request as FastAPIRequest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 
 from core.di.decorators import controller
 from core.di import get_bean_by_type
@@ -36,6 +40,7 @@ from api_specs.request_converter import (
 from infra_layer.adapters.input.api.dto.memory_dto import (
     # Request DTOs
     MemorizeMessageRequest,
+    MemorizeBatchRequest,
     FetchMemRequest,
     RetrieveMemRequest,
     ConversationMetaCreateRequest,
@@ -44,6 +49,7 @@ from infra_layer.adapters.input.api.dto.memory_dto import (
     DeleteMemoriesRequestDTO,
     # Response DTOs
     MemorizeResponse,
+    MemorizeBatchResponse,
     FetchMemoriesResponse,
     SearchMemoriesResponse,
     GetConversationMetaResponse,
@@ -55,9 +61,11 @@ from core.request.timeout_background import timeout_to_background
 from core.request import log_request
 from core.component.redis_provider import RedisProvider
 from service.memory_request_log_service import MemoryRequestLogService
+from biz_layer.group_mailbox_executor import MailboxFullError
 from service.memcell_delete_service import MemCellDeleteService
 from service.conversation_meta_service import ConversationMetaService
 from api_specs.memory_types import RawDataType
+from api_specs.dtos.memory import MAX_MEMORIZE_BATCH_SIZE
 from agentic_layer.metrics.memorize_metrics import (
     record_memorize_request,
     record_memorize_error,
@@ -294,6 +302,24 @@ class MemoryController(BaseController):
                 duration_seconds=time.perf_counter() - start_time,
             )
             raise HTTPException(status_code=400, detail=str(e)) from e
+        except MailboxFullError as e:
+            logger.warning("memorize request rejected: %s", e)
+            record_memorize_error(
+                space_id=space_id,
+                raw_data_type=raw_data_type,
+                stage='memorize_process',
+                error_type='mailbox_full',
+            )
+            record_memorize_request(
+                space_id=space_id,
+                raw_data_type=raw_data_type,
+                status='error',
+                duration_seconds=time.perf_counter() - start_time,
+            )
+            raise HTTPException(
+                status_code=503,
+                detail="Too many pending messages for this group, please retry later",
+            ) from e
         except HTTPException:
             # Re-raise HTTPException (already handled errors)
             record_memorize_request(
@@ -322,6 +348,215 @@ class MemoryController(BaseController):
                 status_code=500, detail="Failed to store memory, please try again later"
             ) from e
 
+    @post(
+        "/batch",
+        response_model=MemorizeBatchResponse,
+        summary="Store message batch",
+        description="""
+        Store an ordered batch of messages into memory (import / backfill).
+
+        ## Fields:
+        - **messages** (required): Ordered list of messages, same fields as POST /api/v1/memories
+
+        ## Functionality:
+        - Request logs of all messages are saved with one bulk write
+        - Messages are grouped by group_id, keeping their order within each group
+        - Each group runs one boundary detection pass over its messages and may create several MemCells
+        - Independent groups are processed concurrently
+        - Returns per-group MemCell and memory counts; a failing group does not fail the others
+        """,
+        responses={
+            400: {
+                "description": "Request parameter error",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status": ErrorStatus.FAILED.value,
+                            "code": ErrorCode.INVALID_PARAMETER.value,
+                            "message": "messages[3]: Missing required field: sender",
+                            "timestamp": "2025-01-15T10:30:00+00:00",
+                            "path": "/api/v1/memories/batch",
+                        }
+                    }
+                },
+            },
+            500: {
+                "description": "Internal server error",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status": ErrorStatus.FAILED.value,
+                            "code": ErrorCode.SYSTEM_ERROR.value,
+                            "message": "Failed to store memory, please try again later",
+                            "timestamp": "2025-01-15T10:30:00+00:00",
+                            "path": "/api/v1/memories/batch",
+                        }
+                    }
+                },
+            },
+        },
+    )
+    @log_request()
+    @timeout_to_background()
+    async def memorize_batch_messages(
+        self,
+        request: FastAPIRequest,
+        request_body: MemorizeBatchRequest = None,  # OpenAPI documentation only
+    ) -> MemorizeBatchResponse:
+        """
+        Store an ordered batch of messages
+
+        Args:
+            request: FastAPI request object
+            request_body: Batch request body (used for OpenAPI documentation only)
+
+        Returns:
+            Dict[str, Any]: Batch storage response with per-group results
+
+        Raises:
+            HTTPException: When request processing fails
+        """
+        del request_body  # Used for OpenAPI documentation only
+        start_time = time.perf_counter()
+        space_id = get_space_id_for_metrics()
+        raw_data_type = get_raw_data_type_label(RawDataType.CONVERSATION.value)
+
+        try:
+            body = await request.json()
+            messages = body.get("messages") if isinstance(body, dict) else None
+            if not isinstance(messages, list) or not messages:
+                raise ValueError("Missing required field: messages")
+            if len(messages) > MAX_MEMORIZE_BATCH_SIZE:
+                raise ValueError(
+                    f"Too many messages: {len(messages)} > {MAX_MEMORIZE_BATCH_SIZE}"
+                )
+            logger.info("Received memorize batch request: %d messages", len(messages))
+
+            memorize_requests = []
+            for index, message_data in enumerate(messages):
+                try:
+                    memorize_requests.append(
+                        await convert_simple_message_to_memorize_request(message_data)
+                    )
+                except (ValueError, AttributeError) as e:
+                    raise ValueError(f"messages[{index}]: {e}") from e
+
+            record_memorize_message(
+                space_id=space_id,
+                raw_data_type=raw_data_type,
+                status='received',
+                count=len(memorize_requests),
+            )
+
+            # Save all request logs with one bulk write (sync_status=-1)
+            log_service = get_bean_by_type(MemoryRequestLogService)
+            saved_message_ids = await log_service.save_request_logs_batch(
+                requests=memorize_requests,
+                version="1.0.0",
+                endpoint_name="memorize_batch_messages",
+                method=request.method,
+                url=str(request.url),
+                raw_input_dicts=messages,
+            )
+            record_memorize_message(
+                space_id=space_id,
+                raw_data_type=raw_data_type,
+                status='saved',
+                count=len(saved_message_ids),
+            )
+
+            group_results = await self.memory_manager.memorize_batch(memorize_requests)
+
+            memory_count = sum(r.memory_count for r in group_results)
+            memcell_count = sum(r.memcell_count for r in group_results)
+            failed_groups = [r.group_id for r in group_results if r.error]
+            logger.info(
+                "Memory batch processing completed: groups=%d, memcells=%d, memories=%d, failed_groups=%s",
+                len(group_results),
+                memcell_count,
+                memory_count,
+                failed_groups,
+            )
+
+            if failed_groups:
+                status = 'partial'
+                message = f"Extracted {memory_count} memories, {len(failed_groups)} groups failed"
+            elif memory_count > 0:
+                status = 'extracted'
+                message = f"Extracted {memory_count} memories"
+            else:
+                status = 'accumulated'
+                message = "Messages queued, awaiting boundary detection"
+
+            record_memorize_request(
+                space_id=space_id,
+                raw_data_type=raw_data_type,
+                status=status,
+                duration_seconds=time.perf_counter() - start_time,
+            )
+
+            return {
+                "status": ErrorStatus.OK.value,
+                "message": message,
+                "result": {
+                    "count": memory_count,
+                    "memcell_count": memcell_count,
+                    "groups": [
+                        {
+                            "group_id": r.group_id,
+                            "message_count": r.message_count,
+                            "memcell_count": r.memcell_count,
+                            "count": r.memory_count,
+                            "error": r.error,
+                        }
+                        for r in group_results
+                    ],
+                },
+            }
+
+        except ValueError as e:
+            logger.error("memorize batch request parameter error: %s", e)
+            record_memorize_error(
+                space_id=space_id,
+                raw_data_type=raw_data_type,
+                stage='conversion',
+                error_type='validation_error',
+            )
+            record_memorize_request(
+                space_id=space_id,
+                raw_data_type=raw_data_type,
+                status='error',
+                duration_seconds=time.perf_counter() - start_time,
+            )
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        except HTTPException:
+            record_memorize_request(
+                space_id=space_id,
+                raw_data_type=raw_data_type,
+                status='error',
+                duration_seconds=time.perf_counter() - start_time,
+            )
+            raise
+        except Exception as e:
+            logger.error(
+                "memorize batch request processing failed: %s", e, exc_info=True
+            )
+            record_memorize_error(
+                space_id=space_id,
+                raw_data_type=raw_data_type,
+                stage='memorize_process',
+                error_type=classify_memorize_error(e),
+            )
+            record_memorize_request(
+                space_id=space_id,
+                raw_data_type=raw_data_type,
+                status='error',
+                duration_seconds=time.perf_counter() - start_time,
+            )
+            raise HTTPException(
+                status_code=500, detail="Failed to store memory, please try again later"
+            ) from e
+
     @get(
         "",
         response_model=FetchMemoriesResponse,
@@ -337,7 +572,7 @@ class MemoryController(BaseController):
             - foresight: prospective memory
             - event_log: event log (atomic facts)
         - **limit** (optional): Max records to return (default: 10, max: 100)
-        - **offset** (optional): Pagination offset (default: 0)
+        - **cursor** (optional): Pass the previous response's `next_cursor` to get the next page
         - **version_range** (optional): Version range filter [start, end]
         
         ## Use cases:
@@ -439,6 +674,86 @@ class MemoryController(BaseController):
                 detail="Failed to retrieve memory, please try again later",
             ) from e
 
+    @get(
+        "/export",
+        response_class=StreamingResponse,
+        summary="Export memories as NDJSON stream",
+        description="""
+        Stream every memory matching the filters, one JSON object per line
+
+        ## Fields:
+        - **user_id** / **group_id**: Owner filters (same semantics as GET /api/v1/memories)
+        - **memory_type** (optional): Memory type (default: episodic_memory)
+        - **start_time** / **end_time** (optional): Time range filter (ISO 8601)
+
+        Memories are read from MongoDB in keyset pages of MEMORY_EXPORT_BATCH_SIZE
+        records, so exports of any size run in constant memory.
+        """,
+        responses={
+            200: {
+                "description": "NDJSON stream of memories",
+                "content": {"application/x-ndjson": {}},
+            },
+            400: {"description": "Request parameter error"},
+        },
+    )
+    async def export_memories(
+        self,
+        fastapi_request: FastAPIRequest,
+        request_body: FetchMemRequest = None,  # For OpenAPI request body documentation
+    ) -> StreamingResponse:
+        """
+        Stream user or group memories as NDJSON
+
+        Args:
+            fastapi_request: FastAPI request object
+            request_body: Request body parameters (used for OpenAPI documentation only)
+
+        Returns:
+            StreamingResponse: application/x-ndjson body, one memory per line
+
+        Raises:
+            HTTPException: When request parameters are invalid
+        """
+        del request_body  # Used for OpenAPI documentation only
+        params = await self._collect_request_params(fastapi_request)
+        try:
+            fetch_request = convert_dict_to_fetch_mem_request(params)
+        except ValueError as e:
+            logger.error("Export request parameter error: %s", e)
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+        logger.info(
+            "Received export request: user_id=%s, group_id=%s, memory_type=%s",
+            fetch_request.user_id,
+            fetch_request.group_id,
+            fetch_request.memory_type,
+        )
+
+        async def ndjson_lines():
+            count = 0
+            try:
+                async for memory in self.memory_manager.export_mem(fetch_request):
+                    count += 1
+                    # Same encoding FastAPI applies to GET /api/v1/memories results
+                    yield json.dumps(
+                        jsonable_encoder(memory), ensure_ascii=False
+                    ) + "\n"
+            except Exception as e:
+                # Headers are already sent; log and end the stream early
+                logger.error(
+                    "Export failed after %d memories: %s", count, e, exc_info=True
+                )
+                raise
+            logger.info(
+                "Export completed: user_id=%s, group_id=%s, exported %d memories",
+                fetch_request.user_id,
+                fetch_request.group_id,
+                count,
+            )
+
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
     @get(
         "/search",
         response_model=SearchMemoriesResponse,
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from beanie import Indexed
 from core.oxm.mongo.document_base import DocumentBase
 from pydantic import Field
@@ -35,8 +35,8 @@ class ClusterState(DocumentBase, AuditBase):
     # Clustering metadata
     next_cluster_idx: int = Field(default=0, description="Next cluster index")
 
-    # Cluster centroid information (vectors stored as lists)
-    cluster_centroids: Dict[str, List[float]] = Field(
+    # Cluster centroid information (raw little-endian float32 bytes; legacy documents store lists)
+    cluster_centroids: Dict[str, Union[bytes, List[float]]] = Field(
         default_factory=dict,
         description="Cluster centroid vectors {cluster_id: vector}",
     )
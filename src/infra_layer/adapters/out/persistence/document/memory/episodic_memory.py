@@ -110,6 +110,24 @@ class EpisodicMemory(DocumentBase, AuditBase):
                 name="idx_group_user_timestamp",
                 sparse=True,
             ),
+            # Keyset pagination indexes: (owner, timestamp, _id) serve cursor pages
+            IndexModel(
+                [
+                    ("user_id", ASCENDING),
+                    ("timestamp", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="idx_user_timestamp_id",
+            ),
+            IndexModel(
+                [
+                    ("group_id", ASCENDING),
+                    ("timestamp", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="idx_group_timestamp_id",
+                sparse=True,
+            ),
             # Index on keywords
             IndexModel([("keywords", ASCENDING)], name="idx_keywords", sparse=True),
             # Index on linked entities
@@ -119,6 +119,24 @@ class EventLogRecord(DocumentBase, AuditBase):
                 name="idx_group_user_timestamp",
                 sparse=True,
             ),
+            # Keyset pagination indexes: (owner, timestamp, _id) serve cursor pages
+            IndexModel(
+                [
+                    ("user_id", ASCENDING),
+                    ("timestamp", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="idx_user_timestamp_id",
+            ),
+            IndexModel(
+                [
+                    ("group_id", ASCENDING),
+                    ("timestamp", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="idx_group_timestamp_id",
+                sparse=True,
+            ),
             # Creation time index
             IndexModel([("created_at", DESCENDING)], name="idx_created_at"),
             # Update time index
@@ -146,6 +146,24 @@ class ForesightRecord(DocumentBase, AuditBase):
                 name="idx_group_user_time_range",
                 sparse=True,
             ),
+            # Keyset pagination indexes: (owner, created_at, _id) serve cursor pages
+            IndexModel(
+                [
+                    ("user_id", ASCENDING),
+                    ("created_at", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="idx_user_created_id",
+            ),
+            IndexModel(
+                [
+                    ("group_id", ASCENDING),
+                    ("created_at", DESCENDING),
+                    ("_id", DESCENDING),
+                ],
+                name="idx_group_created_id",
+                sparse=True,
+            ),
             # Creation time index
             IndexModel([("created_at", DESCENDING)], name="idx_created_at"),
             # Update time index
@@ -235,5 +235,33 @@ class MemCell(DocumentBaseWithSoftDelete, AuditBase):
         use_state_management = True
 
 
+class MemCellOriginalDataProjection(BaseModel):
+    """
+    MemCell projection with only the raw messages
+
+    Used by retrieval responses, which read nothing else from the MemCell; skips
+    episode, foresight, event log and extension data.
+    """
+
+    id: Optional[PydanticObjectId] = Field(
+        default=None, alias="_id", description="MemCell ID"
+    )
+    original_data: Optional[List] = Field(
+        default=None, description="Original information"
+    )
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    @property
+    def event_id(self) -> Optional[PydanticObjectId]:
+        return self.id
+
+
 # Export models
-__all__ = ["MemCell", "RawData", "Message", "DataTypeEnum"]
+__all__ = [
+    "MemCell",
+    "MemCellOriginalDataProjection",
+    "RawData",
+    "Message",
+    "DataTypeEnum",
+]
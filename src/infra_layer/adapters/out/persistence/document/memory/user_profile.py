@@ -38,6 +38,10 @@ class UserProfile(DocumentBase, AuditBase):
     memcell_count: int = Field(
         default=0, description="Number of MemCells involved in extraction"
     )
+    event_watermarks: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Per cluster ID: number of group cluster-state events already folded into the profile",
+    )
 
     # History
     last_updated_cluster: Optional[str] = Field(
@@ -1,6 +1,7 @@
 from typing import List, Optional
 from pymongo.asynchronous.client_session import AsyncClientSession
 from core.oxm.mongo.base_repository import BaseRepository
+from core.oxm.keyset_pagination import KeysetCursor, apply_keyset_filter, keyset_sort
 from infra_layer.adapters.out.persistence.document.memory.behavior_history import (
     BehaviorHistory,
 )
@@ -29,12 +30,14 @@ class BehaviorHistoryRawRepository(BaseRepository[BehaviorHistory]):
         user_id: str,
         limit: int = 100,
         session: Optional[AsyncClientSession] = None,
+        cursor: Optional[KeysetCursor] = None,
     ) -> List[BehaviorHistory]:
-        """Get behavior history list by user ID"""
+        """Get behavior history list by user ID, newest first (after cursor if given)"""
         try:
+            filter_dict = apply_keyset_filter({"user_id": user_id}, "timestamp", cursor)
             results = (
-                await self.model.find({"user_id": user_id}, session=session)
-                .sort("-timestamp")
+                await self.model.find(filter_dict, session=session)
+                .sort(keyset_sort("timestamp"))
                 .limit(limit)
                 .to_list()
             )
@@ -6,6 +6,7 @@ Provides ClusterStorage compatible interface (duck typing).
 """
 
 from typing import Optional, Dict, Any
+from common_utils.datetime_utils import get_now_with_timezone
 from core.observation.logger import get_logger
 from core.di.decorators import repository
 from core.oxm.mongo.base_repository import BaseRepository
@@ -24,6 +25,7 @@ class ClusterStateRawRepository(BaseRepository[ClusterState]):
 
     Provides ClusterStorage compatible interface:
     - save_cluster_state(group_id, state) -> bool
+    - save_cluster_state_delta(group_id, delta) -> bool
     - load_cluster_state(group_id) -> Optional[Dict]
     - get_cluster_assignments(group_id) -> Dict[str, str]
     - clear(group_id) -> bool
@@ -38,6 +40,57 @@ class ClusterStateRawRepository(BaseRepository[ClusterState]):
         result = await self.upsert_by_group_id(group_id, state)
         return result is not None
 
+    async def save_cluster_state_delta(
+        self, group_id: str, delta: Dict[str, Any]
+    ) -> bool:
+        """
+        Apply an incremental cluster state update (see ClusterState.to_delta)
+
+        Appends the new events and overwrites only the touched clusters' centroid,
+        count and last timestamp with a single atomic update, instead of rewriting
+        the whole document. Creates the document if it does not exist yet.
+        """
+        now = get_now_with_timezone()
+        set_fields: Dict[str, Any] = {
+            "next_cluster_idx": delta.get("next_cluster_idx", 0),
+            "updated_at": now,
+        }
+        for field in (
+            "eventid_to_cluster",
+            "cluster_centroids",
+            "cluster_counts",
+            "cluster_last_ts",
+        ):
+            for key, value in (delta.get(field) or {}).items():
+                set_fields[f"{field}.{key}"] = value
+
+        update: Dict[str, Any] = {
+            "$set": set_fields,
+            "$setOnInsert": {"created_at": now},
+        }
+        push_fields = {
+            field: {"$each": list(delta[field])}
+            for field in ("event_ids", "timestamps", "cluster_ids")
+            if delta.get(field)
+        }
+        if push_fields:
+            update["$push"] = push_fields
+
+        try:
+            collection = self.model.get_pymongo_collection()
+            await collection.update_one({"group_id": group_id}, update, upsert=True)
+            logger.debug(
+                f"Applied cluster state delta: group_id={group_id}, "
+                f"events={len(delta.get('event_ids') or [])}, "
+                f"clusters={len(delta.get('cluster_counts') or {})}"
+            )
+            return True
+        except Exception as e:
+            logger.error(
+                f"Failed to apply cluster state delta: group_id={group_id}, error={e}"
+            )
+            return False
+
     async def load_cluster_state(self, group_id: str) -> Optional[Dict[str, Any]]:
         cluster_state = await self.get_by_group_id(group_id)
         if cluster_state is None:
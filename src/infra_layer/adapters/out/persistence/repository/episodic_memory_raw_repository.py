@@ -6,6 +6,7 @@ from core.observation.logger import get_logger
 from core.di.decorators import repository
 from core.oxm.mongo.base_repository import BaseRepository
 from core.oxm.constants import MAGIC_ALL
+from core.oxm.keyset_pagination import KeysetCursor, apply_keyset_filter, keyset_sort
 from infra_layer.adapters.out.persistence.document.memory.episodic_memory import (
     EpisodicMemory,
 )
@@ -129,6 +130,7 @@ class EpisodicMemoryRawRepository(BaseRepository[EpisodicMemory]):
         limit: Optional[int] = None,
         skip: Optional[int] = None,
         sort_desc: bool = True,
+        cursor: Optional[KeysetCursor] = None,
         session: Optional[AsyncClientSession] = None,
     ) -> List[EpisodicMemory]:
         """
@@ -148,6 +150,8 @@ class EpisodicMemoryRawRepository(BaseRepository[EpisodicMemory]):
             limit: Limit number of returned results
             skip: Number of results to skip
             sort_desc: Whether to sort by time in descending order
+            cursor: Keyset cursor from the previous page; returns records after it
+                in (timestamp, _id) order. Prefer it over skip for deep pages
             session: Optional MongoDB session, for transaction support
 
         Returns:
@@ -181,12 +185,15 @@ class EpisodicMemoryRawRepository(BaseRepository[EpisodicMemory]):
                 else:
                     filter_dict["group_id"] = group_id
 
+            # Keyset pagination: only records after the cursor
+            filter_dict = apply_keyset_filter(
+                filter_dict, "timestamp", cursor, descending=sort_desc
+            )
+
             query = self.model.find(filter_dict, session=session)
 
-            if sort_desc:
-                query = query.sort("-timestamp")
-            else:
-                query = query.sort("timestamp")
+            # _id breaks timestamp ties so keyset pages are stable
+            query = query.sort(keyset_sort("timestamp", descending=sort_desc))
 
             if skip:
                 query = query.skip(skip)
@@ -246,6 +253,50 @@ class EpisodicMemoryRawRepository(BaseRepository[EpisodicMemory]):
             logger.error("❌ Failed to append episodic memory: %s", e)
             return None
 
+    async def append_episodic_memories(
+        self,
+        episodic_memories: List[EpisodicMemory],
+        session: Optional[AsyncClientSession] = None,
+    ) -> List[EpisodicMemory]:
+        """
+        Append episodic memories in batch
+
+        Missing vectors are generated with one batched embedding call, then all
+        documents are written with a single insert_many.
+
+        Args:
+            episodic_memories: List of episodic memory objects
+            session: Optional MongoDB session, for transaction support
+
+        Returns:
+            Appended EpisodicMemory list (same order as input)
+
+        Raises:
+            Exception: If the bulk insert fails
+        """
+        if not episodic_memories:
+            return []
+
+        # Synchronize vectors
+        to_embed = [
+            memory
+            for memory in episodic_memories
+            if memory.episode and not memory.vector
+        ]
+        if to_embed:
+            try:
+                vectors = await self.vectorize_service.get_embeddings(
+                    [memory.episode for memory in to_embed]
+                )
+                model_name = self.vectorize_service.get_model_name()
+                for memory, vector in zip(to_embed, vectors):
+                    memory.vector = vector.tolist()
+                    memory.vector_model = model_name
+            except Exception as e:
+                logger.error("❌ Failed to synchronize vectors in batch: %s", e)
+
+        return await self.create_batch(episodic_memories, session=session)
+
     async def delete_by_event_id(
         self, event_id: str, user_id: str, session: Optional[AsyncClientSession] = None
     ) -> bool:
@@ -12,6 +12,7 @@ from core.observation.logger import get_logger
 from core.di.decorators import repository
 from core.oxm.mongo.base_repository import BaseRepository
 from core.oxm.constants import MAGIC_ALL
+from core.oxm.keyset_pagination import KeysetCursor, apply_keyset_filter, keyset_sort
 from infra_layer.adapters.out.persistence.document.memory.event_log_record import (
     EventLogRecord,
     EventLogRecordProjection,
@@ -168,6 +169,7 @@ class EventLogRecordRawRepository(BaseRepository[EventLogRecord]):
         limit: Optional[int] = None,
         skip: Optional[int] = None,
         sort_desc: bool = True,
+        cursor: Optional[KeysetCursor] = None,
         session: Optional[AsyncClientSession] = None,
         model: Optional[Type[T]] = None,
     ) -> List[Union[EventLogRecord, EventLogRecordProjection]]:
@@ -188,6 +190,8 @@ class EventLogRecordRawRepository(BaseRepository[EventLogRecord]):
             limit: Limit number of returned records
             skip: Number of records to skip
             sort_desc: Whether to sort by time in descending order
+            cursor: Keyset cursor from the previous page; returns records after it
+                in (timestamp, _id) order. Prefer it over skip for deep pages
             session: Optional MongoDB session, for transaction support
             model: Returned model type, default is EventLogRecord (full version), can pass EventLogRecordProjection
 
@@ -222,6 +226,11 @@ class EventLogRecordRawRepository(BaseRepository[EventLogRecord]):
                 else:
                     filter_dict["group_id"] = group_id
 
+            # Keyset pagination: only records after the cursor
+            filter_dict = apply_keyset_filter(
+                filter_dict, "timestamp", cursor, descending=sort_desc
+            )
+
             # If model is not specified, use full version
             target_model = model if model is not None else self.model
 
@@ -233,10 +242,8 @@ class EventLogRecordRawRepository(BaseRepository[EventLogRecord]):
                     filter_dict, projection_model=target_model, session=session
                 )
 
-            if sort_desc:
-                query = query.sort("-timestamp")
-            else:
-                query = query.sort("timestamp")
+            # _id breaks timestamp ties so keyset pages are stable
+            query = query.sort(keyset_sort("timestamp", descending=sort_desc))
 
             if skip:
                 query = query.skip(skip)
@@ -12,6 +12,7 @@ from core.observation.logger import get_logger
 from core.di.decorators import repository
 from core.oxm.mongo.base_repository import BaseRepository
 from core.oxm.constants import MAGIC_ALL
+from core.oxm.keyset_pagination import KeysetCursor, apply_keyset_filter, keyset_sort
 from common_utils.datetime_utils import to_date_str
 from infra_layer.adapters.out.persistence.document.memory.foresight_record import (
     ForesightRecord,
@@ -168,6 +169,7 @@ class ForesightRecordRawRepository(BaseRepository[ForesightRecord]):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = None,
         skip: Optional[int] = None,
+        cursor: Optional[KeysetCursor] = None,
         session: Optional[AsyncClientSession] = None,
         model: Optional[Type[T]] = None,
     ) -> List[Union[ForesightRecord, ForesightRecordProjection]]:
@@ -191,6 +193,8 @@ class ForesightRecordRawRepository(BaseRepository[ForesightRecord]):
                 - Will be converted to ISO date string (YYYY-MM-DD) internally
             limit: Limit number of returned records
             skip: Number of records to skip
+            cursor: Keyset cursor from the previous page; returns records after it
+                in (created_at, _id) descending order
             session: Optional MongoDB session for transaction support
             model: Type of model to return, defaults to ForesightRecord (full version)
 
@@ -235,6 +239,9 @@ class ForesightRecordRawRepository(BaseRepository[ForesightRecord]):
                 else:
                     filter_dict["group_id"] = group_id
 
+            # Keyset pagination: only records after the cursor
+            filter_dict = apply_keyset_filter(filter_dict, "created_at", cursor)
+
             # Use full version if model is not specified
             target_model = model if model is not None else self.model
 
@@ -246,6 +253,9 @@ class ForesightRecordRawRepository(BaseRepository[ForesightRecord]):
                     filter_dict, projection_model=target_model, session=session
                 )
 
+            # Newest first; _id breaks created_at ties so keyset pages are stable
+            query = query.sort(keyset_sort("created_at"))
+
             if skip:
                 query = query.skip(skip)
             if limit:
@@ -5,6 +5,7 @@ Native data access layer for MemCell based on Beanie ODM, providing complete CRU
 Does not depend on domain layer interfaces, directly operates on MemCell document models.
 """
 
+import asyncio
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Type
 from bson import ObjectId
@@ -125,6 +126,40 @@ class MemCellRawRepository(BaseRepository[MemCell]):
             logger.error("❌ Failed to batch retrieve MemCell by event_ids: %s", e)
             return {}
 
+    async def get_by_event_ids_batched(
+        self,
+        event_ids: List[str],
+        projection_model: Optional[Type[BaseModel]] = None,
+        batch_size: int = 100,
+    ) -> Dict[str, Any]:
+        """
+        Batch get MemCell by event_id list, splitting large lists into concurrent queries
+
+        Args:
+            event_ids: List of event IDs (duplicates are removed)
+            projection_model: Pydantic projection model class, see get_by_event_ids
+            batch_size: Maximum number of event IDs per query
+
+        Returns:
+            Dict[event_id, MemCell | ProjectionModel]: Mapping dictionary from event_id to MemCell (or projection model)
+        """
+        unique_event_ids = list(dict.fromkeys(event_ids))
+        if not unique_event_ids:
+            return {}
+
+        batches = [
+            unique_event_ids[i : i + batch_size]
+            for i in range(0, len(unique_event_ids), batch_size)
+        ]
+        results = await asyncio.gather(
+            *[self.get_by_event_ids(batch, projection_model) for batch in batches]
+        )
+
+        result_dict: Dict[str, Any] = {}
+        for batch_result in results:
+            result_dict.update(batch_result)
+        return result_dict
+
     async def append_memcell(
         self, memcell: MemCell, session: Optional[AsyncClientSession] = None
     ) -> Optional[MemCell]:
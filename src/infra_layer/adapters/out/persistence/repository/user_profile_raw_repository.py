@@ -5,12 +5,15 @@ User profile data access layer based on Beanie ODM.
 Provides ProfileStorage compatible interface (duck typing).
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from beanie.operators import Or, Eq
+from pymongo import UpdateOne
+from common_utils.datetime_utils import get_now_with_timezone
 from core.observation.logger import get_logger
 from core.di.decorators import repository
 from core.oxm.mongo.base_repository import BaseRepository
 from core.oxm.constants import MAGIC_ALL
+from core.oxm.keyset_pagination import KeysetCursor, keyset_filter, keyset_sort
 
 from infra_layer.adapters.out.persistence.document.memory.user_profile import (
     UserProfile,
@@ -126,6 +129,7 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
         user_id: Optional[str] = MAGIC_ALL,
         group_id: Optional[str] = MAGIC_ALL,
         limit: Optional[int] = None,
+        cursor: Optional[KeysetCursor] = None,
     ) -> List[UserProfile]:
         """
         Retrieve list of user profiles by filters (user_id and/or group_id)
@@ -140,6 +144,8 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
                 - None or "": Filter for null/empty values (records with group_id as None or "")
                 - Other values: Exact match
             limit: Limit number of returned results
+            cursor: Keyset cursor from the previous page; returns profiles after it
+                in (version, _id) descending order
 
         Returns:
             List of UserProfile
@@ -176,8 +182,12 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
                 # No conditions - find all
                 query = self.model.find()
 
-            # Sort by version descending
-            query = query.sort([("version", -1)])
+            # Keyset pagination: only profiles after the cursor
+            if cursor is not None:
+                query = query.find(keyset_filter("version", cursor))
+
+            # Sort by version descending (_id breaks ties for stable pages)
+            query = query.sort(keyset_sort("version"))
 
             # Apply limit
             if limit:
@@ -220,6 +230,8 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
                 if "memcell_count" in metadata:
                     existing.memcell_count = metadata["memcell_count"]
 
+                existing.event_watermarks.update(metadata.get("event_watermarks") or {})
+
                 await existing.save()
                 logger.debug(
                     f"Updated user profile: user_id={user_id}, group_id={group_id}, version={existing.version}"
@@ -238,6 +250,7 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
                     ),
                     memcell_count=metadata.get("memcell_count", 0),
                     last_updated_cluster=metadata.get("cluster_id"),
+                    event_watermarks=dict(metadata.get("event_watermarks") or {}),
                 )
                 await user_profile.insert()
                 logger.info(
@@ -250,6 +263,84 @@ class UserProfileRawRepository(BaseRepository[UserProfile]):
             )
             return None
 
+    async def upsert_many(
+        self, group_id: str, items: List[Tuple[str, Dict[str, Any], Dict[str, Any]]]
+    ) -> int:
+        """
+        Upsert several profiles of one group with a single bulk_write
+
+        Same field semantics as upsert() (version incremented, cluster_id added
+        to cluster_ids, event_watermarks merged per cluster), without reading
+        the existing documents first.
+
+        Args:
+            group_id: Group ID
+            items: (user_id, profile_data, metadata) tuples
+
+        Returns:
+            Number of inserted or modified profiles (0 on failure)
+        """
+        if not items:
+            return 0
+
+        now = get_now_with_timezone()
+        operations = []
+        for user_id, profile_data, metadata in items:
+            metadata = metadata or {}
+            set_fields: Dict[str, Any] = {
+                "profile_data": profile_data,
+                "updated_at": now,
+            }
+            set_on_insert: Dict[str, Any] = {
+                "user_id": user_id,
+                "group_id": group_id,
+                "scenario": metadata.get("scenario", "group_chat"),
+                "created_at": now,
+            }
+            if "confidence" in metadata:
+                set_fields["confidence"] = metadata["confidence"]
+            else:
+                set_on_insert["confidence"] = 0.0
+            if "memcell_count" in metadata:
+                set_fields["memcell_count"] = metadata["memcell_count"]
+            else:
+                set_on_insert["memcell_count"] = 0
+            for cluster_id, watermark in (
+                metadata.get("event_watermarks") or {}
+            ).items():
+                set_fields[f"event_watermarks.{cluster_id}"] = watermark
+
+            update: Dict[str, Any] = {
+                "$set": set_fields,
+                "$setOnInsert": set_on_insert,
+                "$inc": {"version": 1},
+            }
+            if "cluster_id" in metadata:
+                set_fields["last_updated_cluster"] = metadata["cluster_id"]
+                update["$addToSet"] = {"cluster_ids": metadata["cluster_id"]}
+            else:
+                set_on_insert["cluster_ids"] = []
+
+            operations.append(
+                UpdateOne(
+                    {"user_id": user_id, "group_id": group_id}, update, upsert=True
+                )
+            )
+
+        try:
+            collection = self.model.get_pymongo_collection()
+            result = await collection.bulk_write(operations, ordered=False)
+            count = result.upserted_count + result.modified_count
+            logger.debug(
+                f"Bulk upserted user profiles: group_id={group_id}, count={count}"
+            )
+            return count
+        except Exception as e:
+            logger.error(
+                f"Failed to bulk save user profiles: group_id={group_id}, error={e}"
+            )
+            return 0
+
     async def delete_by_group(self, group_id: str) -> int:
         try:
             result = await self.model.find(UserProfile.group_id == group_id).delete()
@@ -119,6 +119,10 @@ class EventLogCollection(TenantAwareMilvusCollectionWithSuffix):
         enable_dynamic_field=True,
     )
 
+    # Fields that can be used as partition key (MILVUS_PARTITION_KEY); searches
+    # filtering on that field only visit the matching partition
+    _PARTITION_KEY_FIELDS = ("group_id", "user_id")
+
     # Index configurations
     _INDEX_CONFIGS = [
         # Vector field index (for similarity search)
@@ -8,7 +8,12 @@ Main features include vector storage, similarity search, filtered queries, and d
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Union
 import json
-from core.oxm.milvus.base_repository import BaseMilvusRepository
+import time
+from core.oxm.milvus.base_repository import (
+    BaseMilvusRepository,
+    MilvusOutputProfile,
+    get_default_output_profile,
+)
 from core.oxm.constants import MAGIC_ALL
 from infra_layer.adapters.out.search.milvus.memory.episodic_memory_collection import (
     EpisodicMemoryCollection,
@@ -16,6 +21,7 @@ from infra_layer.adapters.out.search.milvus.memory.episodic_memory_collection im
 from core.observation.logger import get_logger
 from common_utils.datetime_utils import get_now_with_timezone
 from core.di.decorators import repository
+from agentic_layer.metrics.retrieve_metrics import record_milvus_search_decode
 
 logger = get_logger(__name__)
 
@@ -184,6 +190,7 @@ class EpisodicMemoryMilvusRepository(BaseMilvusRepository[EpisodicMemoryCollecti
         score_threshold: float = 0.0,
         radius: Optional[float] = None,
         participant_user_id: Optional[str] = None,
+        output_profile: Optional[MilvusOutputProfile] = None,
     ) -> List[Dict[str, Any]]:
         """
         Vector similarity search
@@ -198,10 +205,13 @@ class EpisodicMemoryMilvusRepository(BaseMilvusRepository[EpisodicMemoryCollecti
             limit: Number of results to return
             score_threshold: Similarity threshold
             radius: COSINE similarity threshold (optional, defaults to MILVUS_SIMILARITY_RADIUS)
+            output_profile: Output fields (ids, summary without metadata/search_content,
+                full); defaults to MILVUS_SEARCH_OUTPUT_PROFILE
 
         Returns:
             List of search results
         """
+        output_profile = output_profile or get_default_output_profile()
         try:
             # Build filter expression
             filter_expr = []
@@ -258,11 +268,13 @@ class EpisodicMemoryMilvusRepository(BaseMilvusRepository[EpisodicMemoryCollecti
                 param=search_params,
                 limit=limit,
                 expr=filter_str,
-                output_fields=self.all_output_fields,
+                output_fields=self.get_output_fields(output_profile),
             )
 
             # Process results
             search_results = []
+            decode_seconds = 0.0
+            payload_bytes = 0
             raw_hit_count = sum(len(hits) for hits in results)
             logger.info(
                 f"Milvus raw return: {raw_hit_count} results, "
@@ -272,31 +284,42 @@ class EpisodicMemoryMilvusRepository(BaseMilvusRepository[EpisodicMemoryCollecti
             for hits in results:
                 for hit in hits:
                     if hit.score >= score_threshold:
-                        # Parse metadata
-                        metadata_json = hit.entity.get("metadata", "{}")
-                        metadata = json.loads(metadata_json) if metadata_json else {}
-
-                        # Parse search_content (unified as JSON array format)
-                        search_content_raw = hit.entity.get("search_content", "[]")
-                        search_content = (
-                            json.loads(search_content_raw) if search_content_raw else []
-                        )
-
-                        result = {
-                            "id": hit.entity.get("id"),
-                            "score": float(hit.score),
-                            "user_id": hit.entity.get("user_id"),
-                            "group_id": hit.entity.get("group_id"),
-                            "event_type": hit.entity.get("event_type"),
-                            "timestamp": datetime.fromtimestamp(
-                                hit.entity.get("timestamp", 0)
-                            ),
-                            "episode": hit.entity.get("episode"),
-                            "search_content": search_content,
-                            "metadata": metadata,
-                        }
+                        result = {"id": hit.entity.get("id"), "score": float(hit.score)}
+                        if output_profile != MilvusOutputProfile.IDS:
+                            result.update(
+                                {
+                                    "user_id": hit.entity.get("user_id"),
+                                    "group_id": hit.entity.get("group_id"),
+                                    "event_type": hit.entity.get("event_type"),
+                                    "timestamp": datetime.fromtimestamp(
+                                        hit.entity.get("timestamp", 0)
+                                    ),
+                                    "episode": hit.entity.get("episode"),
+                                }
+                            )
+                        if output_profile == MilvusOutputProfile.FULL:
+                            decode_start = time.perf_counter()
+                            metadata_json = hit.entity.get("metadata")
+                            search_content_raw = hit.entity.get("search_content")
+                            # search_content is unified as JSON array format
+                            result["search_content"] = self.parse_json_field(
+                                search_content_raw, []
+                            )
+                            result["metadata"] = self.parse_json_field(
+                                metadata_json, {}
+                            )
+                            decode_seconds += time.perf_counter() - decode_start
+                            payload_bytes += len(metadata_json or "") + len(
+                                search_content_raw or ""
+                            )
                         search_results.append(result)
 
+            record_milvus_search_decode(
+                collection=self.model_name,
+                output_profile=output_profile.value,
+                duration_seconds=decode_seconds,
+                payload_bytes=payload_bytes,
+            )
             logger.debug(
                 "✅ Vector search successful: Found %d results", len(search_results)
             )
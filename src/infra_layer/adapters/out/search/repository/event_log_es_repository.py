@@ -8,7 +8,7 @@ Reuses EpisodicMemoryDoc, filtering by type field as event_log.
 from datetime import datetime
 import pprint
 from typing import List, Optional, Dict, Any
-from elasticsearch.dsl import Q
+from elasticsearch.dsl import AsyncSearch, Q
 from core.oxm.es.base_repository import BaseRepository
 from core.oxm.constants import MAGIC_ALL
 from infra_layer.adapters.out.search.elasticsearch.memory.event_log import EventLogDoc
@@ -166,6 +166,107 @@ class EventLogEsRepository(BaseRepository[EventLogDoc]):
 
     # ==================== Search functionality ====================
 
+    def build_multi_search(
+        self,
+        query: List[str],
+        user_id: Optional[str] = None,
+        group_id: Optional[str] = None,
+        parent_type: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        keywords: Optional[List[str]] = None,
+        date_range: Optional[Dict[str, Any]] = None,
+        size: int = 10,
+        from_: int = 0,
+        participant_user_id: Optional[str] = None,
+    ) -> AsyncSearch:
+        """
+        Build the event log keyword search without executing it
+
+        Hard conditions (user_id, group_id, time range, ...) are placed in the
+        bool filter context, so they do not affect scoring and can be served from
+        the ES filter cache. Shared by multi_search and batched msearch callers.
+
+        Args:
+            Same as multi_search (without explain)
+
+        Returns:
+            AsyncSearch: Search with query, sort and pagination applied
+        """
+        # Create AsyncSearch object
+        search = EventLogDoc.search()
+
+        # Build filter conditions
+        filter_queries = []
+
+        # Handle user_id filter: MAGIC_ALL means no filter
+        if user_id != MAGIC_ALL:
+            if user_id and user_id != "":
+                filter_queries.append(Q("term", user_id=user_id))
+            elif user_id is None or user_id == "":
+                # Explicitly filter for null or empty: documents where user_id does not exist
+                filter_queries.append(Q("bool", must_not=Q("exists", field="user_id")))
+
+        # Handle group_id filter: MAGIC_ALL means no filter
+        if group_id != MAGIC_ALL:
+            if group_id and group_id != "":
+                filter_queries.append(Q("term", group_id=group_id))
+            elif group_id is None or group_id == "":
+                # Explicitly filter for null or empty: documents where group_id does not exist
+                filter_queries.append(Q("bool", must_not=Q("exists", field="group_id")))
+
+        # Handle parent_id filter
+        if parent_id:
+            filter_queries.append(Q("term", parent_id=parent_id))
+
+        # Handle parent_type filter
+        if parent_type:
+            filter_queries.append(Q("term", parent_type=parent_type))
+
+        if keywords:
+            filter_queries.append(Q("terms", keywords=keywords))
+        if date_range:
+            filter_queries.append(Q("range", timestamp=date_range))
+
+        # Use different query templates based on whether there are query terms
+        if query:
+            # Filter query terms by intelligent score, keep top 10 highest scoring terms
+            query_with_scores = [
+                (word, self._calculate_text_score(word)) for word in query
+            ]
+            sorted_query_with_scores = sorted(
+                query_with_scores, key=lambda x: x[1], reverse=True
+            )[:10]
+
+            # Build should clauses
+            should_queries = []
+            for word, word_score in sorted_query_with_scores:
+                should_queries.append(
+                    Q("match", search_content={"query": word, "boost": word_score})
+                )
+
+            # Build bool query parameters
+            bool_query_params = {"should": should_queries, "minimum_should_match": 1}
+
+            # Filter conditions go to filter context: not scored, cacheable
+            if filter_queries:
+                bool_query_params["filter"] = filter_queries
+
+            # Use bool query
+            search = search.query(Q("bool", **bool_query_params))
+        else:
+            # Case without query terms: pure filtering query
+            if filter_queries:
+                search = search.query(Q("bool", filter=filter_queries))
+            else:
+                search = search.query(Q("match_all"))
+
+            # Sort by time descending when no query terms
+            search = search.sort({"timestamp": {"order": "desc"}})
+
+        # Set pagination parameters
+        search = search[from_ : from_ + size]
+        return search
+
     async def multi_search(
         self,
         query: List[str],
@@ -203,86 +304,18 @@ class EventLogEsRepository(BaseRepository[EventLogDoc]):
             Hits part of search results, containing matched document data
         """
         try:
-            # Create AsyncSearch object
-            search = EventLogDoc.search()
-
-            # Build filter conditions
-            filter_queries = []
-
-            # Handle user_id filter: MAGIC_ALL means no filter
-            if user_id != MAGIC_ALL:
-                if user_id and user_id != "":
-                    filter_queries.append(Q("term", user_id=user_id))
-                elif user_id is None or user_id == "":
-                    # Explicitly filter for null or empty: documents where user_id does not exist
-                    filter_queries.append(
-                        Q("bool", must_not=Q("exists", field="user_id"))
-                    )
-
-            # Handle group_id filter: MAGIC_ALL means no filter
-            if group_id != MAGIC_ALL:
-                if group_id and group_id != "":
-                    filter_queries.append(Q("term", group_id=group_id))
-                elif group_id is None or group_id == "":
-                    # Explicitly filter for null or empty: documents where group_id does not exist
-                    filter_queries.append(
-                        Q("bool", must_not=Q("exists", field="group_id"))
-                    )
-
-            # Handle parent_id filter
-            if parent_id:
-                filter_queries.append(Q("term", parent_id=parent_id))
-
-            # Handle parent_type filter
-            if parent_type:
-                filter_queries.append(Q("term", parent_type=parent_type))
-
-            if keywords:
-                filter_queries.append(Q("terms", keywords=keywords))
-            if date_range:
-                filter_queries.append(Q("range", timestamp=date_range))
-
-            # Use different query templates based on whether there are query terms
-            if query:
-                # Filter query terms by intelligent score, keep top 10 highest scoring terms
-                query_with_scores = [
-                    (word, self._calculate_text_score(word)) for word in query
-                ]
-                sorted_query_with_scores = sorted(
-                    query_with_scores, key=lambda x: x[1], reverse=True
-                )[:10]
-
-                # Build should clauses
-                should_queries = []
-                for word, word_score in sorted_query_with_scores:
-                    should_queries.append(
-                        Q("match", search_content={"query": word, "boost": word_score})
-                    )
-
-                # Build bool query parameters
-                bool_query_params = {
-                    "should": should_queries,
-                    "minimum_should_match": 1,
-                }
-
-                # If there are filter conditions, add to must clause
-                if filter_queries:
-                    bool_query_params["must"] = filter_queries
-
-                # Use bool query
-                search = search.query(Q("bool", **bool_query_params))
-            else:
-                # Case without query terms: pure filtering query
-                if filter_queries:
-                    search = search.query(Q("bool", filter=filter_queries))
-                else:
-                    search = search.query(Q("match_all"))
-
-                # Sort by time descending when no query terms
-                search = search.sort({"timestamp": {"order": "desc"}})
-
-            # Set pagination parameters
-            search = search[from_ : from_ + size]
+            search = self.build_multi_search(
+                query=query,
+                user_id=user_id,
+                group_id=group_id,
+                parent_type=parent_type,
+                parent_id=parent_id,
+                keywords=keywords,
+                date_range=date_range,
+                size=size,
+                from_=from_,
+                participant_user_id=participant_user_id,
+            )
 
             logger.debug("event log search query: %s", search.to_dict())
 
@@ -12,7 +12,7 @@ Design:
 
 import asyncio
 import numpy as np
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 from pathlib import Path
 
 from memory_layer.cluster_manager.config import ClusterManagerConfig
@@ -30,8 +30,20 @@ except ImportError:
 
 
 class ClusterState:
-    """Internal state for a single group's clustering."""
-    
+    """Internal state for a single group's clustering.
+
+    Centroids are kept as one contiguous float32 matrix (one row per cluster) with
+    cached norms, member counts and last timestamps, so matching a new vector is a
+    single matrix-vector product plus a time mask. Rows are allocated with spare
+    capacity to make adding clusters amortized O(dim).
+
+    Clusters and events touched since the state was loaded are tracked so callers can
+    persist only the delta (see `to_delta`).
+    """
+
+    _INITIAL_CAPACITY = 16
+    _NORM_EPS = 1e-9
+
     def __init__(self):
         """Initialize empty cluster state."""
         self.event_ids: List[str] = []
@@ -40,12 +52,88 @@ class ClusterState:
         self.cluster_ids: List[str] = []
         self.eventid_to_cluster: Dict[str, str] = {}
         self.next_cluster_idx: int = 0
-        
-        # Centroid-based clustering state
-        self.cluster_centroids: Dict[str, np.ndarray] = {}
-        self.cluster_counts: Dict[str, int] = {}
-        self.cluster_last_ts: Dict[str, Optional[float]] = {}
-    
+
+        # Centroid-based clustering state (row i describes cluster _row_ids[i])
+        self._row_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._dim: int = 0
+        self._centroids = np.zeros((0, 0), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._counts = np.zeros(0, dtype=np.int64)
+        # NaN means no timestamp known for the cluster
+        self._last_ts = np.zeros(0, dtype=np.float64)
+
+        # Delta tracking
+        self._dirty_clusters: Set[str] = set()
+        self._synced_events: int = 0
+        self._synced_timestamps: int = 0
+        self._synced_cluster_ids: int = 0
+
+    # ==================== Vectorized views ====================
+
+    @property
+    def centroid_dim(self) -> int:
+        """Dimension of the centroid vectors (0 before the first embedding)."""
+        return self._dim
+
+    @property
+    def centroid_ids(self) -> List[str]:
+        """Cluster ID of each centroid matrix row."""
+        return self._row_ids
+
+    @property
+    def centroid_matrix(self) -> np.ndarray:
+        """Centroid matrix view, shape (n_clusters, dim), float32."""
+        return self._centroids[: len(self._row_ids)]
+
+    @property
+    def centroid_norms(self) -> np.ndarray:
+        """Cached L2 norm (+eps) of each centroid row."""
+        return self._norms[: len(self._row_ids)]
+
+    @property
+    def centroid_counts(self) -> np.ndarray:
+        """Number of embedded members of each cluster row (0 = no centroid yet)."""
+        return self._counts[: len(self._row_ids)]
+
+    @property
+    def centroid_last_ts(self) -> np.ndarray:
+        """Last member timestamp of each cluster row (NaN if unknown)."""
+        return self._last_ts[: len(self._row_ids)]
+
+    # ==================== Dict views (backward compatible) ====================
+
+    @property
+    def cluster_centroids(self) -> Dict[str, np.ndarray]:
+        return {
+            cid: self._centroids[row]
+            for cid, row in self._rows.items()
+            if self._counts[row] > 0
+        }
+
+    @property
+    def cluster_counts(self) -> Dict[str, int]:
+        return {
+            cid: int(self._counts[row])
+            for cid, row in self._rows.items()
+            if self._counts[row] > 0
+        }
+
+    @property
+    def cluster_last_ts(self) -> Dict[str, Optional[float]]:
+        return {
+            cid: float(self._last_ts[row])
+            for cid, row in self._rows.items()
+            if not np.isnan(self._last_ts[row])
+        }
+
+    def get_cluster_count(self, cluster_id: str) -> int:
+        """Get the number of embedded members of a cluster."""
+        row = self._rows.get(cluster_id)
+        return int(self._counts[row]) if row is not None else 0
+
+    # ==================== Mutation ====================
+
     def assign_new_cluster(self, event_id: str) -> str:
         """Assign a new cluster ID to an event."""
         cluster_id = f"cluster_{self.next_cluster_idx:03d}"
@@ -53,7 +141,7 @@ class ClusterState:
         self.eventid_to_cluster[event_id] = cluster_id
         self.cluster_ids.append(cluster_id)
         return cluster_id
-    
+
     def add_to_cluster(
         self,
         event_id: str,
@@ -65,7 +153,7 @@ class ClusterState:
         self.eventid_to_cluster[event_id] = cluster_id
         self.cluster_ids.append(cluster_id)
         self._update_cluster_centroid(cluster_id, vector, timestamp)
-    
+
     def _update_cluster_centroid(
         self,
         cluster_id: str,
@@ -73,65 +161,188 @@ class ClusterState:
         timestamp: Optional[float]
     ) -> None:
         """Update cluster centroid with new vector."""
-        if vector is None or vector.size == 0:
-            if timestamp is not None:
-                prev_ts = self.cluster_last_ts.get(cluster_id)
-                self.cluster_last_ts[cluster_id] = max(prev_ts or timestamp, timestamp)
+        has_vector = vector is not None and vector.size > 0
+        if not has_vector and timestamp is None:
             return
-        
-        count = self.cluster_counts.get(cluster_id, 0)
-        if count <= 0:
-            self.cluster_centroids[cluster_id] = vector.astype(np.float32, copy=False)
-            self.cluster_counts[cluster_id] = 1
-        else:
-            current_centroid = self.cluster_centroids[cluster_id]
-            if current_centroid.dtype != np.float32:
-                current_centroid = current_centroid.astype(np.float32)
-            new_centroid = (current_centroid * float(count) + vector) / float(count + 1)
-            self.cluster_centroids[cluster_id] = new_centroid.astype(np.float32, copy=False)
-            self.cluster_counts[cluster_id] = count + 1
-        
+
+        if has_vector:
+            vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+            self._ensure_dim(vector.shape[0])
+        row = self._get_or_create_row(cluster_id)
+
+        if has_vector:
+            count = int(self._counts[row])
+            if count <= 0:
+                self._centroids[row] = vector
+            else:
+                self._centroids[row] = (
+                    self._centroids[row] * float(count) + vector
+                ) / float(count + 1)
+            self._counts[row] = count + 1
+            self._norms[row] = np.linalg.norm(self._centroids[row]) + self._NORM_EPS
+
         if timestamp is not None:
-            prev_ts = self.cluster_last_ts.get(cluster_id)
-            self.cluster_last_ts[cluster_id] = max(prev_ts or timestamp, timestamp)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert state to dictionary for serialization."""
+            prev_ts = self._last_ts[row]
+            self._last_ts[row] = (
+                timestamp if np.isnan(prev_ts) else max(prev_ts, timestamp)
+            )
+
+        self._dirty_clusters.add(cluster_id)
+
+    def _ensure_dim(self, dim: int) -> None:
+        if self._dim == dim:
+            return
+        if self._dim and self._counts[: len(self._row_ids)].any():
+            raise ValueError(
+                f"Embedding dimension changed from {self._dim} to {dim}, "
+                f"cluster state must be rebuilt"
+            )
+        # First embedding: (re)allocate the matrix with the real dimension
+        self._dim = dim
+        self._centroids = np.zeros((self._counts.shape[0], dim), dtype=np.float32)
+
+    def _get_or_create_row(self, cluster_id: str) -> int:
+        row = self._rows.get(cluster_id)
+        if row is not None:
+            return row
+
+        row = len(self._row_ids)
+        if row >= self._counts.shape[0]:
+            self._reserve(max(self._INITIAL_CAPACITY, 2 * row))
+        self._row_ids.append(cluster_id)
+        self._rows[cluster_id] = row
+        return row
+
+    def _reserve(self, capacity: int) -> None:
+        n = len(self._row_ids)
+        centroids = np.zeros((capacity, self._dim), dtype=np.float32)
+        centroids[:n] = self._centroids[:n]
+        norms = np.full(capacity, self._NORM_EPS, dtype=np.float32)
+        norms[:n] = self._norms[:n]
+        counts = np.zeros(capacity, dtype=np.int64)
+        counts[:n] = self._counts[:n]
+        last_ts = np.full(capacity, np.nan, dtype=np.float64)
+        last_ts[:n] = self._last_ts[:n]
+        self._centroids, self._norms = centroids, norms
+        self._counts, self._last_ts = counts, last_ts
+
+    # ==================== Serialization ====================
+
+    def _centroid_value(self, row: int, binary: bool) -> Union[bytes, List[float]]:
+        centroid = self._centroids[row]
+        return centroid.astype("<f4").tobytes() if binary else centroid.tolist()
+
+    def _cluster_fields(
+        self, cluster_ids: Iterable[str], binary: bool
+    ) -> Dict[str, Dict[str, Any]]:
+        centroids, counts, last_ts = {}, {}, {}
+        for cid in cluster_ids:
+            row = self._rows[cid]
+            if self._counts[row] > 0:
+                centroids[cid] = self._centroid_value(row, binary)
+                counts[cid] = int(self._counts[row])
+            if not np.isnan(self._last_ts[row]):
+                last_ts[cid] = float(self._last_ts[row])
+        return {
+            "cluster_centroids": centroids,
+            "cluster_counts": counts,
+            "cluster_last_ts": last_ts,
+        }
+
+    def to_dict(self, binary: bool = False) -> Dict[str, Any]:
+        """Convert state to dictionary for serialization.
+
+        Args:
+            binary: Encode each centroid as raw little-endian float32 bytes instead
+                of a list of floats (compact form used by MongoDB storage)
+        """
         return {
             "event_ids": self.event_ids,
             "timestamps": self.timestamps,
             "cluster_ids": self.cluster_ids,
             "eventid_to_cluster": self.eventid_to_cluster,
             "next_cluster_idx": self.next_cluster_idx,
-            "cluster_centroids": {
-                cid: centroid.tolist()
-                for cid, centroid in self.cluster_centroids.items()
+            **self._cluster_fields(self._row_ids, binary),
+        }
+
+    def to_delta(self) -> Dict[str, Any]:
+        """Get the changes since the state was loaded (or last marked synced).
+
+        Returns a dictionary with the newly appended events (`event_ids`, `timestamps`,
+        `cluster_ids`, `eventid_to_cluster`), `next_cluster_idx`, and the fields of the
+        touched clusters only, with centroids as raw float32 bytes.
+        """
+        new_event_ids = self.event_ids[self._synced_events :]
+        return {
+            "event_ids": new_event_ids,
+            "timestamps": self.timestamps[self._synced_timestamps :],
+            "cluster_ids": self.cluster_ids[self._synced_cluster_ids :],
+            "eventid_to_cluster": {
+                eid: self.eventid_to_cluster[eid]
+                for eid in new_event_ids
+                if eid in self.eventid_to_cluster
             },
-            "cluster_counts": self.cluster_counts,
-            "cluster_last_ts": self.cluster_last_ts,
+            "next_cluster_idx": self.next_cluster_idx,
+            **self._cluster_fields(sorted(self._dirty_clusters), binary=True),
         }
-    
+
+    def mark_synced(self) -> None:
+        """Mark the current state as persisted (resets delta tracking)."""
+        self._dirty_clusters.clear()
+        self._synced_events = len(self.event_ids)
+        self._synced_timestamps = len(self.timestamps)
+        self._synced_cluster_ids = len(self.cluster_ids)
+
+    @staticmethod
+    def _decode_centroid(value: Any) -> np.ndarray:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return np.frombuffer(value, dtype="<f4").astype(np.float32)
+        return np.asarray(value, dtype=np.float32).reshape(-1)
+
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "ClusterState":
-        """Create ClusterState from dictionary."""
+        """Create ClusterState from dictionary.
+
+        Centroids may be stored either as raw float32 bytes or as lists of floats.
+        """
         state = ClusterState()
         state.event_ids = list(data.get("event_ids", []))
         state.timestamps = list(data.get("timestamps", []))
         state.cluster_ids = list(data.get("cluster_ids", []))
         state.eventid_to_cluster = dict(data.get("eventid_to_cluster", {}))
         state.next_cluster_idx = int(data.get("next_cluster_idx", 0))
-        
-        centroids = data.get("cluster_centroids", {}) or {}
-        state.cluster_centroids = {
-            k: np.array(v, dtype=np.float32) for k, v in centroids.items()
-        }
-        state.cluster_counts = {
-            k: int(v) for k, v in (data.get("cluster_counts", {}) or {}).items()
+
+        centroids = {
+            k: ClusterState._decode_centroid(v)
+            for k, v in (data.get("cluster_centroids", {}) or {}).items()
+            if v is not None and len(v) > 0
         }
-        state.cluster_last_ts = {
-            k: float(v) for k, v in (data.get("cluster_last_ts", {}) or {}).items()
+        counts = {k: int(v) for k, v in (data.get("cluster_counts", {}) or {}).items()}
+        last_ts = {
+            k: float(v)
+            for k, v in (data.get("cluster_last_ts", {}) or {}).items()
+            if v is not None
         }
-        
+
+        row_ids = list(dict.fromkeys([*centroids, *last_ts]))
+        state._reserve(max(ClusterState._INITIAL_CAPACITY, 2 * len(row_ids)))
+        if centroids:
+            state._ensure_dim(next(iter(centroids.values())).shape[0])
+        for row, cid in enumerate(row_ids):
+            state._row_ids.append(cid)
+            state._rows[cid] = row
+            centroid = centroids.get(cid)
+            if centroid is not None:
+                state._centroids[row] = centroid
+                state._counts[row] = max(counts.get(cid, 1), 1)
+            if cid in last_ts:
+                state._last_ts[row] = last_ts[cid]
+
+        n = len(row_ids)
+        state._norms[:n] = (
+            np.linalg.norm(state._centroids[:n], axis=1) + ClusterState._NORM_EPS
+        )
+        state.mark_synced()
         return state
 
 
@@ -155,8 +366,9 @@ class ClusterManager:
         # Pure computation
         cluster_id, updated_state = await cluster_mgr.cluster_memcell(memcell, state)
         
-        # Caller saves state
+        # Caller saves state (full, or only what changed)
         await storage.save(group_id, updated_state.to_dict())
+        # or: await storage.save_delta(group_id, updated_state.to_delta())
         ```
     """
     
@@ -183,6 +395,7 @@ class ClusterManager:
             "clustered_memcells": 0,
             "new_clusters": 0,
             "failed_embeddings": 0,
+            "reused_embeddings": 0,
         }
     
     def on_cluster_assigned(self, callback: Callable[[str, Dict[str, Any], str], None]) -> None:
@@ -197,6 +410,7 @@ class ClusterManager:
         self,
         memcell: Dict[str, Any],
         state: ClusterState,
+        vector: Optional[Any] = None,
     ) -> Tuple[Optional[str], ClusterState]:
         """Cluster a memcell and return updated state.
         
@@ -206,6 +420,8 @@ class ClusterManager:
         Args:
             memcell: Memcell dictionary with event_id, timestamp, episode/summary
             state: Current cluster state for the group
+            vector: Precomputed embedding of the memcell text (e.g. the episode
+                embedding); the vectorize service is only called if missing
         
         Returns:
             Tuple of (cluster_id, updated_state):
@@ -223,8 +439,12 @@ class ClusterManager:
         timestamp = self._parse_timestamp(memcell.get("timestamp"))
         text = self._extract_text(memcell)
         
-        # Get embedding
-        vector = await self._get_embedding(text)
+        # Get embedding (reuse the precomputed one when available)
+        if vector is not None and len(vector) > 0:
+            vector = np.asarray(vector, dtype=np.float32)
+            self._stats["reused_embeddings"] += 1
+        else:
+            vector = await self._get_embedding(text)
         if vector is None or vector.size == 0:
             logger.warning(f"Failed to get embedding for event {event_id}, creating singleton cluster")
             cluster_id = state.assign_new_cluster(event_id)
@@ -261,40 +481,40 @@ class ClusterManager:
         vector: np.ndarray,
         timestamp: Optional[float]
     ) -> Optional[str]:
-        """Find the best matching cluster for a vector."""
-        if not state.cluster_centroids:
+        """Find the best matching cluster for a vector.
+
+        Cosine similarity against all centroids is one matrix-vector product;
+        clusters whose last timestamp is too far away are masked out.
+        """
+        if state.centroid_dim == 0 or not state.centroid_ids:
             return None
-        
-        best_similarity = -1.0
-        best_cluster_id = None
-        
+
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
         vector_norm = np.linalg.norm(vector) + 1e-9
-        
-        for cluster_id, centroid in state.cluster_centroids.items():
-            if centroid is None or centroid.size == 0:
-                continue
-            
-            # Check time constraint
-            if timestamp is not None:
-                last_ts = state.cluster_last_ts.get(cluster_id)
-                if last_ts is not None:
-                    time_diff = abs(timestamp - last_ts)
-                    if time_diff > self.config.max_time_gap_seconds:
-                        continue
-            
-            # Compute cosine similarity
-            centroid_norm = np.linalg.norm(centroid) + 1e-9
-            similarity = float((centroid @ vector) / (centroid_norm * vector_norm))
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_cluster_id = cluster_id
-        
-        if best_similarity >= self.config.similarity_threshold:
-            return best_cluster_id
-        
+        similarities = (state.centroid_matrix @ vector) / (
+            state.centroid_norms * vector_norm
+        )
+
+        # Rows without an embedded member have no centroid yet
+        candidates = state.centroid_counts > 0
+        if timestamp is not None:
+            # Unknown (NaN) last timestamps never exceed the gap
+            with np.errstate(invalid="ignore"):
+                too_far = (
+                    np.abs(state.centroid_last_ts - timestamp)
+                    > self.config.max_time_gap_seconds
+                )
+            candidates &= ~too_far
+        if not candidates.any():
+            return None
+
+        similarities = np.where(candidates, similarities, -np.inf)
+        best_row = int(np.argmax(similarities))
+        if float(similarities[best_row]) >= self.config.similarity_threshold:
+            return state.centroid_ids[best_row]
+
         return None
-    
+
     async def _get_embedding(self, text: str) -> Optional[np.ndarray]:
         """Get embedding for text."""
         if not self._vectorize_service:
@@ -0,0 +1,336 @@
+"""
+Shared LLM HTTP client pool
+
+All LLM providers share one pool per process:
+- One keep-alive aiohttp session per base_url (no TCP/TLS handshake per call)
+- A global concurrency limit and a per-model concurrency limit
+- A per-model token bucket (optional requests/second limit) that adapts to 429
+  responses: the rate is halved and all callers of the model back off for
+  Retry-After (or an exponential, jittered delay), then the rate recovers
+  additively on success
+- With RATE_LIMIT_BACKEND=redis the per-model rate is also enforced across all
+  processes by the distributed rate limiter (key "llm:<model>")
+- Queue wait (tokens + slots) and in-flight latency are reported separately
+
+Usage:
+    pool = get_llm_client_pool()
+    async with pool.slot(model) as slot:
+        session = pool.get_session(base_url)
+        async with session.post(url, json=data) as response:
+            ...
+        slot.status = "success"
+
+The pool is closed on application shutdown (see BusinessLifespanProvider).
+"""
+
+import asyncio
+import os
+import random
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional, Union
+
+import aiohttp
+from aiolimiter import AsyncLimiter
+
+from agentic_layer.metrics.llm_metrics import (
+    record_llm_rate_limit_backoff,
+    record_llm_request,
+)
+from core.observation.logger import get_logger
+from core.rate_limit.rate_limiter import (
+    get_provider_rate_limiter,
+    is_distributed_rate_limit_enabled,
+)
+from core.rate_limit.redis_rate_limiter import RedisRateLimiter
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class LLMClientPoolConfig:
+    """LLM client pool configuration"""
+
+    # Connections per base_url session
+    max_connections: int = 100
+    keepalive_timeout: float = 30.0
+    request_timeout: float = 600.0
+    # Concurrency limits (0 = unlimited)
+    max_concurrent: int = 64
+    max_concurrent_per_model: int = 16
+    # Token bucket per model (requests/second, 0 = no rate limit)
+    rate_limit_rps: float = 0.0
+    rate_limit_burst: int = 10
+    # 429 backoff when the response carries no Retry-After
+    backoff_base: float = 1.0
+    backoff_max: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "LLMClientPoolConfig":
+        return cls(
+            max_connections=int(os.getenv("LLM_POOL_MAX_CONNECTIONS", "100")),
+            keepalive_timeout=float(os.getenv("LLM_POOL_KEEPALIVE_SECONDS", "30")),
+            request_timeout=float(os.getenv("LLM_REQUEST_TIMEOUT", "600")),
+            max_concurrent=int(os.getenv("LLM_MAX_CONCURRENT", "64")),
+            max_concurrent_per_model=int(
+                os.getenv("LLM_MAX_CONCURRENT_PER_MODEL", "16")
+            ),
+            rate_limit_rps=float(os.getenv("LLM_RATE_LIMIT_RPS", "0")),
+            rate_limit_burst=int(os.getenv("LLM_RATE_LIMIT_BURST", "10")),
+            backoff_base=float(os.getenv("LLM_RATE_LIMIT_BACKOFF_BASE", "1")),
+            backoff_max=float(os.getenv("LLM_RATE_LIMIT_BACKOFF_MAX", "60")),
+        )
+
+
+class AdaptiveTokenBucket:
+    """
+    Token bucket whose rate reacts to 429 responses (AIMD)
+
+    With rate 0 there is no rate limit, but 429 backoff still pauses all callers.
+    A shared limiter, if given, is acquired after the local token (global quota).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        shared_limiter: Optional[Union[AsyncLimiter, RedisRateLimiter]] = None,
+    ):
+        self.max_rate = max(rate, 0.0)
+        self.rate = self.max_rate
+        self.min_rate = self.max_rate / 16
+        self.burst = max(burst, 1)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.shared_limiter = shared_limiter
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._pause_until = 0.0
+        self._consecutive_limited = 0
+        # Serializes waiters so tokens are handed out in FIFO order
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent"""
+        async with self._lock:
+            await self._acquire_local()
+            if self.shared_limiter is not None:
+                await self.shared_limiter.acquire()
+
+    async def _acquire_local(self) -> None:
+        while True:
+            now = time.monotonic()
+            if now < self._pause_until:
+                await asyncio.sleep(self._pause_until - now)
+                continue
+            if self.rate <= 0:
+                return
+            self._refill(now)
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> float:
+        """
+        Register a 429 response
+
+        Returns:
+            float: Backoff applied to all callers, in seconds
+        """
+        self._consecutive_limited += 1
+        if retry_after is not None and retry_after >= 0:
+            backoff = min(retry_after, self.backoff_max)
+        else:
+            exp = self.backoff_base * (2 ** (self._consecutive_limited - 1))
+            # Full jitter avoids synchronized retries
+            backoff = random.uniform(0, min(exp, self.backoff_max))
+        self._pause_until = max(self._pause_until, time.monotonic() + backoff)
+        if self.max_rate > 0:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+        return backoff
+
+    def on_success(self) -> None:
+        """Register a successful response (additive rate recovery)"""
+        self._consecutive_limited = 0
+        if self.max_rate > 0 and self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+class LLMRequestSlot:
+    """Permission to send one request, carries the outcome for metrics"""
+
+    def __init__(self, model: str, queue_wait: float):
+        self.model = model
+        self.queue_wait = queue_wait
+        self.status = "error"
+
+
+class LLMClientPool:
+    """Process-wide pool of LLM HTTP sessions and limiters"""
+
+    def __init__(self, config: Optional[LLMClientPoolConfig] = None):
+        self.config = config or LLMClientPoolConfig()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._global_semaphore: Optional[asyncio.Semaphore] = None
+        self._model_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._buckets: Dict[str, AdaptiveTokenBucket] = {}
+
+    def _bind_loop(self) -> None:
+        """Sessions and asyncio primitives belong to one event loop, reset on change"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            logger.debug("Event loop changed, resetting LLM client pool")
+        self._loop = loop
+        self._sessions = {}
+        self._model_semaphores = {}
+        self._buckets = {}
+        self._global_semaphore = (
+            asyncio.Semaphore(self.config.max_concurrent)
+            if self.config.max_concurrent > 0
+            else None
+        )
+
+    def get_session(self, base_url: str) -> aiohttp.ClientSession:
+        """Get the shared keep-alive session for a base_url"""
+        self._bind_loop()
+        session = self._sessions.get(base_url)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                keepalive_timeout=self.config.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.request_timeout),
+            )
+            self._sessions[base_url] = session
+            logger.info(f"Created LLM client session: base_url={base_url}")
+        return session
+
+    def get_bucket(self, model: str) -> AdaptiveTokenBucket:
+        self._bind_loop()
+        bucket = self._buckets.get(model)
+        if bucket is None:
+            shared_limiter = None
+            if is_distributed_rate_limit_enabled():
+                shared_limiter = get_provider_rate_limiter(
+                    f"llm:{model}",
+                    self.config.rate_limit_rps,
+                    self.config.rate_limit_burst,
+                    distributed=True,
+                )
+            bucket = AdaptiveTokenBucket(
+                rate=self.config.rate_limit_rps,
+                burst=self.config.rate_limit_burst,
+                backoff_base=self.config.backoff_base,
+                backoff_max=self.config.backoff_max,
+                shared_limiter=shared_limiter,
+            )
+            self._buckets[model] = bucket
+        return bucket
+
+    def _get_model_semaphore(self, model: str) -> Optional[asyncio.Semaphore]:
+        if self.config.max_concurrent_per_model <= 0:
+            return None
+        semaphore = self._model_semaphores.get(model)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_per_model)
+            self._model_semaphores[model] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def slot(self, model: str) -> AsyncIterator[LLMRequestSlot]:
+        """
+        Wait for a rate limit token and concurrency slots, then hold them for one request
+
+        Set `slot.status` inside the block; queue wait and in-flight time are
+        recorded when the block exits.
+        """
+        self._bind_loop()
+        start = time.perf_counter()
+        bucket = self.get_bucket(model)
+        await bucket.acquire()
+
+        model_semaphore = self._get_model_semaphore(model)
+        global_semaphore = self._global_semaphore
+        if model_semaphore is not None:
+            await model_semaphore.acquire()
+        try:
+            if global_semaphore is not None:
+                await global_semaphore.acquire()
+            try:
+                sent_at = time.perf_counter()
+                slot = LLMRequestSlot(model, queue_wait=sent_at - start)
+                try:
+                    yield slot
+                except asyncio.TimeoutError:
+                    slot.status = "timeout"
+                    raise
+                finally:
+                    record_llm_request(
+                        model=model,
+                        status=slot.status,
+                        queue_wait_seconds=slot.queue_wait,
+                        in_flight_seconds=time.perf_counter() - sent_at,
+                    )
+                    if slot.status == "success":
+                        bucket.on_success()
+            finally:
+                if global_semaphore is not None:
+                    global_semaphore.release()
+        finally:
+            if model_semaphore is not None:
+                model_semaphore.release()
+
+    def on_rate_limited(self, model: str, retry_after: Optional[float] = None) -> float:
+        """Back off all requests of a model after a 429, returns the backoff in seconds"""
+        backoff = self.get_bucket(model).on_rate_limited(retry_after)
+        record_llm_rate_limit_backoff(model, backoff)
+        return backoff
+
+    async def close(self) -> None:
+        """Close all sessions"""
+        sessions, self._sessions = self._sessions, {}
+        for base_url, session in sessions.items():
+            try:
+                if not session.closed:
+                    await session.close()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to close LLM client session: base_url={base_url}, error={e}"
+                )
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (HTTP dates are ignored)"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+_llm_client_pool: Optional[LLMClientPool] = None
+
+
+def get_llm_client_pool() -> LLMClientPool:
+    """Get the process-wide LLM client pool (configured from environment variables)"""
+    global _llm_client_pool
+    if _llm_client_pool is None:
+        _llm_client_pool = LLMClientPool(LLMClientPoolConfig.from_env())
+    return _llm_client_pool
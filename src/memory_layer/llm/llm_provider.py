@@ -1,5 +1,8 @@
 import os
+from typing import Optional
+
 from memory_layer.llm.openai_provider import OpenAIProvider
+from memory_layer.llm.response_cache import build_llm_cache_key, get_llm_response_cache
 
 
 class LLMProvider:
@@ -20,7 +23,49 @@ class LLMProvider:
         max_tokens: int | None = None,
         extra_body: dict | None = None,
         response_format: dict | None = None,
+        cache_site: Optional[str] = None,
+        refresh_cache: bool = False,
     ) -> str:
-        return await self.provider.generate(
+        """
+        Generate a response for the given prompt.
+
+        Args:
+            cache_site: Opt in to the LLM response cache for this call site (used as
+                metrics label); no caching when None or when no backend is configured
+            refresh_cache: Skip the cache lookup but store the new response, e.g. when
+                retrying because the previous (possibly cached) response was unusable
+        """
+        cache = get_llm_response_cache() if cache_site else None
+        if cache is None:
+            return await self.provider.generate(
+                prompt, temperature, max_tokens, extra_body, response_format
+            )
+
+        key = build_llm_cache_key(
+            provider_type=self.provider_type,
+            model=getattr(self.provider, "model", ""),
+            prompt=prompt,
+            temperature=(
+                temperature
+                if temperature is not None
+                else getattr(self.provider, "temperature", None)
+            ),
+            max_tokens=(
+                max_tokens
+                if max_tokens is not None
+                else getattr(self.provider, "max_tokens", None)
+            ),
+            response_format=response_format,
+            extra_body=extra_body,
+        )
+        if not refresh_cache:
+            cached = await cache.get(key, cache_site)
+            if cached is not None:
+                return cached
+
+        response = await self.provider.generate(
             prompt, temperature, max_tokens, extra_body, response_format
         )
+        if response:
+            await cache.set(key, response)
+        return response
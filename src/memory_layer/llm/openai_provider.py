@@ -13,9 +13,8 @@ import urllib.parse
 import urllib.error
 import aiohttp
 from typing import Optional
-import asyncio
-import random
 
+from memory_layer.llm.client_pool import get_llm_client_pool, parse_retry_after
 from memory_layer.llm.protocol import LLMProvider, LLMError
 from core.observation.logger import get_logger
 
@@ -116,35 +115,47 @@ class OpenAIProvider(LLMProvider):
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.api_key}',
         }
+        pool = get_llm_client_pool()
         max_retries = 5
         for retry_num in range(max_retries):
             try:
-                timeout = aiohttp.ClientTimeout(total=600)
-                async with aiohttp.ClientSession(timeout=timeout) as session:
+                # Waits for rate limit tokens / concurrency slots, reuses keep-alive connections
+                async with pool.slot(self.model) as slot:
+                    session = pool.get_session(self.base_url)
                     async with session.post(
                         f"{self.base_url}/chat/completions", json=data, headers=headers
                     ) as response:
-                        chunks = []
-                        async for chunk in response.content.iter_any():
-                            chunks.append(chunk)
-                        test = b"".join(chunks).decode()
-                        response_data = json.loads(test)
-                        # print(response_data)
+                        body = (await response.read()).decode()
+                        try:
+                            response_data = json.loads(body)
+                        except json.JSONDecodeError:
+                            if response.status == 200:
+                                raise
+                            response_data = {}
                         # Handle error responses
                         if response.status != 200:
-                            error_msg = response_data.get('error', {}).get(
-                                'message', f"HTTP {response.status}"
-                            )
+                            error = response_data.get('error') or {}
+                            error_msg = (
+                                error.get('message')
+                                if isinstance(error, dict)
+                                else None
+                            ) or f"HTTP {response.status}"
                             logger.error(
                                 f"❌ [OpenAI-{self.model}] HTTP error {response.status}:"
                             )
                             logger.error(f"   💬 Error message: {error_msg}")
-                            # Debug: 429 Too Many Requests breakpoint debugging
                             if response.status == 429:
+                                # Back off all requests to this model, not just this one
+                                slot.status = "rate_limited"
+                                backoff = pool.on_rate_limited(
+                                    self.model,
+                                    parse_retry_after(
+                                        response.headers.get("Retry-After")
+                                    ),
+                                )
                                 logger.warning(
-                                    f"429 Too Many Requests, waiting for 10 seconds"
+                                    f"429 Too Many Requests, backing off {backoff:.1f}s"
                                 )
-                                await asyncio.sleep(random.randint(5, 20))
 
                             raise LLMError(f"HTTP Error {response.status}: {error_msg}")
 
@@ -201,7 +212,9 @@ class OpenAIProvider(LLMProvider):
                                 'timestamp': time.time(),
                             }
 
-                        return response_data['choices'][0]['message']['content']
+                        content = response_data['choices'][0]['message']['content']
+                        slot.status = "success"
+                        return content
 
             except aiohttp.ClientError as e:
                 error_time = time.perf_counter()
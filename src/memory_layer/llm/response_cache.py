@@ -0,0 +1,295 @@
+"""
+Content-addressed LLM response cache
+
+Caches completions by a hash of (provider, model, prompt, temperature, max_tokens,
+response_format, extra_body), so replays, backfills and retried extractions do not
+pay for identical prompts twice.
+
+Caching is opt-in per call site: `LLMProvider.generate(..., cache_site="episode")`.
+The backend is selected with LLM_RESPONSE_CACHE_BACKEND:
+- none (default): caching disabled
+- disk: local SQLite file, TTL + least-recently-used eviction above max entries
+- redis: shared Redis (tenant-prefixed keys), TTL + LRU index trimmed to max entries
+
+Cache failures are logged and treated as misses, they never fail the LLM call.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional
+
+from agentic_layer.metrics.llm_metrics import record_llm_response_cache
+from core.observation.logger import get_logger
+
+logger = get_logger(__name__)
+
+LLM_RESPONSE_CACHE_KEY_PREFIX = "llm_response"
+
+DEFAULT_LLM_RESPONSE_CACHE_TTL = 7 * 24 * 60 * 60
+DEFAULT_LLM_RESPONSE_CACHE_MAX_ENTRIES = 100_000
+
+
+def build_llm_cache_key(
+    provider_type: str,
+    model: str,
+    prompt: str,
+    temperature: Optional[float],
+    max_tokens: Optional[int],
+    response_format: Optional[dict] = None,
+    extra_body: Optional[dict] = None,
+) -> str:
+    """Build the content hash identifying an LLM request"""
+    payload = json.dumps(
+        {
+            "provider": provider_type,
+            "model": model,
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_format": response_format,
+            "extra_body": extra_body,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache(ABC):
+    """LLM response cache backend (records hit/miss metrics, swallows errors)"""
+
+    backend_name: str = ""
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+    async def get(self, key: str, call_site: str) -> Optional[str]:
+        """Get a cached response, None on miss or error"""
+        try:
+            response = await self._get(key)
+        except Exception as e:
+            logger.warning(
+                f"LLM response cache read failed: backend={self.backend_name}, error={e}"
+            )
+            record_llm_response_cache(self.backend_name, call_site, "error")
+            return None
+        record_llm_response_cache(
+            self.backend_name, call_site, "hit" if response is not None else "miss"
+        )
+        return response
+
+    async def set(self, key: str, response: str) -> None:
+        """Store a response"""
+        try:
+            await self._set(key, response)
+        except Exception as e:
+            logger.warning(
+                f"LLM response cache write failed: backend={self.backend_name}, error={e}"
+            )
+
+    @abstractmethod
+    async def _get(self, key: str) -> Optional[str]: ...
+
+    @abstractmethod
+    async def _set(self, key: str, response: str) -> None: ...
+
+    async def close(self) -> None:
+        """Release backend resources"""
+
+
+class DiskLLMResponseCache(LLMResponseCache):
+    """SQLite-backed local cache"""
+
+    backend_name = "disk"
+
+    # Expired/overflow entries are purged every N writes
+    EVICT_EVERY_WRITES = 64
+
+    def __init__(self, cache_dir: str, ttl_seconds: int, max_entries: int):
+        super().__init__(ttl_seconds, max_entries)
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, "llm_responses.sqlite3")
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed_at "
+            "ON llm_responses (accessed_at)"
+        )
+
+    async def _get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def _set(self, key: str, response: str) -> None:
+        await asyncio.to_thread(self._set_sync, key, response)
+
+    def _get_sync(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, created_at = row
+            if self.ttl_seconds > 0 and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return response
+
+    def _set_sync(self, key: str, response: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, response, now, now),
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY_WRITES == 0:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        if self.ttl_seconds > 0:
+            self._conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            )
+        if self.max_entries > 0:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM llm_responses"
+            ).fetchone()
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM llm_responses WHERE key IN ("
+                    "SELECT key FROM llm_responses ORDER BY accessed_at LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisLLMResponseCache(LLMResponseCache):
+    """Redis-backed shared cache with an LRU index sorted set"""
+
+    backend_name = "redis"
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        super().__init__(ttl_seconds, max_entries)
+        # Lazy load RedisProvider to avoid circular dependency
+        self._redis_provider = None
+
+    async def _get_client(self):
+        if self._redis_provider is None:
+            from core.component.redis_provider import RedisProvider
+            from core.di.utils import get_bean_by_type
+
+            self._redis_provider = get_bean_by_type(RedisProvider)
+        return await self._redis_provider.get_client()
+
+    def _build_key(self, key: str) -> str:
+        from core.tenants.tenantize.kv.redis.tenant_key_utils import (
+            patch_redis_tenant_key,
+        )
+
+        return patch_redis_tenant_key(f"{LLM_RESPONSE_CACHE_KEY_PREFIX}:{key}")
+
+    def _build_index_key(self) -> str:
+        return self._build_key("index")
+
+    async def _get(self, key: str) -> Optional[str]:
+        client = await self._get_client()
+        redis_key = self._build_key(key)
+        response = await client.get(redis_key)
+        if response is not None:
+            await client.zadd(self._build_index_key(), {redis_key: time.time()})
+        return response
+
+    async def _set(self, key: str, response: str) -> None:
+        client = await self._get_client()
+        redis_key = self._build_key(key)
+        index_key = self._build_index_key()
+        now = time.time()
+
+        pipe = client.pipeline()
+        if self.ttl_seconds > 0:
+            pipe.set(redis_key, response, ex=self.ttl_seconds)
+            pipe.zremrangebyscore(index_key, "-inf", now - self.ttl_seconds)
+        else:
+            pipe.set(redis_key, response)
+        pipe.zadd(index_key, {redis_key: now})
+        pipe.zcard(index_key)
+        results = await pipe.execute()
+
+        overflow = results[-1] - self.max_entries if self.max_entries > 0 else 0
+        if overflow > 0:
+            evicted: List[Any] = await client.zpopmin(index_key, overflow)
+            if evicted:
+                await client.delete(*[member for member, _ in evicted])
+
+
+def create_llm_response_cache_from_env() -> Optional[LLMResponseCache]:
+    """Create the configured cache backend, None when caching is disabled"""
+    backend = os.getenv("LLM_RESPONSE_CACHE_BACKEND", "none").lower()
+    ttl_seconds = int(
+        os.getenv("LLM_RESPONSE_CACHE_TTL_SECONDS", str(DEFAULT_LLM_RESPONSE_CACHE_TTL))
+    )
+    max_entries = int(
+        os.getenv(
+            "LLM_RESPONSE_CACHE_MAX_ENTRIES",
+            str(DEFAULT_LLM_RESPONSE_CACHE_MAX_ENTRIES),
+        )
+    )
+
+    if backend in ("", "none"):
+        return None
+    if backend == "disk":
+        cache_dir = os.getenv("LLM_RESPONSE_CACHE_DIR", ".cache/llm_responses")
+        return DiskLLMResponseCache(cache_dir, ttl_seconds, max_entries)
+    if backend == "redis":
+        return RedisLLMResponseCache(ttl_seconds, max_entries)
+
+    logger.warning(f"Unknown LLM_RESPONSE_CACHE_BACKEND={backend}, caching disabled")
+    return None
+
+
+_llm_response_cache: Optional[LLMResponseCache] = None
+_llm_response_cache_initialized = False
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """Get the process-wide LLM response cache (None when disabled)"""
+    global _llm_response_cache, _llm_response_cache_initialized
+    if not _llm_response_cache_initialized:
+        _llm_response_cache_initialized = True
+        try:
+            _llm_response_cache = create_llm_response_cache_from_env()
+        except Exception as e:
+            logger.warning(f"Failed to initialize LLM response cache: {e}")
+            _llm_response_cache = None
+        if _llm_response_cache is not None:
+            logger.info(
+                f"LLM response cache enabled: backend={_llm_response_cache.backend_name}"
+            )
+    return _llm_response_cache
@@ -5,7 +5,7 @@ This module provides a simple and extensible base class for detecting
 boundaries in various types of content (conversations, emails, notes, etc.).
 """
 
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable
 from datetime import datetime
 from dataclasses import dataclass
 import uuid
@@ -47,9 +47,37 @@ class BoundaryDetectionResult:
     topic_summary: Optional[str] = None
 
 
+@dataclass
+class ConversationAccumulation:
+    """
+    Incremental view of the current accumulation window (messages since the last MemCell).
+
+    When history_loader is set, the extractor trusts the cached history counts instead of
+    processing and tokenizing history_raw_data_list, and only calls history_loader when the
+    history messages are actually needed (force split or LLM boundary detection).
+    The output fields are filled by the extractor so the caller can update its cached state
+    without tokenizing the same messages again.
+    """
+
+    # Inputs (from cached accumulation state)
+    history_raw_count: int = 0
+    history_message_count: int = 0
+    history_token_count: int = 0
+    history_loader: Optional[Callable[[], Awaitable[List[Dict[str, Any]]]]] = None
+
+    # Outputs (filled by the extractor)
+    history_message_dict_list: Optional[List[Dict[str, Any]]] = None
+    new_message_dict_list: Optional[List[Dict[str, Any]]] = None
+    new_token_count: int = 0
+
+    @property
+    def cached(self) -> bool:
+        return self.history_loader is not None
+
+
 @dataclass
 class ConversationMemCellExtractRequest(MemCellExtractRequest):
-    pass
+    accumulation: Optional[ConversationAccumulation] = None
 
 
 class ConvMemCellExtractor(MemCellExtractor):
@@ -308,7 +336,9 @@ class ConvMemCellExtractor(MemCellExtractor):
         )
         for i in range(5):
             try:
-                resp = await self.llm_provider.generate(prompt)
+                resp = await self.llm_provider.generate(
+                    prompt, cache_site="boundary_detection", refresh_cache=i > 0
+                )
                 logger.debug(
                     f"[ConversationEpisodeBuilder] Boundary response length: {len(resp)} chars"
                 )
@@ -380,11 +410,14 @@ class ConvMemCellExtractor(MemCellExtractor):
         - event_log: filled by EventLogExtractor
         - extend['embedding']: filled by MemoryManager
         """
-        history_message_dict_list = []
-        for raw_data in request.history_raw_data_list:
-            processed_data = self._data_process(raw_data)
-            if processed_data is not None:  # Filter out unsupported message types
-                history_message_dict_list.append(processed_data)
+        accumulation = request.accumulation
+        history_message_dict_list = None
+        if accumulation is None or not accumulation.cached:
+            history_message_dict_list = []
+            for raw_data in request.history_raw_data_list:
+                processed_data = self._data_process(raw_data)
+                if processed_data is not None:  # Filter out unsupported message types
+                    history_message_dict_list.append(processed_data)
 
         # Check if the last new_raw_data is None
         if (
@@ -413,10 +446,23 @@ class ConvMemCellExtractor(MemCellExtractor):
 
         # === Force split check (token limit or message limit) ===
         # Calculate tokens for history + new messages combined
-        accumulated_tokens = self._count_tokens(history_message_dict_list)
+        # (history counts come from the accumulation state when it is cached)
+        if history_message_dict_list is None:
+            accumulated_tokens = accumulation.history_token_count
+            history_message_count = accumulation.history_message_count
+        else:
+            accumulated_tokens = self._count_tokens(history_message_dict_list)
+            history_message_count = len(history_message_dict_list)
         new_tokens = self._count_tokens(new_message_dict_list)
         total_tokens = accumulated_tokens + new_tokens
-        total_messages = len(history_message_dict_list) + len(new_message_dict_list)
+        total_messages = history_message_count + len(new_message_dict_list)
+
+        if accumulation is not None:
+            accumulation.history_token_count = accumulated_tokens
+            accumulation.history_message_count = history_message_count
+            accumulation.history_message_dict_list = history_message_dict_list
+            accumulation.new_message_dict_list = new_message_dict_list
+            accumulation.new_token_count = new_tokens
 
         # Check if force split is needed (before calling LLM)
         needs_force_split = (
@@ -424,10 +470,13 @@ class ConvMemCellExtractor(MemCellExtractor):
             or total_messages >= self.hard_message_limit
         )
 
-        if needs_force_split and len(history_message_dict_list) >= 2:
+        if needs_force_split and history_message_count >= 2:
             # Force split: create MemCell from history, new message starts next accumulation
             trigger_type = 'token_limit' if total_tokens >= self.hard_token_limit else 'message_limit'
-            
+            history_message_dict_list = await self._load_history(
+                history_message_dict_list, accumulation
+            )
+
             logger.debug(
                 f"[ConvMemCellExtractor] Force split triggered: "
                 f"tokens={total_tokens}/{self.hard_token_limit}, "
@@ -473,11 +522,18 @@ class ConvMemCellExtractor(MemCellExtractor):
             # Needs split but not enough messages (single long message case)
             # Don't split, just log warning and continue normal flow
             logger.debug(
-                f"[ConvMemCellExtractor] Exceeds limits but only {len(history_message_dict_list)} history messages, "
+                f"[ConvMemCellExtractor] Exceeds limits but only {history_message_count} history messages, "
                 f"not splitting single message. tokens={total_tokens}, messages={total_messages}"
             )
 
         # === Normal LLM-based boundary detection ===
+        if history_message_count:
+            history_message_dict_list = await self._load_history(
+                history_message_dict_list, accumulation
+            )
+        else:
+            history_message_dict_list = []
+
         if request.smart_mask_flag:
             boundary_detection_result = await self._detect_boundary(
                 conversation_history=history_message_dict_list[:-1],
@@ -540,6 +596,19 @@ class ConvMemCellExtractor(MemCellExtractor):
             logger.debug(f"⏳ Waiting for more messages: {reason}")
         return (None, status_control_result)
 
+    async def _load_history(
+        self,
+        history_message_dict_list: Optional[List[Dict[str, Any]]],
+        accumulation: Optional[ConversationAccumulation],
+    ) -> List[Dict[str, Any]]:
+        """Return processed history messages, loading them from the accumulation state if needed"""
+        if history_message_dict_list is not None:
+            return history_message_dict_list
+
+        history_message_dict_list = await accumulation.history_loader()
+        accumulation.history_message_dict_list = history_message_dict_list
+        return history_message_dict_list
+
     def _data_process(self, raw_data: RawData) -> Dict[str, Any]:
         """Process raw data, including message type filtering and preprocessing"""
         content = (
@@ -264,7 +264,9 @@ class EpisodeMemoryExtractor(MemoryExtractor):
         for i in range(5):
             try:
                 prompt = prompt_template.format(**format_params)
-                response = await self.llm_provider.generate(prompt)
+                response = await self.llm_provider.generate(
+                    prompt, cache_site="episode", refresh_cache=i > 0
+                )
 
                 # Parse JSON
                 if '```json' in response:
@@ -157,6 +157,7 @@ class EventLogExtractor:
         user_id: str = "",
         ori_event_id_list: Optional[List[str]] = None,
         group_id: Optional[str] = None,
+        refresh_cache: bool = False,
     ) -> Optional[EventLog]:
         """
         Extract event log from episode memory
@@ -167,6 +168,7 @@ class EventLogExtractor:
             user_id: User ID for the event log
             ori_event_id_list: Original event ID list
             group_id: Group ID
+            refresh_cache: Bypass cached LLM responses (set on retries)
 
         Returns:
             EventLog: Extracted event log, return None if extraction fails
@@ -181,7 +183,9 @@ class EventLogExtractor:
         prompt = prompt.replace("{{TIME}}", time_str)
 
         # 3. Call LLM to generate event log
-        response = await self.llm_provider.generate(prompt)
+        response = await self.llm_provider.generate(
+            prompt, cache_site="event_log", refresh_cache=refresh_cache
+        )
 
         # 4. Parse LLM response
         data = self._parse_llm_response(response)
@@ -273,6 +277,7 @@ class EventLogExtractor:
                     user_id=user_id,
                     ori_event_id_list=ori_event_id_list,
                     group_id=group_id,
+                    refresh_cache=retry > 0,
                 )
             except Exception as e:
                 logger.warning(f"Retrying to extract event log {retry+1}/5: {e}")
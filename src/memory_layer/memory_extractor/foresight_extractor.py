@@ -117,7 +117,10 @@ class ForesightExtractor(MemoryExtractor):
                     f"📝 Starting LLM call to generate foresight associations, prompt length: {len(prompt)}"
                 )
                 response = await self.llm_provider.generate(
-                    prompt=prompt, temperature=0.3
+                    prompt=prompt,
+                    temperature=0.3,
+                    cache_site="foresight",
+                    refresh_cache=retry > 0,
                 )
                 logger.debug(
                     f"✅ LLM call completed, response length: {len(response) if response else 0}"
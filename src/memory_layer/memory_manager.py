@@ -15,6 +15,7 @@ from memory_layer.llm.llm_provider import LLMProvider
 from memory_layer.memcell_extractor.conv_memcell_extractor import ConvMemCellExtractor
 from memory_layer.memcell_extractor.base_memcell_extractor import RawData
 from memory_layer.memcell_extractor.conv_memcell_extractor import (
+    ConversationAccumulation,
     ConversationMemCellExtractRequest,
 )
 from api_specs.memory_types import (
@@ -81,6 +82,7 @@ class MemoryManager:
         group_name: Optional[str] = None,
         user_id_list: Optional[List[str]] = None,
         old_memory_list: Optional[List[BaseMemory]] = None,
+        accumulation: Optional[ConversationAccumulation] = None,
     ) -> tuple[Optional[MemCell], Optional[StatusResult]]:
         """
         Extract MemCell (boundary detection + raw data)
@@ -93,6 +95,8 @@ class MemoryManager:
             group_name: Group name
             user_id_list: List of user IDs
             old_memory_list: List of historical memories
+            accumulation: Cached accumulation state; when cached, history_raw_data_list
+                may be empty and history is only loaded if boundary detection needs it
 
         Returns:
             (MemCell, StatusResult) or (None, StatusResult)
@@ -104,8 +108,12 @@ class MemoryManager:
             f"[MemoryManager] Starting boundary detection and creating MemCell"
         )
 
-        # Enable smart_mask when history has more than 5 messages 
-        smart_mask_flag = len(history_raw_data_list) > 5
+        # Enable smart_mask when history has more than 5 messages
+        if accumulation is not None and accumulation.cached:
+            history_raw_count = accumulation.history_raw_count
+        else:
+            history_raw_count = len(history_raw_data_list)
+        smart_mask_flag = history_raw_count > 5
 
         request = ConversationMemCellExtractRequest(
             history_raw_data_list,
@@ -115,6 +123,7 @@ class MemoryManager:
             group_name=group_name,
             old_memory_list=old_memory_list,
             smart_mask_flag=smart_mask_flag,
+            accumulation=accumulation,
         )
 
         extractor = ConvMemCellExtractor(self.llm_provider)
@@ -10,6 +10,7 @@ Provides multiple deletion methods:
 from typing import Optional
 from core.di.decorators import component
 from core.observation.logger import get_logger
+from agentic_layer.memory_read_cache import get_memcell_read_cache
 from infra_layer.adapters.out.persistence.repository.memcell_raw_repository import (
     MemCellRawRepository,
 )
@@ -31,6 +32,14 @@ class MemCellDeleteService:
         self.memcell_repository = memcell_repository
         logger.info("MemCellDeleteService initialized")
 
+    async def _invalidate_read_cache(self, event_id: Optional[str] = None) -> None:
+        """Drop deleted MemCells from the read cache (all of the tenant's if no event_id)"""
+        cache = get_memcell_read_cache()
+        if event_id:
+            await cache.invalidate([event_id])
+        else:
+            await cache.invalidate_all()
+
     async def delete_by_event_id(
         self, event_id: str, deleted_by: Optional[str] = None
     ) -> bool:
@@ -60,6 +69,7 @@ class MemCellDeleteService:
             )
 
             if result:
+                await self._invalidate_read_cache(event_id)
                 logger.info(
                     "Successfully deleted MemCell: event_id=%s, deleted_by=%s",
                     event_id,
@@ -109,6 +119,8 @@ class MemCellDeleteService:
             count = await self.memcell_repository.delete_by_user_id(
                 user_id=user_id, deleted_by=deleted_by
             )
+            if count:
+                await self._invalidate_read_cache()
 
             logger.info(
                 "Successfully deleted MemCells by user_id: user_id=%s, deleted_by=%s, count=%d",
@@ -163,6 +175,8 @@ class MemCellDeleteService:
             )
 
             count = result.modified_count if result else 0
+            if count:
+                await self._invalidate_read_cache()
 
             logger.info(
                 "Successfully deleted MemCells by group_id: group_id=%s, deleted_by=%s, count=%d",
@@ -260,6 +274,11 @@ class MemCellDeleteService:
             # Use delete_many to batch soft delete
             result = await MemCell.delete_many(filter_dict)
             count = result.modified_count if result else 0
+            if count:
+                # With an event_id filter at most that MemCell was removed
+                await self._invalidate_read_cache(
+                    event_id if "event_id" in filters_used else None
+                )
 
             logger.info(
                 "Successfully deleted MemCells: filters=%s, count=%d",
@@ -115,6 +115,86 @@ class MemoryRequestLogService:
 
         return saved_message_ids
 
+    async def save_request_logs_batch(
+        self,
+        requests: List[MemorizeRequest],
+        version: Optional[str] = None,
+        endpoint_name: Optional[str] = None,
+        method: Optional[str] = None,
+        url: Optional[str] = None,
+        raw_input_dicts: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> List[str]:
+        """
+        Save the messages of several MemorizeRequests with a single insert_many
+
+        Saved records have sync_status=-1 (pending confirmation), same as
+        save_request_logs. If the bulk insert fails, logs are saved one by one.
+
+        Args:
+            requests: MemorizeRequest objects (ordered)
+            version: API version (optional)
+            endpoint_name: Endpoint name (optional)
+            method: HTTP method (optional)
+            url: Request URL (optional)
+            raw_input_dicts: Raw input dictionary per request (optional, same order as requests)
+
+        Returns:
+            List[str]: List of saved message_ids
+        """
+        app_info = get_current_app_info()
+        request_id = app_info.get("request_id", "unknown")
+
+        logs: List[MemoryRequestLog] = []
+        for index, request in enumerate(requests):
+            raw_input_dict = raw_input_dicts[index] if raw_input_dicts else None
+            for raw_data in request.new_raw_data_list or []:
+                try:
+                    log = self._build_request_log(
+                        raw_data=raw_data,
+                        group_id=request.group_id,
+                        group_name=request.group_name,
+                        request_id=request_id,
+                        version=version,
+                        endpoint_name=endpoint_name,
+                        method=method,
+                        url=url,
+                        event_id=request_id,
+                        raw_input_dict=raw_input_dict,
+                    )
+                except Exception as e:
+                    logger.error(
+                        "Failed to build MemoryRequestLog: data_id=%s, error=%s",
+                        raw_data.data_id,
+                        e,
+                    )
+                    continue
+                if log is not None:
+                    logs.append(log)
+
+        if not logs:
+            logger.debug("No request logs to save in batch")
+            return []
+
+        repo = self._get_repository()
+        try:
+            await repo.create_batch(logs)
+            saved_logs = logs
+        except Exception as e:
+            logger.warning(
+                "Bulk save of %d request logs failed, saving one by one: %s",
+                len(logs),
+                e,
+            )
+            saved_logs = [log for log in logs if await repo.save(log) is not None]
+
+        saved_message_ids = [log.message_id for log in saved_logs]
+        logger.info(
+            "Saved %d request logs in batch (%d requests)",
+            len(saved_message_ids),
+            len(requests),
+        )
+        return saved_message_ids
+
     async def _save_single_raw_data(
         self,
         raw_data: RawData,
@@ -148,6 +228,52 @@ class MemoryRequestLogService:
         Returns:
             Optional[str]: Returns message_id if saved successfully, None otherwise
         """
+        memory_request_log = self._build_request_log(
+            raw_data=raw_data,
+            group_id=group_id,
+            group_name=group_name,
+            request_id=request_id,
+            version=version,
+            endpoint_name=endpoint_name,
+            method=method,
+            url=url,
+            event_id=event_id,
+            raw_input_dict=raw_input_dict,
+        )
+        if memory_request_log is None:
+            return None
+
+        # Save to MongoDB
+        await repo.save(memory_request_log)
+
+        logger.debug(
+            "Saved request log: group_id=%s, message_id=%s, content_preview=%s",
+            group_id,
+            memory_request_log.message_id,
+            (memory_request_log.content or "")[:50],
+        )
+
+        return memory_request_log.message_id
+
+    def _build_request_log(
+        self,
+        raw_data: RawData,
+        group_id: Optional[str],
+        group_name: Optional[str],
+        request_id: str,
+        version: Optional[str] = None,
+        endpoint_name: Optional[str] = None,
+        method: Optional[str] = None,
+        url: Optional[str] = None,
+        event_id: Optional[str] = None,
+        raw_input_dict: Optional[Dict[str, Any]] = None,
+    ) -> Optional[MemoryRequestLog]:
+        """
+        Build the MemoryRequestLog document for a single RawData (not saved)
+
+        Returns:
+            Optional[MemoryRequestLog]: None if the message has no group_id
+        """
         if not group_id:
             logger.debug("group_id is empty, skipping save")
             return None
@@ -219,18 +345,7 @@ class MemoryRequestLogService:
             event_id=event_id,
             # sync_status=-1 indicates a newly saved log record
         )
-
-        # Save to MongoDB
-        await repo.save(memory_request_log)
-
-        logger.debug(
-            "Saved request log: group_id=%s, message_id=%s, content_preview=%s",
-            group_id,
-            message_id,
-            (content or "")[:50],
-        )
-
-        return message_id
+        return memory_request_log
 
     def _parse_create_time(self, create_time: Any) -> Optional[str]:
         """Parse creation time and return ISO format string"""
@@ -0,0 +1,116 @@
+"""Unit tests for the vectorized cluster state."""
+
+import numpy as np
+import pytest
+
+from memory_layer.cluster_manager import (
+    ClusterManager,
+    ClusterManagerConfig,
+    ClusterState,
+)
+
+DAY = 24 * 60 * 60
+
+
+def _add(state: ClusterState, event_id: str, vector, timestamp, cluster_id=None):
+    vector = np.asarray(vector, dtype=np.float32)
+    if cluster_id is None:
+        cluster_id = state.assign_new_cluster(event_id)
+        state._update_cluster_centroid(cluster_id, vector, timestamp)
+    else:
+        state.add_to_cluster(event_id, cluster_id, vector, timestamp)
+    state.event_ids.append(event_id)
+    state.timestamps.append(timestamp)
+    return cluster_id
+
+
+def test_find_best_cluster_uses_similarity_and_time_gap():
+    manager = ClusterManager(
+        ClusterManagerConfig(similarity_threshold=0.8, max_time_gap_days=1)
+    )
+    state = ClusterState()
+    c0 = _add(state, "e0", [1.0, 0.0, 0.0], 0.0)
+    c1 = _add(state, "e1", [0.0, 1.0, 0.0], 10 * DAY)
+
+    assert manager._find_best_cluster(state, np.array([0.9, 0.1, 0.0]), 0.5 * DAY) == c0
+    # Closest centroid is too far away in time
+    assert manager._find_best_cluster(state, np.array([0.9, 0.1, 0.0]), 5 * DAY) is None
+    assert manager._find_best_cluster(state, np.array([0.1, 0.9, 0.0]), None) == c1
+    # Below similarity threshold
+    assert manager._find_best_cluster(state, np.array([0.0, 0.0, 1.0]), None) is None
+
+
+def test_centroid_running_mean_and_growth():
+    state = ClusterState()
+    cluster_ids = [
+        _add(state, f"e{i}", np.eye(4)[i % 4] * (i + 1), float(i)) for i in range(40)
+    ]
+    _add(state, "extra", [0.0, 2.0, 0.0, 0.0], 100.0, cluster_id=cluster_ids[0])
+
+    assert state.centroid_matrix.shape == (40, 4)
+    assert state.get_cluster_count(cluster_ids[0]) == 2
+    np.testing.assert_allclose(state.cluster_centroids[cluster_ids[0]], [0.5, 1, 0, 0])
+    np.testing.assert_allclose(
+        state.centroid_norms[0], np.linalg.norm([0.5, 1.0]), rtol=1e-5
+    )
+    assert state.cluster_last_ts[cluster_ids[0]] == 100.0
+
+
+def test_binary_roundtrip_and_legacy_lists():
+    state = ClusterState()
+    c0 = _add(state, "e0", [0.25, 0.5, 1.0], 1.0)
+    _add(state, "e1", [1.0, 0.0, 0.0], 2.0, cluster_id=c0)
+
+    binary = state.to_dict(binary=True)
+    assert isinstance(binary["cluster_centroids"][c0], bytes)
+    assert len(binary["cluster_centroids"][c0]) == 3 * 4
+
+    for data in (binary, state.to_dict()):
+        restored = ClusterState.from_dict(data)
+        np.testing.assert_allclose(restored.centroid_matrix, state.centroid_matrix)
+        np.testing.assert_allclose(restored.centroid_norms, state.centroid_norms)
+        assert restored.cluster_counts == {c0: 2}
+        assert restored.cluster_last_ts == {c0: 2.0}
+        assert restored.eventid_to_cluster == state.eventid_to_cluster
+
+
+def test_delta_contains_only_new_events_and_touched_cluster():
+    state = ClusterState()
+    c0 = _add(state, "e0", [1.0, 0.0], 1.0)
+    c1 = _add(state, "e1", [0.0, 1.0], 2.0)
+    state = ClusterState.from_dict(state.to_dict(binary=True))
+
+    _add(state, "e2", [0.0, 3.0], 3.0, cluster_id=c1)
+    delta = state.to_delta()
+
+    assert delta["event_ids"] == ["e2"]
+    assert delta["cluster_ids"] == [c1]
+    assert delta["eventid_to_cluster"] == {"e2": c1}
+    assert set(delta["cluster_centroids"]) == {c1}
+    assert c0 not in delta["cluster_counts"]
+    np.testing.assert_allclose(
+        np.frombuffer(delta["cluster_centroids"][c1], dtype="<f4"), [0.0, 2.0]
+    )
+
+    state.mark_synced()
+    assert state.to_delta()["event_ids"] == []
+    assert state.to_delta()["cluster_centroids"] == {}
+
+
+@pytest.mark.asyncio
+async def test_cluster_memcell_reuses_precomputed_vector():
+    manager = ClusterManager(ClusterManagerConfig(similarity_threshold=0.8))
+    manager._vectorize_service = None  # any embedding call would fail
+    state = ClusterState()
+
+    first, state = await manager.cluster_memcell(
+        {"event_id": "e0", "episode": "a", "timestamp": 1.0}, state, vector=[1.0, 0.0]
+    )
+    second, state = await manager.cluster_memcell(
+        {"event_id": "e1", "episode": "b", "timestamp": 2.0}, state, vector=[0.9, 0.1]
+    )
+
+    assert first == second
+    assert state.get_cluster_count(first) == 2
+    assert manager.get_stats()["reused_embeddings"] == 2
+    assert manager.get_stats()["failed_embeddings"] == 0
@@ -0,0 +1,51 @@
+"""Unit tests for the consistent hash ring used by the Redis group queue."""
+
+import hashlib
+
+import pytest
+
+from core.queue.redis_group_queue.consistent_hash_ring import (
+    ConsistentHashRing,
+    ring_point,
+)
+
+PARTITIONS = [f"{i:03d}" for i in range(1, 51)]
+GROUPS = [f"group-{i}" for i in range(2000)]
+
+
+def test_ring_point_is_first_32_bits_of_sha1():
+    expected = int(hashlib.sha1(b"group-1").hexdigest()[:8], 16)
+    assert ring_point("group-1") == expected
+    assert 0 <= ring_point("anything") < 2**32
+
+
+def test_assignment_is_deterministic_and_order_independent():
+    forward = ConsistentHashRing(PARTITIONS).assign(GROUPS)
+    backward = ConsistentHashRing(list(reversed(PARTITIONS))).assign(GROUPS)
+    assert forward == backward
+
+
+def test_removing_a_node_only_moves_its_keys():
+    before = ConsistentHashRing(PARTITIONS).assign(GROUPS)
+    after = ConsistentHashRing([p for p in PARTITIONS if p != "007"]).assign(GROUPS)
+
+    for group in GROUPS:
+        if before[group] != "007":
+            assert after[group] == before[group]
+
+
+def test_growing_partition_count_only_moves_groups_to_new_partitions():
+    small = ConsistentHashRing([f"{i:03d}" for i in range(1, 51)]).assign(GROUPS)
+    large = ConsistentHashRing([f"{i:03d}" for i in range(1, 61)]).assign(GROUPS)
+
+    moved = [g for g in GROUPS if small[g] != large[g]]
+    assert all(int(large[g]) > 50 for g in moved)
+    # About 10 / 60 of the groups move; modulo routing would move ~5 / 6
+    assert len(moved) < len(GROUPS) * 0.3
+
+
+def test_invalid_rings_are_rejected():
+    with pytest.raises(ValueError):
+        ConsistentHashRing([])
+    with pytest.raises(ValueError):
+        ConsistentHashRing(["owner-a"], virtual_nodes=0)
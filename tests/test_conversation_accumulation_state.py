@@ -0,0 +1,327 @@
+"""Unit tests for the conversation accumulation state."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from api_specs.dtos import MemorizeRequest, RawData
+from api_specs.memory_types import MemCell, RawDataType
+from biz_layer import mem_memorize
+from biz_layer.conversation_accumulation_state import (
+    ConversationAccumulationState,
+    ConversationAccumulationStateService,
+    build_accumulation_anchor,
+)
+from biz_layer.mem_memorize import AccumulationContext, update_accumulation_state
+from memory_layer.memcell_extractor.conv_memcell_extractor import (
+    BoundaryDetectionResult,
+    ConvMemCellExtractor,
+    ConversationAccumulation,
+    ConversationMemCellExtractRequest,
+)
+
+
+def test_state_json_roundtrip():
+    state = ConversationAccumulationState(
+        group_id="group_1",
+        anchor="1700000000000",
+        message_ids=["m1", "m2", "m3"],
+        message_count=2,
+        token_count=42,
+    )
+
+    restored = ConversationAccumulationState.from_json(state.to_json())
+
+    assert restored == state
+    assert restored.raw_message_count == 3
+    assert restored.in_flight is False
+
+
+def test_anchor_is_empty_before_first_memcell():
+    assert build_accumulation_anchor(None) == ""
+    assert build_accumulation_anchor("") == ""
+
+
+def test_anchor_matches_across_representations_at_millisecond_precision():
+    memcell_time = datetime(2025, 1, 1, 8, 0, 0, 123456, tzinfo=timezone.utc)
+    # MongoDB truncates to milliseconds and may return another timezone
+    stored_time = memcell_time.replace(microsecond=123000).astimezone(
+        timezone(timedelta(hours=8))
+    )
+
+    anchor = build_accumulation_anchor(memcell_time)
+
+    assert anchor == build_accumulation_anchor(stored_time)
+    assert anchor == build_accumulation_anchor(memcell_time.isoformat())
+    assert anchor != build_accumulation_anchor(memcell_time + timedelta(seconds=1))
+
+
+# ============================================================
+# State service (Redis faked)
+# ============================================================
+
+
+class FakeRedisProvider:
+    def __init__(self, client):
+        self.client = client
+
+    async def get_client(self):
+        return self.client
+
+
+@pytest.fixture
+def state_service():
+    fakeredis = pytest.importorskip("fakeredis")
+    service = ConversationAccumulationStateService()
+    service.enabled = True
+    service._redis_provider = FakeRedisProvider(
+        fakeredis.FakeAsyncRedis(decode_responses=True)
+    )
+    return service
+
+
+def _message(index):
+    return {"speaker_name": "Alice", "content": f"message {index}"}
+
+
+@pytest.mark.asyncio
+async def test_service_append_then_load_roundtrip(state_service):
+    await state_service.reset("group_1", "100", ["m1"], [_message(1)], 5)
+
+    state = await state_service.load("group_1", "100", ["m2"])
+    await state_service.append(state, ["m2"], [_message(2)], 7)
+    state = await state_service.load("group_1", "100", ["m3"])
+
+    assert state.message_ids == ["m1", "m2"]
+    assert state.token_count == 12
+    assert await state_service.load_messages(state) == [_message(1), _message(2)]
+
+
+@pytest.mark.asyncio
+async def test_service_rejects_stale_or_in_flight_state(state_service):
+    await state_service.reset("group_1", "100", ["m1"], [_message(1)], 5)
+
+    # Anchor moved (a MemCell was written elsewhere)
+    assert await state_service.load("group_1", "200", ["m2"]) is None
+    # Message already accumulated (retried request)
+    assert await state_service.load("group_1", "100", ["m1"]) is None
+    # Left in flight by a request that did not finish
+    assert await state_service.load("group_1", "100", ["m2"]) is not None
+    assert await state_service.load("group_1", "100", ["m3"]) is None
+
+
+@pytest.mark.asyncio
+async def test_service_invalidate_drops_state(state_service):
+    await state_service.reset("group_1", "100", ["m1"], [_message(1)], 5)
+
+    await state_service.invalidate("group_1")
+
+    assert await state_service.load("group_1", "100", ["m2"]) is None
+
+
+# ============================================================
+# update_accumulation_state
+# ============================================================
+
+
+class RecordingStateService:
+    def __init__(self):
+        self.calls = []
+
+    async def append(self, state, message_ids, messages, token_count):
+        self.calls.append(("append", message_ids, messages, token_count))
+
+    async def reset(self, group_id, anchor, message_ids, messages, token_count):
+        self.calls.append(("reset", anchor, message_ids, messages, token_count))
+
+    async def invalidate(self, group_id):
+        self.calls.append(("invalidate", group_id))
+
+
+@pytest.fixture
+def recording_service(monkeypatch):
+    service = RecordingStateService()
+    monkeypatch.setattr(mem_memorize, "get_bean_by_type", lambda cls: service)
+    return service
+
+
+def _memorize_request(history_ids=(), new_ids=("m3",)):
+    return MemorizeRequest(
+        history_raw_data_list=[
+            RawData(content=_message(i), data_id=i) for i in history_ids
+        ],
+        new_raw_data_list=[RawData(content=_message(i), data_id=i) for i in new_ids],
+        raw_data_type=RawDataType.CONVERSATION,
+        user_id_list=["user_1"],
+        group_id="group_1",
+    )
+
+
+def _accumulation_ctx(**kwargs):
+    ctx = AccumulationContext(anchor="100", **kwargs)
+    ctx.accumulation.new_message_dict_list = [_message("m3")]
+    ctx.accumulation.new_token_count = 3
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_update_appends_when_no_boundary(recording_service):
+    ctx = _accumulation_ctx(state=ConversationAccumulationState(group_id="group_1"))
+
+    await update_accumulation_state(_memorize_request(), ctx, None)
+
+    assert recording_service.calls == [("append", ["m3"], [_message("m3")], 3)]
+
+
+@pytest.mark.asyncio
+async def test_update_restarts_window_at_boundary(recording_service):
+    ctx = _accumulation_ctx(state=ConversationAccumulationState(group_id="group_1"))
+    memcell_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    memcell = MemCell(
+        user_id_list=["user_1"],
+        original_data=[_message("m1"), _message("m2")],
+        timestamp=memcell_time,
+    )
+
+    await update_accumulation_state(_memorize_request(), ctx, memcell)
+
+    assert recording_service.calls == [
+        ("reset", build_accumulation_anchor(memcell_time), ["m3"], [_message("m3")], 3)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_rebuilds_from_complete_history(recording_service):
+    ctx = _accumulation_ctx(rebuild=True)
+    ctx.accumulation.history_message_dict_list = [_message("m1"), _message("m2")]
+    ctx.accumulation.history_token_count = 10
+
+    await update_accumulation_state(
+        _memorize_request(history_ids=("m1", "m2")), ctx, None
+    )
+
+    assert recording_service.calls == [
+        (
+            "reset",
+            "100",
+            ["m1", "m2", "m3"],
+            [_message("m1"), _message("m2"), _message("m3")],
+            13,
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_invalidates_when_state_cannot_be_trusted(recording_service):
+    # History was read from MongoDB but may be incomplete
+    await update_accumulation_state(_memorize_request(), _accumulation_ctx(), None)
+    # New messages were skipped before the extractor processed them
+    skipped = _accumulation_ctx(state=ConversationAccumulationState(group_id="g"))
+    skipped.accumulation.new_message_dict_list = None
+    await update_accumulation_state(_memorize_request(), skipped, None)
+
+    assert recording_service.calls == [
+        ("invalidate", "group_1"),
+        ("invalidate", "group_1"),
+    ]
+
+
+# ============================================================
+# Extractor cached-state path
+# ============================================================
+
+
+class StubConvMemCellExtractor(ConvMemCellExtractor):
+    """Counts one token per message and records boundary detection calls"""
+
+    def __init__(self, should_end=False, **kwargs):
+        super().__init__(llm_provider=None, boundary_detection_prompt="-", **kwargs)
+        self.should_end = should_end
+        self.detect_calls = []
+
+    def _count_tokens(self, messages):
+        return len(messages)
+
+    async def _detect_boundary(self, conversation_history, new_messages):
+        self.detect_calls.append((conversation_history, new_messages))
+        return BoundaryDetectionResult(
+            should_end=self.should_end,
+            should_wait=False,
+            reasoning="stub",
+            confidence=1.0,
+        )
+
+
+def _timed_message(index):
+    timestamp = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=index)
+    return {
+        "speaker_id": "user_1",
+        "speaker_name": "Alice",
+        "content": f"message {index}",
+        "timestamp": timestamp.isoformat(),
+    }
+
+
+def _cached_accumulation(history, loads):
+    async def history_loader():
+        loads.append(True)
+        return history
+
+    return ConversationAccumulation(
+        history_raw_count=len(history),
+        history_message_count=len(history),
+        history_token_count=len(history),
+        history_loader=history_loader,
+    )
+
+
+def _extract_request(accumulation, new_index=10):
+    return ConversationMemCellExtractRequest(
+        history_raw_data_list=[],
+        new_raw_data_list=[RawData(content=_timed_message(new_index), data_id="new")],
+        user_id_list=["user_1"],
+        group_id="group_1",
+        accumulation=accumulation,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_state_skips_history_when_window_is_empty():
+    loads = []
+    accumulation = _cached_accumulation([], loads)
+    extractor = StubConvMemCellExtractor()
+
+    memcell, _ = await extractor.extract_memcell(_extract_request(accumulation))
+
+    assert memcell is None
+    assert loads == []
+    assert accumulation.new_message_dict_list == [_timed_message(10)]
+    assert accumulation.new_token_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_state_loads_history_for_boundary_detection():
+    history = [_timed_message(1), _timed_message(2)]
+    loads = []
+    accumulation = _cached_accumulation(history, loads)
+    extractor = StubConvMemCellExtractor(should_end=True)
+
+    memcell, _ = await extractor.extract_memcell(_extract_request(accumulation))
+
+    assert loads == [True]
+    assert extractor.detect_calls == [(history, [_timed_message(10)])]
+    assert memcell.original_data == history
+
+
+@pytest.mark.asyncio
+async def test_cached_counts_trigger_force_split_before_llm():
+    history = [_timed_message(1), _timed_message(2), _timed_message(3)]
+    loads = []
+    accumulation = _cached_accumulation(history, loads)
+    extractor = StubConvMemCellExtractor(hard_message_limit=4)
+
+    memcell, _ = await extractor.extract_memcell(_extract_request(accumulation))
+
+    assert memcell.original_data == history
+    assert extractor.detect_calls == []
+    assert loads == [True]
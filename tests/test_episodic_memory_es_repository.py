@@ -714,6 +714,25 @@ async def test_multi_search():
         assert len(bm25_results) == 2, "BM25 method should return results"
         logger.info("✅ BM25 method test passed: found %d results", len(bm25_results))
 
+        # Test 7: Batched msearch returns the same hits as individual searches
+        logger.info("Testing batched msearch...")
+        queries = [["DSL", "search"], ["BM25", "preference"], ["preference", "test"]]
+        batch_results = await repo.msearch(
+            [
+                repo.build_multi_search(query=q, user_id=test_user_id, size=10)
+                for q in queries
+            ]
+        )
+        assert len(batch_results) == len(queries)
+        for q, hits in zip(queries, batch_results):
+            single = await repo.multi_search(query=q, user_id=test_user_id, size=10)
+            assert [h["_id"] for h in hits] == [h["_id"] for h in single]
+        filter_clause = repo.build_multi_search(
+            query=["DSL"], user_id=test_user_id
+        ).to_dict()["query"]["bool"]
+        assert "filter" in filter_clause and "must" not in filter_clause
+        logger.info("✅ Batched msearch test passed")
+
         # Clean up test data
         await repo.delete_by_event_id(test_event_id, refresh=True)
         await repo.delete_by_event_id(test_event_id_bm25, refresh=True)
@@ -21,6 +21,7 @@ from common_utils.datetime_utils import get_now_with_timezone, to_iso_format
 from infra_layer.adapters.out.search.repository.episodic_memory_milvus_repository import (
     EpisodicMemoryMilvusRepository,
 )
+from core.oxm.milvus.base_repository import MilvusOutputProfile
 from core.observation.logger import get_logger
 
 logger = get_logger(__name__)
@@ -339,6 +340,35 @@ async def test_vector_search():
             "✅ Time range filter test successful, found %d results", len(time_results)
         )
 
+        # Test 6: Output profiles
+        logger.info("Test 6: Vector search output profiles")
+        full_results = await repo.vector_search(
+            query_vector=base_vector,
+            user_id=test_user_id,
+            limit=10,
+            output_profile=MilvusOutputProfile.FULL,
+        )
+        summary_results = await repo.vector_search(
+            query_vector=base_vector,
+            user_id=test_user_id,
+            limit=10,
+            output_profile=MilvusOutputProfile.SUMMARY,
+        )
+        ids_results = await repo.vector_search(
+            query_vector=base_vector,
+            user_id=test_user_id,
+            limit=10,
+            output_profile=MilvusOutputProfile.IDS,
+        )
+        assert [r["id"] for r in full_results] == [r["id"] for r in ids_results]
+        assert all("metadata" in r and "search_content" in r for r in full_results)
+        assert all("vector" not in r for r in full_results)
+        assert all(
+            "metadata" not in r and r["episode"] is not None for r in summary_results
+        )
+        assert all(set(r) == {"id", "score"} for r in ids_results)
+        logger.info("✅ Output profile test successful")
+
     except Exception as e:
         logger.error("❌ Vector search and filtering function test failed: %s", e)
         raise
@@ -0,0 +1,256 @@
+"""Unit tests for keyset paging of memory fetch and the NDJSON export (storage faked)."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+
+from agentic_layer.fetch_mem_service import FetchMemoryServiceImpl
+from api_specs.memory_models import MemoryType
+from core.oxm.keyset_pagination import KeysetCursor
+from infra_layer.adapters.input.api.memory.memory_controller import MemoryController
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeKeysetRepository:
+    """Serves documents newest first on (field, _id), like the Mongo repositories"""
+
+    def __init__(self, documents, field):
+        self.field = field
+        self.documents = sorted(
+            documents, key=lambda d: (getattr(d, field), d.id), reverse=True
+        )
+        self.calls = []
+
+    async def find_by_filters(self, limit=None, cursor=None, **kwargs):
+        self.calls.append({"limit": limit, "cursor": cursor})
+        documents = self.documents
+        if cursor is not None:
+            documents = [
+                d
+                for d in documents
+                if (getattr(d, self.field), d.id) < (cursor.value, cursor.id)
+            ]
+        return documents[:limit]
+
+
+class FakeGlobalUserProfileRepository:
+    def __init__(self):
+        self.calls = []
+
+    async def get_by_user_id(self, user_id):
+        self.calls.append(user_id)
+        return SimpleNamespace(
+            id=ObjectId(),
+            user_id=user_id,
+            profile_data={"role": "engineer"},
+            custom_profile_data=None,
+            confidence=0.9,
+            memcell_count=3,
+            created_at=BASE_TIME,
+            updated_at=BASE_TIME,
+        )
+
+
+def _episode(index, timestamp):
+    return SimpleNamespace(
+        id=ObjectId(),
+        user_id="user_1",
+        group_id="group_1",
+        group_name=None,
+        event_id=f"event_{index}",
+        subject=f"episode {index}",
+        summary=f"summary {index}",
+        participants=["user_1"],
+        extend=None,
+        keywords=None,
+        timestamp=timestamp,
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+
+
+def _user_profile(version):
+    return SimpleNamespace(
+        id=ObjectId(),
+        user_id="user_1",
+        group_id="group_1",
+        profile_data={},
+        scenario="group_chat",
+        confidence=0.5,
+        version=version,
+        cluster_ids=[],
+        memcell_count=1,
+        last_updated_cluster=None,
+        created_at=BASE_TIME,
+        updated_at=BASE_TIME,
+    )
+
+
+def _make_service(monkeypatch, **repositories):
+    service = FetchMemoryServiceImpl()
+    for name, repository in repositories.items():
+        setattr(service, name, repository)
+
+    async def get_user_details_cache(group_id):
+        return {}
+
+    monkeypatch.setattr(service, "_get_repositories", lambda: None)
+    monkeypatch.setattr(service, "_get_user_details_cache", get_user_details_cache)
+    return service
+
+
+def _episodes():
+    # Two episodes share a timestamp so the _id tie-break is exercised
+    timestamps = [BASE_TIME + timedelta(minutes=i) for i in range(4)]
+    timestamps.append(timestamps[2])
+    return [_episode(i, ts) for i, ts in enumerate(timestamps)]
+
+
+@pytest.mark.asyncio
+async def test_find_memories_pages_with_next_cursor(monkeypatch):
+    repository = FakeKeysetRepository(_episodes(), "timestamp")
+    service = _make_service(monkeypatch, _episodic_repo=repository)
+    expected = [str(d.id) for d in repository.documents]
+
+    pages, cursor = [], None
+    while True:
+        response = await service.find_memories(
+            user_id="user_1",
+            memory_type=MemoryType.EPISODIC_MEMORY,
+            limit=2,
+            cursor=cursor,
+        )
+        pages.append([m.id for m in response.memories])
+        assert response.has_more == (response.next_cursor is not None)
+        cursor = response.next_cursor
+        if not cursor:
+            break
+
+    assert pages == [expected[0:2], expected[2:4], expected[4:5]]
+    # One extra record is fetched per page to detect the next one
+    assert [call["limit"] for call in repository.calls] == [3, 3, 3]
+    assert repository.calls[0]["cursor"] is None
+    # The cursor round-trips to the last record of the previous page
+    last_of_first_page = repository.documents[1]
+    assert repository.calls[1]["cursor"] == KeysetCursor(
+        value=last_of_first_page.timestamp, id=last_of_first_page.id
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_memories_exact_page_has_no_next_cursor(monkeypatch):
+    repository = FakeKeysetRepository(_episodes()[:2], "timestamp")
+    service = _make_service(monkeypatch, _episodic_repo=repository)
+
+    response = await service.find_memories(
+        user_id="user_1", memory_type=MemoryType.EPISODIC_MEMORY, limit=2
+    )
+
+    assert len(response.memories) == 2
+    assert response.has_more is False
+    assert response.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_global_profile_is_returned_with_the_first_page_only(monkeypatch):
+    profiles = FakeKeysetRepository([_user_profile(v) for v in range(3)], "version")
+    global_profiles = FakeGlobalUserProfileRepository()
+    service = _make_service(
+        monkeypatch,
+        _user_profile_repo=profiles,
+        _global_user_profile_repo=global_profiles,
+    )
+
+    first = await service.find_memories(
+        user_id="user_1", memory_type=MemoryType.PROFILE, limit=2
+    )
+    second = await service.find_memories(
+        user_id="user_1",
+        memory_type=MemoryType.PROFILE,
+        limit=2,
+        cursor=first.next_cursor,
+    )
+
+    assert [p.version for p in first.memories[0].profiles] == [2, 1]
+    assert first.memories[0].global_profile.user_id == "user_1"
+    assert [p.version for p in second.memories[0].profiles] == [0]
+    assert second.memories[0].global_profile is None
+    assert second.next_cursor is None
+    assert global_profiles.calls == ["user_1"]
+
+
+@pytest.mark.asyncio
+async def test_iter_memories_walks_every_page(monkeypatch):
+    repository = FakeKeysetRepository(_episodes(), "timestamp")
+    service = _make_service(monkeypatch, _episodic_repo=repository)
+
+    memories = [
+        m
+        async for m in service.iter_memories(
+            user_id="user_1", memory_type=MemoryType.EPISODIC_MEMORY, batch_size=2
+        )
+    ]
+
+    assert [m.id for m in memories] == [str(d.id) for d in repository.documents]
+    assert len(repository.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_iter_memories_raises_instead_of_ending_early(monkeypatch):
+    class FailingRepository(FakeKeysetRepository):
+        async def find_by_filters(self, limit=None, cursor=None, **kwargs):
+            if cursor is not None:
+                raise ConnectionError("mongo down")
+            return await super().find_by_filters(limit=limit, cursor=cursor)
+
+    service = _make_service(
+        monkeypatch, _episodic_repo=FailingRepository(_episodes(), "timestamp")
+    )
+
+    exported = []
+    with pytest.raises(ConnectionError):
+        async for memory in service.iter_memories(
+            user_id="user_1", memory_type=MemoryType.EPISODIC_MEMORY, batch_size=2
+        ):
+            exported.append(memory)
+    assert len(exported) == 2
+
+
+class DummyRequest:
+    def __init__(self, query_params):
+        self.query_params = query_params
+
+    async def body(self) -> bytes:
+        return b""
+
+
+@pytest.mark.asyncio
+async def test_export_streams_one_json_memory_per_line(monkeypatch):
+    repository = FakeKeysetRepository(_episodes(), "timestamp")
+    service = _make_service(monkeypatch, _episodic_repo=repository)
+    memory_manager = SimpleNamespace(
+        export_mem=lambda request: service.iter_memories(
+            user_id=request.user_id,
+            memory_type=request.memory_type,
+            group_id=request.group_id,
+            batch_size=2,
+        )
+    )
+    controller = object.__new__(MemoryController)
+    controller.memory_manager = memory_manager
+
+    response = await controller.export_memories(
+        DummyRequest({"user_id": "user_1", "memory_type": "episodic_memory"})
+    )
+    body = "".join([chunk async for chunk in response.body_iterator])
+
+    assert response.media_type == "application/x-ndjson"
+    assert body.endswith("\n")
+    lines = [json.loads(line) for line in body.splitlines()]
+    assert [line["id"] for line in lines] == [str(d.id) for d in repository.documents]
+    # Same encoding as GET /api/v1/memories: datetimes as ISO strings
+    assert lines[0]["created_at"] == repository.documents[0].created_at.isoformat()
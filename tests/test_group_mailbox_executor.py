@@ -0,0 +1,184 @@
+"""Unit tests for the per-group ordered mailbox executor."""
+
+import asyncio
+import contextvars
+
+import pytest
+
+from biz_layer.group_mailbox_executor import (
+    GroupMailboxExecutor,
+    GroupMailboxExecutorConfig,
+    MailboxFullError,
+)
+
+
+def _make_executor(**kwargs):
+    kwargs.setdefault("enabled", True)
+    return GroupMailboxExecutor(GroupMailboxExecutorConfig(**kwargs))
+
+
+@pytest.mark.asyncio
+async def test_work_of_one_group_runs_in_order_without_overlap():
+    executor = _make_executor()
+    events = []
+
+    async def work(i):
+        events.append(("start", i))
+        await asyncio.sleep(0.01)
+        events.append(("end", i))
+        return i
+
+    results = await asyncio.gather(
+        *[executor.submit("g1", lambda i=i: work(i)) for i in range(5)]
+    )
+
+    assert results == [0, 1, 2, 3, 4]
+    expected = []
+    for i in range(5):
+        expected += [("start", i), ("end", i)]
+    assert events == expected
+
+
+@pytest.mark.asyncio
+async def test_groups_run_concurrently_up_to_the_limit():
+    executor = _make_executor(max_concurrent_groups=2)
+    running = 0
+    peak = 0
+
+    async def work():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+
+    await asyncio.gather(*[executor.submit(f"g{i}", work) for i in range(5)])
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_full_mailbox_rejects_after_timeout():
+    executor = _make_executor(max_mailbox_size=1, enqueue_timeout_seconds=0.05)
+    release = asyncio.Event()
+
+    async def blocking():
+        await release.wait()
+
+    running = asyncio.ensure_future(executor.submit("g1", blocking))
+    await asyncio.sleep(0)  # worker takes the first item
+    queued = asyncio.ensure_future(executor.submit("g1", blocking))
+    await asyncio.sleep(0)
+
+    with pytest.raises(MailboxFullError):
+        await executor.submit("g1", blocking)
+
+    release.set()
+    await asyncio.gather(running, queued)
+
+
+@pytest.mark.asyncio
+async def test_exceptions_propagate_and_do_not_stop_the_mailbox():
+    executor = _make_executor()
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    async def ok():
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        await executor.submit("g1", failing)
+    assert await executor.submit("g1", ok) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_idle_mailbox_is_evicted():
+    executor = _make_executor(idle_ttl_seconds=0.02)
+
+    async def ok():
+        return 1
+
+    await executor.submit("g1", ok)
+    assert executor.mailbox_count() == 1
+    await asyncio.sleep(0.1)
+    assert executor.mailbox_count() == 0
+
+    assert await executor.submit("g1", ok) == 1
+
+
+@pytest.mark.asyncio
+async def test_work_runs_in_submitter_context():
+    executor = _make_executor()
+    request_id = contextvars.ContextVar("request_id", default=None)
+
+    async def read():
+        return request_id.get()
+
+    async def submit_as(value):
+        request_id.set(value)
+        return await executor.submit("g1", read)
+
+    assert await asyncio.gather(submit_as("a"), submit_as("b")) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_disabled_executor_runs_inline():
+    executor = _make_executor(enabled=False)
+
+    async def ok():
+        return 1
+
+    assert await executor.submit("g1", ok) == 1
+    assert executor.mailbox_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_running_item_and_cancels_pending():
+    executor = _make_executor()
+    started = asyncio.Event()
+    finished = []
+
+    async def memorize(i):
+        started.set()
+        await asyncio.sleep(0.05)
+        finished.append(i)
+        return i
+
+    running = asyncio.ensure_future(executor.submit("g1", lambda: memorize(0)))
+    await started.wait()
+    pending = asyncio.ensure_future(executor.submit("g1", lambda: memorize(1)))
+    await asyncio.sleep(0.01)
+    assert executor.pending_count("g1") == 1
+
+    await executor.close()
+
+    assert await running == 0
+    assert finished == [0]
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+    assert executor.mailbox_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_running_item_after_shutdown_timeout():
+    executor = _make_executor(shutdown_timeout_seconds=0.02)
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def stuck():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    running = asyncio.ensure_future(executor.submit("g1", stuck))
+    await started.wait()
+
+    await executor.close()
+
+    assert cancelled.is_set()
+    with pytest.raises(asyncio.CancelledError):
+        await running
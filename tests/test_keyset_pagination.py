@@ -0,0 +1,79 @@
+"""Unit tests for keyset pagination utilities."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from bson import ObjectId
+
+from api_specs.request_converter import convert_dict_to_fetch_mem_request
+from core.oxm.keyset_pagination import (
+    KeysetCursor,
+    apply_keyset_filter,
+    keyset_filter,
+    keyset_sort,
+    split_page,
+)
+
+
+def _doc(value):
+    return SimpleNamespace(id=ObjectId(), timestamp=value)
+
+
+@pytest.mark.parametrize(
+    "value", [datetime(2024, 1, 15, 10, 30, 0, 123000, tzinfo=timezone.utc), 7, "v2"]
+)
+def test_cursor_round_trip(value):
+    cursor = KeysetCursor(value=value, id=ObjectId())
+
+    assert KeysetCursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "eyJrIjoiZHQifQ"])
+def test_decode_rejects_malformed_cursor(token):
+    with pytest.raises(ValueError):
+        KeysetCursor.decode(token)
+
+
+def test_keyset_filter_and_sort_descending():
+    cursor = KeysetCursor(value=5, id=ObjectId())
+
+    assert keyset_sort("timestamp") == [("timestamp", -1), ("_id", -1)]
+    assert keyset_filter("timestamp", cursor) == {
+        "$or": [{"timestamp": {"$lt": 5}}, {"timestamp": 5, "_id": {"$lt": cursor.id}}]
+    }
+
+
+def test_apply_keyset_filter_keeps_existing_conditions():
+    cursor = KeysetCursor(value=5, id=ObjectId())
+    base = {"user_id": "u1", "timestamp": {"$gte": 1}}
+
+    assert apply_keyset_filter(base, "timestamp", None) is base
+    assert apply_keyset_filter({}, "timestamp", cursor) == keyset_filter(
+        "timestamp", cursor
+    )
+    assert apply_keyset_filter(base, "timestamp", cursor, descending=False) == {
+        "$and": [base, keyset_filter("timestamp", cursor, descending=False)]
+    }
+
+
+def test_split_page_sets_cursor_only_when_more_records_exist():
+    docs = [_doc(value) for value in (3, 2, 1)]
+
+    page, cursor = split_page(docs, "timestamp", 2)
+    assert page == docs[:2]
+    assert cursor == KeysetCursor(value=2, id=docs[1].id)
+
+    page, cursor = split_page(docs, "timestamp", 3)
+    assert page == docs
+    assert cursor is None
+
+
+def test_fetch_request_validates_cursor():
+    token = KeysetCursor(value=1, id=ObjectId()).encode()
+
+    request = convert_dict_to_fetch_mem_request({"user_id": "u1", "cursor": token})
+    assert request.cursor == token
+
+    with pytest.raises(ValueError):
+        convert_dict_to_fetch_mem_request({"user_id": "u1", "cursor": "bogus"})
@@ -0,0 +1,109 @@
+"""Unit tests for the shared LLM client pool."""
+
+import asyncio
+import time
+
+import pytest
+
+from core.rate_limit import rate_limiter
+from core.rate_limit.rate_limiter import RateLimitManager
+from core.rate_limit.redis_rate_limiter import RateLimiterConfig, RedisRateLimiter
+from memory_layer.llm.client_pool import (
+    AdaptiveTokenBucket,
+    LLMClientPool,
+    LLMClientPoolConfig,
+    parse_retry_after,
+)
+
+
+@pytest.mark.asyncio
+async def test_slots_respect_per_model_and_global_limits():
+    pool = LLMClientPool(
+        LLMClientPoolConfig(max_concurrent=3, max_concurrent_per_model=2)
+    )
+    running = {"a": 0, "b": 0}
+    peaks = {"a": 0, "b": 0, "total": 0}
+
+    async def call(model):
+        async with pool.slot(model) as slot:
+            running[model] += 1
+            peaks[model] = max(peaks[model], running[model])
+            peaks["total"] = max(peaks["total"], sum(running.values()))
+            await asyncio.sleep(0.01)
+            running[model] -= 1
+            slot.status = "success"
+
+    await asyncio.gather(*[call("a") for _ in range(6)], *[call("b") for _ in range(6)])
+
+    assert peaks["a"] == 2
+    assert peaks["b"] == 2
+    assert peaks["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_pauses_callers_and_halves_rate():
+    bucket = AdaptiveTokenBucket(rate=100, burst=1)
+
+    assert bucket.on_rate_limited(retry_after=0.05) == pytest.approx(0.05)
+    assert bucket.rate == 50
+
+    start = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - start >= 0.04
+
+    for _ in range(10):
+        bucket.on_success()
+    assert bucket.rate == 100
+
+
+@pytest.mark.asyncio
+async def test_backoff_without_retry_after_grows_and_is_capped():
+    bucket = AdaptiveTokenBucket(rate=0, burst=1, backoff_base=1, backoff_max=3)
+    backoffs = [bucket.on_rate_limited() for _ in range(5)]
+
+    assert all(0 <= b <= 3 for b in backoffs)
+    assert bucket.rate == 0
+
+
+@pytest.mark.asyncio
+async def test_bucket_acquires_shared_limiter_after_local_token():
+    class FakeLimiter:
+        acquired = 0
+
+        async def acquire(self):
+            self.acquired += 1
+
+    shared = FakeLimiter()
+    bucket = AdaptiveTokenBucket(rate=100, burst=2, shared_limiter=shared)
+
+    await bucket.acquire()
+    await bucket.acquire()
+
+    assert shared.acquired == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["local", "redis"])
+async def test_model_bucket_shares_rate_through_redis_backend(monkeypatch, backend):
+    monkeypatch.setattr(
+        rate_limiter,
+        "_rate_limit_manager",
+        RateLimitManager(RateLimiterConfig(backend=backend)),
+    )
+    pool = LLMClientPool(LLMClientPoolConfig(rate_limit_rps=5, rate_limit_burst=10))
+
+    shared = pool.get_bucket("gpt-4.1-mini").shared_limiter
+
+    if backend == "local":
+        assert shared is None
+    else:
+        assert isinstance(shared, RedisRateLimiter)
+        assert shared.key == "llm:gpt-4.1-mini"
+        assert (shared.max_rate, shared.time_period) == (10, 2)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
@@ -0,0 +1,86 @@
+"""Unit tests for the LLM response cache."""
+
+import pytest
+
+from memory_layer.llm import llm_provider as llm_provider_module
+from memory_layer.llm.llm_provider import LLMProvider
+from memory_layer.llm.response_cache import DiskLLMResponseCache, build_llm_cache_key
+
+
+class _FakeProvider:
+    model = "test-model"
+    temperature = 0.3
+    max_tokens = 1024
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, prompt, *args):
+        self.calls += 1
+        return f"response {self.calls}"
+
+
+def _make_provider(monkeypatch, cache):
+    provider = LLMProvider.__new__(LLMProvider)
+    provider.provider_type = "openai"
+    provider.provider = _FakeProvider()
+    monkeypatch.setattr(llm_provider_module, "get_llm_response_cache", lambda: cache)
+    return provider
+
+
+def test_cache_key_depends_on_all_request_parameters():
+    base = dict(
+        provider_type="openai",
+        model="m",
+        prompt="p",
+        temperature=0.3,
+        max_tokens=100,
+        response_format=None,
+    )
+    key = build_llm_cache_key(**base)
+
+    assert key == build_llm_cache_key(**base)
+    for field, value in [
+        ("model", "m2"),
+        ("prompt", "p2"),
+        ("temperature", 0.0),
+        ("max_tokens", 200),
+        ("response_format", {"type": "json_object"}),
+    ]:
+        assert key != build_llm_cache_key(**{**base, field: value})
+
+
+@pytest.mark.asyncio
+async def test_generate_uses_cache_only_for_opted_in_call_sites(tmp_path, monkeypatch):
+    cache = DiskLLMResponseCache(str(tmp_path), ttl_seconds=60, max_entries=100)
+    provider = _make_provider(monkeypatch, cache)
+
+    assert await provider.generate("prompt", cache_site="episode") == "response 1"
+    assert await provider.generate("prompt", cache_site="episode") == "response 1"
+    assert await provider.generate("prompt") == "response 2"
+    # Retries bypass the lookup and overwrite the cached response
+    assert (
+        await provider.generate("prompt", cache_site="episode", refresh_cache=True)
+        == "response 3"
+    )
+    assert await provider.generate("prompt", cache_site="episode") == "response 3"
+    assert provider.provider.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_ttl_and_eviction(tmp_path, monkeypatch):
+    cache = DiskLLMResponseCache(str(tmp_path), ttl_seconds=60, max_entries=2)
+    cache.EVICT_EVERY_WRITES = 1
+
+    await cache.set("a", "A")
+    await cache.set("b", "B")
+    assert await cache.get("a", "test") == "A"  # "b" is now least recently used
+    await cache.set("c", "C")
+
+    assert await cache.get("b", "test") is None
+    assert await cache.get("a", "test") == "A"
+    assert await cache.get("c", "test") == "C"
+
+    cache._conn.execute("UPDATE llm_responses SET created_at = created_at - 120")
+    assert await cache.get("a", "test") is None
+    await cache.close()
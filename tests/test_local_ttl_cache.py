@@ -0,0 +1,39 @@
+"""Unit tests for the in-process LRU + TTL cache."""
+
+from core.cache.local_ttl_cache import LocalTTLCache
+
+
+def test_evicts_least_recently_used():
+    cache = LocalTTLCache(max_entries=2, ttl_seconds=60)
+    cache.set_many({"a": 1, "b": 2})
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get_many(["a", "b", "c"]) == [1, None, 3]
+    assert len(cache) == 2
+
+
+def test_expired_entries_are_dropped():
+    cache = LocalTTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+
+    # Force the entry's expiry into the past
+    cache._entries["a"] = (0.0, 1)
+
+    assert cache.get("a", "miss") == "miss"
+    assert len(cache) == 0
+
+
+def test_non_positive_ttl_never_expires():
+    cache = LocalTTLCache(max_entries=2, ttl_seconds=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+
+
+def test_delete_many():
+    cache = LocalTTLCache(max_entries=10, ttl_seconds=60)
+    cache.set_many({"a": 1, "b": 2})
+    cache.delete_many(["a", "missing"])
+
+    assert cache.get_many(["a", "b"]) == [None, 2]
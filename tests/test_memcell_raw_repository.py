@@ -26,6 +26,7 @@ from infra_layer.adapters.out.persistence.repository.memcell_raw_repository impo
 )
 from infra_layer.adapters.out.persistence.document.memory.memcell import (
     MemCell,
+    MemCellOriginalDataProjection,
     DataTypeEnum,
 )
 from core.observation.logger import get_logger
@@ -788,6 +789,60 @@ async def test_get_by_event_ids():
     logger.info("✅ Batch query by event_ids test completed")
 
 
+async def test_get_by_event_ids_batched():
+    """Test concurrent batched query by event_ids with the original_data projection"""
+    logger.info("Starting test of batched query by event_ids...")
+
+    repo = get_bean_by_type(MemCellRawRepository)
+    user_id = "test_user_011"
+
+    try:
+        await repo.hard_delete_by_user_id(user_id)
+
+        now = get_now_with_timezone()
+        created_memcells = []
+        for i in range(7):
+            memcell = MemCell(
+                user_id=user_id,
+                timestamp=now - timedelta(minutes=i),
+                summary=f"Batched memory {i+1}",
+                episode=f"Detailed content of batched memory {i+1}",
+                type=DataTypeEnum.CONVERSATION,
+                original_data=[{"content": f"message {i+1}"}],
+            )
+            created_memcells.append(await repo.append_memcell(memcell))
+
+        event_ids = [str(mc.event_id) for mc in created_memcells]
+
+        # 7 ids (+ duplicates) in batches of 3 -> 3 concurrent queries
+        results = await repo.get_by_event_ids_batched(
+            event_ids + event_ids[:2],
+            projection_model=MemCellOriginalDataProjection,
+            batch_size=3,
+        )
+        assert set(results) == set(event_ids), "All event_ids should be returned"
+        for event_id, memcell in zip(event_ids, created_memcells):
+            projection = results[event_id]
+            assert isinstance(projection, MemCellOriginalDataProjection)
+            assert str(projection.event_id) == event_id
+            assert projection.original_data == memcell.original_data
+            assert not hasattr(projection, 'episode'), "episode should not be loaded"
+
+        assert await repo.get_by_event_ids_batched([]) == {}
+
+        await repo.hard_delete_by_user_id(user_id)
+        logger.info("✅ Cleaned up test data successfully")
+
+    except Exception as e:
+        logger.error("❌ Test batched query by event_ids failed: %s", e)
+        import traceback
+
+        logger.error("Detailed error: %s", traceback.format_exc())
+        raise
+
+    logger.info("✅ Batched query by event_ids test completed")
+
+
 async def test_soft_delete_single():
     """测试单个软删除功能"""
     logger.info("Starting test of soft delete single record...")
@@ -1178,6 +1233,7 @@ async def run_all_tests():
         await test_batch_delete_operations()
         await test_statistics_and_aggregation()
         await test_get_by_event_ids()
+        await test_get_by_event_ids_batched()
         
         # 软删除功能测试
         logger.info("")
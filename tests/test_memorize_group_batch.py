@@ -0,0 +1,91 @@
+"""Unit tests for batch memorize of one group (storage and LLM faked)."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from api_specs.dtos import MemorizeRequest, RawData
+from api_specs.memory_types import MemCell, RawDataType
+from biz_layer import mem_memorize
+from memory_layer.memcell_extractor.base_memcell_extractor import StatusResult
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeRepository:
+    """Stands in for the conversation data repository and the state service"""
+
+    async def delete_conversation_data(self, group_id, exclude_message_ids=None):
+        return True
+
+    async def save_conversation_data(self, raw_data_list, group_id):
+        return True
+
+    async def invalidate(self, group_id):
+        return None
+
+
+def _request(index):
+    return MemorizeRequest(
+        history_raw_data_list=[],
+        new_raw_data_list=[
+            RawData(content={"content": f"message {index}"}, data_id=f"m{index}")
+        ],
+        raw_data_type=RawDataType.CONVERSATION,
+        user_id_list=["user_1"],
+        group_id="group_1",
+        current_time=BASE_TIME + timedelta(minutes=index),
+    )
+
+
+@pytest.mark.asyncio
+async def test_memcells_and_status_use_their_own_request_time(monkeypatch):
+    boundary_data_id = "m1"
+    saved_times, extraction_times, status_times = [], [], []
+
+    class FakeMemoryManager:
+        async def extract_memcell(self, history, new_raw_data_list, *args, **kwargs):
+            if new_raw_data_list[0].data_id != boundary_data_id:
+                return None, StatusResult(should_wait=False)
+            memcell = MemCell(
+                user_id_list=["user_1"],
+                original_data=[{"content": "message 0"}],
+                timestamp=BASE_TIME,
+                group_id="group_1",
+            )
+            return memcell, StatusResult(should_wait=False)
+
+    async def preprocess_conv_request(request, current_time, accumulation_ctx=None):
+        return request
+
+    async def save_memcell(memcell, current_time):
+        saved_times.append(current_time)
+        return memcell
+
+    async def process_memory_extraction(memcell, request, manager, current_time):
+        extraction_times.append(current_time)
+        return 1
+
+    async def update_status(request, status_result, current_time, data_type):
+        status_times.append(current_time)
+
+    monkeypatch.setattr(mem_memorize, "MemoryManager", FakeMemoryManager)
+    monkeypatch.setattr(mem_memorize, "get_bean_by_type", lambda cls: FakeRepository())
+    monkeypatch.setattr(
+        mem_memorize, "preprocess_conv_request", preprocess_conv_request
+    )
+    monkeypatch.setattr(mem_memorize, "_save_memcell_to_database", save_memcell)
+    monkeypatch.setattr(
+        mem_memorize, "process_memory_extraction", process_memory_extraction
+    )
+    monkeypatch.setattr(mem_memorize, "update_status_when_no_memcell", update_status)
+
+    result = await mem_memorize._memorize_group_batch(
+        [_request(0), _request(1), _request(2)]
+    )
+
+    assert result.memcell_count == 1
+    assert result.memory_count == 1
+    assert saved_times == [BASE_TIME + timedelta(minutes=1)]
+    assert extraction_times == [BASE_TIME + timedelta(minutes=1)]
+    assert status_times == [BASE_TIME + timedelta(minutes=2)]
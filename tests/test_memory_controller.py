@@ -542,6 +542,56 @@ class MemoryControllerTester:
         print(f"\n✅ Memorize Test Completed")
         return status_code, response
 
+    def test_memorize_batch(self):
+        """Test 1b: POST /api/v1/memories/batch - Store an ordered message batch for two groups"""
+        self.print_section("Test 1b: POST /api/v1/memories/batch - Store Message Batch")
+
+        base_time = datetime.now(ZoneInfo("UTC"))
+        other_group_id = f"{self.group_id}_batch"
+        messages = []
+        for group_id in (self.group_id, other_group_id):
+            for i, (offset, content) in enumerate(
+                [
+                    (timedelta(0), "I'm planning a trip to Kyoto next month."),
+                    (timedelta(minutes=1), "Great, autumn is a good time for Kyoto."),
+                    (timedelta(hours=24), "By the way, how is the weekend project?"),
+                    (timedelta(hours=24, minutes=1), "Main features are 80% done."),
+                ]
+            ):
+                messages.append(
+                    {
+                        "group_id": group_id,
+                        "group_name": "Test Group",
+                        "message_id": f"batch_{uuid.uuid4().hex[:8]}_{i}",
+                        "create_time": (base_time + offset).isoformat(),
+                        "sender": self.user_id if i % 2 == 0 else "assistant_001",
+                        "role": "user" if i % 2 == 0 else "assistant",
+                        "content": content,
+                    }
+                )
+
+        status_code, response = self.call_post_api("/batch", {"messages": messages})
+
+        assert status_code == 200, f"Status code should be 200, actual: {status_code}"
+        assert response.get("status") == "ok", "Status should be ok"
+        result = response["result"]
+        assert result["count"] >= 0, "count should be >= 0"
+        assert result["memcell_count"] >= 0, "memcell_count should be >= 0"
+        groups = {g["group_id"]: g for g in result["groups"]}
+        assert set(groups) == {self.group_id, other_group_id}, "One result per group"
+        for group in groups.values():
+            assert group["message_count"] == 4, "Each group received 4 messages"
+            assert group["error"] is None, f"Group failed: {group['error']}"
+
+        # Invalid message in the batch -> 400
+        status_code, _ = self.call_post_api(
+            "/batch", {"messages": [{"message_id": "missing_fields"}]}
+        )
+        assert status_code == 400, f"Status code should be 400, actual: {status_code}"
+
+        print(f"\n✅ Memorize Batch Test Completed")
+        return status_code, response
+
     def test_fetch_episodic(self):
         """Test 2: GET /api/v1/memories - Fetch user episodic memory (episodic_memory type, pass parameters via body)
 
@@ -2985,6 +3035,7 @@ class MemoryControllerTester:
         # Define test method mapping
         test_methods = {
             "memorize": self.test_memorize_single_message,
+            "memorize_batch": self.test_memorize_batch,
             "fetch_episodic": self.test_fetch_episodic,
             "fetch_foresight": self.test_fetch_foresight,
             "fetch_event_log": self.test_fetch_event_log,
@@ -3019,7 +3070,7 @@ class MemoryControllerTester:
                 "search_vector",
                 "search_hybrid",
             ],
-            "memorize": ["memorize"],
+            "memorize": ["memorize", "memorize_batch"],
             "meta": ["save_meta", "patch_meta"],
             "delete": ["delete_memories"],
         }
@@ -3194,6 +3245,7 @@ Usage Examples:
             "meta",
             "delete",
             # Individual methods
+            "memorize_batch",
             "fetch_episodic",
             "fetch_foresight",
             "fetch_event_log",
@@ -0,0 +1,531 @@
+"""Unit tests for MemoryManager multi-type retrieval (search backends faked)."""
+
+import asyncio
+import gc
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+from bson import ObjectId
+from elasticsearch import ApiError
+
+from agentic_layer import memory_manager as memory_manager_module
+from agentic_layer.memory_manager import MemoryManager
+from api_specs.dtos import RetrieveMemRequest
+from api_specs.memory_models import MemoryType, RetrieveMethod
+from core.oxm.milvus.base_repository import (
+    MilvusOutputProfile,
+    get_default_output_profile,
+)
+from infra_layer.adapters.out.search.repository.episodic_memory_es_repository import (
+    EpisodicMemoryEsRepository,
+)
+
+
+class FakeVectorizeService:
+    async def get_embedding(self, text):
+        return np.array([0.1, 0.2])
+
+
+def _make_manager() -> MemoryManager:
+    # Skip __init__, which resolves services from the DI container
+    return MemoryManager.__new__(MemoryManager)
+
+
+def _make_request(memory_types, **kwargs) -> RetrieveMemRequest:
+    kwargs.setdefault("query", "coffee")
+    return RetrieveMemRequest(user_id="user_1", memory_types=memory_types, **kwargs)
+
+
+def _hit(hit_id, score=1.0):
+    return {"id": hit_id, "score": score}
+
+
+def test_memory_type_label_is_bounded():
+    manager = _make_manager()
+
+    assert (
+        manager._get_memory_type_label(_make_request([MemoryType.EPISODIC_MEMORY]))
+        == MemoryType.EPISODIC_MEMORY.value
+    )
+    assert (
+        manager._get_memory_type_label(
+            _make_request([MemoryType.EPISODIC_MEMORY, MemoryType.EVENT_LOG])
+        )
+        == "multi"
+    )
+    assert manager._get_memory_type_label(_make_request([])) == "unknown"
+
+
+@pytest.mark.asyncio
+async def test_failed_memory_type_does_not_discard_the_others(monkeypatch):
+    manager = _make_manager()
+    monkeypatch.setattr(
+        memory_manager_module, "get_vectorize_service", FakeVectorizeService
+    )
+
+    async def vector_search_single_type(request, mem_type, vector, retrieve_method):
+        if mem_type == MemoryType.EVENT_LOG:
+            raise ConnectionError("milvus down")
+        return [_hit(f"{mem_type.value}-1")]
+
+    monkeypatch.setattr(
+        manager, "_vector_search_single_type", vector_search_single_type
+    )
+
+    results = await manager._vector_search_by_type(
+        _make_request([MemoryType.EPISODIC_MEMORY, MemoryType.EVENT_LOG])
+    )
+
+    assert results == {
+        MemoryType.EPISODIC_MEMORY: [_hit("episodic_memory-1")],
+        MemoryType.EVENT_LOG: [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_raises_when_every_memory_type_fails(monkeypatch):
+    manager = _make_manager()
+    monkeypatch.setattr(
+        memory_manager_module, "get_vectorize_service", FakeVectorizeService
+    )
+
+    async def vector_search_single_type(request, mem_type, vector, retrieve_method):
+        raise ConnectionError("milvus down")
+
+    monkeypatch.setattr(
+        manager, "_vector_search_single_type", vector_search_single_type
+    )
+
+    with pytest.raises(ConnectionError):
+        await manager._vector_search_by_type(
+            _make_request([MemoryType.EPISODIC_MEMORY, MemoryType.EVENT_LOG])
+        )
+
+
+@pytest.mark.asyncio
+async def test_rrf_keeps_keyword_hits_when_vector_leg_fails(monkeypatch):
+    manager = _make_manager()
+
+    async def keyword_search_by_type(request, retrieve_method):
+        return {MemoryType.EPISODIC_MEMORY: [_hit("kw-1"), _hit("kw-2")]}
+
+    async def vector_search_by_type(request, retrieve_method):
+        raise TimeoutError("embedding timed out")
+
+    monkeypatch.setattr(manager, "_keyword_search_by_type", keyword_search_by_type)
+    monkeypatch.setattr(manager, "_vector_search_by_type", vector_search_by_type)
+
+    hits = await manager._search_rrf(_make_request([MemoryType.EPISODIC_MEMORY]))
+
+    assert [h["id"] for h in hits] == ["kw-1", "kw-2"]
+
+
+@pytest.mark.asyncio
+async def test_response_metadata_keeps_first_memory_type():
+    manager = _make_manager()
+    request = _make_request(
+        [MemoryType.EVENT_LOG, MemoryType.EPISODIC_MEMORY],
+        retrieve_method=RetrieveMethod.HYBRID,
+    )
+
+    response = await manager._to_response([], request)
+
+    assert response.metadata.memory_type == MemoryType.EVENT_LOG.value
+    assert response.query_metadata.memory_type == MemoryType.EVENT_LOG.value
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def to_list(self, length=None):
+        return self.rows
+
+
+class FakeMongoCollection:
+    """Applies the _id filter and the inclusion projection of find()"""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query, projection):
+        rows = []
+        for doc in self.docs:
+            if doc["_id"] in query["_id"]["$in"]:
+                row = {k: v for k, v in doc.items() if k in projection}
+                rows.append(dict(row, _id=doc["_id"]))
+        return FakeCursor(rows)
+
+
+def _vector_hit(memory_type, doc_id, metadata=None):
+    hit = {
+        "id": str(doc_id),
+        "score": 0.9,
+        "user_id": "user_1",
+        "group_id": "group_1",
+        "timestamp": datetime(2025, 1, 1),
+        "memory_type": memory_type.value,
+        "_search_source": RetrieveMethod.VECTOR.value,
+    }
+    if metadata is not None:
+        hit["metadata"] = metadata
+    return hit
+
+
+@pytest.mark.asyncio
+async def test_hydrated_hits_match_full_profile_hits(monkeypatch):
+    manager = _make_manager()
+    episode_id, event_log_id, foresight_id = ObjectId(), ObjectId(), ObjectId()
+    extend = {"source": "chat"}
+    # MongoDB source documents hold more fields than the Milvus metadata JSON
+    mongo_docs = {
+        "EpisodicMemory": [
+            {
+                "_id": episode_id,
+                "memcell_event_id_list": ["mc1"],
+                "subject": "Coffee",
+                "summary": "Talked about coffee",
+                "participants": ["user_1"],
+                "extend": extend,
+                "episode": "long episode text",
+            }
+        ],
+        "EventLogRecord": [
+            {
+                "_id": event_log_id,
+                "participants": ["user_1", "user_2"],
+                "vector_model": "m",
+                "extend": extend,
+            }
+        ],
+        "ForesightRecord": [
+            {
+                "_id": foresight_id,
+                "participants": ["user_1"],
+                "vector_model": "m",
+                "extend": extend,
+            }
+        ],
+    }
+    for name, docs in mongo_docs.items():
+        model = getattr(memory_manager_module, name)
+        monkeypatch.setattr(
+            model,
+            "get_pymongo_collection",
+            classmethod(lambda cls, docs=docs: FakeMongoCollection(docs)),
+        )
+
+    # Metadata JSON as written by the Milvus converters
+    full_hits = [
+        _vector_hit(
+            MemoryType.EPISODIC_MEMORY,
+            episode_id,
+            {
+                "title": "Coffee",
+                "subject": "Coffee",
+                "summary": "Talked about coffee",
+                "participants": ["user_1"],
+                "memcell_event_id_list": ["mc1"],
+                "extend": extend,
+            },
+        ),
+        _vector_hit(
+            MemoryType.EVENT_LOG, event_log_id, {"vector_model": "m", "extend": extend}
+        ),
+        _vector_hit(
+            MemoryType.FORESIGHT, foresight_id, {"vector_model": "m", "extend": extend}
+        ),
+    ]
+    summary_hits = [
+        _vector_hit(MemoryType.EPISODIC_MEMORY, episode_id),
+        _vector_hit(MemoryType.EVENT_LOG, event_log_id),
+        _vector_hit(MemoryType.FORESIGHT, foresight_id),
+    ]
+
+    await manager._hydrate_milvus_metadata(summary_hits)
+
+    assert [manager._extract_hit_fields(h) for h in summary_hits] == [
+        manager._extract_hit_fields(h) for h in full_hits
+    ]
+
+
+def test_ids_profile_is_not_accepted_as_default(monkeypatch):
+    monkeypatch.setenv("MILVUS_SEARCH_OUTPUT_PROFILE", "ids")
+    assert get_default_output_profile() == MilvusOutputProfile.FULL
+
+    monkeypatch.setenv("MILVUS_SEARCH_OUTPUT_PROFILE", "Summary")
+    assert get_default_output_profile() == MilvusOutputProfile.SUMMARY
+
+
+class FakeMsearchResponse(dict):
+    """_msearch response body with the transport meta of ObjectApiResponse"""
+
+    meta = SimpleNamespace(status=200)
+
+
+class FakeEsClient:
+    def __init__(self, responses):
+        self.responses = responses
+
+    async def msearch(self, body):
+        return FakeMsearchResponse(responses=self.responses)
+
+
+def _es_response(*hit_ids):
+    return {
+        "hits": {
+            "hits": [
+                {"_index": "idx", "_id": hit_id, "_score": 1.0, "_source": {}}
+                for hit_id in hit_ids
+            ]
+        }
+    }
+
+
+_ES_ERROR = {"error": {"type": "search_phase_execution_exception"}, "status": 500}
+
+
+@pytest.mark.asyncio
+async def test_msearch_returns_error_of_failed_search_in_place(monkeypatch):
+    repo = EpisodicMemoryEsRepository()
+    client = FakeEsClient([_es_response("a"), _ES_ERROR])
+    monkeypatch.setattr(repo, "get_client", AsyncMock(return_value=client))
+    searches = [repo.build_multi_search(query=["coffee"]) for _ in range(2)]
+
+    with pytest.raises(ApiError):
+        await repo.msearch(searches)
+
+    hits, error = await repo.msearch(searches, raise_on_error=False)
+    assert [h["_id"] for h in hits] == ["a"]
+    assert isinstance(error, ApiError)
+
+
+class FakeKeywordRepository:
+    """Builds searches tagged with their memory type, errors the failing types"""
+
+    def __init__(self, failing_types=()):
+        self.failing_types = set(failing_types)
+
+    def build_multi_search(self, query, **kwargs):
+        return query
+
+    async def msearch(self, searches, raise_on_error=True):
+        results = []
+        for mem_type in searches:
+            if mem_type in self.failing_types:
+                results.append(
+                    ApiError("N/A", meta=FakeMsearchResponse.meta, body=_ES_ERROR)
+                )
+            else:
+                results.append([{"_id": f"kw-{mem_type}", "_score": 2.0}])
+        return results
+
+
+def _patch_keyword_repository(monkeypatch, manager, repository):
+    monkeypatch.setattr(
+        memory_manager_module, "get_bean_by_type", lambda cls: repository
+    )
+    # Use the memory type as the "query" so each search knows its type
+    monkeypatch.setattr(
+        manager,
+        "_build_keyword_query",
+        lambda request: (request.memory_types[0].value, {}),
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_keyword_subsearch_keeps_other_searches(monkeypatch):
+    manager = _make_manager()
+    _patch_keyword_repository(
+        monkeypatch, manager, FakeKeywordRepository([MemoryType.EVENT_LOG.value])
+    )
+    requests = [
+        _make_request([MemoryType.EPISODIC_MEMORY]),
+        _make_request([MemoryType.EVENT_LOG]),
+    ]
+
+    results = await manager._keyword_search_batch(requests)
+
+    assert [h["id"] for h in results[0][MemoryType.EPISODIC_MEMORY]] == [
+        "kw-episodic_memory"
+    ]
+    assert results[1] == {MemoryType.EVENT_LOG: []}
+
+
+@pytest.mark.asyncio
+async def test_hybrid_batch_keeps_vector_hits_of_failed_keyword_search(monkeypatch):
+    manager = _make_manager()
+    _patch_keyword_repository(
+        monkeypatch, manager, FakeKeywordRepository([MemoryType.EVENT_LOG.value])
+    )
+
+    async def get_vector_search_results(request, retrieve_method):
+        return [_hit(f"vec-{request.memory_types[0].value}")]
+
+    async def rerank(query, hits, top_k, memory_type, retrieve_method):
+        return hits
+
+    monkeypatch.setattr(manager, "get_vector_search_results", get_vector_search_results)
+    monkeypatch.setattr(manager, "_rerank", rerank)
+
+    results = await manager._search_hybrid_batch(
+        [
+            _make_request([MemoryType.EPISODIC_MEMORY]),
+            _make_request([MemoryType.EVENT_LOG]),
+        ]
+    )
+
+    assert [[h["id"] for h in hits] for hits in results] == [
+        ["kw-episodic_memory", "vec-episodic_memory"],
+        ["vec-event_log"],
+    ]
+
+
+class SpeculationHarness:
+    """Fakes the agentic LLM calls and searches around the speculative round 2"""
+
+    def __init__(self, monkeypatch, manager, is_sufficient, round2_error=None):
+        self.is_sufficient = is_sufficient
+        self.round2_error = round2_error
+        self.round2_calls = []
+        self.round2_started = asyncio.Event()
+        self.round2_cancelled = False
+        self.started_before_check = None
+        self.speculation = []
+        monkeypatch.setenv("AGENTIC_SPECULATIVE_ROUND2", "true")
+        monkeypatch.setattr(
+            memory_manager_module, "LLMProvider", lambda **kwargs: object()
+        )
+        monkeypatch.setattr(
+            memory_manager_module, "check_sufficiency", self.check_sufficiency
+        )
+        monkeypatch.setattr(
+            memory_manager_module,
+            "record_agentic_speculation",
+            lambda memory_type, outcome: self.speculation.append(outcome),
+        )
+        monkeypatch.setattr(manager, "_search_hybrid", self.search_hybrid)
+        monkeypatch.setattr(manager, "_rerank", self.rerank)
+        monkeypatch.setattr(manager, "_agentic_round2", self.agentic_round2)
+        monkeypatch.setattr(manager, "_to_response", self.to_response)
+
+    async def search_hybrid(self, request, retrieve_method):
+        return [_hit("r1-1", 0.9), _hit("r1-2", 0.8)]
+
+    async def rerank(self, query, hits, top_k, memory_type, method, instruction):
+        return hits[:top_k]
+
+    async def check_sufficiency(self, query, results, llm_provider, max_docs):
+        # Give the speculative task a chance to start before the check returns
+        await asyncio.sleep(0)
+        self.started_before_check = self.round2_started.is_set()
+        await asyncio.sleep(0.01)
+        return self.is_sufficient, "reason", ["missing"]
+
+    async def agentic_round2(
+        self, req, topn_pairs, missing_info, config, llm_provider, memory_type
+    ):
+        self.round2_calls.append(missing_info)
+        self.round2_started.set()
+        if self.round2_error is not None and len(self.round2_calls) == 1:
+            raise self.round2_error
+        if self.is_sufficient:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                self.round2_cancelled = True
+                raise
+        return [_hit("r2-1", 0.7), _hit("r1-1", 0.9)]
+
+    async def to_response(self, hits, request):
+        return [h["id"] for h in hits]
+
+
+@pytest.mark.asyncio
+async def test_speculative_round2_is_cancelled_when_round1_is_sufficient(monkeypatch):
+    manager = _make_manager()
+    harness = SpeculationHarness(monkeypatch, manager, is_sufficient=True)
+
+    result = await manager.retrieve_mem_agentic(_make_request([], top_k=5))
+    await asyncio.sleep(0)
+
+    assert result == ["r1-1", "r1-2"]
+    assert harness.started_before_check
+    assert harness.round2_cancelled
+    assert harness.round2_calls == [[]]
+    assert harness.speculation == ["discarded"]
+
+
+@pytest.mark.asyncio
+async def test_failed_speculative_round2_is_discarded_without_unretrieved_error(
+    monkeypatch,
+):
+    manager = _make_manager()
+    harness = SpeculationHarness(
+        monkeypatch,
+        manager,
+        is_sufficient=True,
+        round2_error=ConnectionError("es down"),
+    )
+    loop_errors = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda loop, context: loop_errors.append(context))
+
+    try:
+        result = await manager.retrieve_mem_agentic(_make_request([], top_k=5))
+        await asyncio.sleep(0)
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert result == ["r1-1", "r1-2"]
+    assert harness.round2_calls == [[]]
+    assert harness.speculation == ["discarded"]
+    assert loop_errors == []
+
+
+@pytest.mark.asyncio
+async def test_speculative_round2_result_is_reused_when_insufficient(monkeypatch):
+    manager = _make_manager()
+    harness = SpeculationHarness(monkeypatch, manager, is_sufficient=False)
+
+    result = await manager.retrieve_mem_agentic(_make_request([], top_k=5))
+
+    assert result == ["r1-1", "r1-2", "r2-1"]
+    assert harness.started_before_check
+    # Only the speculative run, launched before missing info was known
+    assert harness.round2_calls == [[]]
+    assert harness.speculation == ["used"]
+
+
+@pytest.mark.asyncio
+async def test_failed_speculative_round2_is_rerun_with_missing_info(monkeypatch):
+    manager = _make_manager()
+    harness = SpeculationHarness(
+        monkeypatch,
+        manager,
+        is_sufficient=False,
+        round2_error=ConnectionError("es down"),
+    )
+
+    result = await manager.retrieve_mem_agentic(_make_request([], top_k=5))
+
+    assert result == ["r1-1", "r1-2", "r2-1"]
+    assert harness.round2_calls == [[], ["missing"]]
+    assert harness.speculation == ["failed"]
+
+
+@pytest.mark.asyncio
+async def test_round2_is_not_speculated_when_disabled(monkeypatch):
+    manager = _make_manager()
+    harness = SpeculationHarness(monkeypatch, manager, is_sufficient=True)
+    monkeypatch.setenv("AGENTIC_SPECULATIVE_ROUND2", "false")
+
+    result = await manager.retrieve_mem_agentic(_make_request([], top_k=5))
+
+    assert result == ["r1-1", "r1-2"]
+    assert harness.round2_calls == []
+    assert harness.speculation == []
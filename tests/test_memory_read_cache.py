@@ -0,0 +1,176 @@
+"""Unit tests for the memory read cache."""
+
+import pytest
+from pydantic import BaseModel
+
+from agentic_layer.memory_read_cache import (
+    NOT_CACHED,
+    LocalReadCacheTier,
+    MemoryReadCache,
+    MemoryReadCacheConfig,
+    group_user_profile_cache_key,
+)
+
+
+class _Doc(BaseModel):
+    value: str
+
+
+class _Loader:
+    def __init__(self, data):
+        self.data = data
+        self.calls = []
+
+    async def __call__(self, keys):
+        self.calls.append(list(keys))
+        return {key: self.data[key] for key in keys if key in self.data}
+
+
+def _make_cache(*backends):
+    return MemoryReadCache("test", _Doc, MemoryReadCacheConfig(), list(backends))
+
+
+@pytest.mark.asyncio
+async def test_read_through_loads_only_misses():
+    loader = _Loader({"a": _Doc(value="a"), "b": _Doc(value="b")})
+    cache = _make_cache(LocalReadCacheTier(max_entries=10))
+
+    first = await cache.get_many(["a", "b", "missing"], loader)
+    second = await cache.get_many(["a", "b", "missing"], loader)
+
+    assert first == second == {"a": _Doc(value="a"), "b": _Doc(value="b")}
+    # Keys the loader does not return are not cached
+    assert loader.calls == [["a", "b", "missing"], ["missing"]]
+
+
+@pytest.mark.asyncio
+async def test_none_values_are_cached():
+    loader = _Loader({"a": None})
+    cache = _make_cache(LocalReadCacheTier(max_entries=10))
+
+    assert await cache.get_many(["a"], loader) == {"a": None}
+    assert await cache.get_many(["a"], loader) == {"a": None}
+    assert loader.calls == [["a"]]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_key():
+    loader = _Loader({"a": _Doc(value="a"), "b": _Doc(value="b")})
+    cache = _make_cache(LocalReadCacheTier(max_entries=10))
+    await cache.get_many(["a", "b"], loader)
+
+    await cache.invalidate(["a"])
+    await cache.get_many(["a", "b"], loader)
+
+    assert loader.calls == [["a", "b"], ["a"]]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_all_bumps_generation():
+    loader = _Loader({"a": _Doc(value="a"), "b": _Doc(value="b")})
+    cache = _make_cache(LocalReadCacheTier(max_entries=10))
+    await cache.get_many(["a", "b"], loader)
+
+    await cache.invalidate_all()
+    await cache.get_many(["a", "b"], loader)
+
+    assert loader.calls == [["a", "b"], ["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_lower_tier_hits_are_promoted():
+    upper = LocalReadCacheTier(max_entries=10)
+    lower = LocalReadCacheTier(max_entries=10)
+    loader = _Loader({"a": _Doc(value="a")})
+    await _make_cache(lower).get_many(["a"], loader)
+
+    cache = _make_cache(upper, lower)
+    assert await cache.get_many(["a"], loader) == {"a": _Doc(value="a")}
+    assert len(upper) == 1
+    assert loader.calls == [["a"]]
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_loads():
+    config = MemoryReadCacheConfig()
+    config.enabled = False
+    loader = _Loader({"a": _Doc(value="a")})
+    cache = MemoryReadCache("test", _Doc, config, [LocalReadCacheTier()])
+
+    await cache.get_many(["a"], loader)
+    await cache.get_many(["a"], loader)
+
+    assert loader.calls == [["a"], ["a"]]
+
+
+@pytest.mark.asyncio
+async def test_local_tier_evicts_least_recently_used():
+    local = LocalReadCacheTier(max_entries=2)
+    await local.set_many({"a": 1, "b": 2})
+    await local.get_many(["a"])
+    await local.set_many({"c": 3})
+
+    assert await local.get_many(["a", "b", "c"]) == [1, NOT_CACHED, 3]
+
+
+@pytest.mark.asyncio
+async def test_local_tier_expires_entries():
+    local = LocalReadCacheTier(max_entries=2, ttl_seconds=60)
+    await local.set_many({"a": 1})
+    assert await local.get_many(["a"]) == [1]
+
+    # Force the entry's expiry into the past
+    local._cache._entries["a"] = (0.0, 1)
+    assert await local.get_many(["a"]) == [NOT_CACHED]
+
+
+class _FakeRedisProvider:
+    def __init__(self, client):
+        self.client = client
+
+    async def get_client(self):
+        return self.client
+
+
+def _make_replica(client, **config_fields):
+    config = MemoryReadCacheConfig()
+    config.redis_enabled = True
+    for name, value in config_fields.items():
+        setattr(config, name, value)
+    cache = MemoryReadCache("test", _Doc, config)
+    cache.backends[-1]._redis_provider = _FakeRedisProvider(client)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_other_replicas_through_redis():
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    replica_a, replica_b = _make_replica(client), _make_replica(client)
+    loader = _Loader({"k": _Doc(value="old")})
+    assert [backend.tier for backend in replica_b.backends] == ["redis"]
+
+    assert await replica_b.get_many(["k"], loader) == {"k": _Doc(value="old")}
+    loader.data["k"] = _Doc(value="new")
+    await replica_a.invalidate(["k"])
+
+    assert await replica_b.get_many(["k"], loader) == {"k": _Doc(value="new")}
+
+
+def test_local_tier_in_front_of_redis_is_opt_in():
+    config = MemoryReadCacheConfig()
+    config.redis_enabled = True
+    config.local_with_redis = True
+
+    cache = MemoryReadCache("test", _Doc, config)
+
+    assert [backend.tier for backend in cache.backends] == ["local", "redis"]
+
+
+def test_group_user_profile_cache_key_is_unambiguous():
+    assert group_user_profile_cache_key("a:b", "c") != group_user_profile_cache_key(
+        "a", "b:c"
+    )
+    assert group_user_profile_cache_key("u", "g") == group_user_profile_cache_key(
+        "u", "g"
+    )
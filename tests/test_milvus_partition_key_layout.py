@@ -0,0 +1,60 @@
+"""Unit tests for the Milvus partition key layout (no Milvus server needed)."""
+
+from pymilvus import CollectionSchema, DataType, FieldSchema
+
+from core.oxm.milvus.milvus_collection_base import (
+    MilvusCollectionWithSuffix,
+    PartitionKeyLayout,
+    get_schema_partition_key,
+)
+
+
+class _MemoryCollection(MilvusCollectionWithSuffix):
+    _COLLECTION_NAME = "partition_key_test"
+    _SCHEMA = CollectionSchema(
+        fields=[
+            FieldSchema(
+                name="id",
+                dtype=DataType.VARCHAR,
+                is_primary=True,
+                auto_id=False,
+                max_length=100,
+            ),
+            FieldSchema(name="vector", dtype=DataType.FLOAT_VECTOR, dim=4),
+            FieldSchema(name="user_id", dtype=DataType.VARCHAR, max_length=100),
+            FieldSchema(name="group_id", dtype=DataType.VARCHAR, max_length=100),
+        ],
+        description="partition key test",
+        enable_dynamic_field=True,
+    )
+    _PARTITION_KEY_FIELDS = ("group_id", "user_id")
+
+
+def test_no_partition_key_by_default(monkeypatch):
+    monkeypatch.delenv("MILVUS_PARTITION_KEY", raising=False)
+
+    assert _MemoryCollection.get_schema() is _MemoryCollection._SCHEMA
+    assert _MemoryCollection.get_create_kwargs() == {}
+
+
+def test_configured_partition_key(monkeypatch):
+    monkeypatch.setenv("MILVUS_PARTITION_KEY", "group_id")
+    monkeypatch.setenv("MILVUS_PARTITION_KEY_NUM_PARTITIONS", "128")
+
+    schema = _MemoryCollection.get_schema()
+
+    assert get_schema_partition_key(schema) == "group_id"
+    assert schema.enable_dynamic_field
+    assert [f.name for f in schema.fields] == [
+        f.name for f in _MemoryCollection._SCHEMA.fields
+    ]
+    # The class schema itself is left untouched
+    assert get_schema_partition_key(_MemoryCollection._SCHEMA) is None
+    assert _MemoryCollection.get_create_kwargs() == {"num_partitions": 128}
+
+
+def test_unsupported_partition_key_is_ignored(monkeypatch):
+    monkeypatch.setenv("MILVUS_PARTITION_KEY", "event_type")
+
+    assert _MemoryCollection.get_partition_key_layout() == PartitionKeyLayout()
+    assert get_schema_partition_key(_MemoryCollection.get_schema()) is None
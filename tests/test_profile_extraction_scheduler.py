@@ -0,0 +1,145 @@
+"""Unit tests for the debouncing / coalescing profile extraction scheduler."""
+
+import asyncio
+
+import pytest
+
+from biz_layer.profile_extraction_scheduler import (
+    ProfileExtractionJob,
+    ProfileExtractionScheduler,
+    ProfileExtractionSchedulerConfig,
+)
+from core.tenants.tenant_contextvar import get_current_tenant_id, set_current_tenant
+from core.tenants.tenant_models import TenantDetail, TenantInfo
+
+
+def _job(group_id, cluster_id, memcell, users):
+    return ProfileExtractionJob(
+        group_id=group_id,
+        cluster_ids=[cluster_id],
+        cluster_state=f"state-{memcell}",
+        memcell=memcell,
+        user_ids=users,
+    )
+
+
+def _make_scheduler(debounce_seconds, max_delay_seconds=30.0):
+    runs = []
+
+    async def run_job(job):
+        runs.append(job)
+
+    scheduler = ProfileExtractionScheduler(
+        run_job=run_job,
+        config=ProfileExtractionSchedulerConfig(
+            debounce_seconds=debounce_seconds, max_delay_seconds=max_delay_seconds
+        ),
+    )
+    return scheduler, runs
+
+
+@pytest.mark.asyncio
+async def test_burst_of_triggers_is_coalesced_into_one_run():
+    scheduler, runs = _make_scheduler(debounce_seconds=0.05)
+
+    await scheduler.submit(_job("g1", "c1", "m1", ["u1"]))
+    await scheduler.submit(_job("g1", "c2", "m2", ["u2"]))
+    await scheduler.submit(_job("g1", "c1", "m3", ["u1"]))
+    assert runs == []
+    assert scheduler.pending_count() == 1
+
+    await asyncio.sleep(0.15)
+    await scheduler.flush()
+
+    assert len(runs) == 1
+    job = runs[0]
+    assert job.trigger_count == 3
+    assert job.cluster_ids == ["c1", "c2"]
+    assert job.user_ids == ["u1", "u2"]
+    assert job.memcell == "m3"
+    assert job.cluster_state == "state-m3"
+
+
+@pytest.mark.asyncio
+async def test_groups_are_scheduled_independently():
+    scheduler, runs = _make_scheduler(debounce_seconds=0.05)
+
+    await scheduler.submit(_job("g1", "c1", "m1", ["u1"]))
+    await scheduler.submit(_job("g2", "c1", "m2", ["u2"]))
+    await asyncio.sleep(0.15)
+    await scheduler.flush()
+
+    assert sorted(job.group_id for job in runs) == ["g1", "g2"]
+
+
+@pytest.mark.asyncio
+async def test_max_delay_bounds_a_continuous_burst():
+    scheduler, runs = _make_scheduler(debounce_seconds=0.1, max_delay_seconds=0.15)
+
+    # A trigger every 50ms keeps resetting the debounce window
+    for i in range(6):
+        await scheduler.submit(_job("g1", "c1", f"m{i}", ["u1"]))
+        await asyncio.sleep(0.05)
+
+    assert len(runs) >= 1
+    await scheduler.close()
+    assert sum(job.trigger_count for job in runs) == 6
+
+
+@pytest.mark.asyncio
+async def test_zero_debounce_runs_inline():
+    scheduler, runs = _make_scheduler(debounce_seconds=0)
+
+    await scheduler.submit(_job("g1", "c1", "m1", ["u1"]))
+
+    assert [job.memcell for job in runs] == ["m1"]
+    assert scheduler.pending_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_job_does_not_block_the_group():
+    calls = []
+
+    async def run_job(job):
+        calls.append(job.memcell)
+        if job.memcell == "bad":
+            raise RuntimeError("boom")
+
+    scheduler = ProfileExtractionScheduler(
+        run_job=run_job, config=ProfileExtractionSchedulerConfig(debounce_seconds=0)
+    )
+
+    await scheduler.submit(_job("g1", "c1", "bad", ["u1"]))
+    await scheduler.submit(_job("g1", "c1", "good", ["u1"]))
+
+    assert calls == ["bad", "good"]
+
+
+@pytest.mark.asyncio
+async def test_same_group_id_of_two_tenants_is_not_merged():
+    runs = []
+
+    async def run_job(job):
+        runs.append((get_current_tenant_id(), job.cluster_ids, job.trigger_count))
+
+    scheduler = ProfileExtractionScheduler(
+        run_job=run_job,
+        config=ProfileExtractionSchedulerConfig(
+            debounce_seconds=60, max_delay_seconds=60
+        ),
+    )
+
+    async def submit_as(tenant_id, cluster_id):
+        set_current_tenant(
+            TenantInfo(tenant_id=tenant_id, tenant_detail=TenantDetail())
+        )
+        await scheduler.submit(_job("g1", cluster_id, "m1", ["u1"]))
+
+    await asyncio.create_task(submit_as("tenant_a", "c1"))
+    await asyncio.create_task(submit_as("tenant_b", "c2"))
+    assert scheduler.pending_count() == 2
+
+    # Flushed outside any tenant context, each job still runs as its tenant
+    await scheduler.flush()
+
+    assert sorted(runs) == [("tenant_a", ["c1"], 1), ("tenant_b", ["c2"], 1)]
@@ -7,10 +7,21 @@ Test scenarios include:
 3. Timeout mechanism
 4. Concurrent competition
 5. Decorator usage
+6. Fencing tokens, lease renewal and release wake-ups
 """
 
 import asyncio
-from core.lock.redis_distributed_lock import with_distributed_lock, distributed_lock
+import os
+import time
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from core.lock.redis_distributed_lock import (
+    RedisDistributedLockManager,
+    distributed_lock,
+    with_distributed_lock,
+)
 
 
 async def test_basic_lock_operations(redis_distributed_lock_manager):
@@ -279,6 +290,123 @@ async def test_blocking_timeout_and_reentry(redis_distributed_lock_manager):
     await final
 
 
+async def test_fencing_tokens(redis_distributed_lock_manager):
+    """Fencing tokens grow with every fresh acquisition and are stable on reentry"""
+    lock = redis_distributed_lock_manager.get_lock("test_fencing")
+
+    async with lock.acquire() as first:
+        assert (
+            first.fencing_token is not None
+        ), "Acquisition should carry a fencing token"
+        async with lock.acquire() as reentry:
+            assert (
+                reentry.fencing_token == first.fencing_token
+            ), "Reentry should keep the fencing token of the outer acquisition"
+
+    async with lock.acquire() as second:
+        assert (
+            second.fencing_token > first.fencing_token
+        ), "Fencing tokens should increase"
+
+
+async def test_owner_ids_are_unique_per_task(redis_distributed_lock_manager):
+    """Owner ids carry host and pid and differ between tasks"""
+
+    async def owner_id():
+        # pylint: disable-next=protected-access
+        return redis_distributed_lock_manager._get_owner_id()
+
+    first, second = await asyncio.gather(
+        asyncio.create_task(owner_id()), asyncio.create_task(owner_id())
+    )
+    assert first != second, "Different tasks should get different owner ids"
+    assert f":{os.getpid()}:" in first, "Owner id should contain the process id"
+
+
+async def test_lock_renewal(redis_distributed_lock_manager):
+    """Manual renewal and the auto-renew watchdog keep a short lease alive"""
+    lock = redis_distributed_lock_manager.get_lock("test_renewal")
+
+    async with lock.acquire(timeout=1) as acquired:
+        assert acquired, "Should successfully acquire the lock"
+        await asyncio.sleep(0.6)
+        assert await lock.renew(timeout=1), "Renewal by the holder should succeed"
+        await asyncio.sleep(0.6)
+        assert await lock.is_locked(), "Renewed lock should still exist"
+
+    assert not await lock.renew(), "Renewing a released lock should fail"
+
+    async with lock.acquire(timeout=1, auto_renew=True) as acquired:
+        assert acquired, "Should successfully acquire the lock"
+        await asyncio.sleep(2.5)
+        assert await lock.is_locked(), "Watchdog should keep the lock alive"
+
+    assert not await lock.is_locked(), "The lock should be released after the block"
+
+
+async def test_waiter_is_woken_on_release(redis_distributed_lock_manager):
+    """A waiter acquires right after release instead of at its next poll"""
+    resource = "test_wakeup"
+    released_at = {}
+
+    async def holder():
+        async with redis_distributed_lock_manager.acquire_lock(resource) as acquired:
+            assert acquired, "Holder should acquire the lock"
+            await asyncio.sleep(0.5)
+        released_at["t"] = time.monotonic()
+
+    async def waiter():
+        async with redis_distributed_lock_manager.acquire_lock(
+            resource, blocking_timeout=10
+        ) as acquired:
+            assert acquired, "Waiter should acquire the lock after release"
+            return time.monotonic()
+
+    holder_task = asyncio.create_task(holder())
+    await asyncio.sleep(0.1)
+    acquired_at = await waiter()
+    await holder_task
+
+    # Polling would wait up to DEFAULT_RETRY_INTERVAL (3s)
+    assert acquired_at - released_at["t"] < 1, "Waiter should be woken by the release"
+
+
+class FakeRedisProvider:
+    """Hands out one fakeredis client"""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def get_client(self):
+        return self.client
+
+
+@pytest.mark.asyncio
+async def test_failed_release_stops_watchdog_and_lease_expires():
+    """A failed release stops the renewal, the lease then expires for waiters"""
+    fakeredis = pytest.importorskip("fakeredis")
+    manager = RedisDistributedLockManager(FakeRedisProvider(fakeredis.FakeAsyncRedis()))
+    resource = "test_failed_release"
+    lock = manager.get_lock(resource)
+
+    async def failing_release(*args, **kwargs):
+        raise RedisConnectionError("connection lost")
+
+    async with lock.acquire(timeout=0.3, auto_renew=True) as acquired:
+        assert acquired, "Should successfully acquire the lock"
+        manager._lua_release = failing_release  # pylint: disable=protected-access
+
+    assert not manager._watchdogs, "Watchdog should stop after a failed release"
+
+    async def waiter():
+        async with manager.get_lock(resource).acquire(
+            timeout=1, blocking_timeout=2
+        ) as acquired:
+            return acquired
+
+    assert await waiter(), "Waiter should acquire the lock once the lease expired"
+
+
 async def run_all_tests():
     """Run all tests"""
     from core.di.utils import get_bean_by_type
@@ -301,6 +429,10 @@ async def run_all_tests():
         test_convenient_context_manager,
         test_context_manager_with_timeout,
         test_context_manager_concurrent,
+        test_fencing_tokens,
+        test_owner_ids_are_unique_per_task,
+        test_lock_renewal,
+        test_waiter_is_woken_on_release,
     ]
 
     # Run all tests
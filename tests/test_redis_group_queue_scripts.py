@@ -0,0 +1,222 @@
+"""Unit tests for the Redis group queue enqueue / dequeue Lua scripts (Redis faked)."""
+
+import pytest
+
+from core.queue.redis_group_queue.redis_group_queue_item import SimpleQueueItem
+from core.queue.redis_group_queue.redis_msg_group_queue_manager import (
+    RedisGroupQueueManager,
+)
+
+OWNER_ID = "owner-1"
+
+
+@pytest.fixture
+def manager():
+    fakeredis = pytest.importorskip("fakeredis")
+    return RedisGroupQueueManager(
+        fakeredis.FakeAsyncRedis(decode_responses=True),
+        key_prefix="test",
+        sort_key_func=lambda item: item.data["score"],
+        enable_metrics=False,
+    )
+
+
+def _item(name, score):
+    return SimpleQueueItem({"name": name, "score": score})
+
+
+def _group_in_other_partition(manager, group_key):
+    """A group key routed to another partition than group_key"""
+    partition = manager._hash_group_key_to_partition(group_key)
+    return next(
+        f"group-{i}"
+        for i in range(1000)
+        if manager._hash_group_key_to_partition(f"group-{i}") != partition
+    )
+
+
+async def _counter(manager):
+    return int(await manager.redis_client.get(manager.counter_key) or 0)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_batch_statuses_at_total_limit(manager):
+    await manager._ensure_scripts_loaded()
+    queue_key = manager._get_queue_key("001")
+    messages = [_item("a", 1), _item("a", 1), _item("b", 2), _item("c", 3)]
+    args = [60, 60, 2]
+    for item in messages:
+        args.extend([item.to_json_str(), item.data["score"]])
+
+    count, statuses = await manager._enqueue_batch_script(
+        keys=[manager.counter_key] + [queue_key] * len(messages), args=args
+    )
+
+    # Added, already exists, added, exceeded the limit of 2
+    assert statuses == [1, 0, 1, -1]
+    assert count == 2
+    assert await manager.redis_client.zcard(queue_key) == 2
+    assert await _counter(manager) == 2
+
+
+@pytest.mark.asyncio
+async def test_deliver_messages_reports_rejections_in_input_order(manager):
+    results = await manager.deliver_messages(
+        [
+            ("g1", _item("a", 1)),
+            ("g1", _item("a", 1)),
+            ("g2", _item("b", 2)),
+            ("g3", _item("c", 3)),
+        ],
+        max_total_messages=2,
+    )
+
+    assert results == [True, False, True, False]
+    assert manager._manager_stats.total_delivered_messages == 2
+    assert manager._manager_stats.total_rejected_messages == 2
+    assert await _counter(manager) == 2
+
+
+@pytest.mark.asyncio
+async def test_deliver_messages_enqueues_in_chunks(manager):
+    await manager._ensure_scripts_loaded()
+    script = manager._enqueue_batch_script
+    chunk_sizes = []
+
+    async def recording_script(keys, args):
+        chunk_sizes.append(len(keys) - 1)
+        return await script(keys=keys, args=args)
+
+    manager._enqueue_batch_script = recording_script
+    total = 2 * manager.DELIVER_BATCH_CHUNK_SIZE + 1
+
+    results = await manager.deliver_messages(
+        [(f"group-{i % 7}", _item(f"m{i}", i)) for i in range(total)]
+    )
+
+    assert chunk_sizes == [500, 500, 1]
+    assert all(results) and len(results) == total
+    assert await _counter(manager) == total
+
+
+@pytest.mark.asyncio
+async def test_get_messages_takes_ready_messages_per_partition(manager):
+    group_a = "group-a"
+    group_b = _group_in_other_partition(manager, group_a)
+    await manager.deliver_messages(
+        [(group_a, _item(f"a{score}", score)) for score in (1, 2, 3)]
+        + [(group_b, _item(f"b{score}", score)) for score in (4, 5)]
+        + [(group_b, _item("not-ready", 500))]
+    )
+    redis_client = manager.redis_client
+    await redis_client.zadd(manager.owner_activate_time_zset_key, {OWNER_ID: 1})
+    await redis_client.rpush(
+        manager._get_queue_list_key(OWNER_ID),
+        manager._hash_group_key_to_partition(group_a),
+        manager._hash_group_key_to_partition(group_b),
+    )
+
+    messages = await manager.get_messages(
+        score_threshold=100,
+        current_score=200,
+        owner_id=OWNER_ID,
+        max_messages_per_partition=2,
+        max_messages=3,
+    )
+
+    assert [m.data["name"] for m in messages] == ["a1", "a2", "b4"]
+    # DECRBY by the number of messages taken
+    assert await _counter(manager) == 3
+
+    messages = await manager.get_messages(
+        score_threshold=100,
+        current_score=200,
+        owner_id=OWNER_ID,
+        max_messages_per_partition=2,
+    )
+
+    assert [m.data["name"] for m in messages] == ["a3", "b5"]
+    assert await _counter(manager) == 1
+
+
+# ============================================================
+# Partition rebalance (REBALANCE_FUNCTION)
+# ============================================================
+
+
+def _owners(name, count):
+    return [f"{name}-owner-{i}" for i in range(count)]
+
+
+# join / exit without their @local_rate_limit wrappers (one call per second)
+async def _join(manager, owner_id):
+    return await RedisGroupQueueManager.join_consumer.__wrapped__(manager, owner_id)
+
+
+async def _exit(manager, owner_id):
+    return await RedisGroupQueueManager.exit_consumer.__wrapped__(manager, owner_id)
+
+
+async def _join_all(manager, owners):
+    assignment = {}
+    for owner_id in owners:
+        _, assignment = await _join(manager, owner_id)
+    return assignment
+
+
+async def _last_moved(manager):
+    stats = await manager.redis_client.hgetall(manager.rebalance_stats_key)
+    return int(stats["last_moved_partitions"])
+
+
+def _assert_even_split(manager, assignment):
+    loads = [len(partitions) for partitions in assignment.values()]
+    share = manager.partition_count // len(assignment)
+    assert set(loads) <= {share, share + 1}
+    assert sorted(p for ps in assignment.values() for p in ps) == (
+        manager.partition_names
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("owner_count", [3, 5, 7])
+async def test_partitions_are_spread_over_owners(manager, owner_count):
+    owners = _owners(f"spread{owner_count}", owner_count)
+
+    assignment = await _join_all(manager, owners)
+
+    assert set(assignment) == set(owners)
+    _assert_even_split(manager, assignment)
+    for owner_id, partitions in assignment.items():
+        queue_list = await manager.redis_client.lrange(
+            manager._get_queue_list_key(owner_id), 0, -1
+        )
+        assert queue_list == partitions
+
+
+@pytest.mark.asyncio
+async def test_joining_owner_only_takes_its_share(manager):
+    owners = _owners("join", 4)
+    before = await _join_all(manager, owners[:3])
+
+    _, after = await _join(manager, owners[3])
+
+    _assert_even_split(manager, after)
+    for owner_id in owners[:3]:
+        assert set(after[owner_id]) <= set(before[owner_id])
+    # Only the partitions handed to the new owner move
+    assert await _last_moved(manager) == len(after[owners[3]]) == 12
+
+
+@pytest.mark.asyncio
+async def test_exiting_owner_only_releases_its_partitions(manager):
+    owners = _owners("exit", 4)
+    before = await _join_all(manager, owners)
+
+    _, after = await _exit(manager, owners[0])
+
+    assert set(after) == set(owners[1:])
+    _assert_even_split(manager, after)
+    for owner_id in owners[1:]:
+        assert set(before[owner_id]) <= set(after[owner_id])
+    assert await _last_moved(manager) == len(before[owners[0]])
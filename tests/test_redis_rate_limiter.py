@@ -0,0 +1,161 @@
+"""Unit tests for the Redis-backed distributed rate limiter (GCRA script faked)."""
+
+import asyncio
+import time
+
+import pytest
+
+from core.rate_limit import rate_limit_metrics
+from core.rate_limit.rate_limiter import RateLimitManager
+from core.rate_limit.redis_rate_limiter import (
+    RateLimiterConfig,
+    RateLimiterUnavailableError,
+    RedisRateLimiter,
+)
+
+
+class FakeScript:
+    """Stands in for the registered GCRA script, returns scripted results"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = []
+
+    async def __call__(self, keys, args):
+        self.calls.append(args[2])
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _make_limiter(results, max_rate=100, time_period=1, **config):
+    config.setdefault("backend", "redis")
+    limiter = RedisRateLimiter(
+        "test", max_rate, time_period, RateLimiterConfig(**config)
+    )
+    limiter._script = FakeScript(results)
+    return limiter
+
+
+@pytest.mark.asyncio
+async def test_prefetched_tokens_are_spent_without_redis_round_trips():
+    limiter = _make_limiter([[10, 0]], prefetch_tokens=10)
+
+    for _ in range(10):
+        async with limiter:
+            pass
+
+    assert limiter._script.calls == [10]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_is_capped_to_a_share_of_the_burst():
+    limiter = _make_limiter([[1, 0]], max_rate=5, prefetch_tokens=10)
+
+    await limiter.acquire()
+
+    assert limiter._script.calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_rejected_fetch_waits_for_retry_after():
+    limiter = _make_limiter([[0, 50_000], [1, 0]], prefetch_tokens=1)
+
+    start = time.perf_counter()
+    await limiter.acquire()
+
+    assert time.perf_counter() - start >= 0.045
+    assert len(limiter._script.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_prefetched_tokens_are_dropped():
+    limiter = _make_limiter(
+        [[10, 0], [10, 0]], prefetch_tokens=10, prefetch_ttl_seconds=0.01
+    )
+
+    await limiter.acquire()
+    await asyncio.sleep(0.02)
+    await limiter.acquire()
+
+    assert limiter._script.calls == [10, 10]
+
+
+@pytest.mark.asyncio
+async def test_fail_open_falls_back_to_local_limiter():
+    limiter = _make_limiter([ConnectionError("down")], failure_mode="open")
+
+    await limiter.acquire()
+
+    assert limiter._fallback is not None
+
+
+@pytest.mark.asyncio
+async def test_fail_closed_raises():
+    limiter = _make_limiter([ConnectionError("down")], failure_mode="closed")
+
+    with pytest.raises(RateLimiterUnavailableError):
+        await limiter.acquire()
+
+
+@pytest.mark.asyncio
+async def test_fail_open_skips_redis_during_backoff():
+    limiter = _make_limiter(
+        [ConnectionError("down")], failure_mode="open", unavailable_backoff_seconds=60
+    )
+
+    for _ in range(3):
+        await limiter.acquire()
+
+    assert len(limiter._script.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_is_retried_after_backoff():
+    limiter = _make_limiter(
+        [ConnectionError("down"), [1, 0]],
+        failure_mode="open",
+        unavailable_backoff_seconds=0.01,
+    )
+
+    await limiter.acquire()
+    await asyncio.sleep(0.02)
+    await limiter.acquire()
+
+    assert len(limiter._script.calls) == 2
+    assert limiter._redis_healthy
+
+
+@pytest.mark.asyncio
+async def test_fail_closed_raises_during_backoff_without_redis():
+    limiter = _make_limiter(
+        [ConnectionError("down")], failure_mode="closed", unavailable_backoff_seconds=60
+    )
+
+    for _ in range(2):
+        with pytest.raises(RateLimiterUnavailableError):
+            await limiter.acquire()
+
+    assert len(limiter._script.calls) == 1
+
+
+def test_key_label_is_bounded(monkeypatch):
+    monkeypatch.setattr(rate_limit_metrics, "MAX_KEY_LABELS", 2)
+    monkeypatch.setattr(rate_limit_metrics, "_key_labels", set())
+
+    labels = [rate_limit_metrics._key_label(f"user_{i}") for i in range(4)]
+
+    assert labels == ["user_0", "user_1", "other", "other"]
+    assert rate_limit_metrics._key_label("user_1") == "user_1"
+
+
+def test_manager_selects_backend_from_config():
+    local = RateLimitManager(RateLimiterConfig(backend="local"))
+    distributed = RateLimitManager(RateLimiterConfig(backend="redis"))
+
+    assert not isinstance(local.get_limiter("k", 1, 1), RedisRateLimiter)
+    assert isinstance(distributed.get_limiter("k", 1, 1), RedisRateLimiter)
+    assert not isinstance(
+        distributed.get_limiter("k", 1, 1, distributed=False), RedisRateLimiter
+    )
@@ -0,0 +1,90 @@
+"""Unit tests for token-budgeted batching and score caching in VllmRerankService."""
+
+import pytest
+
+from agentic_layer.rerank_cache import RerankScoreCache, RerankScoreCacheConfig
+from agentic_layer.rerank_vllm import VllmRerankConfig, VllmRerankService
+
+
+class _WordTokenizer:
+    """One token per whitespace-separated word"""
+
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+def _make_service(**config_kwargs):
+    service = VllmRerankService(
+        VllmRerankConfig(**config_kwargs),
+        score_cache=RerankScoreCache(RerankScoreCacheConfig(enabled=True)),
+    )
+    service._get_tokenizer = lambda: _WordTokenizer()
+    service.sent_batches = []
+
+    async def fake_send(query, documents, start_index, instruction=None):
+        service.sent_batches.append(list(documents))
+        # Score = number of words, so results are easy to check
+        return {
+            "results": [
+                {"index": i, "relevance_score": float(len(doc.split()))}
+                for i, doc in enumerate(documents)
+            ]
+        }
+
+    service._send_rerank_request_batch = fake_send
+    return service
+
+
+def test_pack_batches_respects_token_budget_and_doc_count():
+    service = _make_service(batch_size=3, max_batch_tokens=10)
+    # query_tokens=2: costs are 5, 5, 3, 3, 3, 12
+    batches = service._pack_batches([3, 3, 1, 1, 1, 10], query_tokens=2)
+    assert batches == [[0, 1], [2, 3, 4], [5]]
+
+
+@pytest.mark.asyncio
+async def test_documents_are_truncated_to_document_budget():
+    service = _make_service(max_document_tokens=2)
+    scores = await service._score_documents("q", ["a b c d", "e"])
+
+    assert service.sent_batches == [["a b", "e"]]
+    assert scores == [2.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_repeated_pairs_are_served_from_cache():
+    service = _make_service()
+    await service._score_documents("q", ["a", "b c"])
+    scores = await service._score_documents("q", ["b c", "d e f"])
+
+    assert service.sent_batches == [["a", "b c"], ["d e f"]]
+    assert scores == [2.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_cache_key_depends_on_instruction():
+    service = _make_service()
+    await service._score_documents("q", ["a"], instruction="one")
+    await service._score_documents("q", ["a"], instruction="two")
+
+    assert len(service.sent_batches) == 2
+
+
+@pytest.mark.asyncio
+async def test_rerank_memories_keeps_original_order_when_a_batch_fails():
+    service = _make_service(batch_size=1)
+
+    async def failing_send(query, documents, start_index, instruction=None):
+        if documents == ["bad"]:
+            raise RuntimeError("boom")
+        return {"results": [{"index": 0, "relevance_score": 1.0}]}
+
+    service._send_rerank_request_batch = failing_send
+    hits = [{"content": "bad", "score": 0.9}, {"content": "good", "score": 0.1}]
+
+    reranked = await service.rerank_memories("q", hits)
+
+    assert [h["content"] for h in reranked] == ["bad", "good"]
@@ -32,3 +32,84 @@ def test_safe_cosine_similarity_returns_score_for_valid_vectors():
         np.array([1.0, 0.0]), 1.0, candidate
     )
     assert score == 1.0
+
+
+def test_embedding_matrix_matches_per_candidate_similarity():
+    candidates = [
+        Candidate([1.0, 0.0]),
+        Candidate([]),
+        Candidate([0.0, 0.0]),
+        Candidate([1.0]),
+        Candidate([1.0, 1.0]),
+        Candidate([-1.0, 0.5]),
+    ]
+    query = np.array([1.0, 0.2])
+    expected = [
+        (c, retrieval_utils._safe_cosine_similarity(query, np.linalg.norm(query), c))
+        for c in candidates
+    ]
+    expected = sorted(
+        [(c, s) for c, s in expected if s is not None], key=lambda x: x[1], reverse=True
+    )
+
+    matrix = retrieval_utils.CandidateEmbeddingMatrix(candidates)
+    results = matrix.top_k(query, 10)
+
+    assert [c for c, _ in results] == [c for c, _ in expected]
+    np.testing.assert_allclose([s for _, s in results], [s for _, s in expected])
+
+
+def test_embedding_matrix_skips_dimension_mismatch_and_zero_query():
+    matrix = retrieval_utils.CandidateEmbeddingMatrix([Candidate([1.0, 0.0])])
+    assert matrix.top_k(np.array([1.0, 0.0, 0.0]), 5) == []
+    assert matrix.top_k(np.array([0.0, 0.0]), 5) == []
+
+
+def test_bm25_index_add_and_remove_tokenize_only_changes():
+    tokenized = []
+
+    def tokenize(text):
+        tokenized.append(text)
+        return text.split()
+
+    index = retrieval_utils.Bm25Index(["a b", "c d"], tokenize)
+    index.add(["e f"])
+    index.remove([0])
+
+    assert tokenized == ["a b", "c d", "e f"]
+    assert index.texts == ["c d", "e f"]
+    assert index.tokenized_docs == [["c", "d"], ["e", "f"]]
+
+
+def test_bm25_index_cache_memoises_by_candidate_fingerprint(monkeypatch):
+    cache = retrieval_utils.Bm25IndexCache(max_indexes=2)
+    monkeypatch.setattr(cache, "_tokenize", lambda text: text.split())
+
+    first = cache.get_or_build(["a b", "c d"])
+    assert cache.get_or_build(["a b", "c d"]) is first
+    assert cache.get_or_build(["c d", "a b"]) is not first
+
+
+def test_bm25_index_cache_derives_append_and_delete_deltas(monkeypatch):
+    cache = retrieval_utils.Bm25IndexCache()
+    tokenized = []
+
+    def tokenize(text):
+        tokenized.append(text)
+        return text.split()
+
+    monkeypatch.setattr(cache, "_tokenize", tokenize)
+
+    base = cache.get_or_build(["a b", "c d"])
+    appended = cache.get_or_build(["a b", "c d", "e f"])
+    deleted = cache.get_or_build(["a b", "e f"])
+
+    # Only the appended text is tokenized, cached indexes are left unchanged
+    assert tokenized == ["a b", "c d", "e f"]
+    assert base.texts == ["a b", "c d"]
+    assert appended.texts == ["a b", "c d", "e f"]
+    assert deleted.tokenized_docs == [["a", "b"], ["e", "f"]]
+    np.testing.assert_allclose(
+        deleted.bm25.get_scores(["e"]),
+        retrieval_utils.Bm25Index(["a b", "e f"], str.split).bm25.get_scores(["e"]),
+    )
@@ -0,0 +1,76 @@
+"""Unit tests for the tiered embedding cache."""
+
+import numpy as np
+import pytest
+
+from agentic_layer.vectorize_cache import (
+    EmbeddingCache,
+    EmbeddingCacheConfig,
+    LocalEmbeddingCache,
+)
+
+
+def _make_cache(*backends):
+    return EmbeddingCache(EmbeddingCacheConfig(), backends=list(backends))
+
+
+def test_build_key_distinguishes_query_instruction_and_model():
+    base = EmbeddingCache.build_key("m", 1024, "hello", None, False)
+    assert base != EmbeddingCache.build_key("m", 1024, "hello", None, True)
+    assert base != EmbeddingCache.build_key("m", 1024, "hello", "inst", False)
+    assert base != EmbeddingCache.build_key("m", 512, "hello", None, False)
+    assert base != EmbeddingCache.build_key("m2", 1024, "hello", None, False)
+    assert base == EmbeddingCache.build_key("m", 1024, "hello", None, False)
+
+
+@pytest.mark.asyncio
+async def test_roundtrip_stores_float32_bytes():
+    local = LocalEmbeddingCache(max_entries=10)
+    cache = _make_cache(local)
+    await cache.set("k", np.array([0.5, 1.5, -2.0], dtype=np.float64))
+
+    raw = await local.get("k")
+    assert len(raw) == 3 * 4
+
+    embedding = await cache.get("k")
+    assert embedding.dtype == np.float32
+    np.testing.assert_allclose(embedding, [0.5, 1.5, -2.0])
+
+
+@pytest.mark.asyncio
+async def test_local_cache_evicts_least_recently_used():
+    local = LocalEmbeddingCache(max_entries=2)
+    await local.set("a", b"a")
+    await local.set("b", b"b")
+    await local.get("a")
+    await local.set("c", b"c")
+
+    assert await local.get("a") == b"a"
+    assert await local.get("b") is None
+    assert await local.get("c") == b"c"
+
+
+@pytest.mark.asyncio
+async def test_local_cache_expires_entries():
+    local = LocalEmbeddingCache(max_entries=2, ttl_seconds=60)
+    await local.set("a", b"a")
+    assert await local.get("a") == b"a"
+
+    # Force the entry's expiry into the past
+    local._cache._entries["a"] = (0.0, b"a")
+    assert await local.get("a") is None
+    assert len(local) == 0
+
+
+@pytest.mark.asyncio
+async def test_hit_in_lower_tier_is_promoted():
+    upper = LocalEmbeddingCache(max_entries=10)
+    lower = LocalEmbeddingCache(max_entries=10)
+    cache = _make_cache(upper, lower)
+    await lower.set("k", EmbeddingCache.encode(np.ones(2)))
+
+    results = await cache.get_many(["k", "missing"])
+
+    np.testing.assert_allclose(results[0], [1.0, 1.0])
+    assert results[1] is None
+    assert await upper.get("k") is not None
@@ -0,0 +1,75 @@
+"""Unit tests for the embedding micro-batcher."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from agentic_layer.vectorize_batcher import EmbeddingMicroBatcher
+
+
+class RecordingSender:
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.fail = fail
+
+    async def __call__(self, texts, instruction, is_query):
+        self.calls.append((list(texts), instruction, is_query))
+        if self.fail:
+            raise RuntimeError("boom")
+        return [np.array([float(len(t))], dtype=np.float32) for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_coalesced_within_window():
+    sender = RecordingSender()
+    batcher = EmbeddingMicroBatcher(sender, "test", window_ms=20, max_batch_size=10)
+
+    results = await asyncio.gather(
+        *[batcher.submit(text, None, True) for text in ["a", "bb", "ccc"]]
+    )
+
+    assert len(sender.calls) == 1
+    assert sender.calls[0] == (["a", "bb", "ccc"], None, True)
+    assert [float(r[0]) for r in results] == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_batch_flushes_when_size_limit_reached():
+    sender = RecordingSender()
+    batcher = EmbeddingMicroBatcher(sender, "test", window_ms=1000, max_batch_size=2)
+
+    await asyncio.wait_for(
+        asyncio.gather(batcher.submit("a"), batcher.submit("b")), timeout=0.5
+    )
+
+    assert sender.calls == [(["a", "b"], None, False)]
+
+
+@pytest.mark.asyncio
+async def test_requests_with_different_instruction_are_not_mixed():
+    sender = RecordingSender()
+    batcher = EmbeddingMicroBatcher(sender, "test", window_ms=10, max_batch_size=10)
+
+    await asyncio.gather(
+        batcher.submit("a", "x", True),
+        batcher.submit("b", None, True),
+        batcher.submit("c", "x", True),
+    )
+
+    assert sorted(sender.calls, key=lambda c: c[0]) == [
+        (["a", "c"], "x", True),
+        (["b"], None, True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_waiter():
+    sender = RecordingSender(fail=True)
+    batcher = EmbeddingMicroBatcher(sender, "test", window_ms=5, max_batch_size=10)
+
+    results = await asyncio.gather(
+        batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)